@@ -0,0 +1,96 @@
+import asyncio
+import os
+
+import imagesProcessing
+from inference_pool import InferencePool, PoolSaturated, pool
+
+
+class RecognitionBatcher:
+    """
+    Dynamic micro-batching in front of the inference pool.
+    Items submitted within max_wait_ms of each other (up to max_batch) are
+    handed to handler(items) as one batch on a worker thread; handler returns
+    one result per item, where an Exception instance fails only that item.
+    """
+
+    def __init__(self, handler, pool: InferencePool, max_batch: int = 8, max_wait_ms: float = 5.0, max_pending: int = 256):
+        self.handler = handler
+        self.pool = pool
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self.max_pending = max_pending
+        self._queue = None
+        self._collector = None
+        self._dispatches = set()  # the loop only keeps weak references to tasks
+        self.batches = 0
+        self.items = 0
+
+    def _ensure_started(self):
+        if self._collector is None or self._collector.done():
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._collector = asyncio.get_running_loop().create_task(self._collect())
+
+    async def submit(self, item):
+        """Queues one item and waits for its result (an exception result is raised)."""
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((item, future))
+        except asyncio.QueueFull:
+            raise PoolSaturated(f"Recognition batch queue is full ({self.max_pending} pending)")
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without waiting so the next batch can be collected meanwhile
+            task = loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch):
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.pool.run(self.handler, [item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait_ms,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "batches": self.batches,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+# Create a single instance to be used across the application
+batcher = RecognitionBatcher(
+    imagesProcessing.recognize_uploads,
+    pool,
+    max_batch=int(os.environ.get("RECOGNITION_MAX_BATCH", 8)),
+    max_wait_ms=float(os.environ.get("RECOGNITION_MAX_WAIT_MS", 5)),
+    max_pending=int(os.environ.get("RECOGNITION_MAX_PENDING", 256)),
+)
@@ -0,0 +1,266 @@
+"""
+Benchmark for the recognition hot path.
+
+Builds synthetic galleries of OpenFace-sized vectors in a throwaway SQLite
+database and times gallery lookup, insert-with-eviction (single and bulk), /list-people and
+end-to-end /recognize (through FastAPI's test client, with a stubbed
+embedder so no model, GPU or network is needed). Results are written as
+JSON so runs can be compared across commits:
+
+    python benchmark.py --sizes 1000 10000 100000 --output bench.json
+
+--shortlists compares two-stage prototype matching against exact search:
+latency, top-1 agreement and match-decision agreement at the threshold.
+The synthetic clusters are easy to separate, so that agreement is an upper
+bound; --embeddings measures it on real embeddings instead.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+# Point face_db at a scratch database before it is imported. Always, not as a default:
+# build_gallery empties the tables, so a FACE_DB_PATH exported for the server must not leak in
+_workdir = tempfile.mkdtemp(prefix="face-bench-")
+os.environ["FACE_DB_PATH"] = os.path.join(_workdir, "bench_faces.db")
+os.environ["FACE_DB_BACKEND"] = "local"
+os.environ["EVENT_BUS"] = "memory"  # nor should its gallery changes reach running workers
+
+import face_db  # noqa: E402
+
+DIM = 128  # OpenFace embedding size
+THRESHOLD = 0.93  # face_db's local match threshold
+
+
+def summarize(latencies, wall_seconds):
+    ms = np.asarray(latencies) * 1000
+    return {
+        "count": len(ms),
+        "mean_ms": round(float(ms.mean()), 4),
+        "p50_ms": round(float(np.percentile(ms, 50)), 4),
+        "p95_ms": round(float(np.percentile(ms, 95)), 4),
+        "p99_ms": round(float(np.percentile(ms, 99)), 4),
+        "max_ms": round(float(ms.max()), 4),
+        "throughput_per_s": round(len(ms) / wall_seconds, 2) if wall_seconds else None,
+    }
+
+
+def timed(fn, args_list):
+    latencies = []
+    start = time.perf_counter()
+    for args in args_list:
+        t0 = time.perf_counter()
+        fn(*args)
+        latencies.append(time.perf_counter() - t0)
+    return summarize(latencies, time.perf_counter() - start)
+
+
+def build_gallery(size, vectors_per_person, rng, spread=0.15):
+    """Empties the tables and bulk-loads `size` vectors; returns the person centroids."""
+    persons = max(1, size // vectors_per_person)
+    centroids = rng.normal(size=(persons, DIM)).astype(np.float32)
+    now = datetime.utcnow().isoformat(" ")
+    with face_db.get_conn() as conn:
+        conn.execute("DELETE FROM vectors")
+        conn.execute("DELETE FROM persons")
+        conn.executemany(
+            "INSERT INTO persons (person_id, last_seen, vector_count) VALUES (?, ?, ?)",
+            [(p + 1, now, 0) for p in range(persons)],
+        )
+        chunk = 50_000
+        for start in range(0, size, chunk):
+            ids = np.arange(start, min(size, start + chunk))
+            owners = ids % persons
+            noise = rng.normal(scale=spread, size=(len(ids), DIM)).astype(np.float32)
+            rows = centroids[owners] + noise
+            conn.executemany(
+                "INSERT INTO vectors (person_id, vector, last_checked) VALUES (?, ?, ?)",
+                [(int(o) + 1, face_db.vector_to_blob(r), now) for o, r in zip(owners, rows)],
+            )
+        conn.execute("""
+            UPDATE persons SET vector_count = (
+                SELECT COUNT(*) FROM vectors WHERE vectors.person_id = persons.person_id
+            )
+        """)
+        conn.commit()
+    t0 = time.perf_counter()
+    face_db.load_gallery()
+    return centroids, time.perf_counter() - t0
+
+
+def bench_shortlists(queries, shortlists, k=5):
+    """Latency and agreement with exact search for each prototype shortlist size."""
+    exact = face_db.gallery.search(queries, k, shortlist=0)
+    results = {}
+    for shortlist in shortlists:
+        stats = timed(lambda q: face_db.gallery.search(q, k, shortlist=shortlist), [(q,) for q in queries])
+        found = face_db.gallery.search(queries, k, shortlist=shortlist)
+        same_top1 = [e[0][0] == f[0][0] for e, f in zip(exact, found)]
+        # Same outcome at the threshold: both unmatched, or both matched to the same person
+        same_decision = [
+            (e[0][1] >= THRESHOLD) == (f[0][1] >= THRESHOLD) and (e[0][1] < THRESHOLD or e[0][0] == f[0][0])
+            for e, f in zip(exact, found)
+        ]
+        stats["top1_agreement"] = round(float(np.mean(same_top1)), 4)
+        stats["match_agreement"] = round(float(np.mean(same_decision)), 4)
+        results[f"shortlist_{shortlist}"] = stats
+    return results
+
+
+def bench_embeddings(path, shortlists):
+    """
+    bench_shortlists on real embeddings: an .npz with `vectors` [n, dim] and
+    `person_ids` [n]. Each person's last vector is a query and the rest form the
+    gallery (people with a single vector become queries with no true match).
+    """
+    data = np.load(path)
+    vectors = np.asarray(data["vectors"], dtype=np.float32)
+    person_ids = np.asarray(data["person_ids"]).astype(np.int64)
+    last = {int(p): row for row, p in enumerate(person_ids)}
+    held = np.zeros(len(vectors), dtype=bool)
+    held[list(last.values())] = True
+    rows = np.flatnonzero(~held)
+    now = datetime.utcnow()
+    face_db.gallery.load([int(r) + 1 for r in rows], [int(p) for p in person_ids[rows]], vectors[rows], [now] * len(rows))
+    result = {"file": path, "vectors": len(rows), "persons": len(last), "queries": int(held.sum())}
+    result.update(bench_shortlists(vectors[held], shortlists))
+    return result
+
+
+def stub_embedder(rng):
+    """Replaces the DeepFace embedder with a random-vector stub."""
+    from embedder import embedder
+
+    def represent_batch(images):
+        return [rng.normal(size=DIM).tolist() for _ in images]
+
+    embedder.represent_batch = represent_batch
+    embedder.ready = True
+
+
+def bench_server(args, rng, jpeg):
+    from fastapi.testclient import TestClient
+    import server
+
+    results = {}
+    with TestClient(server.app) as client:
+        results["list_people"] = timed(
+            lambda: client.get("/list-people", params={"limit": 100}).raise_for_status(),
+            [()] * args.requests,
+        )
+
+        def recognize():
+            client.post("/recognize", files={"file": ("face.jpg", jpeg, "image/jpeg")}).raise_for_status()
+
+        results["recognize"] = timed(recognize, [()] * args.requests)
+
+        if args.concurrency > 1:
+            latencies = []
+
+            def one(_):
+                t0 = time.perf_counter()
+                recognize()
+                return time.perf_counter() - t0
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(args.concurrency) as executor:
+                latencies = list(executor.map(one, range(args.requests)))
+            results[f"recognize_concurrent_{args.concurrency}"] = summarize(latencies, time.perf_counter() - start)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the face recognition hot path")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="gallery sizes (vectors)")
+    parser.add_argument("--vectors-per-person", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=500, help="lookups per gallery size")
+    parser.add_argument("--inserts", type=int, default=200, help="insert-with-eviction calls per gallery size")
+    parser.add_argument("--requests", type=int, default=200, help="HTTP requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8, help="parallel /recognize clients (1 disables)")
+    parser.add_argument("--no-server", action="store_true", help="skip /list-people and /recognize")
+    parser.add_argument("--shortlists", type=int, nargs="*", default=[0, 16, 64, 256],
+                        help="prototype shortlist sizes to compare (0 = exact search)")
+    parser.add_argument("--embeddings", help="also compare shortlists on real embeddings (.npz with vectors, person_ids)")
+    parser.add_argument("--noise", type=float, default=0.15, help="spread of a person's vectors around their centroid")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    jpeg = None
+    if not args.no_server:
+        import cv2
+        stub_embedder(rng)
+        jpeg = cv2.imencode(".jpg", rng.integers(0, 255, (160, 160, 3), dtype=np.uint8))[1].tobytes()
+
+    runs = []
+    for size in args.sizes:
+        print(f"Gallery of {size} vectors...")
+        centroids, load_seconds = build_gallery(size, args.vectors_per_person, rng, args.noise)
+        queries = centroids[rng.integers(0, len(centroids), args.queries)]
+        queries = queries + rng.normal(scale=args.noise, size=queries.shape).astype(np.float32)
+
+        run = {"size": size, "persons": len(centroids), "gallery_load_s": round(load_seconds, 4)}
+        run["lookup"] = timed(face_db.search_person, [(q,) for q in queries])
+        if args.shortlists:
+            run["two_stage"] = bench_shortlists(queries, args.shortlists)
+        run["lookup_batch_32"] = timed(
+            face_db.search_persons, [(queries[i:i + 32],) for i in range(0, len(queries), 32)]
+        )
+        # Persons are full (vectors_per_person == max_vectors by default), so each insert evicts
+        targets = rng.integers(1, len(centroids) + 1, args.inserts)
+        run["insert_with_eviction"] = timed(
+            face_db.insert_vector_for_person,
+            [(int(p), rng.normal(size=DIM).astype(np.float32)) for p in targets],
+        )
+        # The same kind of writes through the bulk API, 1000 visits per transaction
+        batches = max(1, args.inserts // 100)
+        run["bulk_visits_1000"] = timed(
+            face_db.insert_vectors_for_persons,
+            [([(int(p), v) for p, v in zip(rng.integers(1, len(centroids) + 1, 1000),
+                                         rng.normal(size=(1000, DIM)).astype(np.float32))],)
+             for _ in range(batches)],
+        )
+        if not args.no_server:
+            run.update(bench_server(args, rng, jpeg))
+        runs.append(run)
+        print(json.dumps(run, indent=2))
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "dim": DIM,
+            "args": vars(args),
+        },
+        "results": runs,
+    }
+    if args.embeddings and args.shortlists:
+        print(f"Real embeddings from {args.embeddings}...")
+        report["embeddings"] = bench_embeddings(args.embeddings, args.shortlists)
+        print(json.dumps(report["embeddings"], indent=2))
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
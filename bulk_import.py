@@ -0,0 +1,115 @@
+"""
+Enrolls a folder of face photos through the bulk API.
+
+Each sub-folder is one person (its first usable photo enrolls them, the
+rest are added as visits); photos directly in the folder are one person
+each. Photos are embedded locally in batches, checked by the same quality
+gate as /recognize, and sent as NDJSON to /add-people and /update-visits:
+
+    python bulk_import.py photos/ --api-url http://localhost:8000 --output enrolled.json
+"""
+import argparse
+import json
+import os
+
+import cv2
+import requests
+
+from embedder import embedder
+from quality_gate import quality_gate
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+
+
+def find_people(root):
+    """{person label: [image paths]} for the folder layout described above."""
+    people = {}
+    for entry in sorted(os.scandir(root), key=lambda e: e.name):
+        if entry.is_dir():
+            paths = [
+                os.path.join(dirpath, name)
+                for dirpath, _, names in sorted(os.walk(entry.path))
+                for name in sorted(names)
+                if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+            ]
+            if paths:
+                people[entry.name] = paths
+        elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+            people[os.path.splitext(entry.name)[0]] = [entry.path]
+    return people
+
+
+def embed_all(people, batch_size):
+    """Embeds every photo in batches; returns {label: [vectors]} and {path: skip reason}."""
+    jobs = [(label, path) for label, paths in people.items() for path in paths]
+    vectors = {label: [] for label in people}
+    skipped = {}
+    for start in range(0, len(jobs), batch_size):
+        batch = []
+        for label, path in jobs[start:start + batch_size]:
+            image = cv2.imread(path)
+            reason = "unreadable" if image is None else quality_gate.check(image)
+            if reason is not None:
+                skipped[path] = reason
+            else:
+                batch.append((label, path, image))
+        for (label, path, _), vector in zip(batch, embedder.represent_batch([image for _, _, image in batch])):
+            if isinstance(vector, Exception):
+                skipped[path] = str(vector)
+            else:
+                vectors[label].append(vector)
+        print(f"Embedded {min(start + batch_size, len(jobs))}/{len(jobs)} photos")
+    return vectors, skipped
+
+
+def post_ndjson(session, url, records, chunk_size):
+    """Posts records in chunks; returns the parsed responses."""
+    responses = []
+    for start in range(0, len(records), chunk_size):
+        body = "\n".join(json.dumps(r) for r in records[start:start + chunk_size])
+        response = session.post(url, data=body, headers={"Content-Type": "application/x-ndjson"}, timeout=120)
+        response.raise_for_status()
+        responses.append(response.json())
+    return responses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-enroll a folder of face photos")
+    parser.add_argument("folder")
+    parser.add_argument("--api-url", default="http://localhost:8000")
+    parser.add_argument("--batch-size", type=int, default=32, help="photos embedded per batch")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="records per bulk request")
+    parser.add_argument("--max-vectors", type=int, default=10, help="photos kept per person (the server's limit)")
+    parser.add_argument("--output", help="write {label: person_id} here as JSON")
+    args = parser.parse_args()
+
+    people = find_people(args.folder)
+    print(f"Found {sum(len(p) for p in people.values())} photos of {len(people)} people")
+    embedder.load()
+    vectors, skipped = embed_all(people, args.batch_size)
+    for path, reason in skipped.items():
+        print(f"Skipped {path}: {reason}")
+
+    labels = [label for label in people if vectors[label]]
+    session = requests.Session()
+    person_ids = []
+    for response in post_ndjson(session, f"{args.api_url}/add-people", [{"vector": vectors[l][0]} for l in labels], args.chunk_size):
+        person_ids.extend(response["person_ids"])
+    enrolled = dict(zip(labels, person_ids))
+
+    # Only the newest max_vectors would survive eviction anyway
+    visits = [
+        {"person_id": enrolled[label], "vector": vector}
+        for label in labels
+        for vector in vectors[label][1:args.max_vectors]
+    ]
+    post_ndjson(session, f"{args.api_url}/update-visits", visits, args.chunk_size)
+    print(f"Enrolled {len(enrolled)} people with {len(visits)} extra photos, skipped {len(skipped)} photos")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(enrolled, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import logging
+import threading
+
+import numpy as np
+
+MODEL_NAME = "OpenFace"
+
+logger = logging.getLogger(__name__)
+
+
+def _deepface():
+    # Imported on first use: it pulls in TensorFlow, which scripts that only
+    # need face_db / the server plumbing (e.g. benchmark.py) can do without
+    from deepface import DeepFace
+    return DeepFace
+
+
+class Embedder:
+    """
+    Keeps the face embedding model resident so requests never pay for building it.
+    Residency comes from DeepFace's own model cache: build_model() fills it once
+    and every later DeepFace.represent call with the same model_name reuses it.
+    """
+
+    def __init__(self, model_name: str = MODEL_NAME):
+        self.model_name = model_name
+        self.ready = False
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Builds the model once and runs a warm-up inference. Safe to call repeatedly."""
+        with self._lock:
+            if self.ready:
+                return
+            _deepface().build_model(self.model_name)
+            self.warm_up()
+            self.ready = True
+            logger.info("Embedding model %s loaded", self.model_name)
+
+    def warm_up(self):
+        # A blank synthetic frame is enough to trace the graph and allocate buffers
+        image = np.zeros((160, 160, 3), dtype=np.uint8)
+        _deepface().represent(image, model_name=self.model_name, enforce_detection=False)
+
+    def represent_batch(self, images) -> list:
+        """
+        Embeds several images, one DeepFace.represent call per image (DeepFace
+        has no batched call here; batching saves the per-request overhead
+        around it). Returns one embedding per image, or the exception raised
+        for that image (e.g. no face detected).
+        """
+        if not self.ready:
+            self.load()
+        DeepFace = _deepface()
+        results = []
+        for image in images:
+            try:
+                results.append(DeepFace.represent(image, model_name=self.model_name)[0]["embedding"])
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+# Create a single instance to be used across the application
+embedder = Embedder()
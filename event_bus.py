@@ -0,0 +1,194 @@
+import asyncio
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process on a shared bus so it can skip its own events
+WORKER_ID = uuid.uuid4().hex[:12]
+
+
+class EventBus:
+    """
+    In-process pub/sub (the default, for a single uvicorn worker).
+
+    publish() is thread-safe and never blocks; handlers run on the event loop
+    (coroutine handlers as tasks). A handler subscribed with remote_only=True
+    only sees events published by *other* workers, for state the publishing
+    worker has already updated itself (e.g. its gallery index).
+    """
+
+    shared = False  # True when events reach other processes
+
+    def __init__(self):
+        self._handlers: dict = {}  # topic -> [(handler, remote_only)]
+        self._loop = None
+        self._tasks = set()  # coroutine handlers in flight (the loop only keeps weak references)
+        self.published = 0
+        self.received = 0
+
+    def subscribe(self, topic: str, handler, remote_only: bool = False):
+        handlers = self._handlers.setdefault(topic, [])
+        # Startup hooks may run more than once per process (e.g. under TestClient)
+        if (handler, remote_only) not in handlers:
+            handlers.append((handler, remote_only))
+
+    def publish(self, topic: str, data: dict):
+        self.published += 1
+        self._deliver(topic, data, remote=False)
+
+    def _deliver(self, topic: str, data: dict, remote: bool):
+        for handler, remote_only in self._handlers.get(topic, ()):
+            if remote_only and not remote:
+                continue
+            self._call(handler, data)
+
+    def _call(self, handler, data):
+        loop = self._loop
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop (scripts, benchmarks): plain handlers still run
+                if not asyncio.iscoroutinefunction(handler):
+                    self._run(handler, data)
+                return
+        loop.call_soon_threadsafe(self._run, handler, data)
+
+    def _run(self, handler, data):
+        try:
+            result = handler(data)
+            if asyncio.iscoroutine(result):
+                task = asyncio.get_running_loop().create_task(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        except Exception:
+            logger.exception("Event handler %r failed", handler)
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+
+    async def stop(self):
+        self._loop = None
+
+    def stats(self) -> dict:
+        return {"backend": type(self).__name__, "worker_id": WORKER_ID, "published": self.published, "received": self.received}
+
+
+class SQLiteEventBus(EventBus):
+    """
+    Cross-process bus for several workers on one box. Published events are
+    appended to a table in a shared SQLite file by a writer thread; every
+    worker polls for rows newer than the last one it has seen and delivers
+    those from other workers to its local handlers. Rows older than
+    retention_seconds are pruned.
+    """
+
+    shared = True
+
+    def __init__(self, path: str, poll_interval: float = 0.05, retention_seconds: float = 300.0):
+        super().__init__()
+        self.path = path
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self._outbox: queue.Queue = queue.Queue()
+        self._last_id = 0
+        self._poller = None
+        self._writer = None
+        self._read_conn = None
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS events (
+                event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                origin TEXT NOT NULL,
+                topic TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        return conn
+
+    def publish(self, topic: str, data: dict):
+        super().publish(topic, data)
+        self._outbox.put((WORKER_ID, topic, json.dumps(data, separators=(",", ":")), time.time()))
+
+    def _write_loop(self):
+        conn = self._connect()
+        last_prune = time.time()
+        while True:
+            rows = [self._outbox.get()]
+            if rows[0] is None:
+                return
+            # Everything published meanwhile goes in the same transaction
+            while not self._outbox.empty():
+                row = self._outbox.get_nowait()
+                if row is None:
+                    self._outbox.put(None)
+                    break
+                rows.append(row)
+            try:
+                with conn:
+                    conn.executemany("INSERT INTO events (origin, topic, payload, created) VALUES (?, ?, ?, ?)", rows)
+                    if time.time() - last_prune > self.retention_seconds / 10:
+                        conn.execute("DELETE FROM events WHERE created < ?", (time.time() - self.retention_seconds,))
+                        last_prune = time.time()
+            except sqlite3.Error:
+                logger.exception("Dropped %d events that could not be written to the bus", len(rows))
+
+    def _fetch(self):
+        return self._read_conn.execute(
+            "SELECT event_id, origin, topic, payload FROM events WHERE event_id > ? ORDER BY event_id",
+            (self._last_id,),
+        ).fetchall()
+
+    async def _poll(self):
+        while True:
+            try:
+                rows = await asyncio.to_thread(self._fetch)
+            except sqlite3.Error:
+                logger.exception("Polling the event bus failed")
+                rows = []
+            for event_id, origin, topic, payload in rows:
+                self._last_id = event_id
+                if origin != WORKER_ID:
+                    self.received += 1
+                    self._deliver(topic, json.loads(payload), remote=True)
+            await asyncio.sleep(self.poll_interval)
+
+    async def start(self):
+        await super().start()
+        self._read_conn = self._connect()
+        # Only events published from now on are delivered
+        self._last_id = self._read_conn.execute("SELECT COALESCE(MAX(event_id), 0) FROM events").fetchone()[0]
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+        self._poller = asyncio.get_running_loop().create_task(self._poll())
+
+    async def stop(self):
+        if self._poller is not None:
+            self._poller.cancel()
+        if self._writer is not None:
+            self._outbox.put(None)
+            await asyncio.to_thread(self._writer.join)
+        await super().stop()
+
+
+# Create a single instance to be used across the application
+if os.environ.get("EVENT_BUS", "memory") == "sqlite":
+    bus = SQLiteEventBus(
+        os.environ.get("EVENT_BUS_PATH", "local_events.db"),
+        poll_interval=float(os.environ.get("EVENT_BUS_POLL_MS", 50)) / 1000,
+    )
+else:
+    bus = EventBus()
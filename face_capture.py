@@ -1,19 +1,33 @@
+import argparse
+import itertools
+import json
+import queue
+import struct
+import threading
+import time
+
 import cv2
 import requests
-import time
-from face_db import get_conn, USE_LOCAL
 
 # Your server address - change accordingly
 API_URL = "http://localhost:8000/recognize"  # or server IP
+INGEST_URL = "ws://localhost:8000/ws/ingest"
 DEVICE_ID = "macbook-test"
 
-def send_face_to_server(face_image):
+MIN_TRACK_FRAMES = 3        # frames a face must be tracked before its first upload
+REFRESH_SECONDS = 10.0      # re-send a still-visible face this often
+IOU_THRESHOLD = 0.3         # min overlap for a detection to continue a track
+MAX_MISSED_FRAMES = 10      # frames a track survives without a detection
+UPLOAD_QUEUE_SIZE = 8       # pending uploads before new ones are dropped
+
+
+def send_face_to_server(face_image, session=None, api_url=API_URL, device_id=DEVICE_ID):
     _, img_encoded = cv2.imencode('.jpg', face_image)
     files = {'file': ('face.jpg', img_encoded.tobytes(), 'image/jpeg')}
-    params = {'device_id': DEVICE_ID}
+    params = {'device_id': device_id}
 
     try:
-        response = requests.post(API_URL, files=files, params=params, timeout=10)
+        response = (session or requests).post(api_url, files=files, params=params, timeout=10)
         response.raise_for_status()
         result = response.json()
         print("✅ Server response:", result)
@@ -22,41 +36,312 @@ def send_face_to_server(face_image):
         print("❌ Failed to send image:", e)
         return None
 
+
+def iou(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    ix = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    iy = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = ix * iy
+    union = aw * ah + bw * bh - inter
+    return inter / union if union else 0.0
+
+
+def face_quality(gray_crop):
+    """Bigger and sharper (Laplacian variance) crops score higher."""
+    h, w = gray_crop.shape[:2]
+    sharpness = cv2.Laplacian(gray_crop, cv2.CV_64F).var()
+    return w * h * min(sharpness, 500.0)
+
+
+class Track:
+    def __init__(self, track_id, box):
+        self.track_id = track_id
+        self.box = box
+        self.hits = 0
+        self.missed = 0
+        self.best_crop = None
+        self.best_score = -1.0
+        self.last_sent = None
+        self.status = None  # last server answer for this face
+
+    def observe(self, box, crop, score):
+        self.box = box
+        self.hits += 1
+        self.missed = 0
+        if score > self.best_score:
+            self.best_crop, self.best_score = crop, score
+
+
+class FaceTracker:
+    """
+    Lightweight IoU tracker: each face becomes a track, and only the best
+    crop of a track is uploaded (once it is stable, then every REFRESH_SECONDS).
+    """
+
+    def __init__(self):
+        self.tracks = []
+        self._ids = itertools.count(1)
+
+    def update(self, frame, gray, boxes, now):
+        """Matches detections to tracks; returns [(track, crop)] that should be uploaded."""
+        unmatched = list(boxes)
+        for track in self.tracks:
+            best = max(unmatched, key=lambda b: iou(track.box, b), default=None)
+            if best is not None and iou(track.box, best) >= IOU_THRESHOLD:
+                unmatched.remove(best)
+                self._observe(track, frame, gray, best)
+            else:
+                track.missed += 1
+        for box in unmatched:
+            track = Track(next(self._ids), box)
+            self._observe(track, frame, gray, box)
+            self.tracks.append(track)
+
+        uploads = []
+        alive = []
+        for track in self.tracks:
+            if track.missed > MAX_MISSED_FRAMES:
+                # Face left the frame: send it once if it was never sent
+                if track.last_sent is None and track.best_crop is not None:
+                    uploads.append((track, track.best_crop))
+                continue
+            alive.append(track)
+            due = track.last_sent is None or now - track.last_sent >= REFRESH_SECONDS
+            if track.missed == 0 and track.hits >= MIN_TRACK_FRAMES and due:
+                uploads.append((track, track.best_crop))
+                track.last_sent = now
+                track.best_crop, track.best_score = None, -1.0  # collect a fresh best for the refresh
+        self.tracks = alive
+        return [(t, c) for t, c in uploads if c is not None]
+
+    @staticmethod
+    def _observe(track, frame, gray, box):
+        x, y, w, h = box
+        track.observe(box, frame[y:y+h, x:x+w].copy(), face_quality(gray[y:y+h, x:x+w]))
+
+    def flush(self):
+        """Crops of tracks that were never uploaded (end of input)."""
+        return [(t, t.best_crop) for t in self.tracks if t.last_sent is None and t.best_crop is not None]
+
+
+class FrameReader(threading.Thread):
+    """
+    Capture thread. For a live camera only the latest frame is kept so the
+    pipeline never lags behind; video files are read without dropping frames.
+    """
+
+    def __init__(self, source):
+        super().__init__(daemon=True)
+        self.is_file = not str(source).isdigit()
+        self.cap = cv2.VideoCapture(source if self.is_file else int(source))
+        self.frames = queue.Queue(maxsize=4 if self.is_file else 1)
+        self.finished = threading.Event()
+
+    def run(self):
+        try:
+            while True:
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+                # Video files use their own clock so runs are reproducible
+                now = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000 if self.is_file else time.monotonic()
+                if self.is_file:
+                    self.frames.put((now, frame))
+                else:
+                    try:
+                        self.frames.get_nowait()  # drop the stale frame
+                    except queue.Empty:
+                        pass
+                    self.frames.put((now, frame))
+        finally:
+            self.cap.release()
+            self.finished.set()
+
+
+class Uploader(threading.Thread):
+    """Sends face crops over one keep-alive session, off the capture/preview path."""
+
+    def __init__(self, api_url=API_URL, device_id=DEVICE_ID):
+        super().__init__(daemon=True)
+        self.api_url = api_url
+        self.device_id = device_id
+        self.session = requests.Session()
+        self.pending = queue.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+        self.sent = 0
+        self.dropped = 0
+
+    def submit(self, track, crop):
+        try:
+            self.pending.put_nowait((track, crop))
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        while True:
+            item = self.pending.get()
+            try:
+                if item is None:
+                    return
+                track, crop = item
+                result = send_face_to_server(crop, self.session, self.api_url, self.device_id)
+                self.sent += 1
+                if result is not None:
+                    track.status = result.get("status")
+            finally:
+                self.pending.task_done()
+
+    def close(self):
+        self.pending.put(None)
+        self.join()
+        self.session.close()
+
+
+class StreamUploader(threading.Thread):
+    """
+    Streams face crops over one persistent /ws/ingest socket (see ingest.py for
+    the protocol). Keeps at most the server's max_in_flight frames outstanding
+    and pauses when the server answers slow_down.
+    """
+
+    def __init__(self, ingest_url=INGEST_URL, device_id=DEVICE_ID):
+        super().__init__(daemon=True)
+        from websockets.sync.client import connect  # only needed for --transport ws
+
+        self.ws = connect(ingest_url)
+        self.ws.send(json.dumps({"device_id": device_id}))
+        ready = json.loads(self.ws.recv(timeout=10))
+        self.max_in_flight = ready.get("max_in_flight", 1)
+        self.pending = queue.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+        self.awaiting = {}  # seq -> track
+        self.window = threading.Condition()
+        self.paused_until = 0.0
+        self._seq = itertools.count()
+        self.sent = 0
+        self.dropped = 0
+        self.receiver = threading.Thread(target=self._receive, daemon=True)
+
+    def submit(self, track, crop):
+        try:
+            self.pending.put_nowait((track, crop))
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        self.receiver.start()
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            track, crop = item
+            with self.window:
+                while len(self.awaiting) >= self.max_in_flight or time.monotonic() < self.paused_until:
+                    self.window.wait(timeout=max(0.01, self.paused_until - time.monotonic()))
+                seq = next(self._seq) & 0xFFFFFFFF
+                self.awaiting[seq] = track
+            _, img_encoded = cv2.imencode('.jpg', crop)
+            try:
+                self.ws.send(struct.pack(">I", seq) + img_encoded.tobytes())
+                self.sent += 1
+            except Exception as e:
+                print("❌ Failed to stream image:", e)
+                return
+
+    def _receive(self):
+        try:
+            for message in self.ws:
+                reply = json.loads(message)
+                with self.window:
+                    track = self.awaiting.pop(reply.get("seq"), None)
+                    if reply["type"] == "slow_down":
+                        self.dropped += 1
+                        self.paused_until = time.monotonic() + reply.get("retry_after_ms", 250) / 1000
+                    self.window.notify_all()
+                if reply["type"] == "result":
+                    print("✅ Server response:", reply)
+                    if track is not None:
+                        track.status = reply["status"]
+                elif reply["type"] == "error":
+                    print("❌ Server error:", reply.get("detail"))
+        except Exception:
+            pass  # socket closed
+
+    def close(self):
+        self.pending.put(None)
+        self.join()
+        # Give outstanding frames a moment to be answered
+        deadline = time.monotonic() + 5
+        with self.window:
+            while self.awaiting and time.monotonic() < deadline:
+                self.window.wait(timeout=0.1)
+        self.ws.close()
+
+
+STATUS_COLORS = {"green": (0, 255, 0), "yellow": (0, 255, 255), "red": (0, 0, 255)}
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Detect faces and send them to the recognition server")
+    parser.add_argument("--source", default="0", help="camera index or path to a video file")
+    parser.add_argument("--api-url", default=API_URL)
+    parser.add_argument("--transport", choices=["http", "ws"], default="http",
+                        help="one POST per face, or stream faces over a persistent websocket")
+    parser.add_argument("--ingest-url", default=INGEST_URL)
+    parser.add_argument("--device-id", default=DEVICE_ID)
+    parser.add_argument("--headless", action="store_true", help="don't open a preview window")
+    args = parser.parse_args()
+
     # Load face detection model
     face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
 
-    # Open laptop camera
-    cap = cv2.VideoCapture(0)
-
-    if not cap.isOpened():
+    reader = FrameReader(args.source)
+    if not reader.cap.isOpened():
         print("❌ Cannot open camera")
         return
+    if args.transport == "ws":
+        uploader = StreamUploader(args.ingest_url, args.device_id)
+    else:
+        uploader = Uploader(args.api_url, args.device_id)
+    tracker = FaceTracker()
+    reader.start()
+    uploader.start()
 
-    print("📷 Starting live camera. Press 'q' to quit.")
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            print("❌ Failed to grab frame")
-            break
+    print("📷 Starting capture. Press 'q' to quit.")
+    frames = 0
+    while not (reader.finished.is_set() and reader.frames.empty()):
+        try:
+            now, frame = reader.frames.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        frames += 1
 
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         faces = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5)
 
-        for (x, y, w, h) in faces:
-            face_img = frame[y:y+h, x:x+w]
-            cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
-            print("📤 Face detected. Sending to server...")
-            send_face_to_server(face_img)
-            time.sleep(1.5)  # to avoid flooding the server
+        for track, crop in tracker.update(frame, gray, [tuple(int(v) for v in f) for f in faces], now):
+            print(f"📤 Sending face of track {track.track_id}")
+            uploader.submit(track, crop)
+
+        if not args.headless:
+            for track in tracker.tracks:
+                if track.missed:
+                    continue
+                x, y, w, h = track.box
+                color = STATUS_COLORS.get(track.status, (255, 255, 255))
+                cv2.rectangle(frame, (x, y), (x+w, y+h), color, 2)
+                cv2.putText(frame, f"#{track.track_id}", (x, y - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
+            # Display the image with the frame
+            cv2.imshow("Face Capture (Press 'q' to quit)", frame)
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
 
-        # Display the image with the frame
-        cv2.imshow("Face Capture (Press 'q' to quit)", frame)
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
+    for track, crop in tracker.flush():
+        uploader.submit(track, crop)
+    uploader.close()
+    print(f"Processed {frames} frames, sent {uploader.sent} faces, dropped {uploader.dropped}")
 
-    cap.release()
-    cv2.destroyAllWindows()
+    if not args.headless:
+        cv2.destroyAllWindows()
 
 if __name__ == "__main__":
     main()
@@ -1,141 +1,689 @@
-import psycopg2
-from psycopg2.extras import RealDictCursor
 from datetime import datetime
-import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+import logging
 
 #for local testing:
 import sqlite3
 import os
+import threading
+import time
+import numpy as np
+from gallery_index import GalleryIndex
+from event_bus import bus
+import metrics
 
-USE_LOCAL = True  # שנה ל־False אם חוזרים לדאטהבייס בענן
+logger = logging.getLogger(__name__)
+
+class Match(NamedTuple):
+    """One search candidate. score is cosine similarity locally and L2 distance on Postgres."""
+    person_id: int
+    score: float
+    last_seen: Optional[datetime]
+    matched: bool
+
+
+class InvalidVectorError(ValueError):
+    """A vector whose length is not the stored embedding size; raised before anything is written."""
+
+
+class UnknownPersonError(ValueError):
+    """A visit for a person_id that is not stored; raised before anything is written."""
+
+
+def _check_vectors(vectors, dim: int):
+    for vector in vectors:
+        if len(vector) != dim:
+            raise InvalidVectorError(f"Expected a vector of length {dim}, got {len(vector)}")
+
+
+# Length of the stored embeddings (OpenFace); a local gallery that already holds vectors uses theirs
+EMBEDDING_DIM = int(os.environ.get("EMBEDDING_DIM", 128))
+
+USE_LOCAL = os.environ.get("FACE_DB_BACKEND", "local") == "local"  # שנה ל־False אם חוזרים לדאטהבייס בענן (FACE_DB_BACKEND=postgres)
+
+# Connection pool settings (Postgres pool size / whether to ping connections on checkout)
+POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN", 1))
+POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX", 10))
+POOL_HEALTH_CHECK = os.environ.get("DB_POOL_HEALTH_CHECK", "1") == "1"
+# Seconds to wait for a free pooled connection before giving up
+POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", 30))
 
 if USE_LOCAL:
-    DB_PATH = "local_faces.db"
+    DB_PATH = os.environ.get("FACE_DB_PATH", "local_faces.db")
+    _thread_conns = threading.local()
+
+    def _connect():
+        conn = sqlite3.connect(DB_PATH, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")      # readers don't block the writer
+        conn.execute("PRAGMA synchronous=NORMAL")    # safe with WAL, far fewer fsyncs
+        conn.execute("PRAGMA cache_size=-16000")     # ~16MB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
 
     def get_conn():
-        return sqlite3.connect(DB_PATH)
+        """
+        Returns this thread's persistent connection, opening it on first use.
+        `with get_conn() as conn:` commits/rolls back but keeps it open.
+        """
+        conn = getattr(_thread_conns, "conn", None)
+        if conn is not None and POOL_HEALTH_CHECK:
+            try:
+                conn.execute("SELECT 1")
+            except sqlite3.Error:
+                conn = None
+        if conn is None:
+            conn = _connect()
+            _thread_conns.conn = conn
+        return conn
+
+    def _create_base_tables(conn):
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS persons (
+                person_id INTEGER PRIMARY KEY AUTOINCREMENT
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS vectors (
+                vector_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                person_id INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_checked TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (person_id) REFERENCES persons(person_id)
+            )
+        ''')
+
+    def _add_person_summary(conn):
+        # persons gets a summary kept up to date by the insert functions
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(persons)")}
+        if "last_seen" not in columns:
+            conn.execute("ALTER TABLE persons ADD COLUMN last_seen TIMESTAMP")
+        if "vector_count" not in columns:
+            conn.execute("ALTER TABLE persons ADD COLUMN vector_count INTEGER NOT NULL DEFAULT 0")
+        conn.execute("""
+            UPDATE persons SET
+                last_seen = (SELECT MAX(last_checked) FROM vectors WHERE vectors.person_id = persons.person_id),
+                vector_count = (SELECT COUNT(*) FROM vectors WHERE vectors.person_id = persons.person_id)
+        """)
+        conn.execute('CREATE INDEX IF NOT EXISTS vectors_person_last_checked_idx ON vectors (person_id, last_checked)')
+        conn.execute('CREATE INDEX IF NOT EXISTS persons_last_seen_idx ON persons (last_seen)')
+
+    def _convert_text_vectors(conn):
+        return migrate_vector_storage(conn) > 0
+
+    # Schema migrations, applied in order; PRAGMA user_version records how many have run.
+    # Append new steps at the end, never edit or reorder existing ones. A step that
+    # returns True rewrote enough rows that the file is VACUUMed once they are committed.
+    MIGRATIONS = [
+        _create_base_tables,
+        _add_person_summary,
+        _convert_text_vectors,
+    ]
 
     def create_tables():
-        with get_conn() as conn:
-            # Drop existing tables to recreate with new schema
-            conn.execute('DROP TABLE IF EXISTS vectors')
-            conn.execute('DROP TABLE IF EXISTS persons')
-            
-            # Create persons table (just IDs)
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS persons (
-                    person_id INTEGER PRIMARY KEY AUTOINCREMENT
-                )
-            ''')
-            
-            # Create vectors table
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS vectors (
-                    vector_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    person_id INTEGER NOT NULL,
-                    vector TEXT NOT NULL,
-                    last_checked TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (person_id) REFERENCES persons(person_id)
-                )
-            ''')
+        """Brings the schema up to date without touching existing data (safe to call on every start)."""
+        conn = get_conn()
+        # IMMEDIATE takes the write lock up front, so concurrently starting workers migrate one at a time
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            vacuum = False
+            for step, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+                vacuum = bool(migration(conn)) or vacuum
+                conn.execute(f"PRAGMA user_version = {step}")
+                logger.info("Applied schema migration %d (%s)", step, migration.__name__)
             conn.commit()
-            print("✅ Database tables created successfully")
-    
-    def cosine_similarity(v1, v2):
-        dot = sum(a*b for a, b in zip(v1, v2))
-        norm1 = math.sqrt(sum(a*a for a in v1))
-        norm2 = math.sqrt(sum(b*b for b in v2))
-        if norm1 == 0 or norm2 == 0:
+        except BaseException:
+            conn.rollback()
+            raise
+        if vacuum:
+            # Outside the transaction: VACUUM can't run inside one
+            conn.execute("VACUUM")
+            logger.info("Vacuumed %s", DB_PATH)
+
+    # Vectors are stored as raw float32 bytes (4 bytes per dimension)
+    def vector_to_blob(vector) -> bytes:
+        return np.asarray(vector, dtype=np.float32).tobytes()
+
+    def blob_to_vector(blob: bytes) -> np.ndarray:
+        return np.frombuffer(blob, dtype=np.float32)
+
+    def migrate_vector_storage(conn):
+        """
+        Converts comma-separated TEXT vectors (old format) to float32 BLOBs, in the
+        caller's transaction. Returns how many rows were converted.
+        """
+        rows = conn.execute("SELECT vector_id, vector FROM vectors WHERE typeof(vector) = 'text'").fetchall()
+        if not rows:
             return 0
-        return dot / (norm1 * norm2)
+        conn.executemany(
+            "UPDATE vectors SET vector = ? WHERE vector_id = ?",
+            [(vector_to_blob(np.array(vec_str.split(','), dtype=np.float32)), vector_id) for vector_id, vec_str in rows],
+        )
+        logger.info("Migrated %d vectors to binary storage", len(rows))
+        return len(rows)
+
+    # In-memory copy of the vectors table, kept in sync by the insert functions below.
+    # Exact search by default; GALLERY_SHORTLIST > 0 matches against per-person prototypes
+    # first and re-scores only that many people's vectors exactly, which can miss matches.
+    gallery = GalleryIndex(shortlist=int(os.environ.get("GALLERY_SHORTLIST", 0)))
+
+    _gallery_loaded = threading.Event()
+    _gallery_lock = threading.Lock()
+    # Serializes local writes through to their gallery update, so evictions reach the index in commit order
+    _write_lock = threading.Lock()
+    # gallery_changed events from other workers that arrive while the gallery is (re)loading
+    _pending_changes = []
+    _pending_lock = threading.Lock()
+
+    def load_gallery():
+        """(Re)loads every stored vector into the in-memory gallery index."""
+        with get_conn() as conn:
+            rows = conn.execute("""
+                SELECT v.vector_id, v.person_id, v.vector, v.last_checked
+                FROM vectors v
+                INNER JOIN persons p ON v.person_id = p.person_id
+            """).fetchall()
+        if rows:
+            # Rows of another length (e.g. written by a different model) would break the matrix below
+            size = EMBEDDING_DIM * 4
+            if not any(len(r[2]) == size for r in rows):
+                size = Counter(len(r[2]) for r in rows).most_common(1)[0][0]
+            bad = [r[0] for r in rows if len(r[2]) != size]
+            if bad:
+                logger.warning("Skipping %d vectors that are not %d-dimensional: %s", len(bad), size // 4, bad[:20])
+                rows = [r for r in rows if len(r[2]) == size]
+        # One contiguous buffer -> [n, dim] matrix without per-row parsing
+        vectors = blob_to_vector(b"".join(r[2] for r in rows)).reshape(len(rows), -1) if rows else []
+        gallery.load(
+            [r[0] for r in rows],
+            [r[1] for r in rows],
+            vectors,
+            [datetime.fromisoformat(r[3]) for r in rows],
+        )
+        with _pending_lock:
+            pending = _pending_changes[:]
+            _pending_changes.clear()
+            _gallery_loaded.set()
+        # The load may have read the table before some of these were committed
+        for change in pending:
+            _apply_gallery_change(change)
+        logger.info("Loaded %d vectors into the gallery index", len(gallery))
+
+    def ensure_gallery():
+        """Loads the gallery on first use; the server does this in the background at startup."""
+        if _gallery_loaded.is_set():
+            return
+        with _gallery_lock:
+            if not _gallery_loaded.is_set():
+                load_gallery()
+
+    def is_ready() -> bool:
+        return _gallery_loaded.is_set()
+
+    def warm_up():
+        ensure_gallery()
+
+    def embedding_dim() -> int:
+        return gallery.dim or EMBEDDING_DIM
+
+    def _resync_gallery():
+        # The DB write is already committed: rebuild the index from it rather than fail the caller
+        logger.exception("Gallery update failed, reloading it from the database")
+        try:
+            with _gallery_lock:
+                load_gallery()
+        except Exception:
+            _gallery_loaded.clear()  # retried on next use
+            logger.exception("Reloading the gallery failed")
 
     def insert_new_person(vector: list[float]):
         """Inserts a new person + their first vector, returns person_id."""
-        vector_str = ",".join(map(str, vector))
-        with get_conn() as conn:
-            # Create new person
-            cursor = conn.execute("INSERT INTO persons DEFAULT VALUES")
-            person_id = cursor.lastrowid
+        ensure_gallery()  # a load running concurrently could miss this insert
+        _check_vectors([vector], embedding_dim())
+        vector_blob = vector_to_blob(vector)
+        now = datetime.utcnow()
+        with _write_lock:
+            with metrics.stage("db_write"), get_conn() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                # Create new person
+                cursor = conn.execute("INSERT INTO persons (last_seen, vector_count) VALUES (?, 1)", (now.isoformat(" "),))
+                person_id = cursor.lastrowid
             
-            # Insert vector
-            conn.execute("""
-                INSERT INTO vectors (person_id, vector)
-                VALUES (?, ?)
-            """, (person_id, vector_str))
+                # Insert vector
+                cursor = conn.execute("""
+                    INSERT INTO vectors (person_id, vector, last_checked)
+                    VALUES (?, ?, ?)
+                """, (person_id, vector_blob, now.isoformat(" ")))
+                vector_id = cursor.lastrowid
             
-            conn.commit()
-            print(f"Successfully added new person with ID {person_id}")
-            return person_id
+                conn.commit()
+            try:
+                gallery.add(vector_id, person_id, vector, now)
+            except Exception:
+                _resync_gallery()
+        bus.publish("gallery_changed", {"person_id": person_id, "added": [vector_id], "removed": []})
+        logger.info("Added new person %s", person_id)
+        return person_id
 
     def insert_vector_for_person(person_id: int, vector: list[float], max_vectors: int = 10):
         """Inserts a vector for an existing person_id. If person has >= max_vectors, deletes oldest vector."""
-        vector_str = ",".join(map(str, vector))
-        with get_conn() as conn:
-            # Count vectors for this person
-            cursor = conn.execute("SELECT COUNT(*) FROM vectors WHERE person_id = ?", (person_id,))
-            vector_count = cursor.fetchone()[0]
+        person_id = int(person_id)
+        ensure_gallery()
+        _check_vectors([vector], embedding_dim())
+        vector_blob = vector_to_blob(vector)
+        now = datetime.utcnow()
+        evicted_id = None
+        with _write_lock:
+            with metrics.stage("db_write"), get_conn() as conn:
+                # IMMEDIATE takes the write lock before the count is read, so another process can't evict in between
+                conn.execute("BEGIN IMMEDIATE")
+                # Count vectors for this person
+                row = conn.execute("SELECT vector_count FROM persons WHERE person_id = ?", (person_id,)).fetchone()
+                if row is None:
+                    raise UnknownPersonError(f"Unknown person_id {person_id}")
+                vector_count = row[0]
             
-            if vector_count >= max_vectors:
-                # Delete oldest vector
-                conn.execute("""
-                    DELETE FROM vectors
-                    WHERE vector_id = (
+                if vector_count >= max_vectors:
+                    # Delete oldest vector (remember its id so the gallery can drop it too)
+                    evicted_id = conn.execute("""
                         SELECT vector_id FROM vectors
                         WHERE person_id = ?
-                        ORDER BY last_checked ASC
+                        ORDER BY last_checked ASC, vector_id ASC
                         LIMIT 1
-                    )
-                """, (person_id,))
+                    """, (person_id,)).fetchone()[0]
+                    conn.execute("DELETE FROM vectors WHERE vector_id = ?", (evicted_id,))
             
-            # Insert new vector
-            conn.execute("""
-                INSERT INTO vectors (person_id, vector)
-                VALUES (?, ?)
-            """, (person_id, vector_str))
+                # Insert new vector
+                cursor = conn.execute("""
+                    INSERT INTO vectors (person_id, vector, last_checked)
+                    VALUES (?, ?, ?)
+                """, (person_id, vector_blob, now.isoformat(" ")))
+                vector_id = cursor.lastrowid
+
+                conn.execute("""
+                    UPDATE persons SET last_seen = ?, vector_count = ?
+                    WHERE person_id = ?
+                """, (now.isoformat(" "), vector_count + (0 if evicted_id is not None else 1), person_id))
             
-            conn.commit()
-            print(f"Successfully added new vector for person {person_id}")
+                conn.commit()
+            try:
+                if evicted_id is not None:
+                    gallery.remove(evicted_id)
+                gallery.add(vector_id, person_id, vector, now)
+            except Exception:
+                _resync_gallery()
+        bus.publish("gallery_changed", {"person_id": person_id, "added": [vector_id], "removed": [evicted_id] if evicted_id is not None else []})
+        logger.info("Added new vector for person %s", person_id)
+
+    # Remote changes are applied on one background thread, in arrival order: the DB reads and
+    # index updates for a bulk enrollment elsewhere must not stall this worker's event loop
+    _gallery_sync = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gallery-sync")
+
+    def apply_gallery_change(change: dict):
+        """Patches the gallery with vectors another worker added/evicted (they are already in the shared DB)."""
+        _gallery_sync.submit(_receive_gallery_change, change)
+
+    def _receive_gallery_change(change: dict):
+        with _pending_lock:
+            if not _gallery_loaded.is_set():
+                _pending_changes.append(change)  # replayed once the load finishes
+                return
+        try:
+            _apply_gallery_change(change)
+        except Exception:
+            _resync_gallery()
+
+    def _apply_gallery_change(change: dict, chunk: int = 500):
+        for vector_id in change["removed"] + change["added"]:
+            gallery.remove(vector_id)  # also makes re-adding idempotent
+        rows = []
+        with get_conn() as conn:
+            # In chunks: SQLite caps the number of bound parameters per statement
+            for start in range(0, len(change["added"]), chunk):
+                ids = change["added"][start:start + chunk]
+                rows += conn.execute(f"""
+                    SELECT vector_id, person_id, vector, last_checked FROM vectors
+                    WHERE vector_id IN ({",".join("?" * len(ids))})
+                """, ids).fetchall()
+        # A vector evicted again since then is simply no longer there
+        for vector_id, person_id, blob, last_checked in rows:
+            gallery.add(vector_id, person_id, blob_to_vector(blob), datetime.fromisoformat(last_checked))
+
+    bus.subscribe("gallery_changed", apply_gallery_change, remote_only=True)
+
+    def insert_new_persons(vectors) -> list[int]:
+        """Bulk insert_new_person: one person per vector in one transaction; returns their person_ids in order."""
+        if not len(vectors):
+            return []
+        ensure_gallery()
+        _check_vectors(vectors, embedding_dim())
+        now = datetime.utcnow()
+        stamp = now.isoformat(" ")
+        with _write_lock:
+            with metrics.stage("db_write"), get_conn() as conn:
+                # IMMEDIATE holds the write lock, so the new rows are exactly those above the current max ids
+                conn.execute("BEGIN IMMEDIATE")
+                first_person = conn.execute("SELECT COALESCE(MAX(person_id), 0) FROM persons").fetchone()[0]
+                first_vector = conn.execute("SELECT COALESCE(MAX(vector_id), 0) FROM vectors").fetchone()[0]
+                conn.executemany("INSERT INTO persons (last_seen, vector_count) VALUES (?, 1)", [(stamp,)] * len(vectors))
+                person_ids = [r[0] for r in conn.execute(
+                    "SELECT person_id FROM persons WHERE person_id > ? ORDER BY person_id", (first_person,))]
+                conn.executemany(
+                    "INSERT INTO vectors (person_id, vector, last_checked) VALUES (?, ?, ?)",
+                    [(person_id, vector_to_blob(vector), stamp) for person_id, vector in zip(person_ids, vectors)],
+                )
+                vector_ids = [r[0] for r in conn.execute(
+                    "SELECT vector_id FROM vectors WHERE vector_id > ? ORDER BY vector_id", (first_vector,))]
+            try:
+                for vector_id, person_id, vector in zip(vector_ids, person_ids, vectors):
+                    gallery.add(vector_id, person_id, vector, now)
+            except Exception:
+                _resync_gallery()
+        bus.publish("gallery_changed", {"person_ids": person_ids, "added": vector_ids, "removed": []})
+        logger.info("Added %d new persons", len(person_ids))
+        return person_ids
+
+    def insert_vectors_for_persons(visits, max_vectors: int = 10):
+        """
+        Bulk insert_vector_for_person for [(person_id, vector)] in one transaction.
+        Eviction is done set-wise afterwards: each affected person keeps only their
+        max_vectors newest vectors. Raises UnknownPersonError (and writes nothing) if any
+        person_id is unknown.
+        """
+        if not len(visits):
+            return
+        ensure_gallery()
+        visits = [(int(person_id), vector) for person_id, vector in visits]
+        _check_vectors([vector for _, vector in visits], embedding_dim())
+        persons = sorted({person_id for person_id, _ in visits})
+        now = datetime.utcnow()
+        stamp = now.isoformat(" ")
+        with _write_lock:
+            with metrics.stage("db_write"), get_conn() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS batch_persons (person_id INTEGER PRIMARY KEY)")
+                conn.execute("DELETE FROM batch_persons")
+                conn.executemany("INSERT INTO batch_persons VALUES (?)", [(p,) for p in persons])
+                unknown = [r[0] for r in conn.execute(
+                    "SELECT person_id FROM batch_persons WHERE person_id NOT IN (SELECT person_id FROM persons)")]
+                if unknown:
+                    raise UnknownPersonError(f"Unknown person_id(s) {unknown[:10]}")
+                first_vector = conn.execute("SELECT COALESCE(MAX(vector_id), 0) FROM vectors").fetchone()[0]
+                conn.executemany(
+                    "INSERT INTO vectors (person_id, vector, last_checked) VALUES (?, ?, ?)",
+                    [(person_id, vector_to_blob(vector), stamp) for person_id, vector in visits],
+                )
+                inserted = [r[0] for r in conn.execute(
+                    "SELECT vector_id FROM vectors WHERE vector_id > ? ORDER BY vector_id", (first_vector,))]
+                # Everything beyond each person's max_vectors newest vectors goes, in one statement
+                evicted = [r[0] for r in conn.execute("""
+                    SELECT vector_id FROM (
+                        SELECT vector_id, ROW_NUMBER() OVER (
+                            PARTITION BY person_id ORDER BY last_checked DESC, vector_id DESC
+                        ) AS newest
+                        FROM vectors WHERE person_id IN (SELECT person_id FROM batch_persons)
+                    ) WHERE newest > ?
+                """, (max_vectors,))]
+                conn.executemany("DELETE FROM vectors WHERE vector_id = ?", [(v,) for v in evicted])
+                conn.execute("""
+                    UPDATE persons SET
+                        last_seen = ?,
+                        vector_count = (SELECT COUNT(*) FROM vectors WHERE vectors.person_id = persons.person_id)
+                    WHERE person_id IN (SELECT person_id FROM batch_persons)
+                """, (stamp,))
+            evicted_set = set(evicted)
+            added = [vector_id for vector_id in inserted if vector_id not in evicted_set]
+            try:
+                for vector_id in evicted:
+                    gallery.remove(vector_id)
+                for vector_id, (person_id, vector) in zip(inserted, visits):
+                    if vector_id not in evicted_set:
+                        gallery.add(vector_id, person_id, vector, now)
+            except Exception:
+                _resync_gallery()
+        bus.publish("gallery_changed", {"person_ids": persons, "added": added, "removed": [v for v in evicted if v <= first_vector]})
+        logger.info("Added %d vectors for %d persons (%d evicted)", len(visits), len(persons), len(evicted))
+
+    def list_persons(limit: int = 100, after: Optional[int] = None, since: Optional[datetime] = None):
+        """
+        One page of the persons summary, ordered by person_id.
+        after: last person_id of the previous page; since: only persons seen after this (UTC) time.
+        Returns [(person_id, last_seen, vector_count)].
+        """
+        query = "SELECT person_id, last_seen, vector_count FROM persons WHERE person_id > ?"
+        params = [after or 0]
+        if since is not None:
+            query += " AND last_seen > ?"
+            params.append(since.isoformat(" "))
+        query += " ORDER BY person_id LIMIT ?"
+        params.append(limit)
+        with get_conn() as conn:
+            return conn.execute(query, params).fetchall()
+
+    def search_persons(vectors, k: int = 5, threshold: float = 0.93):
+        """
+        Batch top-k search over the in-memory gallery index.
+        Returns one list of Match per query vector, best first.
+        """
+        ensure_gallery()
+        results = []
+        with metrics.stage("gallery_search"):
+            found = gallery.search(vectors, k)
+        for candidates in found:
+            results.append([
+                Match(person_id, similarity, gallery.last_seen(person_id), similarity >= threshold)
+                for person_id, similarity in candidates
+            ])
+        return results
+
+    def search_person(vector: list[float], k: int = 5, threshold: float = 0.93):
+        """Top-k candidates for a single vector, best first."""
+        return search_persons([vector], k, threshold)[0]
 
     def check_person_exists(vector: list[float], threshold: float = 0.93):
         """
-        Compares input vector with stored vectors in local DB.
+        Compares input vector with the in-memory gallery index.
         Returns:
         ("found", last_seen_date, person_id)
         or
         ("not found", None, None)
         """
-        with get_conn() as conn:
-            rows = conn.execute("""
-                SELECT v.person_id, v.vector, v.last_checked
-                FROM vectors v
-                INNER JOIN persons p ON v.person_id = p.person_id
-            """).fetchall()
-            
-            for row in rows:
-                person_id, vec_str, last_checked = row
-                stored_vector = list(map(float, vec_str.split(',')))
-                similarity = cosine_similarity(vector, stored_vector)
-                if similarity >= threshold:
-                    return ("found", datetime.fromisoformat(last_checked), person_id)
-            return ("not found", None, None)
+        candidates = search_person(vector, 1, threshold)
+        if candidates and candidates[0].matched:
+            return ("found", candidates[0].last_seen, candidates[0].person_id)
+        return ("not found", None, None)
 
     create_tables()
 
 else:
 #original code
+    # The driver is only needed (and only has to be installed) for this backend
+    import psycopg2
+    import psycopg2.pool
+    from psycopg2.extras import execute_values
 
 
     # === CONFIGURATION ===
     DB_CONFIG = {
-    "host": "face-db-public.cluster-cnks2uk809i8.eu-north-1.rds.amazonaws.com",
-    "port": 5432,
-    "dbname": "postgres",
-    "user": "postgres",
-    "password": "AmitMatanShahar3"
+    "host": os.environ.get("PGHOST", "face-db-public.cluster-cnks2uk809i8.eu-north-1.rds.amazonaws.com"),
+    "port": int(os.environ.get("PGPORT", 5432)),
+    "dbname": os.environ.get("PGDATABASE", "postgres"),
+    "user": os.environ.get("PGUSER", "postgres"),
+    "password": os.environ.get("PGPASSWORD", "AmitMatanShahar3")
 }
 
+    # pgvector ANN index: "hnsw" or "ivfflat"
+    VECTOR_INDEX = os.environ.get("PG_VECTOR_INDEX", "hnsw")
+    HNSW_M = int(os.environ.get("PG_HNSW_M", 16))
+    HNSW_EF_CONSTRUCTION = int(os.environ.get("PG_HNSW_EF_CONSTRUCTION", 64))
+    HNSW_EF_SEARCH = int(os.environ.get("PG_HNSW_EF_SEARCH", 100))
+    IVFFLAT_LISTS = int(os.environ.get("PG_IVFFLAT_LISTS", 100))
+    IVFFLAT_PROBES = int(os.environ.get("PG_IVFFLAT_PROBES", 10))
+    # Nearest vectors fetched per requested person (a person has up to 10 vectors)
+    KNN_CANDIDATES_PER_PERSON = int(os.environ.get("PG_KNN_CANDIDATES_PER_PERSON", 10))
+
+    # Search-time index parameters are set once per pooled session
+    DB_CONFIG["options"] = f"-c hnsw.ef_search={HNSW_EF_SEARCH} -c ivfflat.probes={IVFFLAT_PROBES}"
+
+    _pool = None
+    _pool_lock = threading.Lock()
+    # One slot per pooled connection: getconn() raises instead of waiting when the pool is exhausted
+    _pool_slots = threading.BoundedSemaphore(POOL_MAX_SIZE)
+
+    class PooledConnection:
+        """
+        A pooled psycopg2 connection. close() hands it back to the pool instead
+        of closing it, and `with` commits/rolls back and then hands it back.
+        """
+
+        def __init__(self, pool, conn):
+            self._pool = pool
+            self._conn = conn
+
+        def __getattr__(self, name):
+            return getattr(self._conn, name)
+
+        def close(self):
+            if self._conn is not None:
+                try:
+                    self._pool.putconn(self._conn, close=bool(self._conn.closed))
+                finally:
+                    self._conn = None
+                    _pool_slots.release()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            try:
+                if exc_type is None:
+                    self._conn.commit()
+                else:
+                    self._conn.rollback()
+            finally:
+                self.close()
+
+    def _get_pool():
+        global _pool
+        if _pool is None:
+            with _pool_lock:
+                if _pool is None:
+                    _pool = psycopg2.pool.ThreadedConnectionPool(POOL_MIN_SIZE, POOL_MAX_SIZE, **DB_CONFIG)
+        return _pool
+
+    def _is_healthy(conn) -> bool:
+        if conn.closed:
+            return False
+        if not POOL_HEALTH_CHECK:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
     def get_conn():  # Changed to match local version
-        return psycopg2.connect(**DB_CONFIG)
+        """Checks a connection out of the pool; call close() (or use `with`) to return it."""
+        pool = _get_pool()
+        if not _pool_slots.acquire(timeout=POOL_TIMEOUT):
+            raise psycopg2.pool.PoolError(f"No database connection free after {POOL_TIMEOUT:g}s")
+        try:
+            conn = pool.getconn()
+            if not _is_healthy(conn):
+                pool.putconn(conn, close=True)
+                conn = pool.getconn()
+        except Exception:
+            _pool_slots.release()
+            raise
+        return PooledConnection(pool, conn)
+
+    def embedding_dim() -> int:
+        return EMBEDDING_DIM
+
+    def vector_to_pg(vector) -> str:
+        """pgvector text literal ('[x,y,...]'); the column itself is stored in binary form by pgvector."""
+        return "[" + ",".join(str(x) for x in vector) + "]"
+
+    def create_tables():
+        """Creates the schema and indexes if they don't exist yet (non-destructive)."""
+        with get_conn() as conn:
+            cur = conn.cursor()
+            try:
+                cur.execute("CREATE EXTENSION IF NOT EXISTS vector;")
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS persons (
+                        person_id SERIAL PRIMARY KEY,
+                        last_seen TIMESTAMP,
+                        vector_count INTEGER NOT NULL DEFAULT 0
+                    );
+                """)
+                cur.execute(f"""
+                    CREATE TABLE IF NOT EXISTS vectors (
+                        vector_id SERIAL PRIMARY KEY,
+                        person_id INTEGER NOT NULL REFERENCES persons(person_id),
+                        vector vector({EMBEDDING_DIM}) NOT NULL,
+                        last_checked TIMESTAMP DEFAULT NOW()
+                    );
+                """)
+                # Older databases have persons(person_id) only: add the summary and backfill it once
+                cur.execute("""
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = 'persons' AND column_name = 'vector_count';
+                """)
+                if cur.fetchone() is None:
+                    cur.execute("""
+                        ALTER TABLE persons
+                        ADD COLUMN last_seen TIMESTAMP,
+                        ADD COLUMN vector_count INTEGER NOT NULL DEFAULT 0;
+                    """)
+                    cur.execute("""
+                        UPDATE persons p
+                        SET last_seen = s.last_seen, vector_count = s.vector_count
+                        FROM (
+                            SELECT person_id, MAX(last_checked) AS last_seen, COUNT(*) AS vector_count
+                            FROM vectors GROUP BY person_id
+                        ) s
+                        WHERE p.person_id = s.person_id;
+                    """)
+            finally:
+                cur.close()
+        try:
+            create_indexes()
+        except psycopg2.Error as e:
+            # e.g. a legacy vector column without a fixed dimension can't be indexed
+            logger.warning("Could not create vector index, falling back to exact scans: %s", e)
+
+    def create_indexes():
+        with get_conn() as conn:
+            cur = conn.cursor()
+            try:
+                # Serves the per-person last-seen lookup and oldest-vector eviction
+                cur.execute("""
+                    CREATE INDEX IF NOT EXISTS vectors_person_last_checked_idx
+                    ON vectors (person_id, last_checked);
+                """)
+                cur.execute("""
+                    CREATE INDEX IF NOT EXISTS persons_last_seen_idx
+                    ON persons (last_seen);
+                """)
+                if VECTOR_INDEX == "ivfflat":
+                    cur.execute(f"""
+                        CREATE INDEX IF NOT EXISTS vectors_vector_ivfflat_idx
+                        ON vectors USING ivfflat (vector vector_l2_ops) WITH (lists = {IVFFLAT_LISTS});
+                    """)
+                else:
+                    cur.execute(f"""
+                        CREATE INDEX IF NOT EXISTS vectors_vector_hnsw_idx
+                        ON vectors USING hnsw (vector vector_l2_ops)
+                        WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION});
+                    """)
+            finally:
+                cur.close()
 
     # === API FUNCTIONS ===
 
@@ -143,21 +691,25 @@ else:
     #insert a completly new person tot he system 
     def insert_new_person(vector: list[float]):
         """Inserts a new person + their first vector, returns person_id."""
+        _check_vectors([vector], EMBEDDING_DIM)
+        started = time.perf_counter()
         conn = get_conn()
         cur = conn.cursor()
         try:
-            cur.execute("INSERT INTO persons DEFAULT VALUES RETURNING person_id;")
+            cur.execute("INSERT INTO persons (last_seen, vector_count) VALUES (NOW(), 1) RETURNING person_id;")
             person_id = cur.fetchone()[0]
-            vector_str = "[" + ",".join(str(x) for x in vector) + "]"
+            vector_str = vector_to_pg(vector)
             cur.execute("""
                 INSERT INTO vectors (person_id, vector, last_checked)
                 VALUES (%s, %s::vector, NOW());
             """, (person_id, vector_str))
             conn.commit()
+            bus.publish("gallery_changed", {"person_id": person_id})
             return person_id
         finally:
             cur.close()
             conn.close()
+            metrics.record("db_write", time.perf_counter() - started)
 
     #insert a new vector for an existing person_id 
     #removing the oldest vector if the person has 10 vectors
@@ -166,14 +718,19 @@ else:
         Inserts a vector for an existing person_id.
         If person has >= max_vectors → deletes oldest vector before inserting.
         """
+        _check_vectors([vector], EMBEDDING_DIM)
+        started = time.perf_counter()
         conn = get_conn()
         cur = conn.cursor()
         try:
-            # 1️⃣ Count how many vectors this person has
+            # 1️⃣ Count how many vectors this person has (row lock serializes concurrent inserts)
             cur.execute("""
-                SELECT COUNT(*) FROM vectors WHERE person_id = %s;
+                SELECT vector_count FROM persons WHERE person_id = %s FOR UPDATE;
             """, (person_id,))
-            vector_count = cur.fetchone()[0]
+            row = cur.fetchone()
+            if row is None:
+                raise UnknownPersonError(f"Unknown person_id {person_id}")
+            vector_count = row[0]
 
             if vector_count >= max_vectors:
                 # 2️⃣ Delete oldest vector
@@ -188,63 +745,198 @@ else:
                 """, (person_id,))
 
             # 3️⃣ Insert new vector
-            vector_str = "[" + ",".join(str(x) for x in vector) + "]"
+            vector_str = vector_to_pg(vector)
             cur.execute("""
                 INSERT INTO vectors (person_id, vector, last_checked)
                 VALUES (%s, %s::vector, NOW());
             """, (person_id, vector_str))
 
+            # 4️⃣ Keep the persons summary in the same transaction
+            cur.execute("""
+                UPDATE persons SET last_seen = NOW(), vector_count = %s
+                WHERE person_id = %s;
+            """, (vector_count + (0 if vector_count >= max_vectors else 1), person_id))
+
             conn.commit()
+            bus.publish("gallery_changed", {"person_id": person_id})
 
         finally:
             cur.close()
             conn.close()
+            metrics.record("db_write", time.perf_counter() - started)
 
 
-    def check_person_exists(input_vector, threshold=0.65):
+    def insert_new_persons(vectors):
+        """Bulk insert_new_person: one person per vector in one transaction; returns their person_ids in order."""
+        if not len(vectors):
+            return []
+        _check_vectors(vectors, EMBEDDING_DIM)
+        started = time.perf_counter()
+        conn = get_conn()
+        cur = conn.cursor()
+        try:
+            rows = execute_values(
+                cur,
+                "INSERT INTO persons (last_seen, vector_count) VALUES %s RETURNING person_id",
+                [(1,)] * len(vectors),
+                template="(NOW(), %s)",
+                page_size=1000,
+                fetch=True,
+            )
+            person_ids = [r[0] for r in rows]
+            execute_values(
+                cur,
+                "INSERT INTO vectors (person_id, vector, last_checked) VALUES %s",
+                [(person_id, vector_to_pg(vector)) for person_id, vector in zip(person_ids, vectors)],
+                template="(%s, %s::vector, NOW())",
+                page_size=1000,
+            )
+            conn.commit()
+            bus.publish("gallery_changed", {"person_ids": person_ids})
+            return person_ids
+        finally:
+            cur.close()
+            conn.close()
+            metrics.record("db_write", time.perf_counter() - started)
+
+    def insert_vectors_for_persons(visits, max_vectors=10):
         """
-        Checks if input vector matches a known person.
-        Returns:
-        ("found", last_seen_date, person_id)
-        or
-        ("not found", None, None)
+        Bulk insert_vector_for_person for [(person_id, vector)] in one transaction.
+        Eviction is done set-wise afterwards: each affected person keeps only their
+        max_vectors newest vectors. Raises UnknownPersonError (and writes nothing) if any
+        person_id is unknown.
         """
+        if not len(visits):
+            return
+        visits = [(int(person_id), vector) for person_id, vector in visits]
+        _check_vectors([vector for _, vector in visits], EMBEDDING_DIM)
+        persons = sorted({person_id for person_id, _ in visits})
+        started = time.perf_counter()
         conn = get_conn()
         cur = conn.cursor()
         try:
-            vector_str = "[" + ",".join(str(x) for x in input_vector) + "]"
+            # Row locks (taken in person_id order) serialize with single-visit inserts
+            cur.execute("SELECT person_id FROM persons WHERE person_id = ANY(%s) ORDER BY person_id FOR UPDATE;", (persons,))
+            unknown = sorted(set(persons) - {r[0] for r in cur.fetchall()})
+            if unknown:
+                raise UnknownPersonError(f"Unknown person_id(s) {unknown[:10]}")
 
-            # 1️⃣ Find closest person within threshold
+            execute_values(
+                cur,
+                "INSERT INTO vectors (person_id, vector, last_checked) VALUES %s",
+                [(person_id, vector_to_pg(vector)) for person_id, vector in visits],
+                template="(%s, %s::vector, NOW())",
+                page_size=1000,
+            )
+            # Everything beyond each person's max_vectors newest vectors goes, in one statement
+            cur.execute("""
+                DELETE FROM vectors WHERE vector_id IN (
+                    SELECT vector_id FROM (
+                        SELECT vector_id, ROW_NUMBER() OVER (
+                            PARTITION BY person_id ORDER BY last_checked DESC, vector_id DESC
+                        ) AS newest
+                        FROM vectors WHERE person_id = ANY(%s)
+                    ) ranked WHERE newest > %s
+                );
+            """, (persons, max_vectors))
             cur.execute("""
-                SELECT person_id, MIN(distance) AS min_distance
+                UPDATE persons p SET last_seen = NOW(), vector_count = c.vector_count
                 FROM (
-                    SELECT person_id, vector <-> %s::vector AS distance
-                    FROM vectors
-                ) sub
-                GROUP BY person_id
-                ORDER BY min_distance ASC
-                LIMIT 1;
-            """, (vector_str,))
-            
-            result = cur.fetchone()
-            
-            if result and result[1] < threshold:
-                person_id = result[0]
-                distance = result[1]
-                
-                # 2️⃣ Get last_seen_date (latest timestamp for this person)
+                    SELECT person_id, COUNT(*) AS vector_count FROM vectors
+                    WHERE person_id = ANY(%s) GROUP BY person_id
+                ) c
+                WHERE p.person_id = c.person_id;
+            """, (persons,))
+            conn.commit()
+            bus.publish("gallery_changed", {"person_ids": persons})
+        finally:
+            cur.close()
+            conn.close()
+            metrics.record("db_write", time.perf_counter() - started)
+
+    def list_persons(limit=100, after=None, since=None):
+        """
+        One page of the persons summary, ordered by person_id.
+        after: last person_id of the previous page; since: only persons seen after this (UTC) time.
+        Returns [(person_id, last_seen, vector_count)].
+        """
+        query = "SELECT person_id, last_seen, vector_count FROM persons WHERE person_id > %s"
+        params = [after or 0]
+        if since is not None:
+            query += " AND last_seen > %s"
+            params.append(since)
+        query += " ORDER BY person_id LIMIT %s;"
+        params.append(limit)
+        conn = get_conn()
+        cur = conn.cursor()
+        try:
+            cur.execute(query, params)
+            return cur.fetchall()
+        finally:
+            cur.close()
+            conn.close()
+
+    def search_persons(vectors, k=5, threshold=0.65):
+        """
+        Batch top-k search, one query per vector over a single connection.
+        Each query is an index-friendly k-NN scan (ORDER BY distance LIMIT n)
+        that also returns the person's last-seen time in the same round trip.
+        Returns one list of Match per query vector, closest first.
+        """
+        started = time.perf_counter()
+        conn = get_conn()
+        cur = conn.cursor()
+        try:
+            results = []
+            for vector in vectors:
+                vector_str = vector_to_pg(vector)
                 cur.execute("""
-                    SELECT MAX(last_checked)
-                    FROM vectors
-                    WHERE person_id = %s;
-                """, (person_id,))
-                last_seen_date = cur.fetchone()[0]
-                
-                return ("found", last_seen_date, person_id)
-            
-            else:
-                return ("not found", None, None)
-            
+                    SELECT nn.person_id, MIN(nn.distance) AS min_distance,
+                        (SELECT MAX(v.last_checked) FROM vectors v WHERE v.person_id = nn.person_id)
+                    FROM (
+                        SELECT person_id, vector <-> %(q)s::vector AS distance
+                        FROM vectors
+                        ORDER BY vector <-> %(q)s::vector
+                        LIMIT %(candidates)s
+                    ) nn
+                    GROUP BY nn.person_id
+                    ORDER BY min_distance ASC
+                    LIMIT %(k)s;
+                """, {"q": vector_str, "candidates": k * KNN_CANDIDATES_PER_PERSON, "k": k})
+                results.append([
+                    Match(person_id, distance, last_seen, distance < threshold)
+                    for person_id, distance, last_seen in cur.fetchall()
+                ])
+            return results
         finally:
             cur.close()
             conn.close()
+            metrics.record("gallery_search", time.perf_counter() - started)
+
+    def search_person(input_vector, k=5, threshold=0.65):
+        """Top-k candidates for a single vector, closest first."""
+        return search_persons([input_vector], k, threshold)[0]
+
+    def check_person_exists(input_vector, threshold=0.65):
+        """
+        Checks if input vector matches a known person.
+        Returns:
+        ("found", last_seen_date, person_id)
+        or
+        ("not found", None, None)
+        """
+        candidates = search_person(input_vector, 1, threshold)
+        if candidates and candidates[0].matched:
+            return ("found", candidates[0].last_seen, candidates[0].person_id)
+        return ("not found", None, None)
+
+    _schema_ready = threading.Event()
+
+    def is_ready() -> bool:
+        return _schema_ready.is_set()
+
+    def warm_up():
+        """Connects and creates the schema; the server does this in the background at startup."""
+        if not _schema_ready.is_set():
+            create_tables()
+            _schema_ready.set()
@@ -0,0 +1,239 @@
+import threading
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+
+class GalleryIndex:
+    """
+    Process-resident copy of the stored face vectors.
+    Rows are kept L2-normalized in one contiguous float32 matrix, so a lookup
+    is a single matrix-vector product instead of a Python loop per vector.
+
+    Each person also has a prototype: the normalized mean of their vectors,
+    maintained incrementally on add/remove. With shortlist > 0, a search
+    first scores the prototypes only, then re-scores the individual vectors
+    of the best `shortlist` people exactly (two-stage matching).
+    """
+
+    def __init__(self, initial_capacity: int = 1024, shortlist: int = 0):
+        self._lock = threading.Lock()
+        self.shortlist = shortlist
+        self._initial_capacity = initial_capacity
+        self._dim: Optional[int] = None
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._person_ids = np.empty(0, dtype=np.int64)
+        self._vector_ids = np.empty(0, dtype=np.int64)
+        self._size = 0
+        self._row_of: dict[int, int] = {}               # vector_id -> row
+        self._last_checked: dict[int, datetime] = {}    # vector_id -> timestamp
+        self._vectors_of: dict[int, set[int]] = {}      # person_id -> vector_ids
+        # Prototypes: one row per person, same swap-with-last layout as the vectors
+        self._proto_sums = np.empty((0, 0), dtype=np.float64)  # sum of the person's unit vectors
+        self._protos = np.empty((0, 0), dtype=np.float32)      # normalized sums
+        self._proto_persons = np.empty(0, dtype=np.int64)
+        self._proto_row_of: dict[int, int] = {}          # person_id -> prototype row
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def dim(self) -> Optional[int]:
+        """Length of the stored vectors (None until the first one is added)."""
+        return self._dim
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0  # zero vectors score 0 against everything
+        return vectors / norms
+
+    def _reserve(self, capacity: int, dim: int):
+        if self._dim is None:
+            self._dim = dim
+        elif dim != self._dim:
+            raise ValueError(f"Expected vectors of dimension {self._dim}, got {dim}")
+        if capacity <= self._matrix.shape[0]:
+            return
+        new_capacity = max(capacity, self._initial_capacity, 2 * self._matrix.shape[0])
+        matrix = np.empty((new_capacity, dim), dtype=np.float32)
+        person_ids = np.empty(new_capacity, dtype=np.int64)
+        vector_ids = np.empty(new_capacity, dtype=np.int64)
+        if self._size:
+            matrix[:self._size] = self._matrix[:self._size]
+            person_ids[:self._size] = self._person_ids[:self._size]
+            vector_ids[:self._size] = self._vector_ids[:self._size]
+        self._matrix, self._person_ids, self._vector_ids = matrix, person_ids, vector_ids
+
+    def _reserve_protos(self, capacity: int):
+        if capacity <= self._protos.shape[0]:
+            return
+        new_capacity = max(capacity, 2 * self._protos.shape[0], 64)
+        sums = np.empty((new_capacity, self._dim), dtype=np.float64)
+        protos = np.empty((new_capacity, self._dim), dtype=np.float32)
+        persons = np.empty(new_capacity, dtype=np.int64)
+        used = len(self._proto_row_of)
+        if used:
+            sums[:used] = self._proto_sums[:used]
+            protos[:used] = self._protos[:used]
+            persons[:used] = self._proto_persons[:used]
+        self._proto_sums, self._protos, self._proto_persons = sums, protos, persons
+
+    def _update_proto(self, person_id: int, unit: np.ndarray, sign: int):
+        """Adds (sign=1) or subtracts (sign=-1) one unit vector from a person's prototype."""
+        row = self._proto_row_of.get(person_id)
+        if row is None:
+            row = len(self._proto_row_of)
+            self._reserve_protos(row + 1)
+            self._proto_row_of[person_id] = row
+            self._proto_persons[row] = person_id
+            self._proto_sums[row] = 0.0
+        if sign < 0 and person_id not in self._vectors_of:
+            # Last vector gone: move the last prototype into this slot
+            last = len(self._proto_row_of) - 1
+            del self._proto_row_of[person_id]
+            if row != last:
+                moved = int(self._proto_persons[last])
+                self._proto_sums[row] = self._proto_sums[last]
+                self._protos[row] = self._protos[last]
+                self._proto_persons[row] = moved
+                self._proto_row_of[moved] = row
+            return
+        self._proto_sums[row] += sign * unit
+        self._protos[row] = self._normalize(self._proto_sums[row])
+
+    def load(self, vector_ids, person_ids, vectors, last_checked):
+        """Replaces the whole index with the given rows (used on startup)."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            self._dim = None
+            self._matrix = np.empty((0, 0), dtype=np.float32)
+            self._size = 0
+            self._row_of.clear()
+            self._last_checked.clear()
+            self._vectors_of.clear()
+            self._proto_row_of.clear()
+            self._protos = np.empty((0, 0), dtype=np.float32)
+            if len(vectors) == 0:
+                return
+            n = len(vectors)
+            self._reserve(n, vectors.shape[1])
+            self._matrix[:n] = self._normalize(vectors)
+            self._person_ids[:n] = person_ids
+            self._vector_ids[:n] = vector_ids
+            self._size = n
+            for row, (vector_id, person_id, ts) in enumerate(zip(vector_ids, person_ids, last_checked)):
+                self._row_of[int(vector_id)] = row
+                self._last_checked[int(vector_id)] = ts
+                self._vectors_of.setdefault(int(person_id), set()).add(int(vector_id))
+            # Prototype sums in one pass: group rows by person, then reduceat
+            persons, owner = np.unique(self._person_ids[:n], return_inverse=True)
+            order = np.argsort(owner, kind="stable")
+            starts = np.searchsorted(owner[order], np.arange(len(persons)))
+            self._reserve_protos(len(persons))
+            sums = np.add.reduceat(self._matrix[:n][order].astype(np.float64), starts)
+            self._proto_sums[:len(persons)] = sums
+            self._protos[:len(persons)] = self._normalize(sums)
+            self._proto_persons[:len(persons)] = persons
+            self._proto_row_of.update((int(p), row) for row, p in enumerate(persons))
+
+    def add(self, vector_id: int, person_id: int, vector, last_checked: datetime):
+        vector = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            self._reserve(self._size + 1, vector.shape[0])
+            row = self._size
+            self._matrix[row] = self._normalize(vector)
+            self._update_proto(person_id, self._matrix[row], 1)
+            self._person_ids[row] = person_id
+            self._vector_ids[row] = vector_id
+            self._size += 1
+            self._row_of[vector_id] = row
+            self._last_checked[vector_id] = last_checked
+            self._vectors_of.setdefault(person_id, set()).add(vector_id)
+
+    def remove(self, vector_id: int):
+        """Drops a vector by moving the last row into its slot (O(1))."""
+        with self._lock:
+            row = self._row_of.pop(vector_id, None)
+            if row is None:
+                return
+            person_id = int(self._person_ids[row])
+            unit = self._matrix[row].copy()
+            last = self._size - 1
+            if row != last:
+                moved_id = int(self._vector_ids[last])
+                self._matrix[row] = self._matrix[last]
+                self._person_ids[row] = self._person_ids[last]
+                self._vector_ids[row] = moved_id
+                self._row_of[moved_id] = row
+            self._size = last
+            del self._last_checked[vector_id]
+            person_vectors = self._vectors_of[person_id]
+            person_vectors.discard(vector_id)
+            if not person_vectors:
+                del self._vectors_of[person_id]
+            self._update_proto(person_id, unit, -1)
+
+    def last_seen(self, person_id: int) -> Optional[datetime]:
+        with self._lock:
+            vector_ids = self._vectors_of.get(person_id)
+            if not vector_ids:
+                return None
+            return max(self._last_checked[v] for v in vector_ids)
+
+    def search(self, vectors, k: int = 5, shortlist: Optional[int] = None):
+        """
+        Top-k search for a batch of query vectors (shape [n, dim] or [dim]).
+        Scores are aggregated per person (best cosine similarity over that
+        person's vectors). Returns one list of (person_id, similarity) per
+        query, best first. shortlist overrides the index default (0 = exact
+        search over every vector).
+        """
+        shortlist = self.shortlist if shortlist is None else shortlist
+        queries = np.asarray(vectors, dtype=np.float32)
+        if queries.size == 0:
+            return []
+        queries = self._normalize(np.atleast_2d(queries))
+        with self._lock:
+            if self._size == 0 or k <= 0:
+                return [[] for _ in range(len(queries))]
+            persons = len(self._proto_row_of)
+            if shortlist and persons > max(shortlist, k):
+                return self._search_shortlist(queries, k, max(shortlist, k), persons)
+            sims = queries @ self._matrix[:self._size].T
+            person_ids = self._person_ids[:self._size].copy()
+        return [self._top_persons(row, person_ids, k) for row in sims]
+
+    def _search_shortlist(self, queries: np.ndarray, k: int, shortlist: int, persons: int):
+        # Coarse: best prototypes; exact: every vector of those people (caller holds the lock)
+        coarse = queries @ self._protos[:persons].T
+        candidates = np.argpartition(-coarse, shortlist - 1, axis=1)[:, :shortlist]
+        results = []
+        for query, proto_rows in zip(queries, candidates):
+            rows = np.fromiter(
+                (self._row_of[v] for p in self._proto_persons[proto_rows] for v in self._vectors_of[int(p)]),
+                dtype=np.int64,
+            )
+            results.append(self._top_persons(self._matrix[rows] @ query, self._person_ids[rows], k))
+        return results
+
+    @staticmethod
+    def _top_persons(sims: np.ndarray, person_ids: np.ndarray, k: int):
+        # Look at a growing window of the best rows until it covers k distinct people.
+        n = len(sims)
+        window = min(n, 4 * k)
+        while True:
+            top = np.argpartition(-sims, window - 1)[:window] if window < n else np.arange(n)
+            top = top[np.argsort(-sims[top], kind="stable")]
+            results, seen = [], set()
+            for row in top:
+                person_id = int(person_ids[row])
+                if person_id not in seen:
+                    seen.add(person_id)
+                    results.append((person_id, float(sims[row])))
+                    if len(results) == k:
+                        return results
+            if window == n:
+                return results
+            window = min(n, 2 * window)
@@ -1,15 +1,41 @@
-from deepface import DeepFace
 from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+import cv2
+import numpy as np
 import face_db as facedb
+from embedder import embedder
+from recent_matches import recent_matches
+from event_bus import bus
+from quality_gate import quality_gate
+import metrics
 
 
 def add_new_person(vector: list[float]):
     """Add a new person with their face vector."""
-    return facedb.insert_new_person(vector)
+    person_id = facedb.insert_new_person(vector)
+    recent_matches.clear() #cached "red" answers may now be a known person
+    return person_id
 
 
 def add_new_visit(vector, person_id): #case yellow than approve
     facedb.insert_vector_for_person(person_id, vector) 
+    recent_matches.clear()
+
+
+#Bulk forms for enrolling many people / recording many visits in one transaction
+def add_new_persons(vectors):
+    person_ids = facedb.insert_new_persons(vectors)
+    recent_matches.clear()
+    return person_ids
+
+
+def add_new_visits(visits): #[(person_id, vector)]
+    facedb.insert_vectors_for_persons(visits)
+    recent_matches.clear()
+
+
+# Enrollments made by other workers invalidate this worker's cached answers too
+bus.subscribe("gallery_changed", lambda change: recent_matches.clear(), remote_only=True)
 
 
 #Check whether given date is within the last period
@@ -22,20 +48,131 @@ def is_within_period(date, period):
 #green: person is familiar within the last period
 #yellow: person is familiar but not within the last period
 #red: person is not familiar
-def is_familiar(image_path):
-    df_result = DeepFace.represent(image_path, model_name="OpenFace")
-    vector = df_result[0]["embedding"]
-    db_response = facedb.check_person_exists(vector)
-    if db_response[0] == "found":
-        last_seen_date = db_response[1]
-        person_id = db_response[2]  # Get the person_id
-        period = 14
-        if is_within_period(last_seen_date, period): #person found & within period
-            return ("green", vector, person_id)  # Return the actual person_id
+def classify(candidates, period: int = 14):
+    """Turns face_db search candidates (best first) into (status, person_id)."""
+    if candidates and candidates[0].matched:
+        best = candidates[0]
+        if is_within_period(best.last_seen, period): #person found & within period
+            return ("green", best.person_id)
         else: #person found but not within period
-            return ("yellow", vector, person_id)
-    else: #person not found
-        return ("red", vector, db_response[2])
+            return ("yellow", best.person_id)
+    return ("red", None) #person not found
+
+
+class ImageDecodeError(ValueError):
+    pass
+
+
+#Decode an uploaded image (JPEG/PNG bytes) straight from memory into a BGR ndarray
+def decode_image(content: bytes) -> np.ndarray:
+    image = cv2.imdecode(np.frombuffer(content, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ImageDecodeError("Could not decode image")
+    return image
+
+
+#Small JPEG preview of a decoded image for the dashboard (longest side max_side px)
+def make_thumbnail(image: np.ndarray, max_side: int = 128, quality: int = 80) -> bytes:
+    height, width = image.shape[:2]
+    scale = max_side / max(height, width)
+    if scale < 1:
+        image = cv2.resize(image, (max(1, round(width * scale)), max(1, round(height * scale))), interpolation=cv2.INTER_AREA)
+    ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("Could not encode thumbnail")
+    return encoded.tobytes()
+
+
+#image can be a file path, encoded image bytes or an already decoded BGR ndarray.
+#Goes through the same quality gate, recent-match cache and metrics as uploads.
+#Returns (status, vector, person_id, reason); reason is set only for "rejected" crops.
+def is_familiar(image, device_id=None):
+    if isinstance(image, str):
+        path, image = image, cv2.imread(image)
+        if image is None:
+            raise ImageDecodeError(f"Could not read image {path}")
+    result = _recognize_batch([image], [device_id])[0]
+    if isinstance(result, Exception):
+        raise result
+    status, vector, person_id, _, reason = result
+    return (status, vector, person_id, reason)
+
+
+class Recognition(NamedTuple):
+    status: str
+    vector: list
+    person_id: Optional[int]
+    thumbnail: bytes
+    cached: bool  #answered from the per-device recent-match cache, no gallery search
+    timings: dict  #seconds per stage for the whole batch this upload was part of
+    reason: Optional[str] = None  #why a "rejected" crop failed the quality gate
+
+
+#Crops failing the quality gate are answered ("rejected", None, None, False, reason) without
+#being embedded. The rest are embedded in one pass; recent near-identical faces from the same
+#device reuse their earlier answer, the others go through one batched gallery search.
+#Returns one (status, vector, person_id, cached, reason) per image, or the exception that image raised.
+def _recognize_batch(images, device_ids):
+    results = []
+    for image in images:
+        try:
+            results.append(decode_image(image) if isinstance(image, (bytes, bytearray, memoryview)) else image)
+        except ImageDecodeError as e:
+            results.append(e)
+    pending = []
+    with metrics.stage("quality"):
+        for i, image in enumerate(results):
+            if isinstance(image, Exception):
+                continue
+            reason = quality_gate.check(image) if isinstance(image, np.ndarray) else None
+            if reason is None:
+                pending.append(i)
+            else:
+                results[i] = ("rejected", None, None, False, reason)
+    with metrics.stage("embed"):
+        vectors = embedder.represent_batch([results[i] for i in pending])
+    to_search = []
+    for i, vector in zip(pending, vectors):
+        results[i] = vector
+        if isinstance(vector, Exception):
+            continue
+        cached = recent_matches.lookup(device_ids[i], vector)
+        if cached is not None:
+            results[i] = (cached[0], vector, cached[1], True, None)
+        else:
+            to_search.append(i)
+    candidates = facedb.search_persons([results[i] for i in to_search]) if to_search else []
+    for i, matches in zip(to_search, candidates):
+        status, person_id = classify(matches)
+        recent_matches.remember(device_ids[i], results[i], status, person_id)
+        results[i] = (status, results[i], person_id, False, None)
+    return results
+
+
+#Worker-side handler for uploads given as (content, device_id) pairs: each upload
+#is decoded once and that array is used both for recognition and the preview thumbnail.
+#Returns one Recognition per upload, or the exception it raised.
+def recognize_uploads(uploads):
+    timings = metrics.start_trace()
+    images = []
+    with metrics.stage("decode"):
+        for content, _ in uploads:
+            try:
+                images.append(decode_image(content))
+            except ImageDecodeError as e:
+                images.append(e)
+    valid = [i for i, image in enumerate(images) if not isinstance(image, Exception)]
+    outcomes = list(images)
+    batch = _recognize_batch([images[i] for i in valid], [uploads[i][1] for i in valid])
+    with metrics.stage("thumbnail"):
+        for i, outcome in zip(valid, batch):
+            if isinstance(outcome, Exception):
+                outcomes[i] = outcome
+            elif outcome[0] == "rejected":
+                outcomes[i] = Recognition(*outcome[:3], None, False, timings, outcome[4])
+            else:
+                outcomes[i] = Recognition(*outcome[:3], make_thumbnail(images[i]), outcome[3], timings)
+    return outcomes
     
     
 
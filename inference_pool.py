@@ -0,0 +1,89 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PoolSaturated(Exception):
+    """Raised when the admission queue is full and the request should be shed."""
+
+
+class InferencePool:
+    """
+    Runs CPU-bound recognition work on a bounded set of worker threads so the
+    asyncio event loop (WebSockets, other requests) is never blocked by it.
+    At most max_workers jobs run at once and at most max_queue more wait;
+    anything beyond that is rejected immediately with PoolSaturated.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference")
+        self._lock = threading.Lock()
+        self._admitted = 0      # queued + running
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._exec_total = 0.0
+        self._exec_max = 0.0
+
+    async def run(self, fn, *args):
+        """Runs fn(*args) on a worker thread and returns its result."""
+        with self._lock:
+            if self._admitted >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise PoolSaturated(f"Recognition queue is full ({self.max_queue} waiting)")
+            self._admitted += 1
+        enqueued_at = time.perf_counter()
+
+        def job():
+            started_at = time.perf_counter()
+            with self._lock:
+                self._running += 1
+            try:
+                return fn(*args)
+            finally:
+                finished_at = time.perf_counter()
+                self._record(started_at - enqueued_at, finished_at - started_at)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+        finally:
+            with self._lock:
+                self._admitted -= 1
+
+    def _record(self, wait: float, execution: float):
+        with self._lock:
+            self._running -= 1
+            self._completed += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._exec_total += execution
+            self._exec_max = max(self._exec_max, execution)
+
+    def stats(self) -> dict:
+        with self._lock:
+            done = self._completed or 1
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self._admitted - self._running,
+                "running": self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(1000 * self._wait_total / done, 2),
+                "max_wait_ms": round(1000 * self._wait_max, 2),
+                "avg_exec_ms": round(1000 * self._exec_total / done, 2),
+                "max_exec_ms": round(1000 * self._exec_max, 2),
+            }
+
+
+# Create a single instance to be used across the application
+pool = InferencePool(
+    max_workers=int(os.environ.get("RECOGNITION_WORKERS", min(4, os.cpu_count() or 1))),
+    max_queue=int(os.environ.get("RECOGNITION_QUEUE_SIZE", 32)),
+)
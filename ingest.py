@@ -0,0 +1,117 @@
+import asyncio
+import json
+import logging
+import os
+import struct
+
+from fastapi import WebSocket
+
+from imagesProcessing import ImageDecodeError
+from inference_pool import PoolSaturated
+
+logger = logging.getLogger(__name__)
+
+# Frames a device may have awaiting a result before further frames are refused with slow_down
+MAX_IN_FLIGHT = int(os.environ.get("INGEST_MAX_IN_FLIGHT", 4))
+# How long a device should pause after a slow_down
+SLOW_DOWN_MS = int(os.environ.get("INGEST_SLOW_DOWN_MS", 250))
+HELLO_TIMEOUT = 10.0
+
+# Binary frame layout: 4-byte big-endian sequence number followed by the JPEG bytes
+SEQ = struct.Struct(">I")
+
+
+class IngestSession:
+    """
+    One camera's persistent ingest socket.
+
+    Protocol (all control messages are JSON text):
+      device -> {"device_id": "pi-001"}
+      server -> {"type": "ready", "max_in_flight": N}
+      device -> binary frames: seq (uint32, big-endian) + JPEG
+      server -> {"type": "result", "seq", "status", "person_id", "event_id"[, "reason"]}
+                {"type": "error", "seq", "detail"}
+                {"type": "slow_down", "seq", "retry_after_ms"}  (frame was not processed)
+    Results may arrive out of order; the seq ties them back to frames.
+    """
+
+    def __init__(self, ws: WebSocket, submit, publish, max_in_flight: int = MAX_IN_FLIGHT):
+        self.ws = ws
+        self.submit = submit    # async (content, device_id) -> Recognition
+        self.publish = publish  # async (result, device_id) -> event_id
+        self.max_in_flight = max_in_flight
+        self.device_id = None
+        self._in_flight = set()
+        self._send_lock = asyncio.Lock()
+        self.frames = 0
+        self.throttled = 0
+
+    async def _send(self, message: dict):
+        # Results finish concurrently; one writer at a time on the socket
+        async with self._send_lock:
+            try:
+                await self.ws.send_text(json.dumps(message))
+            except Exception:
+                pass  # device went away; the receive loop notices and ends the session
+
+    async def handshake(self) -> bool:
+        await self.ws.accept()
+        try:
+            message = await asyncio.wait_for(self.ws.receive_text(), HELLO_TIMEOUT)
+            self.device_id = str(json.loads(message)["device_id"])
+        except Exception:
+            await self.ws.close(code=1008)  # policy violation: no/invalid hello
+            return False
+        await self._send({"type": "ready", "device_id": self.device_id, "max_in_flight": self.max_in_flight})
+        return True
+
+    async def run(self):
+        try:
+            while True:
+                message = await self.ws.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                frame = message.get("bytes")
+                if not frame or len(frame) <= SEQ.size:
+                    await self._send({"type": "error", "seq": None, "detail": "Expected seq + JPEG binary frame"})
+                    continue
+                seq, = SEQ.unpack_from(frame)
+                self.frames += 1
+                if len(self._in_flight) >= self.max_in_flight:
+                    await self._slow_down(seq)
+                    continue
+                task = asyncio.get_running_loop().create_task(self._recognize(seq, frame[SEQ.size:]))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+        finally:
+            for task in list(self._in_flight):
+                task.cancel()
+
+    async def _slow_down(self, seq: int):
+        self.throttled += 1
+        await self._send({"type": "slow_down", "seq": seq, "retry_after_ms": SLOW_DOWN_MS})
+
+    async def _recognize(self, seq: int, content: bytes):
+        try:
+            result = await self.submit((content, self.device_id))
+        except PoolSaturated:
+            await self._slow_down(seq)
+            return
+        except ImageDecodeError as e:
+            await self._send({"type": "error", "seq": seq, "detail": str(e)})
+            return
+        except Exception as e:
+            logger.warning("Ingest frame %s from %s failed: %s", seq, self.device_id, e)
+            await self._send({"type": "error", "seq": seq, "detail": str(e)})
+            return
+        event_id = await self.publish(result, self.device_id)
+        message = {
+            "type": "result",
+            "seq": seq,
+            "status": result.status,
+            "person_id": result.person_id,
+            "event_id": event_id,
+        }
+        if result.reason is not None:
+            message["reason"] = result.reason
+        await self._send(message)
@@ -0,0 +1,148 @@
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+# Latency buckets in seconds (upper bounds), from sub-millisecond lookups to slow inferences
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _labels(label: str, value: str) -> str:
+    return f'{label}="{value}"' if label else ""
+
+
+class Histogram:
+    """Fixed-bucket histogram, optionally split by the value of one label."""
+
+    def __init__(self, name: str, help: str, label: str = "", buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.buckets = tuple(buckets)
+        self._series: Dict[str, list] = {}  # label value -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, label_value: str = ""):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += seconds
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {k: list(v) for k, v in self._series.items()}
+        for value, series in sorted(snapshot.items()):
+            base = _labels(self.label, value)
+            sep = "," if base else ""
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{self.name}_bucket{{{base}{sep}le="{le}"}} {cumulative}')
+            suffix = f"{{{base}}}" if base else ""
+            lines.append(f"{self.name}_sum{suffix} {series[-1]}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class Gauge:
+    """
+    A value read from a callback at scrape time (counts that other modules already keep).
+    With a label, read() returns {label value: value} instead.
+    """
+
+    def __init__(self, name: str, help: str, read: Callable[[], float], kind: str = "gauge", label: str = ""):
+        self.name = name
+        self.help = help
+        self.read = read
+        self.kind = kind
+        self.label = label
+
+    def render(self) -> list:
+        try:
+            value = self.read()
+        except Exception:
+            return []
+        if value is None:
+            return []
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        if self.label:
+            lines.extend(f"{self.name}{{{_labels(self.label, key)}}} {v}" for key, v in sorted(value.items()))
+        else:
+            lines.append(f"{self.name} {value}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def gauge(self, name: str, help: str, read: Callable[[], float], label: str = ""):
+        return self.register(Gauge(name, help, read, label=label))
+
+    def counter(self, name: str, help: str, read: Callable[[], float], label: str = ""):
+        return self.register(Gauge(name, help, read, kind="counter", label=label))
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+STAGE_SECONDS = registry.register(Histogram(
+    "facerec_stage_duration_seconds",
+    "Time spent in each recognition stage",
+    label="stage",
+))
+
+# Per-request stage timings (only collected when a request asks for a trace)
+_trace: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar("trace", default=None)
+
+
+def start_trace() -> Dict[str, float]:
+    timings: Dict[str, float] = {}
+    _trace.set(timings)
+    return timings
+
+
+def record(stage: str, seconds: float):
+    """Adds a measurement to the stage histogram and to the current trace, if any."""
+    STAGE_SECONDS.observe(seconds, stage)
+    timings = _trace.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+def add_to_trace(timings: Dict[str, float]):
+    """Merges timings measured elsewhere (e.g. on a worker thread) into the current trace."""
+    current = _trace.get()
+    if current is not None:
+        for stage, seconds in timings.items():
+            current[stage] = current.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def stage(name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
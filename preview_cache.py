@@ -0,0 +1,66 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+
+class Preview(NamedTuple):
+    thumbnail: bytes        # small JPEG
+    vector: list            # embedding, only sent when a client asks for it
+    created: float
+
+
+class PreviewCache:
+    """
+    Bounded, expiring in-memory store of recent recognition previews.
+    Events carry an event_id; clients fetch the thumbnail (and the vector,
+    e.g. for /add-person) by id instead of receiving them inline.
+    """
+
+    def __init__(self, capacity: int = 512, ttl_seconds: float = 600):
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Preview]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, thumbnail: bytes, vector, event_id: Optional[str] = None) -> str:
+        """Stores a preview; event_id is given when replicating another worker's preview."""
+        event_id = event_id or uuid.uuid4().hex
+        now = time.monotonic()
+        with self._lock:
+            self._entries.pop(event_id, None)  # re-put: moves to the back with its new created time
+            self._entries[event_id] = Preview(thumbnail, vector, now)
+            self._expire(now)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+        return event_id
+
+    def get(self, event_id: str) -> Optional[Preview]:
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(event_id)
+            if entry is not None and now - entry.created >= self.ttl_seconds:
+                del self._entries[event_id]
+                return None
+            return entry
+
+    def _expire(self, now: float):
+        # Entries are kept in creation order, so expired ones are at the front
+        while self._entries:
+            event_id, entry = next(iter(self._entries.items()))
+            if now - entry.created < self.ttl_seconds:
+                break
+            del self._entries[event_id]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Create a single instance to be used across the application
+previews = PreviewCache(
+    capacity=int(os.environ.get("PREVIEW_CACHE_SIZE", 512)),
+    ttl_seconds=float(os.environ.get("PREVIEW_TTL_SECONDS", 600)),
+)
@@ -0,0 +1,70 @@
+import os
+import threading
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+class QualityGate:
+    """
+    Cheap checks run on a face crop before it is embedded. Crops that are too
+    small, blurry (low Laplacian variance), too dark/bright or flat will not
+    match reliably and tend to enroll duplicate "red" persons, so they are
+    rejected with a reason instead of going through the model.
+    A threshold of 0 disables that check (max_brightness: 255).
+    """
+
+    REASONS = ("too_small", "blurry", "too_dark", "too_bright", "low_contrast")
+
+    def __init__(self, min_face_size: int = 48, min_sharpness: float = 25.0, min_brightness: float = 40.0,
+                 max_brightness: float = 220.0, min_contrast: float = 12.0):
+        self.min_face_size = min_face_size
+        self.min_sharpness = min_sharpness
+        self.min_brightness = min_brightness
+        self.max_brightness = max_brightness
+        self.min_contrast = min_contrast
+        self._lock = threading.Lock()
+        self.passed = 0
+        self.rejected = {reason: 0 for reason in self.REASONS}
+
+    def check(self, image: np.ndarray) -> Optional[str]:
+        """Returns the reason to reject this BGR crop, or None if it is worth embedding."""
+        reason = self._reason(image)
+        with self._lock:
+            if reason is None:
+                self.passed += 1
+            else:
+                self.rejected[reason] += 1
+        return reason
+
+    def _reason(self, image: np.ndarray) -> Optional[str]:
+        height, width = image.shape[:2]
+        if min(height, width) < self.min_face_size:
+            return "too_small"
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        mean, std = cv2.meanStdDev(gray)
+        brightness, contrast = float(mean[0][0]), float(std[0][0])
+        if brightness < self.min_brightness:
+            return "too_dark"
+        if brightness > self.max_brightness:
+            return "too_bright"
+        if contrast < self.min_contrast:
+            return "low_contrast"
+        if self.min_sharpness and cv2.Laplacian(gray, cv2.CV_64F).var() < self.min_sharpness:
+            return "blurry"
+        return None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"passed": self.passed, "rejected": dict(self.rejected)}
+
+
+# Create a single instance to be used across the application
+quality_gate = QualityGate(
+    min_face_size=int(os.environ.get("QUALITY_MIN_FACE_SIZE", 48)),
+    min_sharpness=float(os.environ.get("QUALITY_MIN_SHARPNESS", 25)),
+    min_brightness=float(os.environ.get("QUALITY_MIN_BRIGHTNESS", 40)),
+    max_brightness=float(os.environ.get("QUALITY_MAX_BRIGHTNESS", 220)),
+    min_contrast=float(os.environ.get("QUALITY_MIN_CONTRAST", 12)),
+)
@@ -0,0 +1,82 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+
+class RecentMatchCache:
+    """
+    Short-lived per-device memory of resolved embeddings. A camera looking at
+    the same person sends near-identical embeddings many times a second; if a
+    new one is within max_distance (cosine distance) of one resolved in the
+    last ttl_seconds on the same device, its status/person_id is reused and
+    the gallery search is skipped.
+    """
+
+    def __init__(self, ttl_seconds: float = 3.0, max_distance: float = 0.03, capacity: int = 8):
+        self.ttl_seconds = ttl_seconds
+        self.max_distance = max_distance
+        self.capacity = capacity
+        self._entries: dict = {}  # device_id -> deque of (time, unit vector, status, person_id)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _unit(vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, device_id: Optional[str], vector):
+        """Returns (status, person_id) of a recent near-identical match, or None."""
+        if device_id is None or self.ttl_seconds <= 0:
+            return None
+        query = self._unit(vector)
+        now = time.monotonic()
+        with self._lock:
+            entries = self._entries.get(device_id)
+            while entries and now - entries[0][0] > self.ttl_seconds:
+                entries.popleft()
+            for _, unit, status, person_id in reversed(entries or ()):
+                if 1.0 - float(unit @ query) <= self.max_distance:
+                    self.hits += 1
+                    return status, person_id
+            self.misses += 1
+            return None
+
+    def remember(self, device_id: Optional[str], vector, status: str, person_id):
+        if device_id is None or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            entries = self._entries.setdefault(device_id, deque(maxlen=self.capacity))
+            entries.append((time.monotonic(), self._unit(vector), status, person_id))
+
+    def clear(self):
+        """Forget everything, e.g. after the gallery changed (a cached "red" may now be known)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "devices": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "max_distance": self.max_distance,
+            }
+
+
+# Create a single instance to be used across the application
+recent_matches = RecentMatchCache(
+    ttl_seconds=float(os.environ.get("DEDUP_TTL_SECONDS", 3)),
+    max_distance=float(os.environ.get("DEDUP_MAX_DISTANCE", 0.03)),
+    capacity=int(os.environ.get("DEDUP_CAPACITY", 8)),
+)
+
+# Skip the WebSocket event for a recognition answered from this cache
+SUPPRESS_DUPLICATE_EVENTS = os.environ.get("DEDUP_SUPPRESS_EVENTS", "1") == "1"
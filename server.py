@@ -1,17 +1,45 @@
-from fastapi import FastAPI, UploadFile, File, WebSocket, WebSocketDisconnect, HTTPException, Query
-from fastapi.middleware.cors import CORSMiddleware
-import imagesProcessing
-import tempfile
+import asyncio
 import base64
+import json
+import logging
 import os
+import threading
+import time
+from datetime import datetime, timezone
+from fastapi import FastAPI, UploadFile, File, WebSocket, WebSocketDisconnect, HTTPException, Query, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+import imagesProcessing
+from embedder import embedder
+from inference_pool import pool, PoolSaturated
+from batcher import batcher
 from typing import Optional, List
 from websocket_manager import manager
-from pydantic import BaseModel
-from face_db import get_conn, USE_LOCAL
+from ingest import IngestSession
+from event_bus import bus
+from preview_cache import previews
+from recent_matches import recent_matches, SUPPRESS_DUPLICATE_EVENTS
+from quality_gate import quality_gate
+from pydantic import BaseModel, ValidationError
+import face_db as facedb
+import metrics
+from metrics import registry
+
+logger = logging.getLogger(__name__)
 
 class AddPersonPayload(BaseModel):
+    # Either the raw vector or the event_id of a recent recognition
+    vector: Optional[list[float]] = None
+    event_id: Optional[str] = None
+
+class VisitPayload(BaseModel):
+    person_id: int
     vector: list[float]
 
+# Most records a single /add-people or /update-visits request may carry
+BULK_MAX_RECORDS = int(os.environ.get("BULK_MAX_RECORDS", 10000))
+
 app = FastAPI()
 
 # CORS to allow frontend communication
@@ -21,8 +49,83 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# Requests currently being handled (read by /metrics)
+_in_flight = 0
+
+@app.middleware("http")
+async def track_requests(request: Request, call_next):
+    """Counts in-flight requests; with an X-Trace header, returns per-stage timings as Server-Timing."""
+    global _in_flight
+    timings = metrics.start_trace() if request.headers.get("x-trace") else None
+    started = time.perf_counter()
+    _in_flight += 1
+    try:
+        response = await call_next(request)
+    finally:
+        _in_flight -= 1
+    if timings is not None:
+        timings["total"] = time.perf_counter() - started
+        response.headers["Server-Timing"] = ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items())
+    return response
+
+registry.gauge("facerec_http_requests_in_flight", "HTTP requests currently being handled", lambda: _in_flight)
+registry.gauge("facerec_websocket_connections", "Connected dashboard websockets", lambda: len(manager.connections))
+registry.counter("facerec_websocket_dropped_total", "Broadcast messages dropped for slow clients", lambda: manager.dropped)
+registry.counter("facerec_websocket_evicted_total", "Dashboard websockets closed for falling behind", lambda: manager.evicted)
+registry.gauge("facerec_ingest_connections", "Connected camera ingest sockets", lambda: len(ingest_sessions))
+registry.counter("facerec_events_received_total", "Events received from other workers over the event bus", lambda: bus.received)
+registry.counter("facerec_quality_passed_total", "Crops that passed the quality gate", lambda: quality_gate.passed)
+registry.counter("facerec_quality_rejected_total", "Crops rejected by the quality gate before embedding", lambda: quality_gate.stats()["rejected"], label="reason")
+registry.gauge("facerec_gallery_vectors", "Vectors in the in-memory gallery", lambda: len(facedb.gallery) if facedb.USE_LOCAL else None)
+registry.gauge("facerec_inference_queue_depth", "Recognition jobs waiting for a worker", lambda: pool.stats()["queue_depth"])
+registry.counter("facerec_inference_rejected_total", "Recognition requests rejected with 503", lambda: pool.stats()["rejected"])
+registry.counter("facerec_dedup_hits_total", "Recognitions answered from the recent-match cache", lambda: recent_matches.hits)
+registry.counter("facerec_dedup_misses_total", "Recognitions that needed a gallery search", lambda: recent_matches.misses)
+
+# Set if loading the gallery or the model failed (reported by /status)
+_warm_up_error = None
+
+def _warm_up():
+    global _warm_up_error
+    try:
+        facedb.warm_up()
+        embedder.load()
+    except Exception as e:
+        _warm_up_error = str(e)
+        logger.exception("Startup warm-up failed")
+
+def _store_remote_preview(data):
+    previews.put(base64.b64decode(data["thumbnail"]), data["vector"], event_id=data["event_id"])
+
+@app.on_event("startup")
+async def start_event_bus():
+    # Dashboards on this worker get events published by every worker
+    manager.subscribe()
+    bus.subscribe("preview", _store_remote_preview, remote_only=True)
+    # Started before the warm-up (hooks run in order), so gallery changes other workers
+    # commit while the gallery loads are delivered rather than skipped
+    await bus.start()
+
+@app.on_event("startup")
+def start_warm_up():
+    # The gallery and the embedding model load in the background so the port binds
+    # right away; /status and the recognition endpoints answer 503 until both are ready
+    threading.Thread(target=_warm_up, name="warm-up", daemon=True).start()
+
+def _is_ready():
+    return embedder.ready and facedb.is_ready()
+
+def _require_ready():
+    if not _is_ready():
+        raise HTTPException(status_code=503, detail=_warm_up_error or "Model is loading", headers={"Retry-After": "5"})
+
+@app.on_event("shutdown")
+async def stop_event_bus():
+    await bus.stop()
+
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     await manager.connect(ws)
@@ -32,111 +135,245 @@ async def websocket_endpoint(ws: WebSocket):
     except WebSocketDisconnect:
         manager.disconnect(ws)
 
+# Connected camera ingest sockets
+ingest_sessions = set()
+
+@app.websocket("/ws/ingest")
+async def ingest_endpoint(ws: WebSocket):
+    session = IngestSession(ws, batcher.submit, _publish_recognition)
+    if not await session.handshake():
+        return
+    if not _is_ready():
+        await ws.close(code=1013)  # try again later
+        return
+    ingest_sessions.add(session)
+    try:
+        await session.run()
+    finally:
+        ingest_sessions.discard(session)
+
+async def _publish_recognition(result, device_id):
+    """Caches the preview and notifies dashboards; returns the event_id (None for rejected crops)."""
+    if result.status == "rejected":
+        return None  # nothing worth showing or enrolling
+    event_id = previews.put(result.thumbnail, result.vector)
+    if bus.shared:
+        # The dashboard may fetch /preview/{event_id} from any worker
+        bus.publish("preview", {"event_id": event_id, "thumbnail": base64.b64encode(result.thumbnail).decode(), "vector": result.vector})
+    if not (result.cached and SUPPRESS_DUPLICATE_EVENTS):
+        with metrics.stage("broadcast"):
+            await manager.broadcast_recognition(result.status, result.person_id, device_id, event_id)
+    return event_id
+
+def _recognition_response(result, event_id):
+    response = {"status": result.status, "person_id": result.person_id, "event_id": event_id}
+    if result.reason is not None:
+        response["reason"] = result.reason
+    return response
+
 @app.post("/recognize")
 async def recognize(file: UploadFile = File(...), device_id: Optional[str] = Query(None)):
+    _require_ready()
+    try:
+        with metrics.stage("upload_read"):
+            content = await file.read()
+        try:
+            result = await batcher.submit((content, device_id))
+        except PoolSaturated as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+        except imagesProcessing.ImageDecodeError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Stages measured on the worker thread (decode, embed, search, ...) join this request's trace
+        metrics.add_to_trace(result.timings)
+        event_id = await _publish_recognition(result, device_id)
+        return _recognition_response(result, event_id)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/recognize-batch")
+async def recognize_batch(files: List[UploadFile] = File(...), device_id: Optional[str] = Query(None)):
+    _require_ready()
     try:
-        content = await file.read()
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
+        with metrics.stage("upload_read"):
+            contents = [await f.read() for f in files]
+        outcomes = await asyncio.gather(*(batcher.submit((c, device_id)) for c in contents), return_exceptions=True)
+        if all(isinstance(o, PoolSaturated) for o in outcomes):
+            raise HTTPException(status_code=503, detail=str(outcomes[0]), headers={"Retry-After": "1"})
 
-        status, vector, person_id = imagesProcessing.is_familiar(tmp_path)
-        os.unlink(tmp_path)
+        # Uploads that went through the same inference batch share its timings; merge each batch once
+        batch_timings = {id(o.timings): o.timings for o in outcomes if not isinstance(o, Exception)}
+        for timings in batch_timings.values():
+            metrics.add_to_trace(timings)
 
-        preview_image = base64.b64encode(content).decode("utf-8")
-        await manager.broadcast_recognition(status, person_id, device_id, preview_image, vector)
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                results.append({"status": "error", "detail": str(outcome)})
+                continue
+            event_id = await _publish_recognition(outcome, device_id)
+            results.append(_recognition_response(outcome, event_id))
 
-        return {"status": status, "person_id": person_id, "vector": vector}
+        return {"results": results}
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _cached_preview(event_id: str):
+    entry = previews.get(event_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired event_id")
+    return entry
+
+@app.get("/preview/{event_id}")
+def preview(event_id: str):
+    entry = _cached_preview(event_id)
+    return Response(content=entry.thumbnail, media_type="image/jpeg", headers={"Cache-Control": "private, max-age=600"})
+
+@app.get("/events/{event_id}/vector")
+def event_vector(event_id: str):
+    return {"event_id": event_id, "vector": _cached_preview(event_id).vector}
+
 @app.post("/add-person")
 async def add_person(payload: AddPersonPayload):
-    print("=== Add Person Request Received ===")
-    print(f"Vector length: {len(payload.vector)}")
+    vector = payload.vector
+    if not vector and payload.event_id:
+        vector = _cached_preview(payload.event_id).vector
     try:
-        if not payload.vector:
-            print("Error: Missing vector")
+        if not vector:
             raise ValueError("Vector is required")
-            
-        print("Calling add_new_person...")
-        person_id = imagesProcessing.add_new_person(payload.vector)
-        print(f"Person added successfully with ID {person_id}")
+
+        person_id = await run_in_threadpool(imagesProcessing.add_new_person, vector)
+        logger.info("Person %s added (vector length %d)", person_id, len(vector))
         await manager.broadcast_person_added()
         return {"status": "person added", "person_id": person_id}
+    except facedb.InvalidVectorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Error in add_person: {str(e)}")
+        logger.warning("add-person failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/update-visit")
-async def update_visit(vector: List[float] = Query(...), person_id: str = Query(...)):
+async def update_visit(vector: List[float] = Query(...), person_id: int = Query(...)):
     try:
-        imagesProcessing.add_new_visit(vector, person_id)
-        await manager.broadcast_visit_updated(person_id)
+        await run_in_threadpool(imagesProcessing.add_new_visit, vector, person_id)
+        await manager.broadcast_visit_updated(str(person_id))  # dashboards receive it as a string, as before
         return {"status": "visit updated"}
+    except facedb.InvalidVectorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except facedb.UnknownPersonError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+async def _read_records(request: Request, key: str, model):
+    """
+    Parses a bulk body: NDJSON (Content-Type application/x-ndjson, one record
+    per line) or JSON, either {key: [records]} or a bare list of records.
+    """
+    body = await request.body()
+    try:
+        if "ndjson" in request.headers.get("content-type", ""):
+            items = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            data = json.loads(body)
+            items = data[key] if isinstance(data, dict) else data
+        if len(items) > BULK_MAX_RECORDS:
+            raise HTTPException(status_code=413, detail=f"At most {BULK_MAX_RECORDS} records per request")
+        records = [model(**item) for item in items]
+    except (ValueError, KeyError, TypeError, ValidationError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid bulk body: {e}")
+    return records
+
+def _check_dimensions(vectors):
+    # Against the stored embedding size, so a bad batch is refused before anything is written
+    expected = facedb.embedding_dim()
+    for vector in vectors:
+        if len(vector) != expected:
+            raise HTTPException(status_code=400, detail=f"Every vector must have length {expected}, got {len(vector)}")
+
+@app.post("/add-people")
+async def add_people(request: Request):
+    """Bulk /add-person: every record becomes a new person, all in one transaction."""
+    records = await _read_records(request, "people", AddPersonPayload)
+    vectors = []
+    for record in records:
+        vector = record.vector
+        if not vector and record.event_id:
+            vector = _cached_preview(record.event_id).vector
+        if not vector:
+            raise HTTPException(status_code=400, detail="Every record needs a vector or an event_id")
+        vectors.append(vector)
+    _check_dimensions(vectors)
+    try:
+        person_ids = await run_in_threadpool(imagesProcessing.add_new_persons, vectors)
+    except facedb.InvalidVectorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
+        logger.warning("add-people failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+    if person_ids:
+        await manager.broadcast_person_added(len(person_ids))
+    return {"status": "people added", "person_ids": person_ids}
+
+@app.post("/update-visits")
+async def update_visits(request: Request):
+    """Bulk /update-visit: records of {person_id, vector}, applied (with eviction) in one transaction."""
+    records = await _read_records(request, "visits", VisitPayload)
+    _check_dimensions([r.vector for r in records])
+    try:
+        await run_in_threadpool(imagesProcessing.add_new_visits, [(r.person_id, r.vector) for r in records])
+    except facedb.InvalidVectorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except facedb.UnknownPersonError as e:  # nothing was written
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    persons = {r.person_id for r in records}
+    if records:
+        await manager.broadcast_visit_updated(str(next(iter(persons))) if len(persons) == 1 else None, len(records))
+    return {"status": "visits updated", "count": len(records), "persons": len(persons)}
 
 @app.get("/status")
 def health():
-    return {"status": "online"}
+    # 503 until the gallery and model are loaded so load balancers hold traffic back
+    if not _is_ready():
+        return JSONResponse(status_code=503, content={
+            "status": "error" if _warm_up_error else "loading",
+            "model_loaded": embedder.ready,
+            "gallery_loaded": facedb.is_ready(),
+            "detail": _warm_up_error,
+        })
+    return {"status": "online", "model_loaded": True, "pool": pool.stats(), "batching": batcher.stats(), "websockets": manager.stats(), "dedup": recent_matches.stats(), "ingest": {"connections": len(ingest_sessions)}, "event_bus": bus.stats(), "quality": quality_gate.stats()}
+
+@app.get("/metrics")
+def prometheus_metrics():
+    return Response(content=registry.render(), media_type="text/plain; version=0.0.4")
 
 @app.get("/list-people")
-async def list_people():
+async def list_people(
+    limit: int = Query(100, ge=1, le=1000),
+    after: Optional[int] = Query(None, description="person_id of the last row of the previous page"),
+    since: Optional[datetime] = Query(None, description="only people seen after this time"),
+):
     try:
-        with get_conn() as conn:
-            cur = conn.cursor()
-            try:
-                if USE_LOCAL:
-                    # SQLite version
-                    cur.execute("""
-                        SELECT 
-                            p.person_id,
-                            MAX(v.last_checked) as last_seen,
-                            COUNT(v.vector_id) as vector_count,
-                            (
-                                SELECT vector 
-                                FROM vectors 
-                                WHERE person_id = p.person_id 
-                                ORDER BY last_checked DESC 
-                                LIMIT 1
-                            ) as latest_vector
-                        FROM persons p
-                        LEFT JOIN vectors v ON p.person_id = v.person_id
-                        GROUP BY p.person_id
-                        ORDER BY p.person_id
-                    """)
-                else:
-                    # PostgreSQL version
-                    cur.execute("""
-                        SELECT 
-                            p.person_id,
-                            MAX(v.last_checked) as last_seen,
-                            COUNT(v.vector_id) as vector_count,
-                            (
-                                SELECT vector::text
-                                FROM vectors 
-                                WHERE person_id = p.person_id 
-                                ORDER BY last_checked DESC 
-                                LIMIT 1
-                            ) as latest_vector
-                        FROM persons p
-                        LEFT JOIN vectors v ON p.person_id = v.person_id
-                        GROUP BY p.person_id
-                        ORDER BY p.person_id
-                    """)
-                rows = cur.fetchall()
-            finally:
-                cur.close()
-            
-            return {
-                "people": [{
-                    "id": r[0],
-                    "last_seen": r[1],
-                    "vector_count": r[2],
-                    "has_vector": r[3] is not None
-                } for r in rows]
-            }
+        if since is not None and since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)  # stored timestamps are naive UTC
+        rows = await run_in_threadpool(facedb.list_persons, limit, after, since)
+        return {
+            "people": [{
+                "id": r[0],
+                "last_seen": r[1],
+                "vector_count": r[2],
+                "has_vector": r[2] > 0
+            } for r in rows],
+            # Pass as ?after= to get the next page; None when this was the last one
+            "next_after": rows[-1][0] if len(rows) == limit else None
+        }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,156 +0,0 @@
-/*! For license information please see main.c5968f34.js.LICENSE.txt */
-(()=>{var e={43:(e,t,n)=>{"use strict";e.exports=n(202)},52:(e,t,n)=>{"use strict";var r=n(994);t.Ay=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{themeId:t,defaultTheme:n=h,rootShouldForwardProp:r=m,slotShouldForwardProp:s=m}=e,c=e=>(0,u.default)((0,o.default)({},e,{theme:g((0,o.default)({},e,{defaultTheme:n,themeId:t}))}));return c.__mui_systemSx=!0,function(e){let u=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};(0,i.internal_processStyles)(e,(e=>e.filter((e=>!(null!=e&&e.__mui_systemSx)))));const{name:d,slot:f,skipVariantsResolver:h,skipSx:x,overridesResolver:w=b(v(f))}=u,S=(0,a.default)(u,p),k=void 0!==h?h:f&&"Root"!==f&&"root"!==f||!1,C=x||!1;let A=m;"Root"===f||"root"===f?A=r:f?A=s:function(e){return"string"===typeof e&&e.charCodeAt(0)>96}(e)&&(A=void 0);const E=(0,i.default)(e,(0,o.default)({shouldForwardProp:A,label:undefined},S)),R=e=>"function"===typeof e&&e.__emotion_real!==e||(0,l.isPlainObject)(e)?r=>y(e,(0,o.default)({},r,{theme:g({theme:r.theme,defaultTheme:n,themeId:t})})):e,P=function(r){let a=R(r);for(var i=arguments.length,l=new Array(i>1?i-1:0),s=1;s<i;s++)l[s-1]=arguments[s];const u=l?l.map(R):[];d&&w&&u.push((e=>{const r=g((0,o.default)({},e,{defaultTheme:n,themeId:t}));if(!r.components||!r.components[d]||!r.components[d].styleOverrides)return null;const a=r.components[d].styleOverrides,i={};return Object.entries(a).forEach((t=>{let[n,a]=t;i[n]=y(a,(0,o.default)({},e,{theme:r}))})),w(e,i)})),d&&!k&&u.push((e=>{var r;const a=g((0,o.default)({},e,{defaultTheme:n,themeId:t}));return y({variants:null==a||null==(r=a.components)||null==(r=r[d])?void 0:r.variants},(0,o.default)({},e,{theme:a}))})),C||u.push(c);const p=u.length-l.length;if(Array.isArray(r)&&p>0){const e=new Array(p).fill("");a=[...r,...e],a.raw=[...r.raw,...e]}const f=E(a,...u);return e.muiName&&(f.muiName=e.muiName),f};return E.withConfig&&(P.withConfig=E.withConfig),P}};var o=r(n(634)),a=r(n(893)),i=function(e,t){if(!t&&e&&e.__esModule)return e;if(null===e||"object"!=typeof e&&"function"!=typeof e)return{default:e};var n=f(t);if(n&&n.has(e))return n.get(e);var r={__proto__:null},o=Object.defineProperty&&Object.getOwnPropertyDescriptor;for(var a in e)if("default"!==a&&Object.prototype.hasOwnProperty.call(e,a)){var i=o?Object.getOwnPropertyDescriptor(e,a):null;i&&(i.get||i.set)?Object.defineProperty(r,a,i):r[a]=e[a]}return r.default=e,n&&n.set(e,r),r}(n(174)),l=n(482),s=(r(n(537)),r(n(382)),r(n(989))),u=r(n(996));const c=["ownerState"],d=["variants"],p=["name","slot","skipVariantsResolver","skipSx","overridesResolver"];function f(e){if("function"!=typeof WeakMap)return null;var t=new WeakMap,n=new WeakMap;return(f=function(e){return e?n:t})(e)}function m(e){return"ownerState"!==e&&"theme"!==e&&"sx"!==e&&"as"!==e}const h=(0,s.default)(),v=e=>e?e.charAt(0).toLowerCase()+e.slice(1):e;function g(e){let{defaultTheme:t,theme:n,themeId:r}=e;return o=n,0===Object.keys(o).length?t:n[r]||n;var o}function b(e){return e?(t,n)=>n[e]:null}function y(e,t){let{ownerState:n}=t,r=(0,a.default)(t,c);const i="function"===typeof e?e((0,o.default)({ownerState:n},r)):e;if(Array.isArray(i))return i.flatMap((e=>y(e,(0,o.default)({ownerState:n},r))));if(i&&"object"===typeof i&&Array.isArray(i.variants)){const{variants:e=[]}=i;let t=(0,a.default)(i,d);return e.forEach((e=>{let a=!0;"function"===typeof e.props?a=e.props((0,o.default)({ownerState:n},r,n)):Object.keys(e.props).forEach((t=>{(null==n?void 0:n[t])!==e.props[t]&&r[t]!==e.props[t]&&(a=!1)})),a&&(Array.isArray(t)||(t=[t]),t.push("function"===typeof e.style?e.style((0,o.default)({ownerState:n},r,n)):e.style))})),t}return i}},153:(e,t,n)=>{"use strict";var r=n(43),o=Symbol.for("react.element"),a=Symbol.for("react.fragment"),i=Object.prototype.hasOwnProperty,l=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,s={key:!0,ref:!0,__self:!0,__source:!0};function u(e,t,n){var r,a={},u=null,c=null;for(r in void 0!==n&&(u=""+n),void 0!==t.key&&(u=""+t.key),void 0!==t.ref&&(c=t.ref),t)i.call(t,r)&&!s.hasOwnProperty(r)&&(a[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps)void 0===a[r]&&(a[r]=t[r]);return{$$typeof:o,type:e,key:u,ref:c,props:a,_owner:l.current}}t.jsx=u,t.jsxs=u},162:(e,t,n)=>{"use strict";n.d(t,{Ay:()=>l,BO:()=>i,Yn:()=>a});var r=n(598),o=n(751);function a(e,t){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!t||"string"!==typeof t)return null;if(e&&e.vars&&n){const n=`vars.${t}`.split(".").reduce(((e,t)=>e&&e[t]?e[t]:null),e);if(null!=n)return n}return t.split(".").reduce(((e,t)=>e&&null!=e[t]?e[t]:null),e)}function i(e,t,n){let r,o=arguments.length>3&&void 0!==arguments[3]?arguments[3]:n;return r="function"===typeof e?e(n):Array.isArray(e)?e[n]||o:a(e,n)||o,t&&(r=t(r,o,e)),r}const l=function(e){const{prop:t,cssProperty:n=e.prop,themeKey:l,transform:s}=e,u=e=>{if(null==e[t])return null;const u=e[t],c=a(e.theme,l)||{};return(0,o.NI)(e,u,(e=>{let o=i(c,s,e);return e===o&&"string"===typeof e&&(o=i(c,s,`${t}${"default"===e?"":(0,r.A)(e)}`,e)),!1===n?o:{[n]:o}}))};return u.propTypes={},u.filterProps=[t],u}},168:(e,t,n)=>{"use strict";function r(){return r=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},r.apply(null,arguments)}n.d(t,{A:()=>r})},172:(e,t,n)=>{"use strict";n.d(t,{A:()=>l,Q:()=>a});var r=n(168),o=n(43);function a(e){if("object"!==typeof e||null===e)return!1;const t=Object.getPrototypeOf(e);return(null===t||t===Object.prototype||null===Object.getPrototypeOf(t))&&!(Symbol.toStringTag in e)&&!(Symbol.iterator in e)}function i(e){if(o.isValidElement(e)||!a(e))return e;const t={};return Object.keys(e).forEach((n=>{t[n]=i(e[n])})),t}function l(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{clone:!0};const s=n.clone?(0,r.A)({},e):e;return a(e)&&a(t)&&Object.keys(t).forEach((r=>{o.isValidElement(t[r])?s[r]=t[r]:a(t[r])&&Object.prototype.hasOwnProperty.call(e,r)&&a(e[r])?s[r]=l(e[r],t[r],n):n.clone?s[r]=a(t[r])?i(t[r]):t[r]:s[r]=t[r]})),s}},174:(e,t,n)=>{"use strict";n.r(t),n.d(t,{GlobalStyles:()=>S.A,StyledEngineProvider:()=>w,ThemeContext:()=>o.T,css:()=>g.AH,default:()=>k,internal_processStyles:()=>C,keyframes:()=>g.i7});var r=n(168),o=n(369),a=n(217),i=n(436),l=n(722),s=n(43),u=n(918),c=/^((children|dangerouslySetInnerHTML|key|ref|autoFocus|defaultValue|defaultChecked|innerHTML|suppressContentEditableWarning|suppressHydrationWarning|valueLink|abbr|accept|acceptCharset|accessKey|action|allow|allowUserMedia|allowPaymentRequest|allowFullScreen|allowTransparency|alt|async|autoComplete|autoPlay|capture|cellPadding|cellSpacing|challenge|charSet|checked|cite|classID|className|cols|colSpan|content|contentEditable|contextMenu|controls|controlsList|coords|crossOrigin|data|dateTime|decoding|default|defer|dir|disabled|disablePictureInPicture|disableRemotePlayback|download|draggable|encType|enterKeyHint|fetchpriority|fetchPriority|form|formAction|formEncType|formMethod|formNoValidate|formTarget|frameBorder|headers|height|hidden|high|href|hrefLang|htmlFor|httpEquiv|id|inputMode|integrity|is|keyParams|keyType|kind|label|lang|list|loading|loop|low|marginHeight|marginWidth|max|maxLength|media|mediaGroup|method|min|minLength|multiple|muted|name|nonce|noValidate|open|optimum|pattern|placeholder|playsInline|poster|preload|profile|radioGroup|readOnly|referrerPolicy|rel|required|reversed|role|rows|rowSpan|sandbox|scope|scoped|scrolling|seamless|selected|shape|size|sizes|slot|span|spellCheck|src|srcDoc|srcLang|srcSet|start|step|style|summary|tabIndex|target|title|translate|type|useMap|value|width|wmode|wrap|about|datatype|inlist|prefix|property|resource|typeof|vocab|autoCapitalize|autoCorrect|autoSave|color|incremental|fallback|inert|itemProp|itemScope|itemType|itemID|itemRef|on|option|results|security|unselectable|accentHeight|accumulate|additive|alignmentBaseline|allowReorder|alphabetic|amplitude|arabicForm|ascent|attributeName|attributeType|autoReverse|azimuth|baseFrequency|baselineShift|baseProfile|bbox|begin|bias|by|calcMode|capHeight|clip|clipPathUnits|clipPath|clipRule|colorInterpolation|colorInterpolationFilters|colorProfile|colorRendering|contentScriptType|contentStyleType|cursor|cx|cy|d|decelerate|descent|diffuseConstant|direction|display|divisor|dominantBaseline|dur|dx|dy|edgeMode|elevation|enableBackground|end|exponent|externalResourcesRequired|fill|fillOpacity|fillRule|filter|filterRes|filterUnits|floodColor|floodOpacity|focusable|fontFamily|fontSize|fontSizeAdjust|fontStretch|fontStyle|fontVariant|fontWeight|format|from|fr|fx|fy|g1|g2|glyphName|glyphOrientationHorizontal|glyphOrientationVertical|glyphRef|gradientTransform|gradientUnits|hanging|horizAdvX|horizOriginX|ideographic|imageRendering|in|in2|intercept|k|k1|k2|k3|k4|kernelMatrix|kernelUnitLength|kerning|keyPoints|keySplines|keyTimes|lengthAdjust|letterSpacing|lightingColor|limitingConeAngle|local|markerEnd|markerMid|markerStart|markerHeight|markerUnits|markerWidth|mask|maskContentUnits|maskUnits|mathematical|mode|numOctaves|offset|opacity|operator|order|orient|orientation|origin|overflow|overlinePosition|overlineThickness|panose1|paintOrder|pathLength|patternContentUnits|patternTransform|patternUnits|pointerEvents|points|pointsAtX|pointsAtY|pointsAtZ|preserveAlpha|preserveAspectRatio|primitiveUnits|r|radius|refX|refY|renderingIntent|repeatCount|repeatDur|requiredExtensions|requiredFeatures|restart|result|rotate|rx|ry|scale|seed|shapeRendering|slope|spacing|specularConstant|specularExponent|speed|spreadMethod|startOffset|stdDeviation|stemh|stemv|stitchTiles|stopColor|stopOpacity|strikethroughPosition|strikethroughThickness|string|stroke|strokeDasharray|strokeDashoffset|strokeLinecap|strokeLinejoin|strokeMiterlimit|strokeOpacity|strokeWidth|surfaceScale|systemLanguage|tableValues|targetX|targetY|textAnchor|textDecoration|textRendering|textLength|to|transform|u1|u2|underlinePosition|underlineThickness|unicode|unicodeBidi|unicodeRange|unitsPerEm|vAlphabetic|vHanging|vIdeographic|vMathematical|values|vectorEffect|version|vertAdvY|vertOriginX|vertOriginY|viewBox|viewTarget|visibility|widths|wordSpacing|writingMode|x|xHeight|x1|x2|xChannelSelector|xlinkActuate|xlinkArcrole|xlinkHref|xlinkRole|xlinkShow|xlinkTitle|xlinkType|xmlBase|xmlns|xmlnsXlink|xmlLang|xmlSpace|y|y1|y2|yChannelSelector|z|zoomAndPan|for|class|autofocus)|(([Dd][Aa][Tt][Aa]|[Aa][Rr][Ii][Aa]|x)-.*))$/,d=(0,u.A)((function(e){return c.test(e)||111===e.charCodeAt(0)&&110===e.charCodeAt(1)&&e.charCodeAt(2)<91})),p=function(e){return"theme"!==e},f=function(e){return"string"===typeof e&&e.charCodeAt(0)>96?d:p},m=function(e,t,n){var r;if(t){var o=t.shouldForwardProp;r=e.__emotion_forwardProp&&o?function(t){return e.__emotion_forwardProp(t)&&o(t)}:o}return"function"!==typeof r&&n&&(r=e.__emotion_forwardProp),r},h=function(e){var t=e.cache,n=e.serialized,r=e.isStringTag;return(0,l.SF)(t,n,r),(0,i.s)((function(){return(0,l.sk)(t,n,r)})),null},v=function e(t,n){var i,u,c=t.__emotion_real===t,d=c&&t.__emotion_base||t;void 0!==n&&(i=n.label,u=n.target);var p=m(t,n,c),v=p||f(d),g=!v("as");return function(){var b=arguments,y=c&&void 0!==t.__emotion_styles?t.__emotion_styles.slice(0):[];if(void 0!==i&&y.push("label:"+i+";"),null==b[0]||void 0===b[0].raw)y.push.apply(y,b);else{var x=b[0];y.push(x[0]);for(var w=b.length,S=1;S<w;S++)y.push(b[S],x[S])}var k=(0,o.w)((function(e,t,n){var r=g&&e.as||d,i="",c=[],m=e;if(null==e.theme){for(var b in m={},e)m[b]=e[b];m.theme=s.useContext(o.T)}"string"===typeof e.className?i=(0,l.Rk)(t.registered,c,e.className):null!=e.className&&(i=e.className+" ");var x=(0,a.J)(y.concat(c),t.registered,m);i+=t.key+"-"+x.name,void 0!==u&&(i+=" "+u);var w=g&&void 0===p?f(r):v,S={};for(var k in e)g&&"as"===k||w(k)&&(S[k]=e[k]);return S.className=i,n&&(S.ref=n),s.createElement(s.Fragment,null,s.createElement(h,{cache:t,serialized:x,isStringTag:"string"===typeof r}),s.createElement(r,S))}));return k.displayName=void 0!==i?i:"Styled("+("string"===typeof d?d:d.displayName||d.name||"Component")+")",k.defaultProps=t.defaultProps,k.__emotion_real=k,k.__emotion_base=d,k.__emotion_styles=y,k.__emotion_forwardProp=p,Object.defineProperty(k,"toString",{value:function(){return"."+u}}),k.withComponent=function(t,o){return e(t,(0,r.A)({},n,o,{shouldForwardProp:m(k,o,!0)})).apply(void 0,y)},k}}.bind(null);["a","abbr","address","area","article","aside","audio","b","base","bdi","bdo","big","blockquote","body","br","button","canvas","caption","cite","code","col","colgroup","data","datalist","dd","del","details","dfn","dialog","div","dl","dt","em","embed","fieldset","figcaption","figure","footer","form","h1","h2","h3","h4","h5","h6","head","header","hgroup","hr","html","i","iframe","img","input","ins","kbd","keygen","label","legend","li","link","main","map","mark","marquee","menu","menuitem","meta","meter","nav","noscript","object","ol","optgroup","option","output","p","param","picture","pre","progress","q","rp","rt","ruby","s","samp","script","section","select","small","source","span","strong","style","sub","summary","sup","table","tbody","td","textarea","tfoot","th","thead","time","title","tr","track","u","ul","var","video","wbr","circle","clipPath","defs","ellipse","foreignObject","g","image","line","linearGradient","mask","path","pattern","polygon","polyline","radialGradient","rect","stop","svg","text","tspan"].forEach((function(e){v[e]=v(e)}));var g=n(290),b=n(803),y=n(579);let x;function w(e){const{injectFirst:t,children:n}=e;return t&&x?(0,y.jsx)(o.C,{value:x,children:n}):n}"object"===typeof document&&(x=(0,b.A)({key:"css",prepend:!0}));var S=n(869);function k(e,t){return v(e,t)}const C=(e,t)=>{Array.isArray(e.__emotion_styles)&&(e.__emotion_styles=t(e.__emotion_styles))}},202:(e,t)=>{"use strict";var n=Symbol.for("react.element"),r=Symbol.for("react.portal"),o=Symbol.for("react.fragment"),a=Symbol.for("react.strict_mode"),i=Symbol.for("react.profiler"),l=Symbol.for("react.provider"),s=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),p=Symbol.for("react.lazy"),f=Symbol.iterator;var m={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},h=Object.assign,v={};function g(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||m}function b(){}function y(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||m}g.prototype.isReactComponent={},g.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},g.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},b.prototype=g.prototype;var x=y.prototype=new b;x.constructor=y,h(x,g.prototype),x.isPureReactComponent=!0;var w=Array.isArray,S=Object.prototype.hasOwnProperty,k={current:null},C={key:!0,ref:!0,__self:!0,__source:!0};function A(e,t,r){var o,a={},i=null,l=null;if(null!=t)for(o in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(i=""+t.key),t)S.call(t,o)&&!C.hasOwnProperty(o)&&(a[o]=t[o]);var s=arguments.length-2;if(1===s)a.children=r;else if(1<s){for(var u=Array(s),c=0;c<s;c++)u[c]=arguments[c+2];a.children=u}if(e&&e.defaultProps)for(o in s=e.defaultProps)void 0===a[o]&&(a[o]=s[o]);return{$$typeof:n,type:e,key:i,ref:l,props:a,_owner:k.current}}function E(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var R=/\/+/g;function P(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function M(e,t,o,a,i){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var s=!1;if(null===e)s=!0;else switch(l){case"string":case"number":s=!0;break;case"object":switch(e.$$typeof){case n:case r:s=!0}}if(s)return i=i(s=e),e=""===a?"."+P(s,0):a,w(i)?(o="",null!=e&&(o=e.replace(R,"$&/")+"/"),M(i,t,o,"",(function(e){return e}))):null!=i&&(E(i)&&(i=function(e,t){return{$$typeof:n,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(i,o+(!i.key||s&&s.key===i.key?"":(""+i.key).replace(R,"$&/")+"/")+e)),t.push(i)),1;if(s=0,a=""===a?".":a+":",w(e))for(var u=0;u<e.length;u++){var c=a+P(l=e[u],u);s+=M(l,t,o,c,i)}else if(c=function(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=f&&e[f]||e["@@iterator"])?e:null}(e),"function"===typeof c)for(e=c.call(e),u=0;!(l=e.next()).done;)s+=M(l=l.value,t,o,c=a+P(l,u++),i);else if("object"===l)throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return s}function N(e,t,n){if(null==e)return e;var r=[],o=0;return M(e,r,"","",(function(e){return t.call(n,e,o++)})),r}function $(e){if(-1===e._status){var t=e._result;(t=t()).then((function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)}),(function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)})),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var T={current:null},z={transition:null},O={ReactCurrentDispatcher:T,ReactCurrentBatchConfig:z,ReactCurrentOwner:k};function I(){throw Error("act(...) is not supported in production builds of React.")}t.Children={map:N,forEach:function(e,t,n){N(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return N(e,(function(){t++})),t},toArray:function(e){return N(e,(function(e){return e}))||[]},only:function(e){if(!E(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=g,t.Fragment=o,t.Profiler=i,t.PureComponent=y,t.StrictMode=a,t.Suspense=c,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=O,t.act=I,t.cloneElement=function(e,t,r){if(null===e||void 0===e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var o=h({},e.props),a=e.key,i=e.ref,l=e._owner;if(null!=t){if(void 0!==t.ref&&(i=t.ref,l=k.current),void 0!==t.key&&(a=""+t.key),e.type&&e.type.defaultProps)var s=e.type.defaultProps;for(u in t)S.call(t,u)&&!C.hasOwnProperty(u)&&(o[u]=void 0===t[u]&&void 0!==s?s[u]:t[u])}var u=arguments.length-2;if(1===u)o.children=r;else if(1<u){s=Array(u);for(var c=0;c<u;c++)s[c]=arguments[c+2];o.children=s}return{$$typeof:n,type:e.type,key:a,ref:i,props:o,_owner:l}},t.createContext=function(e){return(e={$$typeof:s,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:l,_context:e},e.Consumer=e},t.createElement=A,t.createFactory=function(e){var t=A.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:u,render:e}},t.isValidElement=E,t.lazy=function(e){return{$$typeof:p,_payload:{_status:-1,_result:e},_init:$}},t.memo=function(e,t){return{$$typeof:d,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=z.transition;z.transition={};try{e()}finally{z.transition=t}},t.unstable_act=I,t.useCallback=function(e,t){return T.current.useCallback(e,t)},t.useContext=function(e){return T.current.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e){return T.current.useDeferredValue(e)},t.useEffect=function(e,t){return T.current.useEffect(e,t)},t.useId=function(){return T.current.useId()},t.useImperativeHandle=function(e,t,n){return T.current.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return T.current.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return T.current.useLayoutEffect(e,t)},t.useMemo=function(e,t){return T.current.useMemo(e,t)},t.useReducer=function(e,t,n){return T.current.useReducer(e,t,n)},t.useRef=function(e){return T.current.useRef(e)},t.useState=function(e){return T.current.useState(e)},t.useSyncExternalStore=function(e,t,n){return T.current.useSyncExternalStore(e,t,n)},t.useTransition=function(){return T.current.useTransition()},t.version="18.3.1"},214:(e,t,n)=>{"use strict";n.r(t),n.d(t,{default:()=>r});const r=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Number.MIN_SAFE_INTEGER,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:Number.MAX_SAFE_INTEGER;return Math.max(t,Math.min(e,n))}},217:(e,t,n)=>{"use strict";n.d(t,{J:()=>v});var r={animationIterationCount:1,aspectRatio:1,borderImageOutset:1,borderImageSlice:1,borderImageWidth:1,boxFlex:1,boxFlexGroup:1,boxOrdinalGroup:1,columnCount:1,columns:1,flex:1,flexGrow:1,flexPositive:1,flexShrink:1,flexNegative:1,flexOrder:1,gridRow:1,gridRowEnd:1,gridRowSpan:1,gridRowStart:1,gridColumn:1,gridColumnEnd:1,gridColumnSpan:1,gridColumnStart:1,msGridRow:1,msGridRowSpan:1,msGridColumn:1,msGridColumnSpan:1,fontWeight:1,lineHeight:1,opacity:1,order:1,orphans:1,scale:1,tabSize:1,widows:1,zIndex:1,zoom:1,WebkitLineClamp:1,fillOpacity:1,floodOpacity:1,stopOpacity:1,strokeDasharray:1,strokeDashoffset:1,strokeMiterlimit:1,strokeOpacity:1,strokeWidth:1},o=n(918),a=!1,i=/[A-Z]|^ms/g,l=/_EMO_([^_]+?)_([^]*?)_EMO_/g,s=function(e){return 45===e.charCodeAt(1)},u=function(e){return null!=e&&"boolean"!==typeof e},c=(0,o.A)((function(e){return s(e)?e:e.replace(i,"-$&").toLowerCase()})),d=function(e,t){switch(e){case"animation":case"animationName":if("string"===typeof t)return t.replace(l,(function(e,t,n){return m={name:t,styles:n,next:m},t}))}return 1===r[e]||s(e)||"number"!==typeof t||0===t?t:t+"px"},p="Component selectors can only be used in conjunction with @emotion/babel-plugin, the swc Emotion plugin, or another Emotion-aware compiler transform.";function f(e,t,n){if(null==n)return"";var r=n;if(void 0!==r.__emotion_styles)return r;switch(typeof n){case"boolean":return"";case"object":var o=n;if(1===o.anim)return m={name:o.name,styles:o.styles,next:m},o.name;var i=n;if(void 0!==i.styles){var l=i.next;if(void 0!==l)for(;void 0!==l;)m={name:l.name,styles:l.styles,next:m},l=l.next;return i.styles+";"}return function(e,t,n){var r="";if(Array.isArray(n))for(var o=0;o<n.length;o++)r+=f(e,t,n[o])+";";else for(var i in n){var l=n[i];if("object"!==typeof l){var s=l;null!=t&&void 0!==t[s]?r+=i+"{"+t[s]+"}":u(s)&&(r+=c(i)+":"+d(i,s)+";")}else{if("NO_COMPONENT_SELECTOR"===i&&a)throw new Error(p);if(!Array.isArray(l)||"string"!==typeof l[0]||null!=t&&void 0!==t[l[0]]){var m=f(e,t,l);switch(i){case"animation":case"animationName":r+=c(i)+":"+m+";";break;default:r+=i+"{"+m+"}"}}else for(var h=0;h<l.length;h++)u(l[h])&&(r+=c(i)+":"+d(i,l[h])+";")}}return r}(e,t,n);case"function":if(void 0!==e){var s=m,h=n(e);return m=s,f(e,t,h)}}var v=n;if(null==t)return v;var g=t[v];return void 0!==g?g:v}var m,h=/label:\s*([^\s;{]+)\s*(;|$)/g;function v(e,t,n){if(1===e.length&&"object"===typeof e[0]&&null!==e[0]&&void 0!==e[0].styles)return e[0];var r=!0,o="";m=void 0;var a=e[0];null==a||void 0===a.raw?(r=!1,o+=f(n,t,a)):o+=a[0];for(var i=1;i<e.length;i++){if(o+=f(n,t,e[i]),r)o+=a[i]}h.lastIndex=0;for(var l,s="";null!==(l=h.exec(o));)s+="-"+l[1];var u=function(e){for(var t,n=0,r=0,o=e.length;o>=4;++r,o-=4)t=1540483477*(65535&(t=255&e.charCodeAt(r)|(255&e.charCodeAt(++r))<<8|(255&e.charCodeAt(++r))<<16|(255&e.charCodeAt(++r))<<24))+(59797*(t>>>16)<<16),n=1540483477*(65535&(t^=t>>>24))+(59797*(t>>>16)<<16)^1540483477*(65535&n)+(59797*(n>>>16)<<16);switch(o){case 3:n^=(255&e.charCodeAt(r+2))<<16;case 2:n^=(255&e.charCodeAt(r+1))<<8;case 1:n=1540483477*(65535&(n^=255&e.charCodeAt(r)))+(59797*(n>>>16)<<16)}return(((n=1540483477*(65535&(n^=n>>>13))+(59797*(n>>>16)<<16))^n>>>15)>>>0).toString(36)}(o)+s;return{name:u,styles:o,next:m}}},219:(e,t,n)=>{"use strict";var r=n(763),o={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},a={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},i={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},l={};function s(e){return r.isMemo(e)?i:l[e.$$typeof]||o}l[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},l[r.Memo]=i;var u=Object.defineProperty,c=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,p=Object.getOwnPropertyDescriptor,f=Object.getPrototypeOf,m=Object.prototype;e.exports=function e(t,n,r){if("string"!==typeof n){if(m){var o=f(n);o&&o!==m&&e(t,o,r)}var i=c(n);d&&(i=i.concat(d(n)));for(var l=s(t),h=s(n),v=0;v<i.length;++v){var g=i[v];if(!a[g]&&(!r||!r[g])&&(!h||!h[g])&&(!l||!l[g])){var b=p(n,g);try{u(t,g,b)}catch(y){}}}}return t}},234:(e,t)=>{"use strict";function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,o=e[r];if(!(0<a(o,t)))break e;e[r]=t,e[n]=o,n=r}}function r(e){return 0===e.length?null:e[0]}function o(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,o=e.length,i=o>>>1;r<i;){var l=2*(r+1)-1,s=e[l],u=l+1,c=e[u];if(0>a(s,n))u<o&&0>a(c,s)?(e[r]=c,e[u]=n,r=u):(e[r]=s,e[l]=n,r=l);else{if(!(u<o&&0>a(c,n)))break e;e[r]=c,e[u]=n,r=u}}}return t}function a(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if("object"===typeof performance&&"function"===typeof performance.now){var i=performance;t.unstable_now=function(){return i.now()}}else{var l=Date,s=l.now();t.unstable_now=function(){return l.now()-s}}var u=[],c=[],d=1,p=null,f=3,m=!1,h=!1,v=!1,g="function"===typeof setTimeout?setTimeout:null,b="function"===typeof clearTimeout?clearTimeout:null,y="undefined"!==typeof setImmediate?setImmediate:null;function x(e){for(var t=r(c);null!==t;){if(null===t.callback)o(c);else{if(!(t.startTime<=e))break;o(c),t.sortIndex=t.expirationTime,n(u,t)}t=r(c)}}function w(e){if(v=!1,x(e),!h)if(null!==r(u))h=!0,z(S);else{var t=r(c);null!==t&&O(w,t.startTime-e)}}function S(e,n){h=!1,v&&(v=!1,b(E),E=-1),m=!0;var a=f;try{for(x(n),p=r(u);null!==p&&(!(p.expirationTime>n)||e&&!M());){var i=p.callback;if("function"===typeof i){p.callback=null,f=p.priorityLevel;var l=i(p.expirationTime<=n);n=t.unstable_now(),"function"===typeof l?p.callback=l:p===r(u)&&o(u),x(n)}else o(u);p=r(u)}if(null!==p)var s=!0;else{var d=r(c);null!==d&&O(w,d.startTime-n),s=!1}return s}finally{p=null,f=a,m=!1}}"undefined"!==typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var k,C=!1,A=null,E=-1,R=5,P=-1;function M(){return!(t.unstable_now()-P<R)}function N(){if(null!==A){var e=t.unstable_now();P=e;var n=!0;try{n=A(!0,e)}finally{n?k():(C=!1,A=null)}}else C=!1}if("function"===typeof y)k=function(){y(N)};else if("undefined"!==typeof MessageChannel){var $=new MessageChannel,T=$.port2;$.port1.onmessage=N,k=function(){T.postMessage(null)}}else k=function(){g(N,0)};function z(e){A=e,C||(C=!0,k())}function O(e,n){E=g((function(){e(t.unstable_now())}),n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){h||m||(h=!0,z(S))},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):R=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return f},t.unstable_getFirstCallbackNode=function(){return r(u)},t.unstable_next=function(e){switch(f){case 1:case 2:case 3:var t=3;break;default:t=f}var n=f;f=t;try{return e()}finally{f=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=function(){},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=f;f=e;try{return t()}finally{f=n}},t.unstable_scheduleCallback=function(e,o,a){var i=t.unstable_now();switch("object"===typeof a&&null!==a?a="number"===typeof(a=a.delay)&&0<a?i+a:i:a=i,e){case 1:var l=-1;break;case 2:l=250;break;case 5:l=1073741823;break;case 4:l=1e4;break;default:l=5e3}return e={id:d++,callback:o,priorityLevel:e,startTime:a,expirationTime:l=a+l,sortIndex:-1},a>i?(e.sortIndex=a,n(c,e),null===r(u)&&e===r(c)&&(v?(b(E),E=-1):v=!0,O(w,a-i))):(e.sortIndex=l,n(u,e),h||m||(h=!0,z(S))),e},t.unstable_shouldYield=M,t.unstable_wrapCallback=function(e){var t=f;return function(){var n=f;f=t;try{return e.apply(this,arguments)}finally{f=n}}}},266:(e,t,n)=>{"use strict";var r=n(994);t.X4=f,t.e$=m,t.eM=function(e,t){const n=p(e),r=p(t);return(Math.max(n,r)+.05)/(Math.min(n,r)+.05)},t.a=h;var o=r(n(457)),a=r(n(214));function i(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1;return(0,a.default)(e,t,n)}function l(e){e=e.slice(1);const t=new RegExp(`.{1,${e.length>=6?2:1}}`,"g");let n=e.match(t);return n&&1===n[0].length&&(n=n.map((e=>e+e))),n?`rgb${4===n.length?"a":""}(${n.map(((e,t)=>t<3?parseInt(e,16):Math.round(parseInt(e,16)/255*1e3)/1e3)).join(", ")})`:""}function s(e){if(e.type)return e;if("#"===e.charAt(0))return s(l(e));const t=e.indexOf("("),n=e.substring(0,t);if(-1===["rgb","rgba","hsl","hsla","color"].indexOf(n))throw new Error((0,o.default)(9,e));let r,a=e.substring(t+1,e.length-1);if("color"===n){if(a=a.split(" "),r=a.shift(),4===a.length&&"/"===a[3].charAt(0)&&(a[3]=a[3].slice(1)),-1===["srgb","display-p3","a98-rgb","prophoto-rgb","rec-2020"].indexOf(r))throw new Error((0,o.default)(10,r))}else a=a.split(",");return a=a.map((e=>parseFloat(e))),{type:n,values:a,colorSpace:r}}const u=e=>{const t=s(e);return t.values.slice(0,3).map(((e,n)=>-1!==t.type.indexOf("hsl")&&0!==n?`${e}%`:e)).join(" ")};function c(e){const{type:t,colorSpace:n}=e;let{values:r}=e;return-1!==t.indexOf("rgb")?r=r.map(((e,t)=>t<3?parseInt(e,10):e)):-1!==t.indexOf("hsl")&&(r[1]=`${r[1]}%`,r[2]=`${r[2]}%`),r=-1!==t.indexOf("color")?`${n} ${r.join(" ")}`:`${r.join(", ")}`,`${t}(${r})`}function d(e){e=s(e);const{values:t}=e,n=t[0],r=t[1]/100,o=t[2]/100,a=r*Math.min(o,1-o),i=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:(e+n/30)%12;return o-a*Math.max(Math.min(t-3,9-t,1),-1)};let l="rgb";const u=[Math.round(255*i(0)),Math.round(255*i(8)),Math.round(255*i(4))];return"hsla"===e.type&&(l+="a",u.push(t[3])),c({type:l,values:u})}function p(e){let t="hsl"===(e=s(e)).type||"hsla"===e.type?s(d(e)).values:e.values;return t=t.map((t=>("color"!==e.type&&(t/=255),t<=.03928?t/12.92:((t+.055)/1.055)**2.4))),Number((.2126*t[0]+.7152*t[1]+.0722*t[2]).toFixed(3))}function f(e,t){return e=s(e),t=i(t),"rgb"!==e.type&&"hsl"!==e.type||(e.type+="a"),"color"===e.type?e.values[3]=`/${t}`:e.values[3]=t,c(e)}function m(e,t){if(e=s(e),t=i(t),-1!==e.type.indexOf("hsl"))e.values[2]*=1-t;else if(-1!==e.type.indexOf("rgb")||-1!==e.type.indexOf("color"))for(let n=0;n<3;n+=1)e.values[n]*=1-t;return c(e)}function h(e,t){if(e=s(e),t=i(t),-1!==e.type.indexOf("hsl"))e.values[2]+=(100-e.values[2])*t;else if(-1!==e.type.indexOf("rgb"))for(let n=0;n<3;n+=1)e.values[n]+=(255-e.values[n])*t;else if(-1!==e.type.indexOf("color"))for(let n=0;n<3;n+=1)e.values[n]+=(1-e.values[n])*t;return c(e)}function v(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:.15;return p(e)>.5?m(e,t):h(e,t)}},280:(e,t,n)=>{"use strict";n.d(t,{A:()=>f});var r=n(168),o=n(587),a=n(172),i=n(615);const l={borderRadius:4};var s=n(604);var u=n(812),c=n(758),d=n(703);const p=["breakpoints","palette","spacing","shape"];const f=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{breakpoints:t={},palette:n={},spacing:f,shape:m={}}=e,h=(0,o.A)(e,p),v=(0,i.A)(t),g=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:8;if(e.mui)return e;const t=(0,s.LX)({spacing:e}),n=function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return(0===n.length?[1]:n).map((e=>{const n=t(e);return"number"===typeof n?`${n}px`:n})).join(" ")};return n.mui=!0,n}(f);let b=(0,a.A)({breakpoints:v,direction:"ltr",components:{},palette:(0,r.A)({mode:"light"},n),spacing:g,shape:(0,r.A)({},l,m)},h);b.applyStyles=d.A;for(var y=arguments.length,x=new Array(y>1?y-1:0),w=1;w<y;w++)x[w-1]=arguments[w];return b=x.reduce(((e,t)=>(0,a.A)(e,t)),b),b.unstable_sxConfig=(0,r.A)({},c.A,null==h?void 0:h.unstable_sxConfig),b.unstable_sx=function(e){return(0,u.A)({sx:e,theme:this})},b}},290:(e,t,n)=>{"use strict";n.d(t,{AH:()=>c,i7:()=>d,mL:()=>u});var r=n(369),o=n(43),a=n(722),i=n(436),l=n(217),s=(n(803),n(219),function(e,t){var n=arguments;if(null==t||!r.h.call(t,"css"))return o.createElement.apply(void 0,n);var a=n.length,i=new Array(a);i[0]=r.E,i[1]=(0,r.c)(e,t);for(var l=2;l<a;l++)i[l]=n[l];return o.createElement.apply(null,i)});!function(e){var t;t||(t=e.JSX||(e.JSX={}))}(s||(s={}));var u=(0,r.w)((function(e,t){var n=e.styles,s=(0,l.J)([n],void 0,o.useContext(r.T)),u=o.useRef();return(0,i.i)((function(){var e=t.key+"-global",n=new t.sheet.constructor({key:e,nonce:t.sheet.nonce,container:t.sheet.container,speedy:t.sheet.isSpeedy}),r=!1,o=document.querySelector('style[data-emotion="'+e+" "+s.name+'"]');return t.sheet.tags.length&&(n.before=t.sheet.tags[0]),null!==o&&(r=!0,o.setAttribute("data-emotion",e),n.hydrate([o])),u.current=[n,r],function(){n.flush()}}),[t]),(0,i.i)((function(){var e=u.current,n=e[0];if(e[1])e[1]=!1;else{if(void 0!==s.next&&(0,a.sk)(t,s.next,!0),n.tags.length){var r=n.tags[n.tags.length-1].nextElementSibling;n.before=r,n.flush()}t.insert("",s,n,!1)}}),[t,s.name]),null}));function c(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return(0,l.J)(t)}function d(){var e=c.apply(void 0,arguments),t="animation-"+e.name;return{name:t,styles:"@keyframes "+t+"{"+e.styles+"}",anim:1,toString:function(){return"_EMO_"+this.name+"_"+this.styles+"_EMO_"}}}},369:(e,t,n)=>{"use strict";n.d(t,{C:()=>u,E:()=>v,T:()=>d,c:()=>m,h:()=>p,w:()=>c});var r=n(43),o=n(803),a=n(722),i=n(217),l=n(436),s=r.createContext("undefined"!==typeof HTMLElement?(0,o.A)({key:"css"}):null),u=s.Provider,c=function(e){return(0,r.forwardRef)((function(t,n){var o=(0,r.useContext)(s);return e(t,o,n)}))},d=r.createContext({});var p={}.hasOwnProperty,f="__EMOTION_TYPE_PLEASE_DO_NOT_USE__",m=function(e,t){var n={};for(var r in t)p.call(t,r)&&(n[r]=t[r]);return n[f]=e,n},h=function(e){var t=e.cache,n=e.serialized,r=e.isStringTag;return(0,a.SF)(t,n,r),(0,l.s)((function(){return(0,a.sk)(t,n,r)})),null},v=c((function(e,t,n){var o=e.css;"string"===typeof o&&void 0!==t.registered[o]&&(o=t.registered[o]);var l=e[f],s=[o],u="";"string"===typeof e.className?u=(0,a.Rk)(t.registered,s,e.className):null!=e.className&&(u=e.className+" ");var c=(0,i.J)(s,void 0,r.useContext(d));u+=t.key+"-"+c.name;var m={};for(var v in e)p.call(e,v)&&"css"!==v&&v!==f&&(m[v]=e[v]);return m.className=u,n&&(m.ref=n),r.createElement(r.Fragment,null,r.createElement(h,{cache:t,serialized:c,isStringTag:"string"===typeof l}),r.createElement(l,m))}))},382:(e,t,n)=>{"use strict";n.r(t),n.d(t,{default:()=>s,getFunctionName:()=>a});var r=n(528);const o=/^\s*function(?:\s|\s*\/\*.*\*\/\s*)+([^(\s/]*)\s*/;function a(e){const t=`${e}`.match(o);return t&&t[1]||""}function i(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"";return e.displayName||e.name||a(e)||t}function l(e,t,n){const r=i(t);return e.displayName||(""!==r?`${n}(${r})`:n)}function s(e){if(null!=e){if("string"===typeof e)return e;if("function"===typeof e)return i(e,"Component");if("object"===typeof e)switch(e.$$typeof){case r.vM:return l(e,e.render,"ForwardRef");case r.lD:return l(e,e.type,"memo");default:return}}}},391:(e,t,n)=>{"use strict";var r=n(950);t.createRoot=r.createRoot,t.hydrateRoot=r.hydrateRoot},436:(e,t,n)=>{"use strict";var r;n.d(t,{i:()=>l,s:()=>i});var o=n(43),a=!!(r||(r=n.t(o,2))).useInsertionEffect&&(r||(r=n.t(o,2))).useInsertionEffect,i=a||function(e){return e()},l=a||o.useLayoutEffect},457:(e,t,n)=>{"use strict";n.r(t),n.d(t,{default:()=>r.A});var r=n(868)},482:(e,t,n)=>{"use strict";n.r(t),n.d(t,{default:()=>r.A,isPlainObject:()=>r.Q});var r=n(172)},528:(e,t)=>{"use strict";var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),o=Symbol.for("react.fragment"),a=Symbol.for("react.strict_mode"),i=Symbol.for("react.profiler");Symbol.for("react.provider");var l=Symbol.for("react.consumer"),s=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),d=Symbol.for("react.suspense_list"),p=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),m=Symbol.for("react.view_transition"),h=Symbol.for("react.client.reference");function v(e){if("object"===typeof e&&null!==e){var t=e.$$typeof;switch(t){case n:switch(e=e.type){case o:case i:case a:case c:case d:case m:return e;default:switch(e=e&&e.$$typeof){case s:case u:case f:case p:case l:return e;default:return t}}case r:return t}}}t.vM=u,t.lD=p},537:(e,t,n)=>{"use strict";n.r(t),n.d(t,{default:()=>r.A});var r=n(598)},579:(e,t,n)=>{"use strict";e.exports=n(153)},587:(e,t,n)=>{"use strict";function r(e,t){if(null==e)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==t.indexOf(r))continue;n[r]=e[r]}return n}n.d(t,{A:()=>r})},598:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(868);function o(e){if("string"!==typeof e)throw new Error((0,r.A)(7));return e.charAt(0).toUpperCase()+e.slice(1)}},604:(e,t,n)=>{"use strict";n.d(t,{LX:()=>m,MA:()=>f,_W:()=>h,Lc:()=>b,Ms:()=>y});var r=n(751),o=n(162),a=n(815);const i={m:"margin",p:"padding"},l={t:"Top",r:"Right",b:"Bottom",l:"Left",x:["Left","Right"],y:["Top","Bottom"]},s={marginX:"mx",marginY:"my",paddingX:"px",paddingY:"py"},u=function(e){const t={};return n=>(void 0===t[n]&&(t[n]=e(n)),t[n])}((e=>{if(e.length>2){if(!s[e])return[e];e=s[e]}const[t,n]=e.split(""),r=i[t],o=l[n]||"";return Array.isArray(o)?o.map((e=>r+e)):[r+o]})),c=["m","mt","mr","mb","ml","mx","my","margin","marginTop","marginRight","marginBottom","marginLeft","marginX","marginY","marginInline","marginInlineStart","marginInlineEnd","marginBlock","marginBlockStart","marginBlockEnd"],d=["p","pt","pr","pb","pl","px","py","padding","paddingTop","paddingRight","paddingBottom","paddingLeft","paddingX","paddingY","paddingInline","paddingInlineStart","paddingInlineEnd","paddingBlock","paddingBlockStart","paddingBlockEnd"],p=[...c,...d];function f(e,t,n,r){var a;const i=null!=(a=(0,o.Yn)(e,t,!1))?a:n;return"number"===typeof i?e=>"string"===typeof e?e:i*e:Array.isArray(i)?e=>"string"===typeof e?e:i[e]:"function"===typeof i?i:()=>{}}function m(e){return f(e,"spacing",8)}function h(e,t){if("string"===typeof t||null==t)return t;const n=e(Math.abs(t));return t>=0?n:"number"===typeof n?-n:`-${n}`}function v(e,t,n,o){if(-1===t.indexOf(n))return null;const a=function(e,t){return n=>e.reduce(((e,r)=>(e[r]=h(t,n),e)),{})}(u(n),o),i=e[n];return(0,r.NI)(e,i,a)}function g(e,t){const n=m(e.theme);return Object.keys(e).map((r=>v(e,t,r,n))).reduce(a.A,{})}function b(e){return g(e,c)}function y(e){return g(e,d)}function x(e){return g(e,p)}b.propTypes={},b.filterProps=c,y.propTypes={},y.filterProps=d,x.propTypes={},x.filterProps=p},615:(e,t,n)=>{"use strict";n.d(t,{A:()=>l});var r=n(587),o=n(168);const a=["values","unit","step"],i=e=>{const t=Object.keys(e).map((t=>({key:t,val:e[t]})))||[];return t.sort(((e,t)=>e.val-t.val)),t.reduce(((e,t)=>(0,o.A)({},e,{[t.key]:t.val})),{})};function l(e){const{values:t={xs:0,sm:600,md:900,lg:1200,xl:1536},unit:n="px",step:l=5}=e,s=(0,r.A)(e,a),u=i(t),c=Object.keys(u);function d(e){return`@media (min-width:${"number"===typeof t[e]?t[e]:e}${n})`}function p(e){return`@media (max-width:${("number"===typeof t[e]?t[e]:e)-l/100}${n})`}function f(e,r){const o=c.indexOf(r);return`@media (min-width:${"number"===typeof t[e]?t[e]:e}${n}) and (max-width:${(-1!==o&&"number"===typeof t[c[o]]?t[c[o]]:r)-l/100}${n})`}return(0,o.A)({keys:c,values:u,up:d,down:p,between:f,only:function(e){return c.indexOf(e)+1<c.length?f(e,c[c.indexOf(e)+1]):d(e)},not:function(e){const t=c.indexOf(e);return 0===t?d(c[1]):t===c.length-1?p(c[t]):f(e,c[c.indexOf(e)+1]).replace("@media","@media not all and")},unit:n},s)}},634:e=>{function t(){return e.exports=t=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},e.exports.__esModule=!0,e.exports.default=e.exports,t.apply(null,arguments)}e.exports=t,e.exports.__esModule=!0,e.exports.default=e.exports},698:(e,t,n)=>{"use strict";n.d(t,{A:()=>u});var r=n(168),o=n(587),a=n(172),i=n(758);const l=["sx"],s=e=>{var t,n;const r={systemProps:{},otherProps:{}},o=null!=(t=null==e||null==(n=e.theme)?void 0:n.unstable_sxConfig)?t:i.A;return Object.keys(e).forEach((t=>{o[t]?r.systemProps[t]=e[t]:r.otherProps[t]=e[t]})),r};function u(e){const{sx:t}=e,n=(0,o.A)(e,l),{systemProps:i,otherProps:u}=s(n);let c;return c=Array.isArray(t)?[i,...t]:"function"===typeof t?function(){const e=t(...arguments);return(0,a.Q)(e)?(0,r.A)({},i,e):i}:(0,r.A)({},i,t),(0,r.A)({},u,{sx:c})}},703:(e,t,n)=>{"use strict";function r(e,t){const n=this;if(n.vars&&"function"===typeof n.getColorSchemeSelector){const r=n.getColorSchemeSelector(e).replace(/(\[[^\]]+\])/,"*:where($1)");return{[r]:t}}return n.palette.mode===e?t:{}}n.d(t,{A:()=>r})},722:(e,t,n)=>{"use strict";n.d(t,{Rk:()=>r,SF:()=>o,sk:()=>a});function r(e,t,n){var r="";return n.split(" ").forEach((function(n){void 0!==e[n]?t.push(e[n]+";"):n&&(r+=n+" ")})),r}var o=function(e,t,n){var r=e.key+"-"+t.name;!1===n&&void 0===e.registered[r]&&(e.registered[r]=t.styles)},a=function(e,t,n){o(e,t,n);var r=e.key+"-"+t.name;if(void 0===e.inserted[t.name]){var a=t;do{e.insert(t===a?"."+r:"",a,e.sheet,!0),a=a.next}while(void 0!==a)}}},730:(e,t,n)=>{"use strict";var r=n(43),o=n(853);function a(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var i=new Set,l={};function s(e,t){u(e,t),u(e+"Capture",t)}function u(e,t){for(l[e]=t,e=0;e<t.length;e++)i.add(t[e])}var c=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),d=Object.prototype.hasOwnProperty,p=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,f={},m={};function h(e,t,n,r,o,a,i){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=o,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=a,this.removeEmptyString=i}var v={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){v[e]=new h(e,0,!1,e,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var t=e[0];v[t]=new h(t,1,!1,e[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){v[e]=new h(e,2,!1,e.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){v[e]=new h(e,2,!1,e,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){v[e]=new h(e,3,!1,e.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(e){v[e]=new h(e,3,!0,e,null,!1,!1)})),["capture","download"].forEach((function(e){v[e]=new h(e,4,!1,e,null,!1,!1)})),["cols","rows","size","span"].forEach((function(e){v[e]=new h(e,6,!1,e,null,!1,!1)})),["rowSpan","start"].forEach((function(e){v[e]=new h(e,5,!1,e.toLowerCase(),null,!1,!1)}));var g=/[\-:]([a-z])/g;function b(e){return e[1].toUpperCase()}function y(e,t,n,r){var o=v.hasOwnProperty(t)?v[t]:null;(null!==o?0!==o.type:r||!(2<t.length)||"o"!==t[0]&&"O"!==t[0]||"n"!==t[1]&&"N"!==t[1])&&(function(e,t,n,r){if(null===t||"undefined"===typeof t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,o,r)&&(n=null),r||null===o?function(e){return!!d.call(m,e)||!d.call(f,e)&&(p.test(e)?m[e]=!0:(f[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):o.mustUseProperty?e[o.propertyName]=null===n?3!==o.type&&"":n:(t=o.attributeName,r=o.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(o=o.type)||4===o&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var t=e.replace(g,b);v[t]=new h(t,1,!1,e,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var t=e.replace(g,b);v[t]=new h(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var t=e.replace(g,b);v[t]=new h(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(e){v[e]=new h(e,1,!1,e.toLowerCase(),null,!1,!1)})),v.xlinkHref=new h("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(e){v[e]=new h(e,1,!1,e.toLowerCase(),null,!0,!0)}));var x=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,w=Symbol.for("react.element"),S=Symbol.for("react.portal"),k=Symbol.for("react.fragment"),C=Symbol.for("react.strict_mode"),A=Symbol.for("react.profiler"),E=Symbol.for("react.provider"),R=Symbol.for("react.context"),P=Symbol.for("react.forward_ref"),M=Symbol.for("react.suspense"),N=Symbol.for("react.suspense_list"),$=Symbol.for("react.memo"),T=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var z=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var O=Symbol.iterator;function I(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=O&&e[O]||e["@@iterator"])?e:null}var L,_=Object.assign;function j(e){if(void 0===L)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);L=t&&t[1]||""}return"\n"+L+e}var F=!1;function W(e,t){if(!e||F)return"";F=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(u){var r=u}Reflect.construct(e,[],t)}else{try{t.call()}catch(u){r=u}e.call(t.prototype)}else{try{throw Error()}catch(u){r=u}e()}}catch(u){if(u&&r&&"string"===typeof u.stack){for(var o=u.stack.split("\n"),a=r.stack.split("\n"),i=o.length-1,l=a.length-1;1<=i&&0<=l&&o[i]!==a[l];)l--;for(;1<=i&&0<=l;i--,l--)if(o[i]!==a[l]){if(1!==i||1!==l)do{if(i--,0>--l||o[i]!==a[l]){var s="\n"+o[i].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}}while(1<=i&&0<=l);break}}}finally{F=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?j(e):""}function D(e){switch(e.tag){case 5:return j(e.type);case 16:return j("Lazy");case 13:return j("Suspense");case 19:return j("SuspenseList");case 0:case 2:case 15:return e=W(e.type,!1);case 11:return e=W(e.type.render,!1);case 1:return e=W(e.type,!0);default:return""}}function B(e){if(null==e)return null;if("function"===typeof e)return e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case k:return"Fragment";case S:return"Portal";case A:return"Profiler";case C:return"StrictMode";case M:return"Suspense";case N:return"SuspenseList"}if("object"===typeof e)switch(e.$$typeof){case R:return(e.displayName||"Context")+".Consumer";case E:return(e._context.displayName||"Context")+".Provider";case P:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case $:return null!==(t=e.displayName||null)?t:B(e.type)||"Memo";case T:t=e._payload,e=e._init;try{return B(e(t))}catch(n){}}return null}function V(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=t.render).displayName||e.name||"",t.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return B(t);case 8:return t===C?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"===typeof t)return t.displayName||t.name||null;if("string"===typeof t)return t}return null}function U(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function H(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function K(e){e._valueTracker||(e._valueTracker=function(e){var t=H(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var o=n.get,a=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return o.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function q(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=H(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function X(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function G(e,t){var n=t.checked;return _({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function Q(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=U(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function Y(e,t){null!=(t=t.checked)&&y(e,"checked",t,!1)}function Z(e,t){Y(e,t);var n=U(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?ee(e,t.type,n):t.hasOwnProperty("defaultValue")&&ee(e,t.type,U(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function J(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function ee(e,t,n){"number"===t&&X(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var te=Array.isArray;function ne(e,t,n,r){if(e=e.options,t){t={};for(var o=0;o<n.length;o++)t["$"+n[o]]=!0;for(n=0;n<e.length;n++)o=t.hasOwnProperty("$"+e[n].value),e[n].selected!==o&&(e[n].selected=o),o&&r&&(e[n].defaultSelected=!0)}else{for(n=""+U(n),t=null,o=0;o<e.length;o++){if(e[o].value===n)return e[o].selected=!0,void(r&&(e[o].defaultSelected=!0));null!==t||e[o].disabled||(t=e[o])}null!==t&&(t.selected=!0)}}function re(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(a(91));return _({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function oe(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(a(92));if(te(n)){if(1<n.length)throw Error(a(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:U(n)}}function ae(e,t){var n=U(t.value),r=U(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function ie(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}function le(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function se(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?le(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var ue,ce,de=(ce=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((ue=ue||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=ue.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!==typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction((function(){return ce(e,t)}))}:ce);function pe(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var fe={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},me=["Webkit","ms","Moz","O"];function he(e,t,n){return null==t||"boolean"===typeof t||""===t?"":n||"number"!==typeof t||0===t||fe.hasOwnProperty(e)&&fe[e]?(""+t).trim():t+"px"}function ve(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),o=he(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,o):e[n]=o}}Object.keys(fe).forEach((function(e){me.forEach((function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),fe[t]=fe[e]}))}));var ge=_({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function be(e,t){if(t){if(ge[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(a(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(a(60));if("object"!==typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(a(61))}if(null!=t.style&&"object"!==typeof t.style)throw Error(a(62))}}function ye(e,t){if(-1===e.indexOf("-"))return"string"===typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var xe=null;function we(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Se=null,ke=null,Ce=null;function Ae(e){if(e=xo(e)){if("function"!==typeof Se)throw Error(a(280));var t=e.stateNode;t&&(t=So(t),Se(e.stateNode,e.type,t))}}function Ee(e){ke?Ce?Ce.push(e):Ce=[e]:ke=e}function Re(){if(ke){var e=ke,t=Ce;if(Ce=ke=null,Ae(e),t)for(e=0;e<t.length;e++)Ae(t[e])}}function Pe(e,t){return e(t)}function Me(){}var Ne=!1;function $e(e,t,n){if(Ne)return e(t,n);Ne=!0;try{return Pe(e,t,n)}finally{Ne=!1,(null!==ke||null!==Ce)&&(Me(),Re())}}function Te(e,t){var n=e.stateNode;if(null===n)return null;var r=So(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(a(231,t,typeof n));return n}var ze=!1;if(c)try{var Oe={};Object.defineProperty(Oe,"passive",{get:function(){ze=!0}}),window.addEventListener("test",Oe,Oe),window.removeEventListener("test",Oe,Oe)}catch(ce){ze=!1}function Ie(e,t,n,r,o,a,i,l,s){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(c){this.onError(c)}}var Le=!1,_e=null,je=!1,Fe=null,We={onError:function(e){Le=!0,_e=e}};function De(e,t,n,r,o,a,i,l,s){Le=!1,_e=null,Ie.apply(We,arguments)}function Be(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function Ve(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function Ue(e){if(Be(e)!==e)throw Error(a(188))}function He(e){return null!==(e=function(e){var t=e.alternate;if(!t){if(null===(t=Be(e)))throw Error(a(188));return t!==e?null:e}for(var n=e,r=t;;){var o=n.return;if(null===o)break;var i=o.alternate;if(null===i){if(null!==(r=o.return)){n=r;continue}break}if(o.child===i.child){for(i=o.child;i;){if(i===n)return Ue(o),e;if(i===r)return Ue(o),t;i=i.sibling}throw Error(a(188))}if(n.return!==r.return)n=o,r=i;else{for(var l=!1,s=o.child;s;){if(s===n){l=!0,n=o,r=i;break}if(s===r){l=!0,r=o,n=i;break}s=s.sibling}if(!l){for(s=i.child;s;){if(s===n){l=!0,n=i,r=o;break}if(s===r){l=!0,r=i,n=o;break}s=s.sibling}if(!l)throw Error(a(189))}}if(n.alternate!==r)throw Error(a(190))}if(3!==n.tag)throw Error(a(188));return n.stateNode.current===n?e:t}(e))?Ke(e):null}function Ke(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var t=Ke(e);if(null!==t)return t;e=e.sibling}return null}var qe=o.unstable_scheduleCallback,Xe=o.unstable_cancelCallback,Ge=o.unstable_shouldYield,Qe=o.unstable_requestPaint,Ye=o.unstable_now,Ze=o.unstable_getCurrentPriorityLevel,Je=o.unstable_ImmediatePriority,et=o.unstable_UserBlockingPriority,tt=o.unstable_NormalPriority,nt=o.unstable_LowPriority,rt=o.unstable_IdlePriority,ot=null,at=null;var it=Math.clz32?Math.clz32:function(e){return e>>>=0,0===e?32:31-(lt(e)/st|0)|0},lt=Math.log,st=Math.LN2;var ut=64,ct=4194304;function dt(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function pt(e,t){var n=e.pendingLanes;if(0===n)return 0;var r=0,o=e.suspendedLanes,a=e.pingedLanes,i=268435455&n;if(0!==i){var l=i&~o;0!==l?r=dt(l):0!==(a&=i)&&(r=dt(a))}else 0!==(i=n&~o)?r=dt(i):0!==a&&(r=dt(a));if(0===r)return 0;if(0!==t&&t!==r&&0===(t&o)&&((o=r&-r)>=(a=t&-t)||16===o&&0!==(4194240&a)))return t;if(0!==(4&r)&&(r|=16&n),0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)o=1<<(n=31-it(t)),r|=e[n],t&=~o;return r}function ft(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function mt(e){return 0!==(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function ht(){var e=ut;return 0===(4194240&(ut<<=1))&&(ut=64),e}function vt(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function gt(e,t,n){e.pendingLanes|=t,536870912!==t&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[t=31-it(t)]=n}function bt(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-it(n),o=1<<r;o&t|e[r]&t&&(e[r]|=t),n&=~o}}var yt=0;function xt(e){return 1<(e&=-e)?4<e?0!==(268435455&e)?16:536870912:4:1}var wt,St,kt,Ct,At,Et=!1,Rt=[],Pt=null,Mt=null,Nt=null,$t=new Map,Tt=new Map,zt=[],Ot="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function It(e,t){switch(e){case"focusin":case"focusout":Pt=null;break;case"dragenter":case"dragleave":Mt=null;break;case"mouseover":case"mouseout":Nt=null;break;case"pointerover":case"pointerout":$t.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Tt.delete(t.pointerId)}}function Lt(e,t,n,r,o,a){return null===e||e.nativeEvent!==a?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:a,targetContainers:[o]},null!==t&&(null!==(t=xo(t))&&St(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==o&&-1===t.indexOf(o)&&t.push(o),e)}function _t(e){var t=yo(e.target);if(null!==t){var n=Be(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=Ve(n)))return e.blockedOn=t,void At(e.priority,(function(){kt(n)}))}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function jt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Gt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=xo(n))&&St(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);xe=r,n.target.dispatchEvent(r),xe=null,t.shift()}return!0}function Ft(e,t,n){jt(e)&&n.delete(t)}function Wt(){Et=!1,null!==Pt&&jt(Pt)&&(Pt=null),null!==Mt&&jt(Mt)&&(Mt=null),null!==Nt&&jt(Nt)&&(Nt=null),$t.forEach(Ft),Tt.forEach(Ft)}function Dt(e,t){e.blockedOn===t&&(e.blockedOn=null,Et||(Et=!0,o.unstable_scheduleCallback(o.unstable_NormalPriority,Wt)))}function Bt(e){function t(t){return Dt(t,e)}if(0<Rt.length){Dt(Rt[0],e);for(var n=1;n<Rt.length;n++){var r=Rt[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==Pt&&Dt(Pt,e),null!==Mt&&Dt(Mt,e),null!==Nt&&Dt(Nt,e),$t.forEach(t),Tt.forEach(t),n=0;n<zt.length;n++)(r=zt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<zt.length&&null===(n=zt[0]).blockedOn;)_t(n),null===n.blockedOn&&zt.shift()}var Vt=x.ReactCurrentBatchConfig,Ut=!0;function Ht(e,t,n,r){var o=yt,a=Vt.transition;Vt.transition=null;try{yt=1,qt(e,t,n,r)}finally{yt=o,Vt.transition=a}}function Kt(e,t,n,r){var o=yt,a=Vt.transition;Vt.transition=null;try{yt=4,qt(e,t,n,r)}finally{yt=o,Vt.transition=a}}function qt(e,t,n,r){if(Ut){var o=Gt(e,t,n,r);if(null===o)Ur(e,t,r,Xt,n),It(e,r);else if(function(e,t,n,r,o){switch(t){case"focusin":return Pt=Lt(Pt,e,t,n,r,o),!0;case"dragenter":return Mt=Lt(Mt,e,t,n,r,o),!0;case"mouseover":return Nt=Lt(Nt,e,t,n,r,o),!0;case"pointerover":var a=o.pointerId;return $t.set(a,Lt($t.get(a)||null,e,t,n,r,o)),!0;case"gotpointercapture":return a=o.pointerId,Tt.set(a,Lt(Tt.get(a)||null,e,t,n,r,o)),!0}return!1}(o,e,t,n,r))r.stopPropagation();else if(It(e,r),4&t&&-1<Ot.indexOf(e)){for(;null!==o;){var a=xo(o);if(null!==a&&wt(a),null===(a=Gt(e,t,n,r))&&Ur(e,t,r,Xt,n),a===o)break;o=a}null!==o&&r.stopPropagation()}else Ur(e,t,r,null,n)}}var Xt=null;function Gt(e,t,n,r){if(Xt=null,null!==(e=yo(e=we(r))))if(null===(t=Be(e)))e=null;else if(13===(n=t.tag)){if(null!==(e=Ve(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Xt=e,null}function Qt(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Ze()){case Je:return 1;case et:return 4;case tt:case nt:return 16;case rt:return 536870912;default:return 16}default:return 16}}var Yt=null,Zt=null,Jt=null;function en(){if(Jt)return Jt;var e,t,n=Zt,r=n.length,o="value"in Yt?Yt.value:Yt.textContent,a=o.length;for(e=0;e<r&&n[e]===o[e];e++);var i=r-e;for(t=1;t<=i&&n[r-t]===o[a-t];t++);return Jt=o.slice(e,1<t?1-t:void 0)}function tn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function nn(){return!0}function rn(){return!1}function on(e){function t(t,n,r,o,a){for(var i in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=o,this.target=a,this.currentTarget=null,e)e.hasOwnProperty(i)&&(t=e[i],this[i]=t?t(o):o[i]);return this.isDefaultPrevented=(null!=o.defaultPrevented?o.defaultPrevented:!1===o.returnValue)?nn:rn,this.isPropagationStopped=rn,this}return _(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=nn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=nn)},persist:function(){},isPersistent:nn}),t}var an,ln,sn,un={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},cn=on(un),dn=_({},un,{view:0,detail:0}),pn=on(dn),fn=_({},dn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:An,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==sn&&(sn&&"mousemove"===e.type?(an=e.screenX-sn.screenX,ln=e.screenY-sn.screenY):ln=an=0,sn=e),an)},movementY:function(e){return"movementY"in e?e.movementY:ln}}),mn=on(fn),hn=on(_({},fn,{dataTransfer:0})),vn=on(_({},dn,{relatedTarget:0})),gn=on(_({},un,{animationName:0,elapsedTime:0,pseudoElement:0})),bn=_({},un,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),yn=on(bn),xn=on(_({},un,{data:0})),wn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Sn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},kn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Cn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=kn[e])&&!!t[e]}function An(){return Cn}var En=_({},dn,{key:function(e){if(e.key){var t=wn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=tn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?Sn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:An,charCode:function(e){return"keypress"===e.type?tn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),Rn=on(En),Pn=on(_({},fn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Mn=on(_({},dn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:An})),Nn=on(_({},un,{propertyName:0,elapsedTime:0,pseudoElement:0})),$n=_({},fn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Tn=on($n),zn=[9,13,27,32],On=c&&"CompositionEvent"in window,In=null;c&&"documentMode"in document&&(In=document.documentMode);var Ln=c&&"TextEvent"in window&&!In,_n=c&&(!On||In&&8<In&&11>=In),jn=String.fromCharCode(32),Fn=!1;function Wn(e,t){switch(e){case"keyup":return-1!==zn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Dn(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var Bn=!1;var Vn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Un(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Vn[e.type]:"textarea"===t}function Hn(e,t,n,r){Ee(r),0<(t=Kr(t,"onChange")).length&&(n=new cn("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Kn=null,qn=null;function Xn(e){jr(e,0)}function Gn(e){if(q(wo(e)))return e}function Qn(e,t){if("change"===e)return t}var Yn=!1;if(c){var Zn;if(c){var Jn="oninput"in document;if(!Jn){var er=document.createElement("div");er.setAttribute("oninput","return;"),Jn="function"===typeof er.oninput}Zn=Jn}else Zn=!1;Yn=Zn&&(!document.documentMode||9<document.documentMode)}function tr(){Kn&&(Kn.detachEvent("onpropertychange",nr),qn=Kn=null)}function nr(e){if("value"===e.propertyName&&Gn(qn)){var t=[];Hn(t,qn,e,we(e)),$e(Xn,t)}}function rr(e,t,n){"focusin"===e?(tr(),qn=n,(Kn=t).attachEvent("onpropertychange",nr)):"focusout"===e&&tr()}function or(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Gn(qn)}function ar(e,t){if("click"===e)return Gn(t)}function ir(e,t){if("input"===e||"change"===e)return Gn(t)}var lr="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function sr(e,t){if(lr(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var o=n[r];if(!d.call(t,o)||!lr(e[o],t[o]))return!1}return!0}function ur(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cr(e,t){var n,r=ur(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=ur(r)}}function dr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?dr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function pr(){for(var e=window,t=X();t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=X((e=t.contentWindow).document)}return t}function fr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}function mr(e){var t=pr(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&dr(n.ownerDocument.documentElement,n)){if(null!==r&&fr(n))if(t=r.start,void 0===(e=r.end)&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if((e=(t=n.ownerDocument||document)&&t.defaultView||window).getSelection){e=e.getSelection();var o=n.textContent.length,a=Math.min(r.start,o);r=void 0===r.end?a:Math.min(r.end,o),!e.extend&&a>r&&(o=r,r=a,a=o),o=cr(n,a);var i=cr(n,r);o&&i&&(1!==e.rangeCount||e.anchorNode!==o.node||e.anchorOffset!==o.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&((t=t.createRange()).setStart(o.node,o.offset),e.removeAllRanges(),a>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}for(t=[],e=n;e=e.parentNode;)1===e.nodeType&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"===typeof n.focus&&n.focus(),n=0;n<t.length;n++)(e=t[n]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var hr=c&&"documentMode"in document&&11>=document.documentMode,vr=null,gr=null,br=null,yr=!1;function xr(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;yr||null==vr||vr!==X(r)||("selectionStart"in(r=vr)&&fr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},br&&sr(br,r)||(br=r,0<(r=Kr(gr,"onSelect")).length&&(t=new cn("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=vr)))}function wr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Sr={animationend:wr("Animation","AnimationEnd"),animationiteration:wr("Animation","AnimationIteration"),animationstart:wr("Animation","AnimationStart"),transitionend:wr("Transition","TransitionEnd")},kr={},Cr={};function Ar(e){if(kr[e])return kr[e];if(!Sr[e])return e;var t,n=Sr[e];for(t in n)if(n.hasOwnProperty(t)&&t in Cr)return kr[e]=n[t];return e}c&&(Cr=document.createElement("div").style,"AnimationEvent"in window||(delete Sr.animationend.animation,delete Sr.animationiteration.animation,delete Sr.animationstart.animation),"TransitionEvent"in window||delete Sr.transitionend.transition);var Er=Ar("animationend"),Rr=Ar("animationiteration"),Pr=Ar("animationstart"),Mr=Ar("transitionend"),Nr=new Map,$r="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Tr(e,t){Nr.set(e,t),s(t,[e])}for(var zr=0;zr<$r.length;zr++){var Or=$r[zr];Tr(Or.toLowerCase(),"on"+(Or[0].toUpperCase()+Or.slice(1)))}Tr(Er,"onAnimationEnd"),Tr(Rr,"onAnimationIteration"),Tr(Pr,"onAnimationStart"),Tr("dblclick","onDoubleClick"),Tr("focusin","onFocus"),Tr("focusout","onBlur"),Tr(Mr,"onTransitionEnd"),u("onMouseEnter",["mouseout","mouseover"]),u("onMouseLeave",["mouseout","mouseover"]),u("onPointerEnter",["pointerout","pointerover"]),u("onPointerLeave",["pointerout","pointerover"]),s("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),s("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),s("onBeforeInput",["compositionend","keypress","textInput","paste"]),s("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),s("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),s("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ir="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Lr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Ir));function _r(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,o,i,l,s,u){if(De.apply(this,arguments),Le){if(!Le)throw Error(a(198));var c=_e;Le=!1,_e=null,je||(je=!0,Fe=c)}}(r,t,void 0,e),e.currentTarget=null}function jr(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],o=r.event;r=r.listeners;e:{var a=void 0;if(t)for(var i=r.length-1;0<=i;i--){var l=r[i],s=l.instance,u=l.currentTarget;if(l=l.listener,s!==a&&o.isPropagationStopped())break e;_r(o,l,u),a=s}else for(i=0;i<r.length;i++){if(s=(l=r[i]).instance,u=l.currentTarget,l=l.listener,s!==a&&o.isPropagationStopped())break e;_r(o,l,u),a=s}}}if(je)throw e=Fe,je=!1,Fe=null,e}function Fr(e,t){var n=t[vo];void 0===n&&(n=t[vo]=new Set);var r=e+"__bubble";n.has(r)||(Vr(t,e,2,!1),n.add(r))}function Wr(e,t,n){var r=0;t&&(r|=4),Vr(n,e,r,t)}var Dr="_reactListening"+Math.random().toString(36).slice(2);function Br(e){if(!e[Dr]){e[Dr]=!0,i.forEach((function(t){"selectionchange"!==t&&(Lr.has(t)||Wr(t,!1,e),Wr(t,!0,e))}));var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Dr]||(t[Dr]=!0,Wr("selectionchange",!1,t))}}function Vr(e,t,n,r){switch(Qt(t)){case 1:var o=Ht;break;case 4:o=Kt;break;default:o=qt}n=o.bind(null,t,n,e),o=void 0,!ze||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(o=!0),r?void 0!==o?e.addEventListener(t,n,{capture:!0,passive:o}):e.addEventListener(t,n,!0):void 0!==o?e.addEventListener(t,n,{passive:o}):e.addEventListener(t,n,!1)}function Ur(e,t,n,r,o){var a=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var i=r.tag;if(3===i||4===i){var l=r.stateNode.containerInfo;if(l===o||8===l.nodeType&&l.parentNode===o)break;if(4===i)for(i=r.return;null!==i;){var s=i.tag;if((3===s||4===s)&&((s=i.stateNode.containerInfo)===o||8===s.nodeType&&s.parentNode===o))return;i=i.return}for(;null!==l;){if(null===(i=yo(l)))return;if(5===(s=i.tag)||6===s){r=a=i;continue e}l=l.parentNode}}r=r.return}$e((function(){var r=a,o=we(n),i=[];e:{var l=Nr.get(e);if(void 0!==l){var s=cn,u=e;switch(e){case"keypress":if(0===tn(n))break e;case"keydown":case"keyup":s=Rn;break;case"focusin":u="focus",s=vn;break;case"focusout":u="blur",s=vn;break;case"beforeblur":case"afterblur":s=vn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":s=mn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":s=hn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":s=Mn;break;case Er:case Rr:case Pr:s=gn;break;case Mr:s=Nn;break;case"scroll":s=pn;break;case"wheel":s=Tn;break;case"copy":case"cut":case"paste":s=yn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":s=Pn}var c=0!==(4&t),d=!c&&"scroll"===e,p=c?null!==l?l+"Capture":null:l;c=[];for(var f,m=r;null!==m;){var h=(f=m).stateNode;if(5===f.tag&&null!==h&&(f=h,null!==p&&(null!=(h=Te(m,p))&&c.push(Hr(m,h,f)))),d)break;m=m.return}0<c.length&&(l=new s(l,u,null,n,o),i.push({event:l,listeners:c}))}}if(0===(7&t)){if(s="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||n===xe||!(u=n.relatedTarget||n.fromElement)||!yo(u)&&!u[ho])&&(s||l)&&(l=o.window===o?o:(l=o.ownerDocument)?l.defaultView||l.parentWindow:window,s?(s=r,null!==(u=(u=n.relatedTarget||n.toElement)?yo(u):null)&&(u!==(d=Be(u))||5!==u.tag&&6!==u.tag)&&(u=null)):(s=null,u=r),s!==u)){if(c=mn,h="onMouseLeave",p="onMouseEnter",m="mouse","pointerout"!==e&&"pointerover"!==e||(c=Pn,h="onPointerLeave",p="onPointerEnter",m="pointer"),d=null==s?l:wo(s),f=null==u?l:wo(u),(l=new c(h,m+"leave",s,n,o)).target=d,l.relatedTarget=f,h=null,yo(o)===r&&((c=new c(p,m+"enter",u,n,o)).target=f,c.relatedTarget=d,h=c),d=h,s&&u)e:{for(p=u,m=0,f=c=s;f;f=qr(f))m++;for(f=0,h=p;h;h=qr(h))f++;for(;0<m-f;)c=qr(c),m--;for(;0<f-m;)p=qr(p),f--;for(;m--;){if(c===p||null!==p&&c===p.alternate)break e;c=qr(c),p=qr(p)}c=null}else c=null;null!==s&&Xr(i,l,s,c,!1),null!==u&&null!==d&&Xr(i,d,u,c,!0)}if("select"===(s=(l=r?wo(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===s&&"file"===l.type)var v=Qn;else if(Un(l))if(Yn)v=ir;else{v=or;var g=rr}else(s=l.nodeName)&&"input"===s.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(v=ar);switch(v&&(v=v(e,r))?Hn(i,v,n,o):(g&&g(e,l,r),"focusout"===e&&(g=l._wrapperState)&&g.controlled&&"number"===l.type&&ee(l,"number",l.value)),g=r?wo(r):window,e){case"focusin":(Un(g)||"true"===g.contentEditable)&&(vr=g,gr=r,br=null);break;case"focusout":br=gr=vr=null;break;case"mousedown":yr=!0;break;case"contextmenu":case"mouseup":case"dragend":yr=!1,xr(i,n,o);break;case"selectionchange":if(hr)break;case"keydown":case"keyup":xr(i,n,o)}var b;if(On)e:{switch(e){case"compositionstart":var y="onCompositionStart";break e;case"compositionend":y="onCompositionEnd";break e;case"compositionupdate":y="onCompositionUpdate";break e}y=void 0}else Bn?Wn(e,n)&&(y="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(y="onCompositionStart");y&&(_n&&"ko"!==n.locale&&(Bn||"onCompositionStart"!==y?"onCompositionEnd"===y&&Bn&&(b=en()):(Zt="value"in(Yt=o)?Yt.value:Yt.textContent,Bn=!0)),0<(g=Kr(r,y)).length&&(y=new xn(y,e,null,n,o),i.push({event:y,listeners:g}),b?y.data=b:null!==(b=Dn(n))&&(y.data=b))),(b=Ln?function(e,t){switch(e){case"compositionend":return Dn(t);case"keypress":return 32!==t.which?null:(Fn=!0,jn);case"textInput":return(e=t.data)===jn&&Fn?null:e;default:return null}}(e,n):function(e,t){if(Bn)return"compositionend"===e||!On&&Wn(e,t)?(e=en(),Jt=Zt=Yt=null,Bn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return _n&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(r=Kr(r,"onBeforeInput")).length&&(o=new xn("onBeforeInput","beforeinput",null,n,o),i.push({event:o,listeners:r}),o.data=b))}jr(i,t)}))}function Hr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Kr(e,t){for(var n=t+"Capture",r=[];null!==e;){var o=e,a=o.stateNode;5===o.tag&&null!==a&&(o=a,null!=(a=Te(e,n))&&r.unshift(Hr(e,a,o)),null!=(a=Te(e,t))&&r.push(Hr(e,a,o))),e=e.return}return r}function qr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Xr(e,t,n,r,o){for(var a=t._reactName,i=[];null!==n&&n!==r;){var l=n,s=l.alternate,u=l.stateNode;if(null!==s&&s===r)break;5===l.tag&&null!==u&&(l=u,o?null!=(s=Te(n,a))&&i.unshift(Hr(n,s,l)):o||null!=(s=Te(n,a))&&i.push(Hr(n,s,l))),n=n.return}0!==i.length&&e.push({event:t,listeners:i})}var Gr=/\r\n?/g,Qr=/\u0000|\uFFFD/g;function Yr(e){return("string"===typeof e?e:""+e).replace(Gr,"\n").replace(Qr,"")}function Zr(e,t,n){if(t=Yr(t),Yr(e)!==t&&n)throw Error(a(425))}function Jr(){}var eo=null,to=null;function no(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var ro="function"===typeof setTimeout?setTimeout:void 0,oo="function"===typeof clearTimeout?clearTimeout:void 0,ao="function"===typeof Promise?Promise:void 0,io="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof ao?function(e){return ao.resolve(null).then(e).catch(lo)}:ro;function lo(e){setTimeout((function(){throw e}))}function so(e,t){var n=t,r=0;do{var o=n.nextSibling;if(e.removeChild(n),o&&8===o.nodeType)if("/$"===(n=o.data)){if(0===r)return e.removeChild(o),void Bt(t);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=o}while(n);Bt(t)}function uo(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t)break;if("/$"===t)return null}}return e}function co(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var po=Math.random().toString(36).slice(2),fo="__reactFiber$"+po,mo="__reactProps$"+po,ho="__reactContainer$"+po,vo="__reactEvents$"+po,go="__reactListeners$"+po,bo="__reactHandles$"+po;function yo(e){var t=e[fo];if(t)return t;for(var n=e.parentNode;n;){if(t=n[ho]||n[fo]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=co(e);null!==e;){if(n=e[fo])return n;e=co(e)}return t}n=(e=n).parentNode}return null}function xo(e){return!(e=e[fo]||e[ho])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function wo(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(a(33))}function So(e){return e[mo]||null}var ko=[],Co=-1;function Ao(e){return{current:e}}function Eo(e){0>Co||(e.current=ko[Co],ko[Co]=null,Co--)}function Ro(e,t){Co++,ko[Co]=e.current,e.current=t}var Po={},Mo=Ao(Po),No=Ao(!1),$o=Po;function To(e,t){var n=e.type.contextTypes;if(!n)return Po;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var o,a={};for(o in n)a[o]=t[o];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=a),a}function zo(e){return null!==(e=e.childContextTypes)&&void 0!==e}function Oo(){Eo(No),Eo(Mo)}function Io(e,t,n){if(Mo.current!==Po)throw Error(a(168));Ro(Mo,t),Ro(No,n)}function Lo(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,"function"!==typeof r.getChildContext)return n;for(var o in r=r.getChildContext())if(!(o in t))throw Error(a(108,V(e)||"Unknown",o));return _({},n,r)}function _o(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Po,$o=Mo.current,Ro(Mo,e),Ro(No,No.current),!0}function jo(e,t,n){var r=e.stateNode;if(!r)throw Error(a(169));n?(e=Lo(e,t,$o),r.__reactInternalMemoizedMergedChildContext=e,Eo(No),Eo(Mo),Ro(Mo,e)):Eo(No),Ro(No,n)}var Fo=null,Wo=!1,Do=!1;function Bo(e){null===Fo?Fo=[e]:Fo.push(e)}function Vo(){if(!Do&&null!==Fo){Do=!0;var e=0,t=yt;try{var n=Fo;for(yt=1;e<n.length;e++){var r=n[e];do{r=r(!0)}while(null!==r)}Fo=null,Wo=!1}catch(o){throw null!==Fo&&(Fo=Fo.slice(e+1)),qe(Je,Vo),o}finally{yt=t,Do=!1}}return null}var Uo=[],Ho=0,Ko=null,qo=0,Xo=[],Go=0,Qo=null,Yo=1,Zo="";function Jo(e,t){Uo[Ho++]=qo,Uo[Ho++]=Ko,Ko=e,qo=t}function ea(e,t,n){Xo[Go++]=Yo,Xo[Go++]=Zo,Xo[Go++]=Qo,Qo=e;var r=Yo;e=Zo;var o=32-it(r)-1;r&=~(1<<o),n+=1;var a=32-it(t)+o;if(30<a){var i=o-o%5;a=(r&(1<<i)-1).toString(32),r>>=i,o-=i,Yo=1<<32-it(t)+o|n<<o|r,Zo=a+e}else Yo=1<<a|n<<o|r,Zo=e}function ta(e){null!==e.return&&(Jo(e,1),ea(e,1,0))}function na(e){for(;e===Ko;)Ko=Uo[--Ho],Uo[Ho]=null,qo=Uo[--Ho],Uo[Ho]=null;for(;e===Qo;)Qo=Xo[--Go],Xo[Go]=null,Zo=Xo[--Go],Xo[Go]=null,Yo=Xo[--Go],Xo[Go]=null}var ra=null,oa=null,aa=!1,ia=null;function la(e,t){var n=$u(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,null===(t=e.deletions)?(e.deletions=[n],e.flags|=16):t.push(n)}function sa(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,ra=e,oa=uo(t.firstChild),!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,ra=e,oa=null,!0);case 13:return null!==(t=8!==t.nodeType?null:t)&&(n=null!==Qo?{id:Yo,overflow:Zo}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},(n=$u(18,null,null,0)).stateNode=t,n.return=e,e.child=n,ra=e,oa=null,!0);default:return!1}}function ua(e){return 0!==(1&e.mode)&&0===(128&e.flags)}function ca(e){if(aa){var t=oa;if(t){var n=t;if(!sa(e,t)){if(ua(e))throw Error(a(418));t=uo(n.nextSibling);var r=ra;t&&sa(e,t)?la(r,n):(e.flags=-4097&e.flags|2,aa=!1,ra=e)}}else{if(ua(e))throw Error(a(418));e.flags=-4097&e.flags|2,aa=!1,ra=e}}}function da(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;ra=e}function pa(e){if(e!==ra)return!1;if(!aa)return da(e),aa=!0,!1;var t;if((t=3!==e.tag)&&!(t=5!==e.tag)&&(t="head"!==(t=e.type)&&"body"!==t&&!no(e.type,e.memoizedProps)),t&&(t=oa)){if(ua(e))throw fa(),Error(a(418));for(;t;)la(e,t),t=uo(t.nextSibling)}if(da(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(a(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){oa=uo(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}oa=null}}else oa=ra?uo(e.stateNode.nextSibling):null;return!0}function fa(){for(var e=oa;e;)e=uo(e.nextSibling)}function ma(){oa=ra=null,aa=!1}function ha(e){null===ia?ia=[e]:ia.push(e)}var va=x.ReactCurrentBatchConfig;function ga(e,t,n){if(null!==(e=n.ref)&&"function"!==typeof e&&"object"!==typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(a(309));var r=n.stateNode}if(!r)throw Error(a(147,e));var o=r,i=""+e;return null!==t&&null!==t.ref&&"function"===typeof t.ref&&t.ref._stringRef===i?t.ref:(t=function(e){var t=o.refs;null===e?delete t[i]:t[i]=e},t._stringRef=i,t)}if("string"!==typeof e)throw Error(a(284));if(!n._owner)throw Error(a(290,e))}return e}function ba(e,t){throw e=Object.prototype.toString.call(t),Error(a(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ya(e){return(0,e._init)(e._payload)}function xa(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function o(e,t){return(e=zu(e,t)).index=0,e.sibling=null,e}function i(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=2,n):r:(t.flags|=2,n):(t.flags|=1048576,n)}function l(t){return e&&null===t.alternate&&(t.flags|=2),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=_u(n,e.mode,r)).return=e,t):((t=o(t,n)).return=e,t)}function u(e,t,n,r){var a=n.type;return a===k?d(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===a||"object"===typeof a&&null!==a&&a.$$typeof===T&&ya(a)===t.type)?((r=o(t,n.props)).ref=ga(e,t,n),r.return=e,r):((r=Ou(n.type,n.key,n.props,null,e.mode,r)).ref=ga(e,t,n),r.return=e,r)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=ju(n,e.mode,r)).return=e,t):((t=o(t,n.children||[])).return=e,t)}function d(e,t,n,r,a){return null===t||7!==t.tag?((t=Iu(n,e.mode,r,a)).return=e,t):((t=o(t,n)).return=e,t)}function p(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t)return(t=_u(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case w:return(n=Ou(t.type,t.key,t.props,null,e.mode,n)).ref=ga(e,null,t),n.return=e,n;case S:return(t=ju(t,e.mode,n)).return=e,t;case T:return p(e,(0,t._init)(t._payload),n)}if(te(t)||I(t))return(t=Iu(t,e.mode,n,null)).return=e,t;ba(e,t)}return null}function f(e,t,n,r){var o=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n)return null!==o?null:s(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case w:return n.key===o?u(e,t,n,r):null;case S:return n.key===o?c(e,t,n,r):null;case T:return f(e,t,(o=n._init)(n._payload),r)}if(te(n)||I(n))return null!==o?null:d(e,t,n,r,null);ba(e,n)}return null}function m(e,t,n,r,o){if("string"===typeof r&&""!==r||"number"===typeof r)return s(t,e=e.get(n)||null,""+r,o);if("object"===typeof r&&null!==r){switch(r.$$typeof){case w:return u(t,e=e.get(null===r.key?n:r.key)||null,r,o);case S:return c(t,e=e.get(null===r.key?n:r.key)||null,r,o);case T:return m(e,t,n,(0,r._init)(r._payload),o)}if(te(r)||I(r))return d(t,e=e.get(n)||null,r,o,null);ba(t,r)}return null}function h(o,a,l,s){for(var u=null,c=null,d=a,h=a=0,v=null;null!==d&&h<l.length;h++){d.index>h?(v=d,d=null):v=d.sibling;var g=f(o,d,l[h],s);if(null===g){null===d&&(d=v);break}e&&d&&null===g.alternate&&t(o,d),a=i(g,a,h),null===c?u=g:c.sibling=g,c=g,d=v}if(h===l.length)return n(o,d),aa&&Jo(o,h),u;if(null===d){for(;h<l.length;h++)null!==(d=p(o,l[h],s))&&(a=i(d,a,h),null===c?u=d:c.sibling=d,c=d);return aa&&Jo(o,h),u}for(d=r(o,d);h<l.length;h++)null!==(v=m(d,o,h,l[h],s))&&(e&&null!==v.alternate&&d.delete(null===v.key?h:v.key),a=i(v,a,h),null===c?u=v:c.sibling=v,c=v);return e&&d.forEach((function(e){return t(o,e)})),aa&&Jo(o,h),u}function v(o,l,s,u){var c=I(s);if("function"!==typeof c)throw Error(a(150));if(null==(s=c.call(s)))throw Error(a(151));for(var d=c=null,h=l,v=l=0,g=null,b=s.next();null!==h&&!b.done;v++,b=s.next()){h.index>v?(g=h,h=null):g=h.sibling;var y=f(o,h,b.value,u);if(null===y){null===h&&(h=g);break}e&&h&&null===y.alternate&&t(o,h),l=i(y,l,v),null===d?c=y:d.sibling=y,d=y,h=g}if(b.done)return n(o,h),aa&&Jo(o,v),c;if(null===h){for(;!b.done;v++,b=s.next())null!==(b=p(o,b.value,u))&&(l=i(b,l,v),null===d?c=b:d.sibling=b,d=b);return aa&&Jo(o,v),c}for(h=r(o,h);!b.done;v++,b=s.next())null!==(b=m(h,o,v,b.value,u))&&(e&&null!==b.alternate&&h.delete(null===b.key?v:b.key),l=i(b,l,v),null===d?c=b:d.sibling=b,d=b);return e&&h.forEach((function(e){return t(o,e)})),aa&&Jo(o,v),c}return function e(r,a,i,s){if("object"===typeof i&&null!==i&&i.type===k&&null===i.key&&(i=i.props.children),"object"===typeof i&&null!==i){switch(i.$$typeof){case w:e:{for(var u=i.key,c=a;null!==c;){if(c.key===u){if((u=i.type)===k){if(7===c.tag){n(r,c.sibling),(a=o(c,i.props.children)).return=r,r=a;break e}}else if(c.elementType===u||"object"===typeof u&&null!==u&&u.$$typeof===T&&ya(u)===c.type){n(r,c.sibling),(a=o(c,i.props)).ref=ga(r,c,i),a.return=r,r=a;break e}n(r,c);break}t(r,c),c=c.sibling}i.type===k?((a=Iu(i.props.children,r.mode,s,i.key)).return=r,r=a):((s=Ou(i.type,i.key,i.props,null,r.mode,s)).ref=ga(r,a,i),s.return=r,r=s)}return l(r);case S:e:{for(c=i.key;null!==a;){if(a.key===c){if(4===a.tag&&a.stateNode.containerInfo===i.containerInfo&&a.stateNode.implementation===i.implementation){n(r,a.sibling),(a=o(a,i.children||[])).return=r,r=a;break e}n(r,a);break}t(r,a),a=a.sibling}(a=ju(i,r.mode,s)).return=r,r=a}return l(r);case T:return e(r,a,(c=i._init)(i._payload),s)}if(te(i))return h(r,a,i,s);if(I(i))return v(r,a,i,s);ba(r,i)}return"string"===typeof i&&""!==i||"number"===typeof i?(i=""+i,null!==a&&6===a.tag?(n(r,a.sibling),(a=o(a,i)).return=r,r=a):(n(r,a),(a=_u(i,r.mode,s)).return=r,r=a),l(r)):n(r,a)}}var wa=xa(!0),Sa=xa(!1),ka=Ao(null),Ca=null,Aa=null,Ea=null;function Ra(){Ea=Aa=Ca=null}function Pa(e){var t=ka.current;Eo(ka),e._currentValue=t}function Ma(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Na(e,t){Ca=e,Ea=Aa=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!==(e.lanes&t)&&(yl=!0),e.firstContext=null)}function $a(e){var t=e._currentValue;if(Ea!==e)if(e={context:e,memoizedValue:t,next:null},null===Aa){if(null===Ca)throw Error(a(308));Aa=e,Ca.dependencies={lanes:0,firstContext:e}}else Aa=Aa.next=e;return t}var Ta=null;function za(e){null===Ta?Ta=[e]:Ta.push(e)}function Oa(e,t,n,r){var o=t.interleaved;return null===o?(n.next=n,za(t)):(n.next=o.next,o.next=n),t.interleaved=n,Ia(e,r)}function Ia(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}var La=!1;function _a(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function ja(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Fa(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Wa(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&Ps)){var o=r.pending;return null===o?t.next=t:(t.next=o.next,o.next=t),r.pending=t,Ia(e,n)}return null===(o=r.interleaved)?(t.next=t,za(r)):(t.next=o.next,o.next=t),r.interleaved=t,Ia(e,n)}function Da(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194240&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,bt(e,n)}}function Ba(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var o=null,a=null;if(null!==(n=n.firstBaseUpdate)){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===a?o=a=i:a=a.next=i,n=n.next}while(null!==n);null===a?o=a=t:a=a.next=t}else o=a=t;return n={baseState:r.baseState,firstBaseUpdate:o,lastBaseUpdate:a,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Va(e,t,n,r){var o=e.updateQueue;La=!1;var a=o.firstBaseUpdate,i=o.lastBaseUpdate,l=o.shared.pending;if(null!==l){o.shared.pending=null;var s=l,u=s.next;s.next=null,null===i?a=u:i.next=u,i=s;var c=e.alternate;null!==c&&((l=(c=c.updateQueue).lastBaseUpdate)!==i&&(null===l?c.firstBaseUpdate=u:l.next=u,c.lastBaseUpdate=s))}if(null!==a){var d=o.baseState;for(i=0,c=u=s=null,l=a;;){var p=l.lane,f=l.eventTime;if((r&p)===p){null!==c&&(c=c.next={eventTime:f,lane:0,tag:l.tag,payload:l.payload,callback:l.callback,next:null});e:{var m=e,h=l;switch(p=t,f=n,h.tag){case 1:if("function"===typeof(m=h.payload)){d=m.call(f,d,p);break e}d=m;break e;case 3:m.flags=-65537&m.flags|128;case 0:if(null===(p="function"===typeof(m=h.payload)?m.call(f,d,p):m)||void 0===p)break e;d=_({},d,p);break e;case 2:La=!0}}null!==l.callback&&0!==l.lane&&(e.flags|=64,null===(p=o.effects)?o.effects=[l]:p.push(l))}else f={eventTime:f,lane:p,tag:l.tag,payload:l.payload,callback:l.callback,next:null},null===c?(u=c=f,s=d):c=c.next=f,i|=p;if(null===(l=l.next)){if(null===(l=o.shared.pending))break;l=(p=l).next,p.next=null,o.lastBaseUpdate=p,o.shared.pending=null}}if(null===c&&(s=d),o.baseState=s,o.firstBaseUpdate=u,o.lastBaseUpdate=c,null!==(t=o.shared.interleaved)){o=t;do{i|=o.lane,o=o.next}while(o!==t)}else null===a&&(o.shared.lanes=0);Ls|=i,e.lanes=i,e.memoizedState=d}}function Ua(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],o=r.callback;if(null!==o){if(r.callback=null,r=n,"function"!==typeof o)throw Error(a(191,o));o.call(r)}}}var Ha={},Ka=Ao(Ha),qa=Ao(Ha),Xa=Ao(Ha);function Ga(e){if(e===Ha)throw Error(a(174));return e}function Qa(e,t){switch(Ro(Xa,t),Ro(qa,e),Ro(Ka,Ha),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:se(null,"");break;default:t=se(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}Eo(Ka),Ro(Ka,t)}function Ya(){Eo(Ka),Eo(qa),Eo(Xa)}function Za(e){Ga(Xa.current);var t=Ga(Ka.current),n=se(t,e.type);t!==n&&(Ro(qa,e),Ro(Ka,n))}function Ja(e){qa.current===e&&(Eo(Ka),Eo(qa))}var ei=Ao(0);function ti(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ni=[];function ri(){for(var e=0;e<ni.length;e++)ni[e]._workInProgressVersionPrimary=null;ni.length=0}var oi=x.ReactCurrentDispatcher,ai=x.ReactCurrentBatchConfig,ii=0,li=null,si=null,ui=null,ci=!1,di=!1,pi=0,fi=0;function mi(){throw Error(a(321))}function hi(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!lr(e[n],t[n]))return!1;return!0}function vi(e,t,n,r,o,i){if(ii=i,li=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,oi.current=null===e||null===e.memoizedState?Ji:el,e=n(r,o),di){i=0;do{if(di=!1,pi=0,25<=i)throw Error(a(301));i+=1,ui=si=null,t.updateQueue=null,oi.current=tl,e=n(r,o)}while(di)}if(oi.current=Zi,t=null!==si&&null!==si.next,ii=0,ui=si=li=null,ci=!1,t)throw Error(a(300));return e}function gi(){var e=0!==pi;return pi=0,e}function bi(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===ui?li.memoizedState=ui=e:ui=ui.next=e,ui}function yi(){if(null===si){var e=li.alternate;e=null!==e?e.memoizedState:null}else e=si.next;var t=null===ui?li.memoizedState:ui.next;if(null!==t)ui=t,si=e;else{if(null===e)throw Error(a(310));e={memoizedState:(si=e).memoizedState,baseState:si.baseState,baseQueue:si.baseQueue,queue:si.queue,next:null},null===ui?li.memoizedState=ui=e:ui=ui.next=e}return ui}function xi(e,t){return"function"===typeof t?t(e):t}function wi(e){var t=yi(),n=t.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=e;var r=si,o=r.baseQueue,i=n.pending;if(null!==i){if(null!==o){var l=o.next;o.next=i.next,i.next=l}r.baseQueue=o=i,n.pending=null}if(null!==o){i=o.next,r=r.baseState;var s=l=null,u=null,c=i;do{var d=c.lane;if((ii&d)===d)null!==u&&(u=u.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var p={lane:d,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};null===u?(s=u=p,l=r):u=u.next=p,li.lanes|=d,Ls|=d}c=c.next}while(null!==c&&c!==i);null===u?l=r:u.next=s,lr(r,t.memoizedState)||(yl=!0),t.memoizedState=r,t.baseState=l,t.baseQueue=u,n.lastRenderedState=r}if(null!==(e=n.interleaved)){o=e;do{i=o.lane,li.lanes|=i,Ls|=i,o=o.next}while(o!==e)}else null===o&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Si(e){var t=yi(),n=t.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=e;var r=n.dispatch,o=n.pending,i=t.memoizedState;if(null!==o){n.pending=null;var l=o=o.next;do{i=e(i,l.action),l=l.next}while(l!==o);lr(i,t.memoizedState)||(yl=!0),t.memoizedState=i,null===t.baseQueue&&(t.baseState=i),n.lastRenderedState=i}return[i,r]}function ki(){}function Ci(e,t){var n=li,r=yi(),o=t(),i=!lr(r.memoizedState,o);if(i&&(r.memoizedState=o,yl=!0),r=r.queue,Li(Ri.bind(null,n,r,e),[e]),r.getSnapshot!==t||i||null!==ui&&1&ui.memoizedState.tag){if(n.flags|=2048,$i(9,Ei.bind(null,n,r,o,t),void 0,null),null===Ms)throw Error(a(349));0!==(30&ii)||Ai(n,t,o)}return o}function Ai(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=li.updateQueue)?(t={lastEffect:null,stores:null},li.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Ei(e,t,n,r){t.value=n,t.getSnapshot=r,Pi(t)&&Mi(e)}function Ri(e,t,n){return n((function(){Pi(t)&&Mi(e)}))}function Pi(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!lr(e,n)}catch(r){return!0}}function Mi(e){var t=Ia(e,1);null!==t&&nu(t,e,1,-1)}function Ni(e){var t=bi();return"function"===typeof e&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:xi,lastRenderedState:e},t.queue=e,e=e.dispatch=Xi.bind(null,li,e),[t.memoizedState,e]}function $i(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=li.updateQueue)?(t={lastEffect:null,stores:null},li.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function Ti(){return yi().memoizedState}function zi(e,t,n,r){var o=bi();li.flags|=e,o.memoizedState=$i(1|t,n,void 0,void 0===r?null:r)}function Oi(e,t,n,r){var o=yi();r=void 0===r?null:r;var a=void 0;if(null!==si){var i=si.memoizedState;if(a=i.destroy,null!==r&&hi(r,i.deps))return void(o.memoizedState=$i(t,n,a,r))}li.flags|=e,o.memoizedState=$i(1|t,n,a,r)}function Ii(e,t){return zi(8390656,8,e,t)}function Li(e,t){return Oi(2048,8,e,t)}function _i(e,t){return Oi(4,2,e,t)}function ji(e,t){return Oi(4,4,e,t)}function Fi(e,t){return"function"===typeof t?(e=e(),t(e),function(){t(null)}):null!==t&&void 0!==t?(e=e(),t.current=e,function(){t.current=null}):void 0}function Wi(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,Oi(4,4,Fi.bind(null,t,e),n)}function Di(){}function Bi(e,t){var n=yi();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&hi(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Vi(e,t){var n=yi();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&hi(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ui(e,t,n){return 0===(21&ii)?(e.baseState&&(e.baseState=!1,yl=!0),e.memoizedState=n):(lr(n,t)||(n=ht(),li.lanes|=n,Ls|=n,e.baseState=!0),t)}function Hi(e,t){var n=yt;yt=0!==n&&4>n?n:4,e(!0);var r=ai.transition;ai.transition={};try{e(!1),t()}finally{yt=n,ai.transition=r}}function Ki(){return yi().memoizedState}function qi(e,t,n){var r=tu(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Gi(e))Qi(t,n);else if(null!==(n=Oa(e,t,n,r))){nu(n,e,r,eu()),Yi(n,t,r)}}function Xi(e,t,n){var r=tu(e),o={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Gi(e))Qi(t,o);else{var a=e.alternate;if(0===e.lanes&&(null===a||0===a.lanes)&&null!==(a=t.lastRenderedReducer))try{var i=t.lastRenderedState,l=a(i,n);if(o.hasEagerState=!0,o.eagerState=l,lr(l,i)){var s=t.interleaved;return null===s?(o.next=o,za(t)):(o.next=s.next,s.next=o),void(t.interleaved=o)}}catch(u){}null!==(n=Oa(e,t,o,r))&&(nu(n,e,r,o=eu()),Yi(n,t,r))}}function Gi(e){var t=e.alternate;return e===li||null!==t&&t===li}function Qi(e,t){di=ci=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Yi(e,t,n){if(0!==(4194240&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,bt(e,n)}}var Zi={readContext:$a,useCallback:mi,useContext:mi,useEffect:mi,useImperativeHandle:mi,useInsertionEffect:mi,useLayoutEffect:mi,useMemo:mi,useReducer:mi,useRef:mi,useState:mi,useDebugValue:mi,useDeferredValue:mi,useTransition:mi,useMutableSource:mi,useSyncExternalStore:mi,useId:mi,unstable_isNewReconciler:!1},Ji={readContext:$a,useCallback:function(e,t){return bi().memoizedState=[e,void 0===t?null:t],e},useContext:$a,useEffect:Ii,useImperativeHandle:function(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,zi(4194308,4,Fi.bind(null,t,e),n)},useLayoutEffect:function(e,t){return zi(4194308,4,e,t)},useInsertionEffect:function(e,t){return zi(4,2,e,t)},useMemo:function(e,t){var n=bi();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=bi();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=qi.bind(null,li,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},bi().memoizedState=e},useState:Ni,useDebugValue:Di,useDeferredValue:function(e){return bi().memoizedState=e},useTransition:function(){var e=Ni(!1),t=e[0];return e=Hi.bind(null,e[1]),bi().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=li,o=bi();if(aa){if(void 0===n)throw Error(a(407));n=n()}else{if(n=t(),null===Ms)throw Error(a(349));0!==(30&ii)||Ai(r,t,n)}o.memoizedState=n;var i={value:n,getSnapshot:t};return o.queue=i,Ii(Ri.bind(null,r,i,e),[e]),r.flags|=2048,$i(9,Ei.bind(null,r,i,n,t),void 0,null),n},useId:function(){var e=bi(),t=Ms.identifierPrefix;if(aa){var n=Zo;t=":"+t+"R"+(n=(Yo&~(1<<32-it(Yo)-1)).toString(32)+n),0<(n=pi++)&&(t+="H"+n.toString(32)),t+=":"}else t=":"+t+"r"+(n=fi++).toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},el={readContext:$a,useCallback:Bi,useContext:$a,useEffect:Li,useImperativeHandle:Wi,useInsertionEffect:_i,useLayoutEffect:ji,useMemo:Vi,useReducer:wi,useRef:Ti,useState:function(){return wi(xi)},useDebugValue:Di,useDeferredValue:function(e){return Ui(yi(),si.memoizedState,e)},useTransition:function(){return[wi(xi)[0],yi().memoizedState]},useMutableSource:ki,useSyncExternalStore:Ci,useId:Ki,unstable_isNewReconciler:!1},tl={readContext:$a,useCallback:Bi,useContext:$a,useEffect:Li,useImperativeHandle:Wi,useInsertionEffect:_i,useLayoutEffect:ji,useMemo:Vi,useReducer:Si,useRef:Ti,useState:function(){return Si(xi)},useDebugValue:Di,useDeferredValue:function(e){var t=yi();return null===si?t.memoizedState=e:Ui(t,si.memoizedState,e)},useTransition:function(){return[Si(xi)[0],yi().memoizedState]},useMutableSource:ki,useSyncExternalStore:Ci,useId:Ki,unstable_isNewReconciler:!1};function nl(e,t){if(e&&e.defaultProps){for(var n in t=_({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}function rl(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:_({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var ol={isMounted:function(e){return!!(e=e._reactInternals)&&Be(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=eu(),o=tu(e),a=Fa(r,o);a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=Wa(e,a,o))&&(nu(t,e,o,r),Da(t,e,o))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=eu(),o=tu(e),a=Fa(r,o);a.tag=1,a.payload=t,void 0!==n&&null!==n&&(a.callback=n),null!==(t=Wa(e,a,o))&&(nu(t,e,o,r),Da(t,e,o))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=eu(),r=tu(e),o=Fa(n,r);o.tag=2,void 0!==t&&null!==t&&(o.callback=t),null!==(t=Wa(e,o,r))&&(nu(t,e,r,n),Da(t,e,r))}};function al(e,t,n,r,o,a,i){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,i):!t.prototype||!t.prototype.isPureReactComponent||(!sr(n,r)||!sr(o,a))}function il(e,t,n){var r=!1,o=Po,a=t.contextType;return"object"===typeof a&&null!==a?a=$a(a):(o=zo(t)?$o:Mo.current,a=(r=null!==(r=t.contextTypes)&&void 0!==r)?To(e,o):Po),t=new t(n,a),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ol,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=o,e.__reactInternalMemoizedMaskedChildContext=a),t}function ll(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ol.enqueueReplaceState(t,t.state,null)}function sl(e,t,n,r){var o=e.stateNode;o.props=n,o.state=e.memoizedState,o.refs={},_a(e);var a=t.contextType;"object"===typeof a&&null!==a?o.context=$a(a):(a=zo(t)?$o:Mo.current,o.context=To(e,a)),o.state=e.memoizedState,"function"===typeof(a=t.getDerivedStateFromProps)&&(rl(e,t,a,n),o.state=e.memoizedState),"function"===typeof t.getDerivedStateFromProps||"function"===typeof o.getSnapshotBeforeUpdate||"function"!==typeof o.UNSAFE_componentWillMount&&"function"!==typeof o.componentWillMount||(t=o.state,"function"===typeof o.componentWillMount&&o.componentWillMount(),"function"===typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount(),t!==o.state&&ol.enqueueReplaceState(o,o.state,null),Va(e,n,o,r),o.state=e.memoizedState),"function"===typeof o.componentDidMount&&(e.flags|=4194308)}function ul(e,t){try{var n="",r=t;do{n+=D(r),r=r.return}while(r);var o=n}catch(a){o="\nError generating stack: "+a.message+"\n"+a.stack}return{value:e,source:t,stack:o,digest:null}}function cl(e,t,n){return{value:e,source:null,stack:null!=n?n:null,digest:null!=t?t:null}}function dl(e,t){try{console.error(t.value)}catch(n){setTimeout((function(){throw n}))}}var pl="function"===typeof WeakMap?WeakMap:Map;function fl(e,t,n){(n=Fa(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Us||(Us=!0,Hs=r),dl(0,t)},n}function ml(e,t,n){(n=Fa(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"===typeof r){var o=t.value;n.payload=function(){return r(o)},n.callback=function(){dl(0,t)}}var a=e.stateNode;return null!==a&&"function"===typeof a.componentDidCatch&&(n.callback=function(){dl(0,t),"function"!==typeof r&&(null===Ks?Ks=new Set([this]):Ks.add(this));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}function hl(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new pl;var o=new Set;r.set(t,o)}else void 0===(o=r.get(t))&&(o=new Set,r.set(t,o));o.has(n)||(o.add(n),e=Au.bind(null,e,t,n),t.then(e,e))}function vl(e){do{var t;if((t=13===e.tag)&&(t=null===(t=e.memoizedState)||null!==t.dehydrated),t)return e;e=e.return}while(null!==e);return null}function gl(e,t,n,r,o){return 0===(1&e.mode)?(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((t=Fa(-1,1)).tag=2,Wa(n,t,1))),n.lanes|=1),e):(e.flags|=65536,e.lanes=o,e)}var bl=x.ReactCurrentOwner,yl=!1;function xl(e,t,n,r){t.child=null===e?Sa(t,null,n,r):wa(t,e.child,n,r)}function wl(e,t,n,r,o){n=n.render;var a=t.ref;return Na(t,o),r=vi(e,t,n,r,a,o),n=gi(),null===e||yl?(aa&&n&&ta(t),t.flags|=1,xl(e,t,r,o),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,Ul(e,t,o))}function Sl(e,t,n,r,o){if(null===e){var a=n.type;return"function"!==typeof a||Tu(a)||void 0!==a.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Ou(n.type,null,r,t,t.mode,o)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=a,kl(e,t,a,r,o))}if(a=e.child,0===(e.lanes&o)){var i=a.memoizedProps;if((n=null!==(n=n.compare)?n:sr)(i,r)&&e.ref===t.ref)return Ul(e,t,o)}return t.flags|=1,(e=zu(a,r)).ref=t.ref,e.return=t,t.child=e}function kl(e,t,n,r,o){if(null!==e){var a=e.memoizedProps;if(sr(a,r)&&e.ref===t.ref){if(yl=!1,t.pendingProps=r=a,0===(e.lanes&o))return t.lanes=e.lanes,Ul(e,t,o);0!==(131072&e.flags)&&(yl=!0)}}return El(e,t,n,r,o)}function Cl(e,t,n){var r=t.pendingProps,o=r.children,a=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(0===(1&t.mode))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},Ro(zs,Ts),Ts|=n;else{if(0===(1073741824&n))return e=null!==a?a.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,Ro(zs,Ts),Ts|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==a?a.baseLanes:n,Ro(zs,Ts),Ts|=r}else null!==a?(r=a.baseLanes|n,t.memoizedState=null):r=n,Ro(zs,Ts),Ts|=r;return xl(e,t,o,n),t.child}function Al(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function El(e,t,n,r,o){var a=zo(n)?$o:Mo.current;return a=To(t,a),Na(t,o),n=vi(e,t,n,r,a,o),r=gi(),null===e||yl?(aa&&r&&ta(t),t.flags|=1,xl(e,t,n,o),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,Ul(e,t,o))}function Rl(e,t,n,r,o){if(zo(n)){var a=!0;_o(t)}else a=!1;if(Na(t,o),null===t.stateNode)Vl(e,t),il(t,n,r),sl(t,n,r,o),r=!0;else if(null===e){var i=t.stateNode,l=t.memoizedProps;i.props=l;var s=i.context,u=n.contextType;"object"===typeof u&&null!==u?u=$a(u):u=To(t,u=zo(n)?$o:Mo.current);var c=n.getDerivedStateFromProps,d="function"===typeof c||"function"===typeof i.getSnapshotBeforeUpdate;d||"function"!==typeof i.UNSAFE_componentWillReceiveProps&&"function"!==typeof i.componentWillReceiveProps||(l!==r||s!==u)&&ll(t,i,r,u),La=!1;var p=t.memoizedState;i.state=p,Va(t,r,i,o),s=t.memoizedState,l!==r||p!==s||No.current||La?("function"===typeof c&&(rl(t,n,c,r),s=t.memoizedState),(l=La||al(t,n,l,r,p,s,u))?(d||"function"!==typeof i.UNSAFE_componentWillMount&&"function"!==typeof i.componentWillMount||("function"===typeof i.componentWillMount&&i.componentWillMount(),"function"===typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount()),"function"===typeof i.componentDidMount&&(t.flags|=4194308)):("function"===typeof i.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=u,r=l):("function"===typeof i.componentDidMount&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,ja(e,t),l=t.memoizedProps,u=t.type===t.elementType?l:nl(t.type,l),i.props=u,d=t.pendingProps,p=i.context,"object"===typeof(s=n.contextType)&&null!==s?s=$a(s):s=To(t,s=zo(n)?$o:Mo.current);var f=n.getDerivedStateFromProps;(c="function"===typeof f||"function"===typeof i.getSnapshotBeforeUpdate)||"function"!==typeof i.UNSAFE_componentWillReceiveProps&&"function"!==typeof i.componentWillReceiveProps||(l!==d||p!==s)&&ll(t,i,r,s),La=!1,p=t.memoizedState,i.state=p,Va(t,r,i,o);var m=t.memoizedState;l!==d||p!==m||No.current||La?("function"===typeof f&&(rl(t,n,f,r),m=t.memoizedState),(u=La||al(t,n,u,r,p,m,s)||!1)?(c||"function"!==typeof i.UNSAFE_componentWillUpdate&&"function"!==typeof i.componentWillUpdate||("function"===typeof i.componentWillUpdate&&i.componentWillUpdate(r,m,s),"function"===typeof i.UNSAFE_componentWillUpdate&&i.UNSAFE_componentWillUpdate(r,m,s)),"function"===typeof i.componentDidUpdate&&(t.flags|=4),"function"===typeof i.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof i.componentDidUpdate||l===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),"function"!==typeof i.getSnapshotBeforeUpdate||l===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=m),i.props=r,i.state=m,i.context=s,r=u):("function"!==typeof i.componentDidUpdate||l===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),"function"!==typeof i.getSnapshotBeforeUpdate||l===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),r=!1)}return Pl(e,t,n,r,a,o)}function Pl(e,t,n,r,o,a){Al(e,t);var i=0!==(128&t.flags);if(!r&&!i)return o&&jo(t,n,!1),Ul(e,t,a);r=t.stateNode,bl.current=t;var l=i&&"function"!==typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&i?(t.child=wa(t,e.child,null,a),t.child=wa(t,null,l,a)):xl(e,t,l,a),t.memoizedState=r.state,o&&jo(t,n,!0),t.child}function Ml(e){var t=e.stateNode;t.pendingContext?Io(0,t.pendingContext,t.pendingContext!==t.context):t.context&&Io(0,t.context,!1),Qa(e,t.containerInfo)}function Nl(e,t,n,r,o){return ma(),ha(o),t.flags|=256,xl(e,t,n,r),t.child}var $l,Tl,zl,Ol,Il={dehydrated:null,treeContext:null,retryLane:0};function Ll(e){return{baseLanes:e,cachePool:null,transitions:null}}function _l(e,t,n){var r,o=t.pendingProps,i=ei.current,l=!1,s=0!==(128&t.flags);if((r=s)||(r=(null===e||null!==e.memoizedState)&&0!==(2&i)),r?(l=!0,t.flags&=-129):null!==e&&null===e.memoizedState||(i|=1),Ro(ei,1&i),null===e)return ca(t),null!==(e=t.memoizedState)&&null!==(e=e.dehydrated)?(0===(1&t.mode)?t.lanes=1:"$!"===e.data?t.lanes=8:t.lanes=1073741824,null):(s=o.children,e=o.fallback,l?(o=t.mode,l=t.child,s={mode:"hidden",children:s},0===(1&o)&&null!==l?(l.childLanes=0,l.pendingProps=s):l=Lu(s,o,0,null),e=Iu(e,o,n,null),l.return=t,e.return=t,l.sibling=e,t.child=l,t.child.memoizedState=Ll(n),t.memoizedState=Il,e):jl(t,s));if(null!==(i=e.memoizedState)&&null!==(r=i.dehydrated))return function(e,t,n,r,o,i,l){if(n)return 256&t.flags?(t.flags&=-257,Fl(e,t,l,r=cl(Error(a(422))))):null!==t.memoizedState?(t.child=e.child,t.flags|=128,null):(i=r.fallback,o=t.mode,r=Lu({mode:"visible",children:r.children},o,0,null),(i=Iu(i,o,l,null)).flags|=2,r.return=t,i.return=t,r.sibling=i,t.child=r,0!==(1&t.mode)&&wa(t,e.child,null,l),t.child.memoizedState=Ll(l),t.memoizedState=Il,i);if(0===(1&t.mode))return Fl(e,t,l,null);if("$!"===o.data){if(r=o.nextSibling&&o.nextSibling.dataset)var s=r.dgst;return r=s,Fl(e,t,l,r=cl(i=Error(a(419)),r,void 0))}if(s=0!==(l&e.childLanes),yl||s){if(null!==(r=Ms)){switch(l&-l){case 4:o=2;break;case 16:o=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:o=32;break;case 536870912:o=268435456;break;default:o=0}0!==(o=0!==(o&(r.suspendedLanes|l))?0:o)&&o!==i.retryLane&&(i.retryLane=o,Ia(e,o),nu(r,e,o,-1))}return hu(),Fl(e,t,l,r=cl(Error(a(421))))}return"$?"===o.data?(t.flags|=128,t.child=e.child,t=Ru.bind(null,e),o._reactRetry=t,null):(e=i.treeContext,oa=uo(o.nextSibling),ra=t,aa=!0,ia=null,null!==e&&(Xo[Go++]=Yo,Xo[Go++]=Zo,Xo[Go++]=Qo,Yo=e.id,Zo=e.overflow,Qo=t),t=jl(t,r.children),t.flags|=4096,t)}(e,t,s,o,r,i,n);if(l){l=o.fallback,s=t.mode,r=(i=e.child).sibling;var u={mode:"hidden",children:o.children};return 0===(1&s)&&t.child!==i?((o=t.child).childLanes=0,o.pendingProps=u,t.deletions=null):(o=zu(i,u)).subtreeFlags=14680064&i.subtreeFlags,null!==r?l=zu(r,l):(l=Iu(l,s,n,null)).flags|=2,l.return=t,o.return=t,o.sibling=l,t.child=o,o=l,l=t.child,s=null===(s=e.child.memoizedState)?Ll(n):{baseLanes:s.baseLanes|n,cachePool:null,transitions:s.transitions},l.memoizedState=s,l.childLanes=e.childLanes&~n,t.memoizedState=Il,o}return e=(l=e.child).sibling,o=zu(l,{mode:"visible",children:o.children}),0===(1&t.mode)&&(o.lanes=n),o.return=t,o.sibling=null,null!==e&&(null===(n=t.deletions)?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=o,t.memoizedState=null,o}function jl(e,t){return(t=Lu({mode:"visible",children:t},e.mode,0,null)).return=e,e.child=t}function Fl(e,t,n,r){return null!==r&&ha(r),wa(t,e.child,null,n),(e=jl(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Wl(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),Ma(e.return,t,n)}function Dl(e,t,n,r,o){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:o}:(a.isBackwards=t,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=n,a.tailMode=o)}function Bl(e,t,n){var r=t.pendingProps,o=r.revealOrder,a=r.tail;if(xl(e,t,r.children,n),0!==(2&(r=ei.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Wl(e,n,t);else if(19===e.tag)Wl(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Ro(ei,r),0===(1&t.mode))t.memoizedState=null;else switch(o){case"forwards":for(n=t.child,o=null;null!==n;)null!==(e=n.alternate)&&null===ti(e)&&(o=n),n=n.sibling;null===(n=o)?(o=t.child,t.child=null):(o=n.sibling,n.sibling=null),Dl(t,!1,o,n,a);break;case"backwards":for(n=null,o=t.child,t.child=null;null!==o;){if(null!==(e=o.alternate)&&null===ti(e)){t.child=o;break}e=o.sibling,o.sibling=n,n=o,o=e}Dl(t,!0,n,null,a);break;case"together":Dl(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Vl(e,t){0===(1&t.mode)&&null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Ul(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Ls|=t.lanes,0===(n&t.childLanes))return null;if(null!==e&&t.child!==e.child)throw Error(a(153));if(null!==t.child){for(n=zu(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=zu(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Hl(e,t){if(!aa)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Kl(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var o=e.child;null!==o;)n|=o.lanes|o.childLanes,r|=14680064&o.subtreeFlags,r|=14680064&o.flags,o.return=e,o=o.sibling;else for(o=e.child;null!==o;)n|=o.lanes|o.childLanes,r|=o.subtreeFlags,r|=o.flags,o.return=e,o=o.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function ql(e,t,n){var r=t.pendingProps;switch(na(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Kl(t),null;case 1:case 17:return zo(t.type)&&Oo(),Kl(t),null;case 3:return r=t.stateNode,Ya(),Eo(No),Eo(Mo),ri(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(pa(t)?t.flags|=4:null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,null!==ia&&(iu(ia),ia=null))),Tl(e,t),Kl(t),null;case 5:Ja(t);var o=Ga(Xa.current);if(n=t.type,null!==e&&null!=t.stateNode)zl(e,t,n,r,o),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(null===t.stateNode)throw Error(a(166));return Kl(t),null}if(e=Ga(Ka.current),pa(t)){r=t.stateNode,n=t.type;var i=t.memoizedProps;switch(r[fo]=t,r[mo]=i,e=0!==(1&t.mode),n){case"dialog":Fr("cancel",r),Fr("close",r);break;case"iframe":case"object":case"embed":Fr("load",r);break;case"video":case"audio":for(o=0;o<Ir.length;o++)Fr(Ir[o],r);break;case"source":Fr("error",r);break;case"img":case"image":case"link":Fr("error",r),Fr("load",r);break;case"details":Fr("toggle",r);break;case"input":Q(r,i),Fr("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!i.multiple},Fr("invalid",r);break;case"textarea":oe(r,i),Fr("invalid",r)}for(var s in be(n,i),o=null,i)if(i.hasOwnProperty(s)){var u=i[s];"children"===s?"string"===typeof u?r.textContent!==u&&(!0!==i.suppressHydrationWarning&&Zr(r.textContent,u,e),o=["children",u]):"number"===typeof u&&r.textContent!==""+u&&(!0!==i.suppressHydrationWarning&&Zr(r.textContent,u,e),o=["children",""+u]):l.hasOwnProperty(s)&&null!=u&&"onScroll"===s&&Fr("scroll",r)}switch(n){case"input":K(r),J(r,i,!0);break;case"textarea":K(r),ie(r);break;case"select":case"option":break;default:"function"===typeof i.onClick&&(r.onclick=Jr)}r=o,t.updateQueue=r,null!==r&&(t.flags|=4)}else{s=9===o.nodeType?o:o.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=le(n)),"http://www.w3.org/1999/xhtml"===e?"script"===n?((e=s.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"===typeof r.is?e=s.createElement(n,{is:r.is}):(e=s.createElement(n),"select"===n&&(s=e,r.multiple?s.multiple=!0:r.size&&(s.size=r.size))):e=s.createElementNS(e,n),e[fo]=t,e[mo]=r,$l(e,t,!1,!1),t.stateNode=e;e:{switch(s=ye(n,r),n){case"dialog":Fr("cancel",e),Fr("close",e),o=r;break;case"iframe":case"object":case"embed":Fr("load",e),o=r;break;case"video":case"audio":for(o=0;o<Ir.length;o++)Fr(Ir[o],e);o=r;break;case"source":Fr("error",e),o=r;break;case"img":case"image":case"link":Fr("error",e),Fr("load",e),o=r;break;case"details":Fr("toggle",e),o=r;break;case"input":Q(e,r),o=G(e,r),Fr("invalid",e);break;case"option":default:o=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},o=_({},r,{value:void 0}),Fr("invalid",e);break;case"textarea":oe(e,r),o=re(e,r),Fr("invalid",e)}for(i in be(n,o),u=o)if(u.hasOwnProperty(i)){var c=u[i];"style"===i?ve(e,c):"dangerouslySetInnerHTML"===i?null!=(c=c?c.__html:void 0)&&de(e,c):"children"===i?"string"===typeof c?("textarea"!==n||""!==c)&&pe(e,c):"number"===typeof c&&pe(e,""+c):"suppressContentEditableWarning"!==i&&"suppressHydrationWarning"!==i&&"autoFocus"!==i&&(l.hasOwnProperty(i)?null!=c&&"onScroll"===i&&Fr("scroll",e):null!=c&&y(e,i,c,s))}switch(n){case"input":K(e),J(e,r,!1);break;case"textarea":K(e),ie(e);break;case"option":null!=r.value&&e.setAttribute("value",""+U(r.value));break;case"select":e.multiple=!!r.multiple,null!=(i=r.value)?ne(e,!!r.multiple,i,!1):null!=r.defaultValue&&ne(e,!!r.multiple,r.defaultValue,!0);break;default:"function"===typeof o.onClick&&(e.onclick=Jr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}null!==t.ref&&(t.flags|=512,t.flags|=2097152)}return Kl(t),null;case 6:if(e&&null!=t.stateNode)Ol(e,t,e.memoizedProps,r);else{if("string"!==typeof r&&null===t.stateNode)throw Error(a(166));if(n=Ga(Xa.current),Ga(Ka.current),pa(t)){if(r=t.stateNode,n=t.memoizedProps,r[fo]=t,(i=r.nodeValue!==n)&&null!==(e=ra))switch(e.tag){case 3:Zr(r.nodeValue,n,0!==(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Zr(r.nodeValue,n,0!==(1&e.mode))}i&&(t.flags|=4)}else(r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[fo]=t,t.stateNode=r}return Kl(t),null;case 13:if(Eo(ei),r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(aa&&null!==oa&&0!==(1&t.mode)&&0===(128&t.flags))fa(),ma(),t.flags|=98560,i=!1;else if(i=pa(t),null!==r&&null!==r.dehydrated){if(null===e){if(!i)throw Error(a(318));if(!(i=null!==(i=t.memoizedState)?i.dehydrated:null))throw Error(a(317));i[fo]=t}else ma(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;Kl(t),i=!1}else null!==ia&&(iu(ia),ia=null),i=!0;if(!i)return 65536&t.flags?t:null}return 0!==(128&t.flags)?(t.lanes=n,t):((r=null!==r)!==(null!==e&&null!==e.memoizedState)&&r&&(t.child.flags|=8192,0!==(1&t.mode)&&(null===e||0!==(1&ei.current)?0===Os&&(Os=3):hu())),null!==t.updateQueue&&(t.flags|=4),Kl(t),null);case 4:return Ya(),Tl(e,t),null===e&&Br(t.stateNode.containerInfo),Kl(t),null;case 10:return Pa(t.type._context),Kl(t),null;case 19:if(Eo(ei),null===(i=t.memoizedState))return Kl(t),null;if(r=0!==(128&t.flags),null===(s=i.rendering))if(r)Hl(i,!1);else{if(0!==Os||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(s=ti(e))){for(t.flags|=128,Hl(i,!1),null!==(r=s.updateQueue)&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;null!==n;)e=r,(i=n).flags&=14680066,null===(s=i.alternate)?(i.childLanes=0,i.lanes=e,i.child=null,i.subtreeFlags=0,i.memoizedProps=null,i.memoizedState=null,i.updateQueue=null,i.dependencies=null,i.stateNode=null):(i.childLanes=s.childLanes,i.lanes=s.lanes,i.child=s.child,i.subtreeFlags=0,i.deletions=null,i.memoizedProps=s.memoizedProps,i.memoizedState=s.memoizedState,i.updateQueue=s.updateQueue,i.type=s.type,e=s.dependencies,i.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return Ro(ei,1&ei.current|2),t.child}e=e.sibling}null!==i.tail&&Ye()>Bs&&(t.flags|=128,r=!0,Hl(i,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=ti(s))){if(t.flags|=128,r=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),Hl(i,!0),null===i.tail&&"hidden"===i.tailMode&&!s.alternate&&!aa)return Kl(t),null}else 2*Ye()-i.renderingStartTime>Bs&&1073741824!==n&&(t.flags|=128,r=!0,Hl(i,!1),t.lanes=4194304);i.isBackwards?(s.sibling=t.child,t.child=s):(null!==(n=i.last)?n.sibling=s:t.child=s,i.last=s)}return null!==i.tail?(t=i.tail,i.rendering=t,i.tail=t.sibling,i.renderingStartTime=Ye(),t.sibling=null,n=ei.current,Ro(ei,r?1&n|2:1&n),t):(Kl(t),null);case 22:case 23:return du(),r=null!==t.memoizedState,null!==e&&null!==e.memoizedState!==r&&(t.flags|=8192),r&&0!==(1&t.mode)?0!==(1073741824&Ts)&&(Kl(t),6&t.subtreeFlags&&(t.flags|=8192)):Kl(t),null;case 24:case 25:return null}throw Error(a(156,t.tag))}function Xl(e,t){switch(na(t),t.tag){case 1:return zo(t.type)&&Oo(),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return Ya(),Eo(No),Eo(Mo),ri(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 5:return Ja(t),null;case 13:if(Eo(ei),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(a(340));ma()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return Eo(ei),null;case 4:return Ya(),null;case 10:return Pa(t.type._context),null;case 22:case 23:return du(),null;default:return null}}$l=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Tl=function(){},zl=function(e,t,n,r){var o=e.memoizedProps;if(o!==r){e=t.stateNode,Ga(Ka.current);var a,i=null;switch(n){case"input":o=G(e,o),r=G(e,r),i=[];break;case"select":o=_({},o,{value:void 0}),r=_({},r,{value:void 0}),i=[];break;case"textarea":o=re(e,o),r=re(e,r),i=[];break;default:"function"!==typeof o.onClick&&"function"===typeof r.onClick&&(e.onclick=Jr)}for(c in be(n,r),n=null,o)if(!r.hasOwnProperty(c)&&o.hasOwnProperty(c)&&null!=o[c])if("style"===c){var s=o[c];for(a in s)s.hasOwnProperty(a)&&(n||(n={}),n[a]="")}else"dangerouslySetInnerHTML"!==c&&"children"!==c&&"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&"autoFocus"!==c&&(l.hasOwnProperty(c)?i||(i=[]):(i=i||[]).push(c,null));for(c in r){var u=r[c];if(s=null!=o?o[c]:void 0,r.hasOwnProperty(c)&&u!==s&&(null!=u||null!=s))if("style"===c)if(s){for(a in s)!s.hasOwnProperty(a)||u&&u.hasOwnProperty(a)||(n||(n={}),n[a]="");for(a in u)u.hasOwnProperty(a)&&s[a]!==u[a]&&(n||(n={}),n[a]=u[a])}else n||(i||(i=[]),i.push(c,n)),n=u;else"dangerouslySetInnerHTML"===c?(u=u?u.__html:void 0,s=s?s.__html:void 0,null!=u&&s!==u&&(i=i||[]).push(c,u)):"children"===c?"string"!==typeof u&&"number"!==typeof u||(i=i||[]).push(c,""+u):"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&(l.hasOwnProperty(c)?(null!=u&&"onScroll"===c&&Fr("scroll",e),i||s===u||(i=[])):(i=i||[]).push(c,u))}n&&(i=i||[]).push("style",n);var c=i;(t.updateQueue=c)&&(t.flags|=4)}},Ol=function(e,t,n,r){n!==r&&(t.flags|=4)};var Gl=!1,Ql=!1,Yl="function"===typeof WeakSet?WeakSet:Set,Zl=null;function Jl(e,t){var n=e.ref;if(null!==n)if("function"===typeof n)try{n(null)}catch(r){Cu(e,t,r)}else n.current=null}function es(e,t,n){try{n()}catch(r){Cu(e,t,r)}}var ts=!1;function ns(e,t,n){var r=t.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var o=r=r.next;do{if((o.tag&e)===e){var a=o.destroy;o.destroy=void 0,void 0!==a&&es(t,n,a)}o=o.next}while(o!==r)}}function rs(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function os(e){var t=e.ref;if(null!==t){var n=e.stateNode;e.tag,e=n,"function"===typeof t?t(e):t.current=e}}function as(e){var t=e.alternate;null!==t&&(e.alternate=null,as(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&(delete t[fo],delete t[mo],delete t[vo],delete t[go],delete t[bo])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function is(e){return 5===e.tag||3===e.tag||4===e.tag}function ls(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||is(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function ss(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Jr));else if(4!==r&&null!==(e=e.child))for(ss(e,t,n),e=e.sibling;null!==e;)ss(e,t,n),e=e.sibling}function us(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(us(e,t,n),e=e.sibling;null!==e;)us(e,t,n),e=e.sibling}var cs=null,ds=!1;function ps(e,t,n){for(n=n.child;null!==n;)fs(e,t,n),n=n.sibling}function fs(e,t,n){if(at&&"function"===typeof at.onCommitFiberUnmount)try{at.onCommitFiberUnmount(ot,n)}catch(l){}switch(n.tag){case 5:Ql||Jl(n,t);case 6:var r=cs,o=ds;cs=null,ps(e,t,n),ds=o,null!==(cs=r)&&(ds?(e=cs,n=n.stateNode,8===e.nodeType?e.parentNode.removeChild(n):e.removeChild(n)):cs.removeChild(n.stateNode));break;case 18:null!==cs&&(ds?(e=cs,n=n.stateNode,8===e.nodeType?so(e.parentNode,n):1===e.nodeType&&so(e,n),Bt(e)):so(cs,n.stateNode));break;case 4:r=cs,o=ds,cs=n.stateNode.containerInfo,ds=!0,ps(e,t,n),cs=r,ds=o;break;case 0:case 11:case 14:case 15:if(!Ql&&(null!==(r=n.updateQueue)&&null!==(r=r.lastEffect))){o=r=r.next;do{var a=o,i=a.destroy;a=a.tag,void 0!==i&&(0!==(2&a)||0!==(4&a))&&es(n,t,i),o=o.next}while(o!==r)}ps(e,t,n);break;case 1:if(!Ql&&(Jl(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(l){Cu(n,t,l)}ps(e,t,n);break;case 21:ps(e,t,n);break;case 22:1&n.mode?(Ql=(r=Ql)||null!==n.memoizedState,ps(e,t,n),Ql=r):ps(e,t,n);break;default:ps(e,t,n)}}function ms(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new Yl),t.forEach((function(t){var r=Pu.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}}function hs(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var o=n[r];try{var i=e,l=t,s=l;e:for(;null!==s;){switch(s.tag){case 5:cs=s.stateNode,ds=!1;break e;case 3:case 4:cs=s.stateNode.containerInfo,ds=!0;break e}s=s.return}if(null===cs)throw Error(a(160));fs(i,l,o),cs=null,ds=!1;var u=o.alternate;null!==u&&(u.return=null),o.return=null}catch(c){Cu(o,t,c)}}if(12854&t.subtreeFlags)for(t=t.child;null!==t;)vs(t,e),t=t.sibling}function vs(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(hs(t,e),gs(e),4&r){try{ns(3,e,e.return),rs(3,e)}catch(v){Cu(e,e.return,v)}try{ns(5,e,e.return)}catch(v){Cu(e,e.return,v)}}break;case 1:hs(t,e),gs(e),512&r&&null!==n&&Jl(n,n.return);break;case 5:if(hs(t,e),gs(e),512&r&&null!==n&&Jl(n,n.return),32&e.flags){var o=e.stateNode;try{pe(o,"")}catch(v){Cu(e,e.return,v)}}if(4&r&&null!=(o=e.stateNode)){var i=e.memoizedProps,l=null!==n?n.memoizedProps:i,s=e.type,u=e.updateQueue;if(e.updateQueue=null,null!==u)try{"input"===s&&"radio"===i.type&&null!=i.name&&Y(o,i),ye(s,l);var c=ye(s,i);for(l=0;l<u.length;l+=2){var d=u[l],p=u[l+1];"style"===d?ve(o,p):"dangerouslySetInnerHTML"===d?de(o,p):"children"===d?pe(o,p):y(o,d,p,c)}switch(s){case"input":Z(o,i);break;case"textarea":ae(o,i);break;case"select":var f=o._wrapperState.wasMultiple;o._wrapperState.wasMultiple=!!i.multiple;var m=i.value;null!=m?ne(o,!!i.multiple,m,!1):f!==!!i.multiple&&(null!=i.defaultValue?ne(o,!!i.multiple,i.defaultValue,!0):ne(o,!!i.multiple,i.multiple?[]:"",!1))}o[mo]=i}catch(v){Cu(e,e.return,v)}}break;case 6:if(hs(t,e),gs(e),4&r){if(null===e.stateNode)throw Error(a(162));o=e.stateNode,i=e.memoizedProps;try{o.nodeValue=i}catch(v){Cu(e,e.return,v)}}break;case 3:if(hs(t,e),gs(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Bt(t.containerInfo)}catch(v){Cu(e,e.return,v)}break;case 4:default:hs(t,e),gs(e);break;case 13:hs(t,e),gs(e),8192&(o=e.child).flags&&(i=null!==o.memoizedState,o.stateNode.isHidden=i,!i||null!==o.alternate&&null!==o.alternate.memoizedState||(Ds=Ye())),4&r&&ms(e);break;case 22:if(d=null!==n&&null!==n.memoizedState,1&e.mode?(Ql=(c=Ql)||d,hs(t,e),Ql=c):hs(t,e),gs(e),8192&r){if(c=null!==e.memoizedState,(e.stateNode.isHidden=c)&&!d&&0!==(1&e.mode))for(Zl=e,d=e.child;null!==d;){for(p=Zl=d;null!==Zl;){switch(m=(f=Zl).child,f.tag){case 0:case 11:case 14:case 15:ns(4,f,f.return);break;case 1:Jl(f,f.return);var h=f.stateNode;if("function"===typeof h.componentWillUnmount){r=f,n=f.return;try{t=r,h.props=t.memoizedProps,h.state=t.memoizedState,h.componentWillUnmount()}catch(v){Cu(r,n,v)}}break;case 5:Jl(f,f.return);break;case 22:if(null!==f.memoizedState){ws(p);continue}}null!==m?(m.return=f,Zl=m):ws(p)}d=d.sibling}e:for(d=null,p=e;;){if(5===p.tag){if(null===d){d=p;try{o=p.stateNode,c?"function"===typeof(i=o.style).setProperty?i.setProperty("display","none","important"):i.display="none":(s=p.stateNode,l=void 0!==(u=p.memoizedProps.style)&&null!==u&&u.hasOwnProperty("display")?u.display:null,s.style.display=he("display",l))}catch(v){Cu(e,e.return,v)}}}else if(6===p.tag){if(null===d)try{p.stateNode.nodeValue=c?"":p.memoizedProps}catch(v){Cu(e,e.return,v)}}else if((22!==p.tag&&23!==p.tag||null===p.memoizedState||p===e)&&null!==p.child){p.child.return=p,p=p.child;continue}if(p===e)break e;for(;null===p.sibling;){if(null===p.return||p.return===e)break e;d===p&&(d=null),p=p.return}d===p&&(d=null),p.sibling.return=p.return,p=p.sibling}}break;case 19:hs(t,e),gs(e),4&r&&ms(e);case 21:}}function gs(e){var t=e.flags;if(2&t){try{e:{for(var n=e.return;null!==n;){if(is(n)){var r=n;break e}n=n.return}throw Error(a(160))}switch(r.tag){case 5:var o=r.stateNode;32&r.flags&&(pe(o,""),r.flags&=-33),us(e,ls(e),o);break;case 3:case 4:var i=r.stateNode.containerInfo;ss(e,ls(e),i);break;default:throw Error(a(161))}}catch(l){Cu(e,e.return,l)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function bs(e,t,n){Zl=e,ys(e,t,n)}function ys(e,t,n){for(var r=0!==(1&e.mode);null!==Zl;){var o=Zl,a=o.child;if(22===o.tag&&r){var i=null!==o.memoizedState||Gl;if(!i){var l=o.alternate,s=null!==l&&null!==l.memoizedState||Ql;l=Gl;var u=Ql;if(Gl=i,(Ql=s)&&!u)for(Zl=o;null!==Zl;)s=(i=Zl).child,22===i.tag&&null!==i.memoizedState?Ss(o):null!==s?(s.return=i,Zl=s):Ss(o);for(;null!==a;)Zl=a,ys(a,t,n),a=a.sibling;Zl=o,Gl=l,Ql=u}xs(e)}else 0!==(8772&o.subtreeFlags)&&null!==a?(a.return=o,Zl=a):xs(e)}}function xs(e){for(;null!==Zl;){var t=Zl;if(0!==(8772&t.flags)){var n=t.alternate;try{if(0!==(8772&t.flags))switch(t.tag){case 0:case 11:case 15:Ql||rs(5,t);break;case 1:var r=t.stateNode;if(4&t.flags&&!Ql)if(null===n)r.componentDidMount();else{var o=t.elementType===t.type?n.memoizedProps:nl(t.type,n.memoizedProps);r.componentDidUpdate(o,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var i=t.updateQueue;null!==i&&Ua(t,i,r);break;case 3:var l=t.updateQueue;if(null!==l){if(n=null,null!==t.child)switch(t.child.tag){case 5:case 1:n=t.child.stateNode}Ua(t,l,n)}break;case 5:var s=t.stateNode;if(null===n&&4&t.flags){n=s;var u=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":u.autoFocus&&n.focus();break;case"img":u.src&&(n.src=u.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===t.memoizedState){var c=t.alternate;if(null!==c){var d=c.memoizedState;if(null!==d){var p=d.dehydrated;null!==p&&Bt(p)}}}break;default:throw Error(a(163))}Ql||512&t.flags&&os(t)}catch(f){Cu(t,t.return,f)}}if(t===e){Zl=null;break}if(null!==(n=t.sibling)){n.return=t.return,Zl=n;break}Zl=t.return}}function ws(e){for(;null!==Zl;){var t=Zl;if(t===e){Zl=null;break}var n=t.sibling;if(null!==n){n.return=t.return,Zl=n;break}Zl=t.return}}function Ss(e){for(;null!==Zl;){var t=Zl;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{rs(4,t)}catch(s){Cu(t,n,s)}break;case 1:var r=t.stateNode;if("function"===typeof r.componentDidMount){var o=t.return;try{r.componentDidMount()}catch(s){Cu(t,o,s)}}var a=t.return;try{os(t)}catch(s){Cu(t,a,s)}break;case 5:var i=t.return;try{os(t)}catch(s){Cu(t,i,s)}}}catch(s){Cu(t,t.return,s)}if(t===e){Zl=null;break}var l=t.sibling;if(null!==l){l.return=t.return,Zl=l;break}Zl=t.return}}var ks,Cs=Math.ceil,As=x.ReactCurrentDispatcher,Es=x.ReactCurrentOwner,Rs=x.ReactCurrentBatchConfig,Ps=0,Ms=null,Ns=null,$s=0,Ts=0,zs=Ao(0),Os=0,Is=null,Ls=0,_s=0,js=0,Fs=null,Ws=null,Ds=0,Bs=1/0,Vs=null,Us=!1,Hs=null,Ks=null,qs=!1,Xs=null,Gs=0,Qs=0,Ys=null,Zs=-1,Js=0;function eu(){return 0!==(6&Ps)?Ye():-1!==Zs?Zs:Zs=Ye()}function tu(e){return 0===(1&e.mode)?1:0!==(2&Ps)&&0!==$s?$s&-$s:null!==va.transition?(0===Js&&(Js=ht()),Js):0!==(e=yt)?e:e=void 0===(e=window.event)?16:Qt(e.type)}function nu(e,t,n,r){if(50<Qs)throw Qs=0,Ys=null,Error(a(185));gt(e,n,r),0!==(2&Ps)&&e===Ms||(e===Ms&&(0===(2&Ps)&&(_s|=n),4===Os&&lu(e,$s)),ru(e,r),1===n&&0===Ps&&0===(1&t.mode)&&(Bs=Ye()+500,Wo&&Vo()))}function ru(e,t){var n=e.callbackNode;!function(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,o=e.expirationTimes,a=e.pendingLanes;0<a;){var i=31-it(a),l=1<<i,s=o[i];-1===s?0!==(l&n)&&0===(l&r)||(o[i]=ft(l,t)):s<=t&&(e.expiredLanes|=l),a&=~l}}(e,t);var r=pt(e,e===Ms?$s:0);if(0===r)null!==n&&Xe(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(null!=n&&Xe(n),1===t)0===e.tag?function(e){Wo=!0,Bo(e)}(su.bind(null,e)):Bo(su.bind(null,e)),io((function(){0===(6&Ps)&&Vo()})),n=null;else{switch(xt(r)){case 1:n=Je;break;case 4:n=et;break;case 16:default:n=tt;break;case 536870912:n=rt}n=Mu(n,ou.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function ou(e,t){if(Zs=-1,Js=0,0!==(6&Ps))throw Error(a(327));var n=e.callbackNode;if(Su()&&e.callbackNode!==n)return null;var r=pt(e,e===Ms?$s:0);if(0===r)return null;if(0!==(30&r)||0!==(r&e.expiredLanes)||t)t=vu(e,r);else{t=r;var o=Ps;Ps|=2;var i=mu();for(Ms===e&&$s===t||(Vs=null,Bs=Ye()+500,pu(e,t));;)try{bu();break}catch(s){fu(e,s)}Ra(),As.current=i,Ps=o,null!==Ns?t=0:(Ms=null,$s=0,t=Os)}if(0!==t){if(2===t&&(0!==(o=mt(e))&&(r=o,t=au(e,o))),1===t)throw n=Is,pu(e,0),lu(e,r),ru(e,Ye()),n;if(6===t)lu(e,r);else{if(o=e.current.alternate,0===(30&r)&&!function(e){for(var t=e;;){if(16384&t.flags){var n=t.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var o=n[r],a=o.getSnapshot;o=o.value;try{if(!lr(a(),o))return!1}catch(l){return!1}}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}(o)&&(2===(t=vu(e,r))&&(0!==(i=mt(e))&&(r=i,t=au(e,i))),1===t))throw n=Is,pu(e,0),lu(e,r),ru(e,Ye()),n;switch(e.finishedWork=o,e.finishedLanes=r,t){case 0:case 1:throw Error(a(345));case 2:case 5:wu(e,Ws,Vs);break;case 3:if(lu(e,r),(130023424&r)===r&&10<(t=Ds+500-Ye())){if(0!==pt(e,0))break;if(((o=e.suspendedLanes)&r)!==r){eu(),e.pingedLanes|=e.suspendedLanes&o;break}e.timeoutHandle=ro(wu.bind(null,e,Ws,Vs),t);break}wu(e,Ws,Vs);break;case 4:if(lu(e,r),(4194240&r)===r)break;for(t=e.eventTimes,o=-1;0<r;){var l=31-it(r);i=1<<l,(l=t[l])>o&&(o=l),r&=~i}if(r=o,10<(r=(120>(r=Ye()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Cs(r/1960))-r)){e.timeoutHandle=ro(wu.bind(null,e,Ws,Vs),r);break}wu(e,Ws,Vs);break;default:throw Error(a(329))}}}return ru(e,Ye()),e.callbackNode===n?ou.bind(null,e):null}function au(e,t){var n=Fs;return e.current.memoizedState.isDehydrated&&(pu(e,t).flags|=256),2!==(e=vu(e,t))&&(t=Ws,Ws=n,null!==t&&iu(t)),e}function iu(e){null===Ws?Ws=e:Ws.push.apply(Ws,e)}function lu(e,t){for(t&=~js,t&=~_s,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-it(t),r=1<<n;e[n]=-1,t&=~r}}function su(e){if(0!==(6&Ps))throw Error(a(327));Su();var t=pt(e,0);if(0===(1&t))return ru(e,Ye()),null;var n=vu(e,t);if(0!==e.tag&&2===n){var r=mt(e);0!==r&&(t=r,n=au(e,r))}if(1===n)throw n=Is,pu(e,0),lu(e,t),ru(e,Ye()),n;if(6===n)throw Error(a(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,wu(e,Ws,Vs),ru(e,Ye()),null}function uu(e,t){var n=Ps;Ps|=1;try{return e(t)}finally{0===(Ps=n)&&(Bs=Ye()+500,Wo&&Vo())}}function cu(e){null!==Xs&&0===Xs.tag&&0===(6&Ps)&&Su();var t=Ps;Ps|=1;var n=Rs.transition,r=yt;try{if(Rs.transition=null,yt=1,e)return e()}finally{yt=r,Rs.transition=n,0===(6&(Ps=t))&&Vo()}}function du(){Ts=zs.current,Eo(zs)}function pu(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,oo(n)),null!==Ns)for(n=Ns.return;null!==n;){var r=n;switch(na(r),r.tag){case 1:null!==(r=r.type.childContextTypes)&&void 0!==r&&Oo();break;case 3:Ya(),Eo(No),Eo(Mo),ri();break;case 5:Ja(r);break;case 4:Ya();break;case 13:case 19:Eo(ei);break;case 10:Pa(r.type._context);break;case 22:case 23:du()}n=n.return}if(Ms=e,Ns=e=zu(e.current,null),$s=Ts=t,Os=0,Is=null,js=_s=Ls=0,Ws=Fs=null,null!==Ta){for(t=0;t<Ta.length;t++)if(null!==(r=(n=Ta[t]).interleaved)){n.interleaved=null;var o=r.next,a=n.pending;if(null!==a){var i=a.next;a.next=o,r.next=i}n.pending=r}Ta=null}return e}function fu(e,t){for(;;){var n=Ns;try{if(Ra(),oi.current=Zi,ci){for(var r=li.memoizedState;null!==r;){var o=r.queue;null!==o&&(o.pending=null),r=r.next}ci=!1}if(ii=0,ui=si=li=null,di=!1,pi=0,Es.current=null,null===n||null===n.return){Os=1,Is=t,Ns=null;break}e:{var i=e,l=n.return,s=n,u=t;if(t=$s,s.flags|=32768,null!==u&&"object"===typeof u&&"function"===typeof u.then){var c=u,d=s,p=d.tag;if(0===(1&d.mode)&&(0===p||11===p||15===p)){var f=d.alternate;f?(d.updateQueue=f.updateQueue,d.memoizedState=f.memoizedState,d.lanes=f.lanes):(d.updateQueue=null,d.memoizedState=null)}var m=vl(l);if(null!==m){m.flags&=-257,gl(m,l,s,0,t),1&m.mode&&hl(i,c,t),u=c;var h=(t=m).updateQueue;if(null===h){var v=new Set;v.add(u),t.updateQueue=v}else h.add(u);break e}if(0===(1&t)){hl(i,c,t),hu();break e}u=Error(a(426))}else if(aa&&1&s.mode){var g=vl(l);if(null!==g){0===(65536&g.flags)&&(g.flags|=256),gl(g,l,s,0,t),ha(ul(u,s));break e}}i=u=ul(u,s),4!==Os&&(Os=2),null===Fs?Fs=[i]:Fs.push(i),i=l;do{switch(i.tag){case 3:i.flags|=65536,t&=-t,i.lanes|=t,Ba(i,fl(0,u,t));break e;case 1:s=u;var b=i.type,y=i.stateNode;if(0===(128&i.flags)&&("function"===typeof b.getDerivedStateFromError||null!==y&&"function"===typeof y.componentDidCatch&&(null===Ks||!Ks.has(y)))){i.flags|=65536,t&=-t,i.lanes|=t,Ba(i,ml(i,s,t));break e}}i=i.return}while(null!==i)}xu(n)}catch(x){t=x,Ns===n&&null!==n&&(Ns=n=n.return);continue}break}}function mu(){var e=As.current;return As.current=Zi,null===e?Zi:e}function hu(){0!==Os&&3!==Os&&2!==Os||(Os=4),null===Ms||0===(268435455&Ls)&&0===(268435455&_s)||lu(Ms,$s)}function vu(e,t){var n=Ps;Ps|=2;var r=mu();for(Ms===e&&$s===t||(Vs=null,pu(e,t));;)try{gu();break}catch(o){fu(e,o)}if(Ra(),Ps=n,As.current=r,null!==Ns)throw Error(a(261));return Ms=null,$s=0,Os}function gu(){for(;null!==Ns;)yu(Ns)}function bu(){for(;null!==Ns&&!Ge();)yu(Ns)}function yu(e){var t=ks(e.alternate,e,Ts);e.memoizedProps=e.pendingProps,null===t?xu(e):Ns=t,Es.current=null}function xu(e){var t=e;do{var n=t.alternate;if(e=t.return,0===(32768&t.flags)){if(null!==(n=ql(n,t,Ts)))return void(Ns=n)}else{if(null!==(n=Xl(n,t)))return n.flags&=32767,void(Ns=n);if(null===e)return Os=6,void(Ns=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}if(null!==(t=t.sibling))return void(Ns=t);Ns=t=e}while(null!==t);0===Os&&(Os=5)}function wu(e,t,n){var r=yt,o=Rs.transition;try{Rs.transition=null,yt=1,function(e,t,n,r){do{Su()}while(null!==Xs);if(0!==(6&Ps))throw Error(a(327));n=e.finishedWork;var o=e.finishedLanes;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(a(177));e.callbackNode=null,e.callbackPriority=0;var i=n.lanes|n.childLanes;if(function(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var o=31-it(n),a=1<<o;t[o]=0,r[o]=-1,e[o]=-1,n&=~a}}(e,i),e===Ms&&(Ns=Ms=null,$s=0),0===(2064&n.subtreeFlags)&&0===(2064&n.flags)||qs||(qs=!0,Mu(tt,(function(){return Su(),null}))),i=0!==(15990&n.flags),0!==(15990&n.subtreeFlags)||i){i=Rs.transition,Rs.transition=null;var l=yt;yt=1;var s=Ps;Ps|=4,Es.current=null,function(e,t){if(eo=Ut,fr(e=pr())){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var o=r.anchorOffset,i=r.focusNode;r=r.focusOffset;try{n.nodeType,i.nodeType}catch(w){n=null;break e}var l=0,s=-1,u=-1,c=0,d=0,p=e,f=null;t:for(;;){for(var m;p!==n||0!==o&&3!==p.nodeType||(s=l+o),p!==i||0!==r&&3!==p.nodeType||(u=l+r),3===p.nodeType&&(l+=p.nodeValue.length),null!==(m=p.firstChild);)f=p,p=m;for(;;){if(p===e)break t;if(f===n&&++c===o&&(s=l),f===i&&++d===r&&(u=l),null!==(m=p.nextSibling))break;f=(p=f).parentNode}p=m}n=-1===s||-1===u?null:{start:s,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for(to={focusedElem:e,selectionRange:n},Ut=!1,Zl=t;null!==Zl;)if(e=(t=Zl).child,0!==(1028&t.subtreeFlags)&&null!==e)e.return=t,Zl=e;else for(;null!==Zl;){t=Zl;try{var h=t.alternate;if(0!==(1024&t.flags))switch(t.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==h){var v=h.memoizedProps,g=h.memoizedState,b=t.stateNode,y=b.getSnapshotBeforeUpdate(t.elementType===t.type?v:nl(t.type,v),g);b.__reactInternalSnapshotBeforeUpdate=y}break;case 3:var x=t.stateNode.containerInfo;1===x.nodeType?x.textContent="":9===x.nodeType&&x.documentElement&&x.removeChild(x.documentElement);break;default:throw Error(a(163))}}catch(w){Cu(t,t.return,w)}if(null!==(e=t.sibling)){e.return=t.return,Zl=e;break}Zl=t.return}h=ts,ts=!1}(e,n),vs(n,e),mr(to),Ut=!!eo,to=eo=null,e.current=n,bs(n,e,o),Qe(),Ps=s,yt=l,Rs.transition=i}else e.current=n;if(qs&&(qs=!1,Xs=e,Gs=o),i=e.pendingLanes,0===i&&(Ks=null),function(e){if(at&&"function"===typeof at.onCommitFiberRoot)try{at.onCommitFiberRoot(ot,e,void 0,128===(128&e.current.flags))}catch(t){}}(n.stateNode),ru(e,Ye()),null!==t)for(r=e.onRecoverableError,n=0;n<t.length;n++)o=t[n],r(o.value,{componentStack:o.stack,digest:o.digest});if(Us)throw Us=!1,e=Hs,Hs=null,e;0!==(1&Gs)&&0!==e.tag&&Su(),i=e.pendingLanes,0!==(1&i)?e===Ys?Qs++:(Qs=0,Ys=e):Qs=0,Vo()}(e,t,n,r)}finally{Rs.transition=o,yt=r}return null}function Su(){if(null!==Xs){var e=xt(Gs),t=Rs.transition,n=yt;try{if(Rs.transition=null,yt=16>e?16:e,null===Xs)var r=!1;else{if(e=Xs,Xs=null,Gs=0,0!==(6&Ps))throw Error(a(331));var o=Ps;for(Ps|=4,Zl=e.current;null!==Zl;){var i=Zl,l=i.child;if(0!==(16&Zl.flags)){var s=i.deletions;if(null!==s){for(var u=0;u<s.length;u++){var c=s[u];for(Zl=c;null!==Zl;){var d=Zl;switch(d.tag){case 0:case 11:case 15:ns(8,d,i)}var p=d.child;if(null!==p)p.return=d,Zl=p;else for(;null!==Zl;){var f=(d=Zl).sibling,m=d.return;if(as(d),d===c){Zl=null;break}if(null!==f){f.return=m,Zl=f;break}Zl=m}}}var h=i.alternate;if(null!==h){var v=h.child;if(null!==v){h.child=null;do{var g=v.sibling;v.sibling=null,v=g}while(null!==v)}}Zl=i}}if(0!==(2064&i.subtreeFlags)&&null!==l)l.return=i,Zl=l;else e:for(;null!==Zl;){if(0!==(2048&(i=Zl).flags))switch(i.tag){case 0:case 11:case 15:ns(9,i,i.return)}var b=i.sibling;if(null!==b){b.return=i.return,Zl=b;break e}Zl=i.return}}var y=e.current;for(Zl=y;null!==Zl;){var x=(l=Zl).child;if(0!==(2064&l.subtreeFlags)&&null!==x)x.return=l,Zl=x;else e:for(l=y;null!==Zl;){if(0!==(2048&(s=Zl).flags))try{switch(s.tag){case 0:case 11:case 15:rs(9,s)}}catch(S){Cu(s,s.return,S)}if(s===l){Zl=null;break e}var w=s.sibling;if(null!==w){w.return=s.return,Zl=w;break e}Zl=s.return}}if(Ps=o,Vo(),at&&"function"===typeof at.onPostCommitFiberRoot)try{at.onPostCommitFiberRoot(ot,e)}catch(S){}r=!0}return r}finally{yt=n,Rs.transition=t}}return!1}function ku(e,t,n){e=Wa(e,t=fl(0,t=ul(n,t),1),1),t=eu(),null!==e&&(gt(e,1,t),ru(e,t))}function Cu(e,t,n){if(3===e.tag)ku(e,e,n);else for(;null!==t;){if(3===t.tag){ku(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Ks||!Ks.has(r))){t=Wa(t,e=ml(t,e=ul(n,e),1),1),e=eu(),null!==t&&(gt(t,1,e),ru(t,e));break}}t=t.return}}function Au(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=eu(),e.pingedLanes|=e.suspendedLanes&n,Ms===e&&($s&n)===n&&(4===Os||3===Os&&(130023424&$s)===$s&&500>Ye()-Ds?pu(e,0):js|=n),ru(e,t)}function Eu(e,t){0===t&&(0===(1&e.mode)?t=1:(t=ct,0===(130023424&(ct<<=1))&&(ct=4194304)));var n=eu();null!==(e=Ia(e,t))&&(gt(e,t,n),ru(e,n))}function Ru(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),Eu(e,n)}function Pu(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,o=e.memoizedState;null!==o&&(n=o.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(a(314))}null!==r&&r.delete(t),Eu(e,n)}function Mu(e,t){return qe(e,t)}function Nu(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function $u(e,t,n,r){return new Nu(e,t,n,r)}function Tu(e){return!(!(e=e.prototype)||!e.isReactComponent)}function zu(e,t){var n=e.alternate;return null===n?((n=$u(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Ou(e,t,n,r,o,i){var l=2;if(r=e,"function"===typeof e)Tu(e)&&(l=1);else if("string"===typeof e)l=5;else e:switch(e){case k:return Iu(n.children,o,i,t);case C:l=8,o|=8;break;case A:return(e=$u(12,n,t,2|o)).elementType=A,e.lanes=i,e;case M:return(e=$u(13,n,t,o)).elementType=M,e.lanes=i,e;case N:return(e=$u(19,n,t,o)).elementType=N,e.lanes=i,e;case z:return Lu(n,o,i,t);default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case E:l=10;break e;case R:l=9;break e;case P:l=11;break e;case $:l=14;break e;case T:l=16,r=null;break e}throw Error(a(130,null==e?e:typeof e,""))}return(t=$u(l,n,t,o)).elementType=e,t.type=r,t.lanes=i,t}function Iu(e,t,n,r){return(e=$u(7,e,r,t)).lanes=n,e}function Lu(e,t,n,r){return(e=$u(22,e,r,t)).elementType=z,e.lanes=n,e.stateNode={isHidden:!1},e}function _u(e,t,n){return(e=$u(6,e,null,t)).lanes=n,e}function ju(e,t,n){return(t=$u(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Fu(e,t,n,r,o){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=vt(0),this.expirationTimes=vt(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=vt(0),this.identifierPrefix=r,this.onRecoverableError=o,this.mutableSourceEagerHydrationData=null}function Wu(e,t,n,r,o,a,i,l,s){return e=new Fu(e,t,n,l,s),1===t?(t=1,!0===a&&(t|=8)):t=0,a=$u(3,null,null,t),e.current=a,a.stateNode=e,a.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},_a(a),e}function Du(e){if(!e)return Po;e:{if(Be(e=e._reactInternals)!==e||1!==e.tag)throw Error(a(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(zo(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(null!==t);throw Error(a(171))}if(1===e.tag){var n=e.type;if(zo(n))return Lo(e,n,t)}return t}function Bu(e,t,n,r,o,a,i,l,s){return(e=Wu(n,r,!0,e,0,a,0,l,s)).context=Du(null),n=e.current,(a=Fa(r=eu(),o=tu(n))).callback=void 0!==t&&null!==t?t:null,Wa(n,a,o),e.current.lanes=o,gt(e,o,r),ru(e,r),e}function Vu(e,t,n,r){var o=t.current,a=eu(),i=tu(o);return n=Du(n),null===t.context?t.context=n:t.pendingContext=n,(t=Fa(a,i)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),null!==(e=Wa(o,t,i))&&(nu(e,o,i,a),Da(e,o,i)),i}function Uu(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Hu(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Ku(e,t){Hu(e,t),(e=e.alternate)&&Hu(e,t)}ks=function(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps||No.current)yl=!0;else{if(0===(e.lanes&n)&&0===(128&t.flags))return yl=!1,function(e,t,n){switch(t.tag){case 3:Ml(t),ma();break;case 5:Za(t);break;case 1:zo(t.type)&&_o(t);break;case 4:Qa(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,o=t.memoizedProps.value;Ro(ka,r._currentValue),r._currentValue=o;break;case 13:if(null!==(r=t.memoizedState))return null!==r.dehydrated?(Ro(ei,1&ei.current),t.flags|=128,null):0!==(n&t.child.childLanes)?_l(e,t,n):(Ro(ei,1&ei.current),null!==(e=Ul(e,t,n))?e.sibling:null);Ro(ei,1&ei.current);break;case 19:if(r=0!==(n&t.childLanes),0!==(128&e.flags)){if(r)return Bl(e,t,n);t.flags|=128}if(null!==(o=t.memoizedState)&&(o.rendering=null,o.tail=null,o.lastEffect=null),Ro(ei,ei.current),r)break;return null;case 22:case 23:return t.lanes=0,Cl(e,t,n)}return Ul(e,t,n)}(e,t,n);yl=0!==(131072&e.flags)}else yl=!1,aa&&0!==(1048576&t.flags)&&ea(t,qo,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Vl(e,t),e=t.pendingProps;var o=To(t,Mo.current);Na(t,n),o=vi(null,t,r,e,o,n);var i=gi();return t.flags|=1,"object"===typeof o&&null!==o&&"function"===typeof o.render&&void 0===o.$$typeof?(t.tag=1,t.memoizedState=null,t.updateQueue=null,zo(r)?(i=!0,_o(t)):i=!1,t.memoizedState=null!==o.state&&void 0!==o.state?o.state:null,_a(t),o.updater=ol,t.stateNode=o,o._reactInternals=t,sl(t,r,e,n),t=Pl(null,t,r,!0,i,n)):(t.tag=0,aa&&i&&ta(t),xl(null,t,o,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Vl(e,t),e=t.pendingProps,r=(o=r._init)(r._payload),t.type=r,o=t.tag=function(e){if("function"===typeof e)return Tu(e)?1:0;if(void 0!==e&&null!==e){if((e=e.$$typeof)===P)return 11;if(e===$)return 14}return 2}(r),e=nl(r,e),o){case 0:t=El(null,t,r,e,n);break e;case 1:t=Rl(null,t,r,e,n);break e;case 11:t=wl(null,t,r,e,n);break e;case 14:t=Sl(null,t,r,nl(r.type,e),n);break e}throw Error(a(306,r,""))}return t;case 0:return r=t.type,o=t.pendingProps,El(e,t,r,o=t.elementType===r?o:nl(r,o),n);case 1:return r=t.type,o=t.pendingProps,Rl(e,t,r,o=t.elementType===r?o:nl(r,o),n);case 3:e:{if(Ml(t),null===e)throw Error(a(387));r=t.pendingProps,o=(i=t.memoizedState).element,ja(e,t),Va(t,r,null,n);var l=t.memoizedState;if(r=l.element,i.isDehydrated){if(i={element:r,isDehydrated:!1,cache:l.cache,pendingSuspenseBoundaries:l.pendingSuspenseBoundaries,transitions:l.transitions},t.updateQueue.baseState=i,t.memoizedState=i,256&t.flags){t=Nl(e,t,r,n,o=ul(Error(a(423)),t));break e}if(r!==o){t=Nl(e,t,r,n,o=ul(Error(a(424)),t));break e}for(oa=uo(t.stateNode.containerInfo.firstChild),ra=t,aa=!0,ia=null,n=Sa(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(ma(),r===o){t=Ul(e,t,n);break e}xl(e,t,r,n)}t=t.child}return t;case 5:return Za(t),null===e&&ca(t),r=t.type,o=t.pendingProps,i=null!==e?e.memoizedProps:null,l=o.children,no(r,o)?l=null:null!==i&&no(r,i)&&(t.flags|=32),Al(e,t),xl(e,t,l,n),t.child;case 6:return null===e&&ca(t),null;case 13:return _l(e,t,n);case 4:return Qa(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=wa(t,null,r,n):xl(e,t,r,n),t.child;case 11:return r=t.type,o=t.pendingProps,wl(e,t,r,o=t.elementType===r?o:nl(r,o),n);case 7:return xl(e,t,t.pendingProps,n),t.child;case 8:case 12:return xl(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,o=t.pendingProps,i=t.memoizedProps,l=o.value,Ro(ka,r._currentValue),r._currentValue=l,null!==i)if(lr(i.value,l)){if(i.children===o.children&&!No.current){t=Ul(e,t,n);break e}}else for(null!==(i=t.child)&&(i.return=t);null!==i;){var s=i.dependencies;if(null!==s){l=i.child;for(var u=s.firstContext;null!==u;){if(u.context===r){if(1===i.tag){(u=Fa(-1,n&-n)).tag=2;var c=i.updateQueue;if(null!==c){var d=(c=c.shared).pending;null===d?u.next=u:(u.next=d.next,d.next=u),c.pending=u}}i.lanes|=n,null!==(u=i.alternate)&&(u.lanes|=n),Ma(i.return,n,t),s.lanes|=n;break}u=u.next}}else if(10===i.tag)l=i.type===t.type?null:i.child;else if(18===i.tag){if(null===(l=i.return))throw Error(a(341));l.lanes|=n,null!==(s=l.alternate)&&(s.lanes|=n),Ma(l,n,t),l=i.sibling}else l=i.child;if(null!==l)l.return=i;else for(l=i;null!==l;){if(l===t){l=null;break}if(null!==(i=l.sibling)){i.return=l.return,l=i;break}l=l.return}i=l}xl(e,t,o.children,n),t=t.child}return t;case 9:return o=t.type,r=t.pendingProps.children,Na(t,n),r=r(o=$a(o)),t.flags|=1,xl(e,t,r,n),t.child;case 14:return o=nl(r=t.type,t.pendingProps),Sl(e,t,r,o=nl(r.type,o),n);case 15:return kl(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:nl(r,o),Vl(e,t),t.tag=1,zo(r)?(e=!0,_o(t)):e=!1,Na(t,n),il(t,r,o),sl(t,r,o,n),Pl(null,t,r,!0,e,n);case 19:return Bl(e,t,n);case 22:return Cl(e,t,n)}throw Error(a(156,t.tag))};var qu="function"===typeof reportError?reportError:function(e){console.error(e)};function Xu(e){this._internalRoot=e}function Gu(e){this._internalRoot=e}function Qu(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Yu(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Zu(){}function Ju(e,t,n,r,o){var a=n._reactRootContainer;if(a){var i=a;if("function"===typeof o){var l=o;o=function(){var e=Uu(i);l.call(e)}}Vu(t,i,e,o)}else i=function(e,t,n,r,o){if(o){if("function"===typeof r){var a=r;r=function(){var e=Uu(i);a.call(e)}}var i=Bu(t,r,e,0,null,!1,0,"",Zu);return e._reactRootContainer=i,e[ho]=i.current,Br(8===e.nodeType?e.parentNode:e),cu(),i}for(;o=e.lastChild;)e.removeChild(o);if("function"===typeof r){var l=r;r=function(){var e=Uu(s);l.call(e)}}var s=Wu(e,0,!1,null,0,!1,0,"",Zu);return e._reactRootContainer=s,e[ho]=s.current,Br(8===e.nodeType?e.parentNode:e),cu((function(){Vu(t,s,n,r)})),s}(n,t,e,o,r);return Uu(i)}Gu.prototype.render=Xu.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(a(409));Vu(e,t,null,null)},Gu.prototype.unmount=Xu.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;cu((function(){Vu(null,e,null,null)})),t[ho]=null}},Gu.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ct();e={blockedOn:null,target:e,priority:t};for(var n=0;n<zt.length&&0!==t&&t<zt[n].priority;n++);zt.splice(n,0,e),0===n&&_t(e)}},wt=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=dt(t.pendingLanes);0!==n&&(bt(t,1|n),ru(t,Ye()),0===(6&Ps)&&(Bs=Ye()+500,Vo()))}break;case 13:cu((function(){var t=Ia(e,1);if(null!==t){var n=eu();nu(t,e,1,n)}})),Ku(e,1)}},St=function(e){if(13===e.tag){var t=Ia(e,134217728);if(null!==t)nu(t,e,134217728,eu());Ku(e,134217728)}},kt=function(e){if(13===e.tag){var t=tu(e),n=Ia(e,t);if(null!==n)nu(n,e,t,eu());Ku(e,t)}},Ct=function(){return yt},At=function(e,t){var n=yt;try{return yt=e,t()}finally{yt=n}},Se=function(e,t,n){switch(t){case"input":if(Z(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var o=So(r);if(!o)throw Error(a(90));q(r),Z(r,o)}}}break;case"textarea":ae(e,n);break;case"select":null!=(t=n.value)&&ne(e,!!n.multiple,t,!1)}},Pe=uu,Me=cu;var ec={usingClientEntryPoint:!1,Events:[xo,wo,So,Ee,Re,uu]},tc={findFiberByHostInstance:yo,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},nc={bundleType:tc.bundleType,version:tc.version,rendererPackageName:tc.rendererPackageName,rendererConfig:tc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:x.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=He(e))?null:e.stateNode},findFiberByHostInstance:tc.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var rc=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!rc.isDisabled&&rc.supportsFiber)try{ot=rc.inject(nc),at=rc}catch(ce){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=ec,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Qu(t))throw Error(a(200));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:S,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.createRoot=function(e,t){if(!Qu(e))throw Error(a(299));var n=!1,r="",o=qu;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onRecoverableError&&(o=t.onRecoverableError)),t=Wu(e,1,!1,null,0,n,0,r,o),e[ho]=t.current,Br(8===e.nodeType?e.parentNode:e),new Xu(t)},t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(a(188));throw e=Object.keys(e).join(","),Error(a(268,e))}return e=null===(e=He(t))?null:e.stateNode},t.flushSync=function(e){return cu(e)},t.hydrate=function(e,t,n){if(!Yu(t))throw Error(a(200));return Ju(null,e,t,!0,n)},t.hydrateRoot=function(e,t,n){if(!Qu(e))throw Error(a(405));var r=null!=n&&n.hydratedSources||null,o=!1,i="",l=qu;if(null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(o=!0),void 0!==n.identifierPrefix&&(i=n.identifierPrefix),void 0!==n.onRecoverableError&&(l=n.onRecoverableError)),t=Bu(t,null,e,1,null!=n?n:null,o,0,i,l),e[ho]=t.current,Br(e),r)for(e=0;e<r.length;e++)o=(o=(n=r[e])._getVersion)(n._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[n,o]:t.mutableSourceEagerHydrationData.push(n,o);return new Gu(t)},t.render=function(e,t,n){if(!Yu(t))throw Error(a(200));return Ju(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Yu(e))throw Error(a(40));return!!e._reactRootContainer&&(cu((function(){Ju(null,null,e,!1,(function(){e._reactRootContainer=null,e[ho]=null}))})),!0)},t.unstable_batchedUpdates=uu,t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Yu(n))throw Error(a(200));if(null==e||void 0===e._reactInternals)throw Error(a(38));return Ju(e,t,n,!1,r)},t.version="18.3.1-next-f1338f8080-20240426"},751:(e,t,n)=>{"use strict";n.d(t,{EU:()=>l,NI:()=>i,iZ:()=>u,kW:()=>c,vf:()=>s,zu:()=>o});var r=n(172);const o={xs:0,sm:600,md:900,lg:1200,xl:1536},a={keys:["xs","sm","md","lg","xl"],up:e=>`@media (min-width:${o[e]}px)`};function i(e,t,n){const r=e.theme||{};if(Array.isArray(t)){const e=r.breakpoints||a;return t.reduce(((r,o,a)=>(r[e.up(e.keys[a])]=n(t[a]),r)),{})}if("object"===typeof t){const e=r.breakpoints||a;return Object.keys(t).reduce(((r,a)=>{if(-1!==Object.keys(e.values||o).indexOf(a)){r[e.up(a)]=n(t[a],a)}else{const e=a;r[e]=t[e]}return r}),{})}return n(t)}function l(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};var t;return(null==(t=e.keys)?void 0:t.reduce(((t,n)=>(t[e.up(n)]={},t)),{}))||{}}function s(e,t){return e.reduce(((e,t)=>{const n=e[t];return(!n||0===Object.keys(n).length)&&delete e[t],e}),t)}function u(e){const t=l(e);for(var n=arguments.length,o=new Array(n>1?n-1:0),a=1;a<n;a++)o[a-1]=arguments[a];const i=[t,...o].reduce(((e,t)=>(0,r.A)(e,t)),{});return s(Object.keys(t),i)}function c(e){let{values:t,breakpoints:n,base:r}=e;const o=r||function(e,t){if("object"!==typeof e)return{};const n={},r=Object.keys(t);return Array.isArray(e)?r.forEach(((t,r)=>{r<e.length&&(n[t]=!0)})):r.forEach((t=>{null!=e[t]&&(n[t]=!0)})),n}(t,n),a=Object.keys(o);if(0===a.length)return t;let i;return a.reduce(((e,n,r)=>(Array.isArray(t)?(e[n]=null!=t[r]?t[r]:t[i],i=r):"object"===typeof t?(e[n]=null!=t[n]?t[n]:t[i],i=n):e[n]=t,e)),{})}},758:(e,t,n)=>{"use strict";n.d(t,{A:()=>O});var r=n(604),o=n(162),a=n(815);const i=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];const r=t.reduce(((e,t)=>(t.filterProps.forEach((n=>{e[n]=t})),e)),{}),o=e=>Object.keys(e).reduce(((t,n)=>r[n]?(0,a.A)(t,r[n](e)):t),{});return o.propTypes={},o.filterProps=t.reduce(((e,t)=>e.concat(t.filterProps)),[]),o};var l=n(751);function s(e){return"number"!==typeof e?e:`${e}px solid`}function u(e,t){return(0,o.Ay)({prop:e,themeKey:"borders",transform:t})}const c=u("border",s),d=u("borderTop",s),p=u("borderRight",s),f=u("borderBottom",s),m=u("borderLeft",s),h=u("borderColor"),v=u("borderTopColor"),g=u("borderRightColor"),b=u("borderBottomColor"),y=u("borderLeftColor"),x=u("outline",s),w=u("outlineColor"),S=e=>{if(void 0!==e.borderRadius&&null!==e.borderRadius){const t=(0,r.MA)(e.theme,"shape.borderRadius",4,"borderRadius"),n=e=>({borderRadius:(0,r._W)(t,e)});return(0,l.NI)(e,e.borderRadius,n)}return null};S.propTypes={},S.filterProps=["borderRadius"];i(c,d,p,f,m,h,v,g,b,y,S,x,w);const k=e=>{if(void 0!==e.gap&&null!==e.gap){const t=(0,r.MA)(e.theme,"spacing",8,"gap"),n=e=>({gap:(0,r._W)(t,e)});return(0,l.NI)(e,e.gap,n)}return null};k.propTypes={},k.filterProps=["gap"];const C=e=>{if(void 0!==e.columnGap&&null!==e.columnGap){const t=(0,r.MA)(e.theme,"spacing",8,"columnGap"),n=e=>({columnGap:(0,r._W)(t,e)});return(0,l.NI)(e,e.columnGap,n)}return null};C.propTypes={},C.filterProps=["columnGap"];const A=e=>{if(void 0!==e.rowGap&&null!==e.rowGap){const t=(0,r.MA)(e.theme,"spacing",8,"rowGap"),n=e=>({rowGap:(0,r._W)(t,e)});return(0,l.NI)(e,e.rowGap,n)}return null};A.propTypes={},A.filterProps=["rowGap"];i(k,C,A,(0,o.Ay)({prop:"gridColumn"}),(0,o.Ay)({prop:"gridRow"}),(0,o.Ay)({prop:"gridAutoFlow"}),(0,o.Ay)({prop:"gridAutoColumns"}),(0,o.Ay)({prop:"gridAutoRows"}),(0,o.Ay)({prop:"gridTemplateColumns"}),(0,o.Ay)({prop:"gridTemplateRows"}),(0,o.Ay)({prop:"gridTemplateAreas"}),(0,o.Ay)({prop:"gridArea"}));function E(e,t){return"grey"===t?t:e}i((0,o.Ay)({prop:"color",themeKey:"palette",transform:E}),(0,o.Ay)({prop:"bgcolor",cssProperty:"backgroundColor",themeKey:"palette",transform:E}),(0,o.Ay)({prop:"backgroundColor",themeKey:"palette",transform:E}));function R(e){return e<=1&&0!==e?100*e+"%":e}const P=(0,o.Ay)({prop:"width",transform:R}),M=e=>{if(void 0!==e.maxWidth&&null!==e.maxWidth){const t=t=>{var n,r;const o=(null==(n=e.theme)||null==(n=n.breakpoints)||null==(n=n.values)?void 0:n[t])||l.zu[t];return o?"px"!==(null==(r=e.theme)||null==(r=r.breakpoints)?void 0:r.unit)?{maxWidth:`${o}${e.theme.breakpoints.unit}`}:{maxWidth:o}:{maxWidth:R(t)}};return(0,l.NI)(e,e.maxWidth,t)}return null};M.filterProps=["maxWidth"];const N=(0,o.Ay)({prop:"minWidth",transform:R}),$=(0,o.Ay)({prop:"height",transform:R}),T=(0,o.Ay)({prop:"maxHeight",transform:R}),z=(0,o.Ay)({prop:"minHeight",transform:R}),O=((0,o.Ay)({prop:"size",cssProperty:"width",transform:R}),(0,o.Ay)({prop:"size",cssProperty:"height",transform:R}),i(P,M,N,$,T,z,(0,o.Ay)({prop:"boxSizing"})),{border:{themeKey:"borders",transform:s},borderTop:{themeKey:"borders",transform:s},borderRight:{themeKey:"borders",transform:s},borderBottom:{themeKey:"borders",transform:s},borderLeft:{themeKey:"borders",transform:s},borderColor:{themeKey:"palette"},borderTopColor:{themeKey:"palette"},borderRightColor:{themeKey:"palette"},borderBottomColor:{themeKey:"palette"},borderLeftColor:{themeKey:"palette"},outline:{themeKey:"borders",transform:s},outlineColor:{themeKey:"palette"},borderRadius:{themeKey:"shape.borderRadius",style:S},color:{themeKey:"palette",transform:E},bgcolor:{themeKey:"palette",cssProperty:"backgroundColor",transform:E},backgroundColor:{themeKey:"palette",transform:E},p:{style:r.Ms},pt:{style:r.Ms},pr:{style:r.Ms},pb:{style:r.Ms},pl:{style:r.Ms},px:{style:r.Ms},py:{style:r.Ms},padding:{style:r.Ms},paddingTop:{style:r.Ms},paddingRight:{style:r.Ms},paddingBottom:{style:r.Ms},paddingLeft:{style:r.Ms},paddingX:{style:r.Ms},paddingY:{style:r.Ms},paddingInline:{style:r.Ms},paddingInlineStart:{style:r.Ms},paddingInlineEnd:{style:r.Ms},paddingBlock:{style:r.Ms},paddingBlockStart:{style:r.Ms},paddingBlockEnd:{style:r.Ms},m:{style:r.Lc},mt:{style:r.Lc},mr:{style:r.Lc},mb:{style:r.Lc},ml:{style:r.Lc},mx:{style:r.Lc},my:{style:r.Lc},margin:{style:r.Lc},marginTop:{style:r.Lc},marginRight:{style:r.Lc},marginBottom:{style:r.Lc},marginLeft:{style:r.Lc},marginX:{style:r.Lc},marginY:{style:r.Lc},marginInline:{style:r.Lc},marginInlineStart:{style:r.Lc},marginInlineEnd:{style:r.Lc},marginBlock:{style:r.Lc},marginBlockStart:{style:r.Lc},marginBlockEnd:{style:r.Lc},displayPrint:{cssProperty:!1,transform:e=>({"@media print":{display:e}})},display:{},overflow:{},textOverflow:{},visibility:{},whiteSpace:{},flexBasis:{},flexDirection:{},flexWrap:{},justifyContent:{},alignItems:{},alignContent:{},order:{},flex:{},flexGrow:{},flexShrink:{},alignSelf:{},justifyItems:{},justifySelf:{},gap:{style:k},rowGap:{style:A},columnGap:{style:C},gridColumn:{},gridRow:{},gridAutoFlow:{},gridAutoColumns:{},gridAutoRows:{},gridTemplateColumns:{},gridTemplateRows:{},gridTemplateAreas:{},gridArea:{},position:{},zIndex:{themeKey:"zIndex"},top:{},right:{},bottom:{},left:{},boxShadow:{themeKey:"shadows"},width:{transform:R},maxWidth:{style:M},minWidth:{transform:R},height:{transform:R},maxHeight:{transform:R},minHeight:{transform:R},boxSizing:{},fontFamily:{themeKey:"typography"},fontSize:{themeKey:"typography"},fontStyle:{themeKey:"typography"},fontWeight:{themeKey:"typography"},letterSpacing:{},textTransform:{},lineHeight:{},textAlign:{},typography:{cssProperty:!1,themeKey:"typography"}})},763:(e,t,n)=>{"use strict";e.exports=n(983)},803:(e,t,n)=>{"use strict";n.d(t,{A:()=>oe});var r=function(){function e(e){var t=this;this._insertTag=function(e){var n;n=0===t.tags.length?t.insertionPoint?t.insertionPoint.nextSibling:t.prepend?t.container.firstChild:t.before:t.tags[t.tags.length-1].nextSibling,t.container.insertBefore(e,n),t.tags.push(e)},this.isSpeedy=void 0===e.speedy||e.speedy,this.tags=[],this.ctr=0,this.nonce=e.nonce,this.key=e.key,this.container=e.container,this.prepend=e.prepend,this.insertionPoint=e.insertionPoint,this.before=null}var t=e.prototype;return t.hydrate=function(e){e.forEach(this._insertTag)},t.insert=function(e){this.ctr%(this.isSpeedy?65e3:1)===0&&this._insertTag(function(e){var t=document.createElement("style");return t.setAttribute("data-emotion",e.key),void 0!==e.nonce&&t.setAttribute("nonce",e.nonce),t.appendChild(document.createTextNode("")),t.setAttribute("data-s",""),t}(this));var t=this.tags[this.tags.length-1];if(this.isSpeedy){var n=function(e){if(e.sheet)return e.sheet;for(var t=0;t<document.styleSheets.length;t++)if(document.styleSheets[t].ownerNode===e)return document.styleSheets[t]}(t);try{n.insertRule(e,n.cssRules.length)}catch(r){}}else t.appendChild(document.createTextNode(e));this.ctr++},t.flush=function(){this.tags.forEach((function(e){var t;return null==(t=e.parentNode)?void 0:t.removeChild(e)})),this.tags=[],this.ctr=0},e}(),o=Math.abs,a=String.fromCharCode,i=Object.assign;function l(e){return e.trim()}function s(e,t,n){return e.replace(t,n)}function u(e,t){return e.indexOf(t)}function c(e,t){return 0|e.charCodeAt(t)}function d(e,t,n){return e.slice(t,n)}function p(e){return e.length}function f(e){return e.length}function m(e,t){return t.push(e),e}var h=1,v=1,g=0,b=0,y=0,x="";function w(e,t,n,r,o,a,i){return{value:e,root:t,parent:n,type:r,props:o,children:a,line:h,column:v,length:i,return:""}}function S(e,t){return i(w("",null,null,"",null,null,0),e,{length:-e.length},t)}function k(){return y=b>0?c(x,--b):0,v--,10===y&&(v=1,h--),y}function C(){return y=b<g?c(x,b++):0,v++,10===y&&(v=1,h++),y}function A(){return c(x,b)}function E(){return b}function R(e,t){return d(x,e,t)}function P(e){switch(e){case 0:case 9:case 10:case 13:case 32:return 5;case 33:case 43:case 44:case 47:case 62:case 64:case 126:case 59:case 123:case 125:return 4;case 58:return 3;case 34:case 39:case 40:case 91:return 2;case 41:case 93:return 1}return 0}function M(e){return h=v=1,g=p(x=e),b=0,[]}function N(e){return x="",e}function $(e){return l(R(b-1,O(91===e?e+2:40===e?e+1:e)))}function T(e){for(;(y=A())&&y<33;)C();return P(e)>2||P(y)>3?"":" "}function z(e,t){for(;--t&&C()&&!(y<48||y>102||y>57&&y<65||y>70&&y<97););return R(e,E()+(t<6&&32==A()&&32==C()))}function O(e){for(;C();)switch(y){case e:return b;case 34:case 39:34!==e&&39!==e&&O(y);break;case 40:41===e&&O(e);break;case 92:C()}return b}function I(e,t){for(;C()&&e+y!==57&&(e+y!==84||47!==A()););return"/*"+R(t,b-1)+"*"+a(47===e?e:C())}function L(e){for(;!P(A());)C();return R(e,b)}var _="-ms-",j="-moz-",F="-webkit-",W="comm",D="rule",B="decl",V="@keyframes";function U(e,t){for(var n="",r=f(e),o=0;o<r;o++)n+=t(e[o],o,e,t)||"";return n}function H(e,t,n,r){switch(e.type){case"@layer":if(e.children.length)break;case"@import":case B:return e.return=e.return||e.value;case W:return"";case V:return e.return=e.value+"{"+U(e.children,r)+"}";case D:e.value=e.props.join(",")}return p(n=U(e.children,r))?e.return=e.value+"{"+n+"}":""}function K(e){return N(q("",null,null,null,[""],e=M(e),0,[0],e))}function q(e,t,n,r,o,i,l,d,f){for(var h=0,v=0,g=l,b=0,y=0,x=0,w=1,S=1,R=1,P=0,M="",N=o,O=i,_=r,j=M;S;)switch(x=P,P=C()){case 40:if(108!=x&&58==c(j,g-1)){-1!=u(j+=s($(P),"&","&\f"),"&\f")&&(R=-1);break}case 34:case 39:case 91:j+=$(P);break;case 9:case 10:case 13:case 32:j+=T(x);break;case 92:j+=z(E()-1,7);continue;case 47:switch(A()){case 42:case 47:m(G(I(C(),E()),t,n),f);break;default:j+="/"}break;case 123*w:d[h++]=p(j)*R;case 125*w:case 59:case 0:switch(P){case 0:case 125:S=0;case 59+v:-1==R&&(j=s(j,/\f/g,"")),y>0&&p(j)-g&&m(y>32?Q(j+";",r,n,g-1):Q(s(j," ","")+";",r,n,g-2),f);break;case 59:j+=";";default:if(m(_=X(j,t,n,h,v,o,d,M,N=[],O=[],g),i),123===P)if(0===v)q(j,t,_,_,N,i,g,d,O);else switch(99===b&&110===c(j,3)?100:b){case 100:case 108:case 109:case 115:q(e,_,_,r&&m(X(e,_,_,0,0,o,d,M,o,N=[],g),O),o,O,g,d,r?N:O);break;default:q(j,_,_,_,[""],O,0,d,O)}}h=v=y=0,w=R=1,M=j="",g=l;break;case 58:g=1+p(j),y=x;default:if(w<1)if(123==P)--w;else if(125==P&&0==w++&&125==k())continue;switch(j+=a(P),P*w){case 38:R=v>0?1:(j+="\f",-1);break;case 44:d[h++]=(p(j)-1)*R,R=1;break;case 64:45===A()&&(j+=$(C())),b=A(),v=g=p(M=j+=L(E())),P++;break;case 45:45===x&&2==p(j)&&(w=0)}}return i}function X(e,t,n,r,a,i,u,c,p,m,h){for(var v=a-1,g=0===a?i:[""],b=f(g),y=0,x=0,S=0;y<r;++y)for(var k=0,C=d(e,v+1,v=o(x=u[y])),A=e;k<b;++k)(A=l(x>0?g[k]+" "+C:s(C,/&\f/g,g[k])))&&(p[S++]=A);return w(e,t,n,0===a?D:c,p,m,h)}function G(e,t,n){return w(e,t,n,W,a(y),d(e,2,-2),0)}function Q(e,t,n,r){return w(e,t,n,B,d(e,0,r),d(e,r+1,-1),r)}var Y=function(e,t,n){for(var r=0,o=0;r=o,o=A(),38===r&&12===o&&(t[n]=1),!P(o);)C();return R(e,b)},Z=function(e,t){return N(function(e,t){var n=-1,r=44;do{switch(P(r)){case 0:38===r&&12===A()&&(t[n]=1),e[n]+=Y(b-1,t,n);break;case 2:e[n]+=$(r);break;case 4:if(44===r){e[++n]=58===A()?"&\f":"",t[n]=e[n].length;break}default:e[n]+=a(r)}}while(r=C());return e}(M(e),t))},J=new WeakMap,ee=function(e){if("rule"===e.type&&e.parent&&!(e.length<1)){for(var t=e.value,n=e.parent,r=e.column===n.column&&e.line===n.line;"rule"!==n.type;)if(!(n=n.parent))return;if((1!==e.props.length||58===t.charCodeAt(0)||J.get(n))&&!r){J.set(e,!0);for(var o=[],a=Z(t,o),i=n.props,l=0,s=0;l<a.length;l++)for(var u=0;u<i.length;u++,s++)e.props[s]=o[l]?a[l].replace(/&\f/g,i[u]):i[u]+" "+a[l]}}},te=function(e){if("decl"===e.type){var t=e.value;108===t.charCodeAt(0)&&98===t.charCodeAt(2)&&(e.return="",e.value="")}};function ne(e,t){switch(function(e,t){return 45^c(e,0)?(((t<<2^c(e,0))<<2^c(e,1))<<2^c(e,2))<<2^c(e,3):0}(e,t)){case 5103:return F+"print-"+e+e;case 5737:case 4201:case 3177:case 3433:case 1641:case 4457:case 2921:case 5572:case 6356:case 5844:case 3191:case 6645:case 3005:case 6391:case 5879:case 5623:case 6135:case 4599:case 4855:case 4215:case 6389:case 5109:case 5365:case 5621:case 3829:return F+e+e;case 5349:case 4246:case 4810:case 6968:case 2756:return F+e+j+e+_+e+e;case 6828:case 4268:return F+e+_+e+e;case 6165:return F+e+_+"flex-"+e+e;case 5187:return F+e+s(e,/(\w+).+(:[^]+)/,F+"box-$1$2"+_+"flex-$1$2")+e;case 5443:return F+e+_+"flex-item-"+s(e,/flex-|-self/,"")+e;case 4675:return F+e+_+"flex-line-pack"+s(e,/align-content|flex-|-self/,"")+e;case 5548:return F+e+_+s(e,"shrink","negative")+e;case 5292:return F+e+_+s(e,"basis","preferred-size")+e;case 6060:return F+"box-"+s(e,"-grow","")+F+e+_+s(e,"grow","positive")+e;case 4554:return F+s(e,/([^-])(transform)/g,"$1"+F+"$2")+e;case 6187:return s(s(s(e,/(zoom-|grab)/,F+"$1"),/(image-set)/,F+"$1"),e,"")+e;case 5495:case 3959:return s(e,/(image-set\([^]*)/,F+"$1$`$1");case 4968:return s(s(e,/(.+:)(flex-)?(.*)/,F+"box-pack:$3"+_+"flex-pack:$3"),/s.+-b[^;]+/,"justify")+F+e+e;case 4095:case 3583:case 4068:case 2532:return s(e,/(.+)-inline(.+)/,F+"$1$2")+e;case 8116:case 7059:case 5753:case 5535:case 5445:case 5701:case 4933:case 4677:case 5533:case 5789:case 5021:case 4765:if(p(e)-1-t>6)switch(c(e,t+1)){case 109:if(45!==c(e,t+4))break;case 102:return s(e,/(.+:)(.+)-([^]+)/,"$1"+F+"$2-$3$1"+j+(108==c(e,t+3)?"$3":"$2-$3"))+e;case 115:return~u(e,"stretch")?ne(s(e,"stretch","fill-available"),t)+e:e}break;case 4949:if(115!==c(e,t+1))break;case 6444:switch(c(e,p(e)-3-(~u(e,"!important")&&10))){case 107:return s(e,":",":"+F)+e;case 101:return s(e,/(.+:)([^;!]+)(;|!.+)?/,"$1"+F+(45===c(e,14)?"inline-":"")+"box$3$1"+F+"$2$3$1"+_+"$2box$3")+e}break;case 5936:switch(c(e,t+11)){case 114:return F+e+_+s(e,/[svh]\w+-[tblr]{2}/,"tb")+e;case 108:return F+e+_+s(e,/[svh]\w+-[tblr]{2}/,"tb-rl")+e;case 45:return F+e+_+s(e,/[svh]\w+-[tblr]{2}/,"lr")+e}return F+e+_+e+e}return e}var re=[function(e,t,n,r){if(e.length>-1&&!e.return)switch(e.type){case B:e.return=ne(e.value,e.length);break;case V:return U([S(e,{value:s(e.value,"@","@"+F)})],r);case D:if(e.length)return function(e,t){return e.map(t).join("")}(e.props,(function(t){switch(function(e,t){return(e=t.exec(e))?e[0]:e}(t,/(::plac\w+|:read-\w+)/)){case":read-only":case":read-write":return U([S(e,{props:[s(t,/:(read-\w+)/,":-moz-$1")]})],r);case"::placeholder":return U([S(e,{props:[s(t,/:(plac\w+)/,":"+F+"input-$1")]}),S(e,{props:[s(t,/:(plac\w+)/,":-moz-$1")]}),S(e,{props:[s(t,/:(plac\w+)/,_+"input-$1")]})],r)}return""}))}}],oe=function(e){var t=e.key;if("css"===t){var n=document.querySelectorAll("style[data-emotion]:not([data-s])");Array.prototype.forEach.call(n,(function(e){-1!==e.getAttribute("data-emotion").indexOf(" ")&&(document.head.appendChild(e),e.setAttribute("data-s",""))}))}var o,a,i=e.stylisPlugins||re,l={},s=[];o=e.container||document.head,Array.prototype.forEach.call(document.querySelectorAll('style[data-emotion^="'+t+' "]'),(function(e){for(var t=e.getAttribute("data-emotion").split(" "),n=1;n<t.length;n++)l[t[n]]=!0;s.push(e)}));var u,c,d=[H,(c=function(e){u.insert(e)},function(e){e.root||(e=e.return)&&c(e)})],p=function(e){var t=f(e);return function(n,r,o,a){for(var i="",l=0;l<t;l++)i+=e[l](n,r,o,a)||"";return i}}([ee,te].concat(i,d));a=function(e,t,n,r){u=n,U(K(e?e+"{"+t.styles+"}":t.styles),p),r&&(m.inserted[t.name]=!0)};var m={key:t,sheet:new r({key:t,container:o,nonce:e.nonce,speedy:e.speedy,prepend:e.prepend,insertionPoint:e.insertionPoint}),nonce:e.nonce,inserted:l,registered:{},insert:a};return m.sheet.hydrate(s),m}},812:(e,t,n)=>{"use strict";n.d(t,{A:()=>c,k:()=>s});var r=n(598),o=n(815),a=n(162),i=n(751),l=n(758);function s(){function e(e,t,n,o){const l={[e]:t,theme:n},s=o[e];if(!s)return{[e]:t};const{cssProperty:u=e,themeKey:c,transform:d,style:p}=s;if(null==t)return null;if("typography"===c&&"inherit"===t)return{[e]:t};const f=(0,a.Yn)(n,c)||{};if(p)return p(l);return(0,i.NI)(l,t,(t=>{let n=(0,a.BO)(f,d,t);return t===n&&"string"===typeof t&&(n=(0,a.BO)(f,d,`${e}${"default"===t?"":(0,r.A)(t)}`,t)),!1===u?n:{[u]:n}}))}return function t(n){var r;const{sx:a,theme:s={}}=n||{};if(!a)return null;const u=null!=(r=s.unstable_sxConfig)?r:l.A;function c(n){let r=n;if("function"===typeof n)r=n(s);else if("object"!==typeof n)return n;if(!r)return null;const a=(0,i.EU)(s.breakpoints),l=Object.keys(a);let c=a;return Object.keys(r).forEach((n=>{const a=(l=r[n],d=s,"function"===typeof l?l(d):l);var l,d;if(null!==a&&void 0!==a)if("object"===typeof a)if(u[n])c=(0,o.A)(c,e(n,a,s,u));else{const e=(0,i.NI)({theme:s},a,(e=>({[n]:e})));!function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];const r=t.reduce(((e,t)=>e.concat(Object.keys(t))),[]),o=new Set(r);return t.every((e=>o.size===Object.keys(e).length))}(e,a)?c=(0,o.A)(c,e):c[n]=t({sx:a,theme:s})}else c=(0,o.A)(c,e(n,a,s,u))})),(0,i.vf)(l,c)}return Array.isArray(a)?a.map(c):c(a)}}const u=s();u.filterProps=["sx"];const c=u},815:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(172);const o=function(e,t){return t?(0,r.A)(e,t,{clone:!1}):e}},853:(e,t,n)=>{"use strict";e.exports=n(234)},868:(e,t,n)=>{"use strict";function r(e){let t="https://mui.com/production-error/?code="+e;for(let n=1;n<arguments.length;n+=1)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified MUI error #"+e+"; visit "+t+" for the full message."}n.d(t,{A:()=>r})},869:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});n(43);var r=n(290),o=n(579);function a(e){const{styles:t,defaultTheme:n={}}=e,a="function"===typeof t?e=>{return t(void 0===(r=e)||null===r||0===Object.keys(r).length?n:e);var r}:t;return(0,o.jsx)(r.mL,{styles:a})}},893:e=>{e.exports=function(e,t){if(null==e)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==t.indexOf(r))continue;n[r]=e[r]}return n},e.exports.__esModule=!0,e.exports.default=e.exports},918:(e,t,n)=>{"use strict";function r(e){var t=Object.create(null);return function(n){return void 0===t[n]&&(t[n]=e(n)),t[n]}}n.d(t,{A:()=>r})},950:(e,t,n)=>{"use strict";!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(730)},983:(e,t)=>{"use strict";var n="function"===typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,o=n?Symbol.for("react.portal"):60106,a=n?Symbol.for("react.fragment"):60107,i=n?Symbol.for("react.strict_mode"):60108,l=n?Symbol.for("react.profiler"):60114,s=n?Symbol.for("react.provider"):60109,u=n?Symbol.for("react.context"):60110,c=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,p=n?Symbol.for("react.forward_ref"):60112,f=n?Symbol.for("react.suspense"):60113,m=n?Symbol.for("react.suspense_list"):60120,h=n?Symbol.for("react.memo"):60115,v=n?Symbol.for("react.lazy"):60116,g=n?Symbol.for("react.block"):60121,b=n?Symbol.for("react.fundamental"):60117,y=n?Symbol.for("react.responder"):60118,x=n?Symbol.for("react.scope"):60119;function w(e){if("object"===typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case c:case d:case a:case l:case i:case f:return e;default:switch(e=e&&e.$$typeof){case u:case p:case v:case h:case s:return e;default:return t}}case o:return t}}}function S(e){return w(e)===d}t.AsyncMode=c,t.ConcurrentMode=d,t.ContextConsumer=u,t.ContextProvider=s,t.Element=r,t.ForwardRef=p,t.Fragment=a,t.Lazy=v,t.Memo=h,t.Portal=o,t.Profiler=l,t.StrictMode=i,t.Suspense=f,t.isAsyncMode=function(e){return S(e)||w(e)===c},t.isConcurrentMode=S,t.isContextConsumer=function(e){return w(e)===u},t.isContextProvider=function(e){return w(e)===s},t.isElement=function(e){return"object"===typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return w(e)===p},t.isFragment=function(e){return w(e)===a},t.isLazy=function(e){return w(e)===v},t.isMemo=function(e){return w(e)===h},t.isPortal=function(e){return w(e)===o},t.isProfiler=function(e){return w(e)===l},t.isStrictMode=function(e){return w(e)===i},t.isSuspense=function(e){return w(e)===f},t.isValidElementType=function(e){return"string"===typeof e||"function"===typeof e||e===a||e===d||e===l||e===i||e===f||e===m||"object"===typeof e&&null!==e&&(e.$$typeof===v||e.$$typeof===h||e.$$typeof===s||e.$$typeof===u||e.$$typeof===p||e.$$typeof===b||e.$$typeof===y||e.$$typeof===x||e.$$typeof===g)},t.typeOf=w},989:(e,t,n)=>{"use strict";n.r(t),n.d(t,{default:()=>r.A,private_createBreakpoints:()=>o.A,unstable_applyStyles:()=>a.A});var r=n(280),o=n(615),a=n(703)},994:e=>{e.exports=function(e){return e&&e.__esModule?e:{default:e}},e.exports.__esModule=!0,e.exports.default=e.exports},996:(e,t,n)=>{"use strict";n.r(t),n.d(t,{default:()=>r.A,extendSxProp:()=>o.A,unstable_createStyleFunctionSx:()=>r.k,unstable_defaultSxConfig:()=>a.A});var r=n(812),o=n(698),a=n(758)}},t={};function n(r){var o=t[r];if(void 0!==o)return o.exports;var a=t[r]={exports:{}};return e[r](a,a.exports,n),a.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},(()=>{var e,t=Object.getPrototypeOf?e=>Object.getPrototypeOf(e):e=>e.__proto__;n.t=function(r,o){if(1&o&&(r=this(r)),8&o)return r;if("object"===typeof r&&r){if(4&o&&r.__esModule)return r;if(16&o&&"function"===typeof r.then)return r}var a=Object.create(null);n.r(a);var i={};e=e||[null,t({}),t([]),t(t)];for(var l=2&o&&r;"object"==typeof l&&!~e.indexOf(l);l=t(l))Object.getOwnPropertyNames(l).forEach((e=>i[e]=()=>r[e]));return i.default=()=>r,n.d(a,i),a}})(),n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},(()=>{"use strict";var e=n(43),t=n.t(e,2),r=n(391),o=n(587),a=n(168);function i(e){var t,n,r="";if("string"==typeof e||"number"==typeof e)r+=e;else if("object"==typeof e)if(Array.isArray(e)){var o=e.length;for(t=0;t<o;t++)e[t]&&(n=i(e[t]))&&(r&&(r+=" "),r+=n)}else for(n in e)e[n]&&(r&&(r+=" "),r+=n);return r}const l=function(){for(var e,t,n=0,r="",o=arguments.length;n<o;n++)(e=arguments[n])&&(t=i(e))&&(r&&(r+=" "),r+=t);return r},s=e=>e,u=(()=>{let e=s;return{configure(t){e=t},generate:t=>e(t),reset(){e=s}}})(),c={active:"active",checked:"checked",completed:"completed",disabled:"disabled",error:"error",expanded:"expanded",focused:"focused",focusVisible:"focusVisible",open:"open",readOnly:"readOnly",required:"required",selected:"selected"};function d(e,t){const n=c[t];return n?`${arguments.length>2&&void 0!==arguments[2]?arguments[2]:"Mui"}-${n}`:`${u.generate(e)}-${t}`}function p(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0;const r={};return Object.keys(e).forEach((o=>{r[o]=e[o].reduce(((e,r)=>{if(r){const o=t(r);""!==o&&e.push(o),n&&n[r]&&e.push(n[r])}return e}),[]).join(" ")})),r}var f=n(598);function m(e,t){const n=(0,a.A)({},t);return Object.keys(e).forEach((r=>{if(r.toString().match(/^(components|slots)$/))n[r]=(0,a.A)({},e[r],n[r]);else if(r.toString().match(/^(componentsProps|slotProps)$/)){const o=e[r]||{},i=t[r];n[r]={},i&&Object.keys(i)?o&&Object.keys(o)?(n[r]=(0,a.A)({},i),Object.keys(o).forEach((e=>{n[r][e]=m(o[e],i[e])}))):n[r]=i:n[r]=o}else void 0===n[r]&&(n[r]=e[r])})),n}var h=n(280),v=n(369);const g=function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:null;const n=e.useContext(v.T);return n&&(r=n,0!==Object.keys(r).length)?n:t;var r},b=(0,h.A)();const y=function(){return g(arguments.length>0&&void 0!==arguments[0]?arguments[0]:b)};function x(e){let{props:t,name:n,defaultTheme:r,themeId:o}=e,a=y(r);o&&(a=a[o]||a);const i=function(e){const{theme:t,name:n,props:r}=e;return t&&t.components&&t.components[n]&&t.components[n].defaultProps?m(t.components[n].defaultProps,r):r}({theme:a,name:n,props:t});return i}var w=n(174),S=n(172),k=n(812);const C=["ownerState"],A=["variants"],E=["name","slot","skipVariantsResolver","skipSx","overridesResolver"];function R(e){return"ownerState"!==e&&"theme"!==e&&"sx"!==e&&"as"!==e}const P=(0,h.A)(),M=e=>e?e.charAt(0).toLowerCase()+e.slice(1):e;function N(e){let{defaultTheme:t,theme:n,themeId:r}=e;return o=n,0===Object.keys(o).length?t:n[r]||n;var o}function $(e){return e?(t,n)=>n[e]:null}function T(e,t){let{ownerState:n}=t,r=(0,o.A)(t,C);const i="function"===typeof e?e((0,a.A)({ownerState:n},r)):e;if(Array.isArray(i))return i.flatMap((e=>T(e,(0,a.A)({ownerState:n},r))));if(i&&"object"===typeof i&&Array.isArray(i.variants)){const{variants:e=[]}=i;let t=(0,o.A)(i,A);return e.forEach((e=>{let o=!0;"function"===typeof e.props?o=e.props((0,a.A)({ownerState:n},r,n)):Object.keys(e.props).forEach((t=>{(null==n?void 0:n[t])!==e.props[t]&&r[t]!==e.props[t]&&(o=!1)})),o&&(Array.isArray(t)||(t=[t]),t.push("function"===typeof e.style?e.style((0,a.A)({ownerState:n},r,n)):e.style))})),t}return i}const z=function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{themeId:t,defaultTheme:n=P,rootShouldForwardProp:r=R,slotShouldForwardProp:i=R}=e,l=e=>(0,k.A)((0,a.A)({},e,{theme:N((0,a.A)({},e,{defaultTheme:n,themeId:t}))}));return l.__mui_systemSx=!0,function(e){let s=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};(0,w.internal_processStyles)(e,(e=>e.filter((e=>!(null!=e&&e.__mui_systemSx)))));const{name:u,slot:c,skipVariantsResolver:d,skipSx:p,overridesResolver:f=$(M(c))}=s,m=(0,o.A)(s,E),h=void 0!==d?d:c&&"Root"!==c&&"root"!==c||!1,v=p||!1;let g=R;"Root"===c||"root"===c?g=r:c?g=i:function(e){return"string"===typeof e&&e.charCodeAt(0)>96}(e)&&(g=void 0);const b=(0,w.default)(e,(0,a.A)({shouldForwardProp:g,label:undefined},m)),y=e=>"function"===typeof e&&e.__emotion_real!==e||(0,S.Q)(e)?r=>T(e,(0,a.A)({},r,{theme:N({theme:r.theme,defaultTheme:n,themeId:t})})):e,x=function(r){let o=y(r);for(var i=arguments.length,s=new Array(i>1?i-1:0),c=1;c<i;c++)s[c-1]=arguments[c];const d=s?s.map(y):[];u&&f&&d.push((e=>{const r=N((0,a.A)({},e,{defaultTheme:n,themeId:t}));if(!r.components||!r.components[u]||!r.components[u].styleOverrides)return null;const o=r.components[u].styleOverrides,i={};return Object.entries(o).forEach((t=>{let[n,o]=t;i[n]=T(o,(0,a.A)({},e,{theme:r}))})),f(e,i)})),u&&!h&&d.push((e=>{var r;const o=N((0,a.A)({},e,{defaultTheme:n,themeId:t}));return T({variants:null==o||null==(r=o.components)||null==(r=r[u])?void 0:r.variants},(0,a.A)({},e,{theme:o}))})),v||d.push(l);const p=d.length-s.length;if(Array.isArray(r)&&p>0){const e=new Array(p).fill("");o=[...r,...e],o.raw=[...r.raw,...e]}const m=b(o,...d);return e.muiName&&(m.muiName=e.muiName),m};return b.withConfig&&(x.withConfig=b.withConfig),x}}(),O=z;var I=n(579);const L=["className","component","disableGutters","fixed","maxWidth","classes"],_=(0,h.A)(),j=O("div",{name:"MuiContainer",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[`maxWidth${(0,f.A)(String(n.maxWidth))}`],n.fixed&&t.fixed,n.disableGutters&&t.disableGutters]}}),F=e=>x({props:e,name:"MuiContainer",defaultTheme:_});const W=f.A;var D=n(52),B=n(868),V=n(758);function U(e,t){return(0,a.A)({toolbar:{minHeight:56,[e.up("xs")]:{"@media (orientation: landscape)":{minHeight:48}},[e.up("sm")]:{minHeight:64}}},t)}var H=n(266);const K={black:"#000",white:"#fff"},q={50:"#fafafa",100:"#f5f5f5",200:"#eeeeee",300:"#e0e0e0",400:"#bdbdbd",500:"#9e9e9e",600:"#757575",700:"#616161",800:"#424242",900:"#212121",A100:"#f5f5f5",A200:"#eeeeee",A400:"#bdbdbd",A700:"#616161"},X={50:"#f3e5f5",100:"#e1bee7",200:"#ce93d8",300:"#ba68c8",400:"#ab47bc",500:"#9c27b0",600:"#8e24aa",700:"#7b1fa2",800:"#6a1b9a",900:"#4a148c",A100:"#ea80fc",A200:"#e040fb",A400:"#d500f9",A700:"#aa00ff"},G={50:"#ffebee",100:"#ffcdd2",200:"#ef9a9a",300:"#e57373",400:"#ef5350",500:"#f44336",600:"#e53935",700:"#d32f2f",800:"#c62828",900:"#b71c1c",A100:"#ff8a80",A200:"#ff5252",A400:"#ff1744",A700:"#d50000"},Q={50:"#fff3e0",100:"#ffe0b2",200:"#ffcc80",300:"#ffb74d",400:"#ffa726",500:"#ff9800",600:"#fb8c00",700:"#f57c00",800:"#ef6c00",900:"#e65100",A100:"#ffd180",A200:"#ffab40",A400:"#ff9100",A700:"#ff6d00"},Y={50:"#e3f2fd",100:"#bbdefb",200:"#90caf9",300:"#64b5f6",400:"#42a5f5",500:"#2196f3",600:"#1e88e5",700:"#1976d2",800:"#1565c0",900:"#0d47a1",A100:"#82b1ff",A200:"#448aff",A400:"#2979ff",A700:"#2962ff"},Z={50:"#e1f5fe",100:"#b3e5fc",200:"#81d4fa",300:"#4fc3f7",400:"#29b6f6",500:"#03a9f4",600:"#039be5",700:"#0288d1",800:"#0277bd",900:"#01579b",A100:"#80d8ff",A200:"#40c4ff",A400:"#00b0ff",A700:"#0091ea"},J={50:"#e8f5e9",100:"#c8e6c9",200:"#a5d6a7",300:"#81c784",400:"#66bb6a",500:"#4caf50",600:"#43a047",700:"#388e3c",800:"#2e7d32",900:"#1b5e20",A100:"#b9f6ca",A200:"#69f0ae",A400:"#00e676",A700:"#00c853"},ee=["mode","contrastThreshold","tonalOffset"],te={text:{primary:"rgba(0, 0, 0, 0.87)",secondary:"rgba(0, 0, 0, 0.6)",disabled:"rgba(0, 0, 0, 0.38)"},divider:"rgba(0, 0, 0, 0.12)",background:{paper:K.white,default:K.white},action:{active:"rgba(0, 0, 0, 0.54)",hover:"rgba(0, 0, 0, 0.04)",hoverOpacity:.04,selected:"rgba(0, 0, 0, 0.08)",selectedOpacity:.08,disabled:"rgba(0, 0, 0, 0.26)",disabledBackground:"rgba(0, 0, 0, 0.12)",disabledOpacity:.38,focus:"rgba(0, 0, 0, 0.12)",focusOpacity:.12,activatedOpacity:.12}},ne={text:{primary:K.white,secondary:"rgba(255, 255, 255, 0.7)",disabled:"rgba(255, 255, 255, 0.5)",icon:"rgba(255, 255, 255, 0.5)"},divider:"rgba(255, 255, 255, 0.12)",background:{paper:"#121212",default:"#121212"},action:{active:K.white,hover:"rgba(255, 255, 255, 0.08)",hoverOpacity:.08,selected:"rgba(255, 255, 255, 0.16)",selectedOpacity:.16,disabled:"rgba(255, 255, 255, 0.3)",disabledBackground:"rgba(255, 255, 255, 0.12)",disabledOpacity:.38,focus:"rgba(255, 255, 255, 0.12)",focusOpacity:.12,activatedOpacity:.24}};function re(e,t,n,r){const o=r.light||r,a=r.dark||1.5*r;e[t]||(e.hasOwnProperty(n)?e[t]=e[n]:"light"===t?e.light=(0,H.a)(e.main,o):"dark"===t&&(e.dark=(0,H.e$)(e.main,a)))}function oe(e){const{mode:t="light",contrastThreshold:n=3,tonalOffset:r=.2}=e,i=(0,o.A)(e,ee),l=e.primary||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:Y[200],light:Y[50],dark:Y[400]}:{main:Y[700],light:Y[400],dark:Y[800]}}(t),s=e.secondary||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:X[200],light:X[50],dark:X[400]}:{main:X[500],light:X[300],dark:X[700]}}(t),u=e.error||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:G[500],light:G[300],dark:G[700]}:{main:G[700],light:G[400],dark:G[800]}}(t),c=e.info||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:Z[400],light:Z[300],dark:Z[700]}:{main:Z[700],light:Z[500],dark:Z[900]}}(t),d=e.success||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:J[400],light:J[300],dark:J[700]}:{main:J[800],light:J[500],dark:J[900]}}(t),p=e.warning||function(){return"dark"===(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"light")?{main:Q[400],light:Q[300],dark:Q[700]}:{main:"#ed6c02",light:Q[500],dark:Q[900]}}(t);function f(e){return(0,H.eM)(e,ne.text.primary)>=n?ne.text.primary:te.text.primary}const m=e=>{let{color:t,name:n,mainShade:o=500,lightShade:i=300,darkShade:l=700}=e;if(t=(0,a.A)({},t),!t.main&&t[o]&&(t.main=t[o]),!t.hasOwnProperty("main"))throw new Error((0,B.A)(11,n?` (${n})`:"",o));if("string"!==typeof t.main)throw new Error((0,B.A)(12,n?` (${n})`:"",JSON.stringify(t.main)));return re(t,"light",i,r),re(t,"dark",l,r),t.contrastText||(t.contrastText=f(t.main)),t},h={dark:ne,light:te};return(0,S.A)((0,a.A)({common:(0,a.A)({},K),mode:t,primary:m({color:l,name:"primary"}),secondary:m({color:s,name:"secondary",mainShade:"A400",lightShade:"A200",darkShade:"A700"}),error:m({color:u,name:"error"}),warning:m({color:p,name:"warning"}),info:m({color:c,name:"info"}),success:m({color:d,name:"success"}),grey:q,contrastThreshold:n,getContrastText:f,augmentColor:m,tonalOffset:r},h[t]),i)}const ae=["fontFamily","fontSize","fontWeightLight","fontWeightRegular","fontWeightMedium","fontWeightBold","htmlFontSize","allVariants","pxToRem"];const ie={textTransform:"uppercase"},le='"Roboto", "Helvetica", "Arial", sans-serif';function se(e,t){const n="function"===typeof t?t(e):t,{fontFamily:r=le,fontSize:i=14,fontWeightLight:l=300,fontWeightRegular:s=400,fontWeightMedium:u=500,fontWeightBold:c=700,htmlFontSize:d=16,allVariants:p,pxToRem:f}=n,m=(0,o.A)(n,ae);const h=i/14,v=f||(e=>e/d*h+"rem"),g=(e,t,n,o,i)=>{return(0,a.A)({fontFamily:r,fontWeight:e,fontSize:v(t),lineHeight:n},r===le?{letterSpacing:(l=o/t,Math.round(1e5*l)/1e5)+"em"}:{},i,p);var l},b={h1:g(l,96,1.167,-1.5),h2:g(l,60,1.2,-.5),h3:g(s,48,1.167,0),h4:g(s,34,1.235,.25),h5:g(s,24,1.334,0),h6:g(u,20,1.6,.15),subtitle1:g(s,16,1.75,.15),subtitle2:g(u,14,1.57,.1),body1:g(s,16,1.5,.15),body2:g(s,14,1.43,.15),button:g(u,14,1.75,.4,ie),caption:g(s,12,1.66,.4),overline:g(s,12,2.66,1,ie),inherit:{fontFamily:"inherit",fontWeight:"inherit",fontSize:"inherit",lineHeight:"inherit",letterSpacing:"inherit"}};return(0,S.A)((0,a.A)({htmlFontSize:d,pxToRem:v,fontFamily:r,fontSize:i,fontWeightLight:l,fontWeightRegular:s,fontWeightMedium:u,fontWeightBold:c},b),m,{clone:!1})}function ue(){return[`${arguments.length<=0?void 0:arguments[0]}px ${arguments.length<=1?void 0:arguments[1]}px ${arguments.length<=2?void 0:arguments[2]}px ${arguments.length<=3?void 0:arguments[3]}px rgba(0,0,0,0.2)`,`${arguments.length<=4?void 0:arguments[4]}px ${arguments.length<=5?void 0:arguments[5]}px ${arguments.length<=6?void 0:arguments[6]}px ${arguments.length<=7?void 0:arguments[7]}px rgba(0,0,0,0.14)`,`${arguments.length<=8?void 0:arguments[8]}px ${arguments.length<=9?void 0:arguments[9]}px ${arguments.length<=10?void 0:arguments[10]}px ${arguments.length<=11?void 0:arguments[11]}px rgba(0,0,0,0.12)`].join(",")}const ce=["none",ue(0,2,1,-1,0,1,1,0,0,1,3,0),ue(0,3,1,-2,0,2,2,0,0,1,5,0),ue(0,3,3,-2,0,3,4,0,0,1,8,0),ue(0,2,4,-1,0,4,5,0,0,1,10,0),ue(0,3,5,-1,0,5,8,0,0,1,14,0),ue(0,3,5,-1,0,6,10,0,0,1,18,0),ue(0,4,5,-2,0,7,10,1,0,2,16,1),ue(0,5,5,-3,0,8,10,1,0,3,14,2),ue(0,5,6,-3,0,9,12,1,0,3,16,2),ue(0,6,6,-3,0,10,14,1,0,4,18,3),ue(0,6,7,-4,0,11,15,1,0,4,20,3),ue(0,7,8,-4,0,12,17,2,0,5,22,4),ue(0,7,8,-4,0,13,19,2,0,5,24,4),ue(0,7,9,-4,0,14,21,2,0,5,26,4),ue(0,8,9,-5,0,15,22,2,0,6,28,5),ue(0,8,10,-5,0,16,24,2,0,6,30,5),ue(0,8,11,-5,0,17,26,2,0,6,32,5),ue(0,9,11,-5,0,18,28,2,0,7,34,6),ue(0,9,12,-6,0,19,29,2,0,7,36,6),ue(0,10,13,-6,0,20,31,3,0,8,38,7),ue(0,10,13,-6,0,21,33,3,0,8,40,7),ue(0,10,14,-6,0,22,35,3,0,8,42,7),ue(0,11,14,-7,0,23,36,3,0,9,44,8),ue(0,11,15,-7,0,24,38,3,0,9,46,8)],de=["duration","easing","delay"],pe={easeInOut:"cubic-bezier(0.4, 0, 0.2, 1)",easeOut:"cubic-bezier(0.0, 0, 0.2, 1)",easeIn:"cubic-bezier(0.4, 0, 1, 1)",sharp:"cubic-bezier(0.4, 0, 0.6, 1)"},fe={shortest:150,shorter:200,short:250,standard:300,complex:375,enteringScreen:225,leavingScreen:195};function me(e){return`${Math.round(e)}ms`}function he(e){if(!e)return 0;const t=e/36;return Math.round(10*(4+15*t**.25+t/5))}function ve(e){const t=(0,a.A)({},pe,e.easing),n=(0,a.A)({},fe,e.duration);return(0,a.A)({getAutoHeightDuration:he,create:function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:["all"],r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};const{duration:a=n.standard,easing:i=t.easeInOut,delay:l=0}=r;(0,o.A)(r,de);return(Array.isArray(e)?e:[e]).map((e=>`${e} ${"string"===typeof a?a:me(a)} ${i} ${"string"===typeof l?l:me(l)}`)).join(",")}},e,{easing:t,duration:n})}const ge={mobileStepper:1e3,fab:1050,speedDial:1050,appBar:1100,drawer:1200,modal:1300,snackbar:1400,tooltip:1500},be=["breakpoints","mixins","spacing","palette","transitions","typography","shape"];function ye(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{mixins:t={},palette:n={},transitions:r={},typography:i={}}=e,l=(0,o.A)(e,be);if(e.vars&&void 0===e.generateCssVars)throw new Error((0,B.A)(18));const s=oe(n),u=(0,h.A)(e);let c=(0,S.A)(u,{mixins:U(u.breakpoints,t),palette:s,shadows:ce.slice(),typography:se(s,i),transitions:ve(r),zIndex:(0,a.A)({},ge)});c=(0,S.A)(c,l);for(var d=arguments.length,p=new Array(d>1?d-1:0),f=1;f<d;f++)p[f-1]=arguments[f];return c=p.reduce(((e,t)=>(0,S.A)(e,t)),c),c.unstable_sxConfig=(0,a.A)({},V.A,null==l?void 0:l.unstable_sxConfig),c.unstable_sx=function(e){return(0,k.A)({sx:e,theme:this})},c}const xe=ye,we=xe(),Se="$$material";const ke=function(e){return"ownerState"!==e&&"theme"!==e&&"sx"!==e&&"as"!==e},Ce=e=>ke(e)&&"classes"!==e,Ae=(0,D.Ay)({themeId:Se,defaultTheme:we,rootShouldForwardProp:Ce}),Ee=e.createContext(void 0);function Re(t){let{props:n,name:r}=t;return function(e){const{theme:t,name:n,props:r}=e;if(!t||!t.components||!t.components[n])return r;const o=t.components[n];return o.defaultProps?m(o.defaultProps,r):o.styleOverrides||o.variants?r:m(o,r)}({props:n,name:r,theme:{components:e.useContext(Ee)}})}function Pe(e){return Re(e)}const Me=function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{createStyledComponent:n=j,useThemeProps:r=F,componentName:i="MuiContainer"}=t,s=n((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({width:"100%",marginLeft:"auto",boxSizing:"border-box",marginRight:"auto",display:"block"},!n.disableGutters&&{paddingLeft:t.spacing(2),paddingRight:t.spacing(2),[t.breakpoints.up("sm")]:{paddingLeft:t.spacing(3),paddingRight:t.spacing(3)}})}),(e=>{let{theme:t,ownerState:n}=e;return n.fixed&&Object.keys(t.breakpoints.values).reduce(((e,n)=>{const r=n,o=t.breakpoints.values[r];return 0!==o&&(e[t.breakpoints.up(r)]={maxWidth:`${o}${t.breakpoints.unit}`}),e}),{})}),(e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({},"xs"===n.maxWidth&&{[t.breakpoints.up("xs")]:{maxWidth:Math.max(t.breakpoints.values.xs,444)}},n.maxWidth&&"xs"!==n.maxWidth&&{[t.breakpoints.up(n.maxWidth)]:{maxWidth:`${t.breakpoints.values[n.maxWidth]}${t.breakpoints.unit}`}})})),u=e.forwardRef((function(e,t){const n=r(e),{className:u,component:c="div",disableGutters:m=!1,fixed:h=!1,maxWidth:v="lg"}=n,g=(0,o.A)(n,L),b=(0,a.A)({},n,{component:c,disableGutters:m,fixed:h,maxWidth:v}),y=((e,t)=>{const{classes:n,fixed:r,disableGutters:o,maxWidth:a}=e;return p({root:["root",a&&`maxWidth${(0,f.A)(String(a))}`,r&&"fixed",o&&"disableGutters"]},(e=>d(t,e)),n)})(b,i);return(0,I.jsx)(s,(0,a.A)({as:c,ownerState:b,className:l(y.root,u),ref:t},g))}));return u}({createStyledComponent:Ae("div",{name:"MuiContainer",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[`maxWidth${W(String(n.maxWidth))}`],n.fixed&&t.fixed,n.disableGutters&&t.disableGutters]}}),useThemeProps:e=>Pe({props:e,name:"MuiContainer"})}),Ne=Me;var $e=n(698);const Te=["className","component"];function ze(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"Mui";const r={};return t.forEach((t=>{r[t]=d(e,t,n)})),r}const Oe=ze("MuiBox",["root"]),Ie=xe(),Le=function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{themeId:n,defaultTheme:r,defaultClassName:i="MuiBox-root",generateClassName:s}=t,u=(0,w.default)("div",{shouldForwardProp:e=>"theme"!==e&&"sx"!==e&&"as"!==e})(k.A);return e.forwardRef((function(e,t){const c=y(r),d=(0,$e.A)(e),{className:p,component:f="div"}=d,m=(0,o.A)(d,Te);return(0,I.jsx)(u,(0,a.A)({as:f,ref:t,className:l(p,s?s(i):i),theme:n&&c[n]||c},m))}))}({themeId:Se,defaultTheme:Ie,defaultClassName:Oe.root,generateClassName:u.generate}),_e=Le;function je(e){return d("MuiTypography",e)}ze("MuiTypography",["root","h1","h2","h3","h4","h5","h6","subtitle1","subtitle2","body1","body2","inherit","button","caption","overline","alignLeft","alignRight","alignCenter","alignJustify","noWrap","gutterBottom","paragraph"]);const Fe=["align","className","component","gutterBottom","noWrap","paragraph","variant","variantMapping"],We=Ae("span",{name:"MuiTypography",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.variant&&t[n.variant],"inherit"!==n.align&&t[`align${W(n.align)}`],n.noWrap&&t.noWrap,n.gutterBottom&&t.gutterBottom,n.paragraph&&t.paragraph]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({margin:0},"inherit"===n.variant&&{font:"inherit"},"inherit"!==n.variant&&t.typography[n.variant],"inherit"!==n.align&&{textAlign:n.align},n.noWrap&&{overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"},n.gutterBottom&&{marginBottom:"0.35em"},n.paragraph&&{marginBottom:16})})),De={h1:"h1",h2:"h2",h3:"h3",h4:"h4",h5:"h5",h6:"h6",subtitle1:"h6",subtitle2:"h6",body1:"p",body2:"p",inherit:"p"},Be={primary:"primary.main",textPrimary:"text.primary",secondary:"secondary.main",textSecondary:"text.secondary",error:"error.main"},Ve=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiTypography"}),r=(e=>Be[e]||e)(n.color),i=(0,$e.A)((0,a.A)({},n,{color:r})),{align:s="inherit",className:u,component:c,gutterBottom:d=!1,noWrap:f=!1,paragraph:m=!1,variant:h="body1",variantMapping:v=De}=i,g=(0,o.A)(i,Fe),b=(0,a.A)({},i,{align:s,color:r,className:u,component:c,gutterBottom:d,noWrap:f,paragraph:m,variant:h,variantMapping:v}),y=c||(m?"p":v[h]||De[h])||"span",x=(e=>{const{align:t,gutterBottom:n,noWrap:r,paragraph:o,variant:a,classes:i}=e;return p({root:["root",a,"inherit"!==e.align&&`align${W(t)}`,n&&"gutterBottom",r&&"noWrap",o&&"paragraph"]},je,i)})(b);return(0,I.jsx)(We,(0,a.A)({as:y,ref:t,ownerState:b,className:l(x.root,u)},g))}));function Ue(e,t){"function"===typeof e?e(t):e&&(e.current=t)}function He(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return e.useMemo((()=>n.every((e=>null==e))?null:e=>{n.forEach((t=>{Ue(t,e)}))}),n)}const Ke=function(e){return"string"===typeof e};const qe=function(e,t,n){return void 0===e||Ke(e)?t:(0,a.A)({},t,{ownerState:(0,a.A)({},t.ownerState,n)})};const Xe=function(e,t,n){return"function"===typeof e?e(t,n):e};const Ge=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[];if(void 0===e)return{};const n={};return Object.keys(e).filter((n=>n.match(/^on[A-Z]/)&&"function"===typeof e[n]&&!t.includes(n))).forEach((t=>{n[t]=e[t]})),n};const Qe=function(e){if(void 0===e)return{};const t={};return Object.keys(e).filter((t=>!(t.match(/^on[A-Z]/)&&"function"===typeof e[t]))).forEach((n=>{t[n]=e[n]})),t};const Ye=function(e){const{getSlotProps:t,additionalProps:n,externalSlotProps:r,externalForwardedProps:o,className:i}=e;if(!t){const e=l(null==n?void 0:n.className,i,null==o?void 0:o.className,null==r?void 0:r.className),t=(0,a.A)({},null==n?void 0:n.style,null==o?void 0:o.style,null==r?void 0:r.style),s=(0,a.A)({},n,o,r);return e.length>0&&(s.className=e),Object.keys(t).length>0&&(s.style=t),{props:s,internalRef:void 0}}const s=Ge((0,a.A)({},o,r)),u=Qe(r),c=Qe(o),d=t(s),p=l(null==d?void 0:d.className,null==n?void 0:n.className,i,null==o?void 0:o.className,null==r?void 0:r.className),f=(0,a.A)({},null==d?void 0:d.style,null==n?void 0:n.style,null==o?void 0:o.style,null==r?void 0:r.style),m=(0,a.A)({},d,n,c,u);return p.length>0&&(m.className=p),Object.keys(f).length>0&&(m.style=f),{props:m,internalRef:d.ref}},Ze=["className","elementType","ownerState","externalForwardedProps","getSlotOwnerState","internalForwardedProps"],Je=["component","slots","slotProps"],et=["component"];function tt(e,t){const{className:n,elementType:r,ownerState:i,externalForwardedProps:l,getSlotOwnerState:s,internalForwardedProps:u}=t,c=(0,o.A)(t,Ze),{component:d,slots:p={[e]:void 0},slotProps:f={[e]:void 0}}=l,m=(0,o.A)(l,Je),h=p[e]||r,v=Xe(f[e],i),g=Ye((0,a.A)({className:n},c,{externalForwardedProps:"root"===e?m:void 0,externalSlotProps:v})),{props:{component:b},internalRef:y}=g,x=(0,o.A)(g.props,et),w=He(y,null==v?void 0:v.ref,t.ref),S=s?s(x):{},k=(0,a.A)({},i,S),C="root"===e?b||d:b,A=qe(h,(0,a.A)({},"root"===e&&!d&&!p[e]&&u,"root"!==e&&!p[e]&&u,x,C&&{as:C},{ref:w}),k);return Object.keys(S).forEach((e=>{delete A[e]})),[h,A]}const nt=e=>{let t;return t=e<1?5.11916*e**2:4.5*Math.log(e+1)+2,(t/100).toFixed(2)};function rt(e){return d("MuiPaper",e)}ze("MuiPaper",["root","rounded","outlined","elevation","elevation0","elevation1","elevation2","elevation3","elevation4","elevation5","elevation6","elevation7","elevation8","elevation9","elevation10","elevation11","elevation12","elevation13","elevation14","elevation15","elevation16","elevation17","elevation18","elevation19","elevation20","elevation21","elevation22","elevation23","elevation24"]);const ot=["className","component","elevation","square","variant"],at=Ae("div",{name:"MuiPaper",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],!n.square&&t.rounded,"elevation"===n.variant&&t[`elevation${n.elevation}`]]}})((e=>{let{theme:t,ownerState:n}=e;var r;return(0,a.A)({backgroundColor:(t.vars||t).palette.background.paper,color:(t.vars||t).palette.text.primary,transition:t.transitions.create("box-shadow")},!n.square&&{borderRadius:t.shape.borderRadius},"outlined"===n.variant&&{border:`1px solid ${(t.vars||t).palette.divider}`},"elevation"===n.variant&&(0,a.A)({boxShadow:(t.vars||t).shadows[n.elevation]},!t.vars&&"dark"===t.palette.mode&&{backgroundImage:`linear-gradient(${(0,H.X4)("#fff",nt(n.elevation))}, ${(0,H.X4)("#fff",nt(n.elevation))})`},t.vars&&{backgroundImage:null==(r=t.vars.overlays)?void 0:r[n.elevation]}))})),it=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiPaper"}),{className:r,component:i="div",elevation:s=1,square:u=!1,variant:c="elevation"}=n,d=(0,o.A)(n,ot),f=(0,a.A)({},n,{component:i,elevation:s,square:u,variant:c}),m=(e=>{const{square:t,elevation:n,variant:r,classes:o}=e;return p({root:["root",r,!t&&"rounded","elevation"===r&&`elevation${n}`]},rt,o)})(f);return(0,I.jsx)(at,(0,a.A)({as:i,ownerState:f,className:l(m.root,r),ref:t},d))}));function lt(e){return d("MuiAlert",e)}const st=ze("MuiAlert",["root","action","icon","message","filled","colorSuccess","colorInfo","colorWarning","colorError","filledSuccess","filledInfo","filledWarning","filledError","outlined","outlinedSuccess","outlinedInfo","outlinedWarning","outlinedError","standard","standardSuccess","standardInfo","standardWarning","standardError"]),ut=He,ct="undefined"!==typeof window?e.useLayoutEffect:e.useEffect;const dt=function(t){const n=e.useRef(t);return ct((()=>{n.current=t})),e.useRef((function(){return(0,n.current)(...arguments)})).current},pt=dt,ft={};const mt=[];class ht{constructor(){this.currentId=null,this.clear=()=>{null!==this.currentId&&(clearTimeout(this.currentId),this.currentId=null)},this.disposeEffect=()=>this.clear}static create(){return new ht}start(e,t){this.clear(),this.currentId=setTimeout((()=>{this.currentId=null,t()}),e)}}function vt(){const t=function(t,n){const r=e.useRef(ft);return r.current===ft&&(r.current=t(n)),r}(ht.create).current;var n;return n=t.disposeEffect,e.useEffect(n,mt),t}let gt=!0,bt=!1;const yt=new ht,xt={text:!0,search:!0,url:!0,tel:!0,email:!0,password:!0,number:!0,date:!0,month:!0,week:!0,time:!0,datetime:!0,"datetime-local":!0};function wt(e){e.metaKey||e.altKey||e.ctrlKey||(gt=!0)}function St(){gt=!1}function kt(){"hidden"===this.visibilityState&&bt&&(gt=!0)}function Ct(e){const{target:t}=e;try{return t.matches(":focus-visible")}catch(n){}return gt||function(e){const{type:t,tagName:n}=e;return!("INPUT"!==n||!xt[t]||e.readOnly)||"TEXTAREA"===n&&!e.readOnly||!!e.isContentEditable}(t)}const At=function(){const t=e.useCallback((e=>{var t;null!=e&&((t=e.ownerDocument).addEventListener("keydown",wt,!0),t.addEventListener("mousedown",St,!0),t.addEventListener("pointerdown",St,!0),t.addEventListener("touchstart",St,!0),t.addEventListener("visibilitychange",kt,!0))}),[]),n=e.useRef(!1);return{isFocusVisibleRef:n,onFocus:function(e){return!!Ct(e)&&(n.current=!0,!0)},onBlur:function(){return!!n.current&&(bt=!0,yt.start(100,(()=>{bt=!1})),n.current=!1,!0)},ref:t}};function Et(e,t){return Et=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Et(e,t)}function Rt(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,Et(e,t)}const Pt=e.createContext(null);function Mt(t,n){var r=Object.create(null);return t&&e.Children.map(t,(function(e){return e})).forEach((function(t){r[t.key]=function(t){return n&&(0,e.isValidElement)(t)?n(t):t}(t)})),r}function Nt(e,t,n){return null!=n[t]?n[t]:e.props[t]}function $t(t,n,r){var o=Mt(t.children),a=function(e,t){function n(n){return n in t?t[n]:e[n]}e=e||{},t=t||{};var r,o=Object.create(null),a=[];for(var i in e)i in t?a.length&&(o[i]=a,a=[]):a.push(i);var l={};for(var s in t){if(o[s])for(r=0;r<o[s].length;r++){var u=o[s][r];l[o[s][r]]=n(u)}l[s]=n(s)}for(r=0;r<a.length;r++)l[a[r]]=n(a[r]);return l}(n,o);return Object.keys(a).forEach((function(i){var l=a[i];if((0,e.isValidElement)(l)){var s=i in n,u=i in o,c=n[i],d=(0,e.isValidElement)(c)&&!c.props.in;!u||s&&!d?u||!s||d?u&&s&&(0,e.isValidElement)(c)&&(a[i]=(0,e.cloneElement)(l,{onExited:r.bind(null,l),in:c.props.in,exit:Nt(l,"exit",t),enter:Nt(l,"enter",t)})):a[i]=(0,e.cloneElement)(l,{in:!1}):a[i]=(0,e.cloneElement)(l,{onExited:r.bind(null,l),in:!0,exit:Nt(l,"exit",t),enter:Nt(l,"enter",t)})}})),a}var Tt=Object.values||function(e){return Object.keys(e).map((function(t){return e[t]}))},zt=function(t){function n(e,n){var r,o=(r=t.call(this,e,n)||this).handleExited.bind(function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(r));return r.state={contextValue:{isMounting:!0},handleExited:o,firstRender:!0},r}Rt(n,t);var r=n.prototype;return r.componentDidMount=function(){this.mounted=!0,this.setState({contextValue:{isMounting:!1}})},r.componentWillUnmount=function(){this.mounted=!1},n.getDerivedStateFromProps=function(t,n){var r,o,a=n.children,i=n.handleExited;return{children:n.firstRender?(r=t,o=i,Mt(r.children,(function(t){return(0,e.cloneElement)(t,{onExited:o.bind(null,t),in:!0,appear:Nt(t,"appear",r),enter:Nt(t,"enter",r),exit:Nt(t,"exit",r)})}))):$t(t,a,i),firstRender:!1}},r.handleExited=function(e,t){var n=Mt(this.props.children);e.key in n||(e.props.onExited&&e.props.onExited(t),this.mounted&&this.setState((function(t){var n=(0,a.A)({},t.children);return delete n[e.key],{children:n}})))},r.render=function(){var t=this.props,n=t.component,r=t.childFactory,a=(0,o.A)(t,["component","childFactory"]),i=this.state.contextValue,l=Tt(this.state.children).map(r);return delete a.appear,delete a.enter,delete a.exit,null===n?e.createElement(Pt.Provider,{value:i},l):e.createElement(Pt.Provider,{value:i},e.createElement(n,a,l))},n}(e.Component);zt.propTypes={},zt.defaultProps={component:"div",childFactory:function(e){return e}};const Ot=zt;var It=n(290);const Lt=function(t){const{className:n,classes:r,pulsate:o=!1,rippleX:a,rippleY:i,rippleSize:s,in:u,onExited:c,timeout:d}=t,[p,f]=e.useState(!1),m=l(n,r.ripple,r.rippleVisible,o&&r.ripplePulsate),h={width:s,height:s,top:-s/2+i,left:-s/2+a},v=l(r.child,p&&r.childLeaving,o&&r.childPulsate);return u||p||f(!0),e.useEffect((()=>{if(!u&&null!=c){const e=setTimeout(c,d);return()=>{clearTimeout(e)}}}),[c,u,d]),(0,I.jsx)("span",{className:m,style:h,children:(0,I.jsx)("span",{className:v})})};const _t=ze("MuiTouchRipple",["root","ripple","rippleVisible","ripplePulsate","child","childLeaving","childPulsate"]),jt=["center","classes","className"];let Ft,Wt,Dt,Bt,Vt=e=>e;const Ut=(0,It.i7)(Ft||(Ft=Vt`
-  0% {
-    transform: scale(0);
-    opacity: 0.1;
-  }
-
-  100% {
-    transform: scale(1);
-    opacity: 0.3;
-  }
-`)),Ht=(0,It.i7)(Wt||(Wt=Vt`
-  0% {
-    opacity: 1;
-  }
-
-  100% {
-    opacity: 0;
-  }
-`)),Kt=(0,It.i7)(Dt||(Dt=Vt`
-  0% {
-    transform: scale(1);
-  }
-
-  50% {
-    transform: scale(0.92);
-  }
-
-  100% {
-    transform: scale(1);
-  }
-`)),qt=Ae("span",{name:"MuiTouchRipple",slot:"Root"})({overflow:"hidden",pointerEvents:"none",position:"absolute",zIndex:0,top:0,right:0,bottom:0,left:0,borderRadius:"inherit"}),Xt=Ae(Lt,{name:"MuiTouchRipple",slot:"Ripple"})(Bt||(Bt=Vt`
-  opacity: 0;
-  position: absolute;
-
-  &.${0} {
-    opacity: 0.3;
-    transform: scale(1);
-    animation-name: ${0};
-    animation-duration: ${0}ms;
-    animation-timing-function: ${0};
-  }
-
-  &.${0} {
-    animation-duration: ${0}ms;
-  }
-
-  & .${0} {
-    opacity: 1;
-    display: block;
-    width: 100%;
-    height: 100%;
-    border-radius: 50%;
-    background-color: currentColor;
-  }
-
-  & .${0} {
-    opacity: 0;
-    animation-name: ${0};
-    animation-duration: ${0}ms;
-    animation-timing-function: ${0};
-  }
-
-  & .${0} {
-    position: absolute;
-    /* @noflip */
-    left: 0px;
-    top: 0;
-    animation-name: ${0};
-    animation-duration: 2500ms;
-    animation-timing-function: ${0};
-    animation-iteration-count: infinite;
-    animation-delay: 200ms;
-  }
-`),_t.rippleVisible,Ut,550,(e=>{let{theme:t}=e;return t.transitions.easing.easeInOut}),_t.ripplePulsate,(e=>{let{theme:t}=e;return t.transitions.duration.shorter}),_t.child,_t.childLeaving,Ht,550,(e=>{let{theme:t}=e;return t.transitions.easing.easeInOut}),_t.childPulsate,Kt,(e=>{let{theme:t}=e;return t.transitions.easing.easeInOut})),Gt=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiTouchRipple"}),{center:i=!1,classes:s={},className:u}=r,c=(0,o.A)(r,jt),[d,p]=e.useState([]),f=e.useRef(0),m=e.useRef(null);e.useEffect((()=>{m.current&&(m.current(),m.current=null)}),[d]);const h=e.useRef(!1),v=vt(),g=e.useRef(null),b=e.useRef(null),y=e.useCallback((e=>{const{pulsate:t,rippleX:n,rippleY:r,rippleSize:o,cb:a}=e;p((e=>[...e,(0,I.jsx)(Xt,{classes:{ripple:l(s.ripple,_t.ripple),rippleVisible:l(s.rippleVisible,_t.rippleVisible),ripplePulsate:l(s.ripplePulsate,_t.ripplePulsate),child:l(s.child,_t.child),childLeaving:l(s.childLeaving,_t.childLeaving),childPulsate:l(s.childPulsate,_t.childPulsate)},timeout:550,pulsate:t,rippleX:n,rippleY:r,rippleSize:o},f.current)])),f.current+=1,m.current=a}),[s]),x=e.useCallback((function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:()=>{};const{pulsate:r=!1,center:o=i||t.pulsate,fakeElement:a=!1}=t;if("mousedown"===(null==e?void 0:e.type)&&h.current)return void(h.current=!1);"touchstart"===(null==e?void 0:e.type)&&(h.current=!0);const l=a?null:b.current,s=l?l.getBoundingClientRect():{width:0,height:0,left:0,top:0};let u,c,d;if(o||void 0===e||0===e.clientX&&0===e.clientY||!e.clientX&&!e.touches)u=Math.round(s.width/2),c=Math.round(s.height/2);else{const{clientX:t,clientY:n}=e.touches&&e.touches.length>0?e.touches[0]:e;u=Math.round(t-s.left),c=Math.round(n-s.top)}if(o)d=Math.sqrt((2*s.width**2+s.height**2)/3),d%2===0&&(d+=1);else{const e=2*Math.max(Math.abs((l?l.clientWidth:0)-u),u)+2,t=2*Math.max(Math.abs((l?l.clientHeight:0)-c),c)+2;d=Math.sqrt(e**2+t**2)}null!=e&&e.touches?null===g.current&&(g.current=()=>{y({pulsate:r,rippleX:u,rippleY:c,rippleSize:d,cb:n})},v.start(80,(()=>{g.current&&(g.current(),g.current=null)}))):y({pulsate:r,rippleX:u,rippleY:c,rippleSize:d,cb:n})}),[i,y,v]),w=e.useCallback((()=>{x({},{pulsate:!0})}),[x]),S=e.useCallback(((e,t)=>{if(v.clear(),"touchend"===(null==e?void 0:e.type)&&g.current)return g.current(),g.current=null,void v.start(0,(()=>{S(e,t)}));g.current=null,p((e=>e.length>0?e.slice(1):e)),m.current=t}),[v]);return e.useImperativeHandle(n,(()=>({pulsate:w,start:x,stop:S})),[w,x,S]),(0,I.jsx)(qt,(0,a.A)({className:l(_t.root,s.root,u),ref:b},c,{children:(0,I.jsx)(Ot,{component:null,exit:!0,children:d})}))}));function Qt(e){return d("MuiButtonBase",e)}const Yt=ze("MuiButtonBase",["root","disabled","focusVisible"]),Zt=["action","centerRipple","children","className","component","disabled","disableRipple","disableTouchRipple","focusRipple","focusVisibleClassName","LinkComponent","onBlur","onClick","onContextMenu","onDragLeave","onFocus","onFocusVisible","onKeyDown","onKeyUp","onMouseDown","onMouseLeave","onMouseUp","onTouchEnd","onTouchMove","onTouchStart","tabIndex","TouchRippleProps","touchRippleRef","type"],Jt=Ae("button",{name:"MuiButtonBase",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"inline-flex",alignItems:"center",justifyContent:"center",position:"relative",boxSizing:"border-box",WebkitTapHighlightColor:"transparent",backgroundColor:"transparent",outline:0,border:0,margin:0,borderRadius:0,padding:0,cursor:"pointer",userSelect:"none",verticalAlign:"middle",MozAppearance:"none",WebkitAppearance:"none",textDecoration:"none",color:"inherit","&::-moz-focus-inner":{borderStyle:"none"},[`&.${Yt.disabled}`]:{pointerEvents:"none",cursor:"default"},"@media print":{colorAdjust:"exact"}}),en=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiButtonBase"}),{action:i,centerRipple:s=!1,children:u,className:c,component:d="button",disabled:f=!1,disableRipple:m=!1,disableTouchRipple:h=!1,focusRipple:v=!1,LinkComponent:g="a",onBlur:b,onClick:y,onContextMenu:x,onDragLeave:w,onFocus:S,onFocusVisible:k,onKeyDown:C,onKeyUp:A,onMouseDown:E,onMouseLeave:R,onMouseUp:P,onTouchEnd:M,onTouchMove:N,onTouchStart:$,tabIndex:T=0,TouchRippleProps:z,touchRippleRef:O,type:L}=r,_=(0,o.A)(r,Zt),j=e.useRef(null),F=e.useRef(null),W=ut(F,O),{isFocusVisibleRef:D,onFocus:B,onBlur:V,ref:U}=At(),[H,K]=e.useState(!1);f&&H&&K(!1),e.useImperativeHandle(i,(()=>({focusVisible:()=>{K(!0),j.current.focus()}})),[]);const[q,X]=e.useState(!1);e.useEffect((()=>{X(!0)}),[]);const G=q&&!m&&!f;function Q(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:h;return pt((r=>{t&&t(r);return!n&&F.current&&F.current[e](r),!0}))}e.useEffect((()=>{H&&v&&!m&&q&&F.current.pulsate()}),[m,v,H,q]);const Y=Q("start",E),Z=Q("stop",x),J=Q("stop",w),ee=Q("stop",P),te=Q("stop",(e=>{H&&e.preventDefault(),R&&R(e)})),ne=Q("start",$),re=Q("stop",M),oe=Q("stop",N),ae=Q("stop",(e=>{V(e),!1===D.current&&K(!1),b&&b(e)}),!1),ie=pt((e=>{j.current||(j.current=e.currentTarget),B(e),!0===D.current&&(K(!0),k&&k(e)),S&&S(e)})),le=()=>{const e=j.current;return d&&"button"!==d&&!("A"===e.tagName&&e.href)},se=e.useRef(!1),ue=pt((e=>{v&&!se.current&&H&&F.current&&" "===e.key&&(se.current=!0,F.current.stop(e,(()=>{F.current.start(e)}))),e.target===e.currentTarget&&le()&&" "===e.key&&e.preventDefault(),C&&C(e),e.target===e.currentTarget&&le()&&"Enter"===e.key&&!f&&(e.preventDefault(),y&&y(e))})),ce=pt((e=>{v&&" "===e.key&&F.current&&H&&!e.defaultPrevented&&(se.current=!1,F.current.stop(e,(()=>{F.current.pulsate(e)}))),A&&A(e),y&&e.target===e.currentTarget&&le()&&" "===e.key&&!e.defaultPrevented&&y(e)}));let de=d;"button"===de&&(_.href||_.to)&&(de=g);const pe={};"button"===de?(pe.type=void 0===L?"button":L,pe.disabled=f):(_.href||_.to||(pe.role="button"),f&&(pe["aria-disabled"]=f));const fe=ut(n,U,j);const me=(0,a.A)({},r,{centerRipple:s,component:d,disabled:f,disableRipple:m,disableTouchRipple:h,focusRipple:v,tabIndex:T,focusVisible:H}),he=(e=>{const{disabled:t,focusVisible:n,focusVisibleClassName:r,classes:o}=e,a=p({root:["root",t&&"disabled",n&&"focusVisible"]},Qt,o);return n&&r&&(a.root+=` ${r}`),a})(me);return(0,I.jsxs)(Jt,(0,a.A)({as:de,className:l(he.root,c),ownerState:me,onBlur:ae,onClick:y,onContextMenu:Z,onFocus:ie,onKeyDown:ue,onKeyUp:ce,onMouseDown:Y,onMouseLeave:te,onMouseUp:ee,onDragLeave:J,onTouchEnd:re,onTouchMove:oe,onTouchStart:ne,ref:fe,tabIndex:f?-1:T,type:L},pe,_,{children:[u,G?(0,I.jsx)(Gt,(0,a.A)({ref:W,center:s},z)):null]}))})),tn=en;function nn(e){return d("MuiIconButton",e)}const rn=ze("MuiIconButton",["root","disabled","colorInherit","colorPrimary","colorSecondary","colorError","colorInfo","colorSuccess","colorWarning","edgeStart","edgeEnd","sizeSmall","sizeMedium","sizeLarge"]),on=["edge","children","className","color","disabled","disableFocusRipple","size"],an=Ae(tn,{name:"MuiIconButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,"default"!==n.color&&t[`color${W(n.color)}`],n.edge&&t[`edge${W(n.edge)}`],t[`size${W(n.size)}`]]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({textAlign:"center",flex:"0 0 auto",fontSize:t.typography.pxToRem(24),padding:8,borderRadius:"50%",overflow:"visible",color:(t.vars||t).palette.action.active,transition:t.transitions.create("background-color",{duration:t.transitions.duration.shortest})},!n.disableRipple&&{"&:hover":{backgroundColor:t.vars?`rgba(${t.vars.palette.action.activeChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,H.X4)(t.palette.action.active,t.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},"start"===n.edge&&{marginLeft:"small"===n.size?-3:-12},"end"===n.edge&&{marginRight:"small"===n.size?-3:-12})}),(e=>{let{theme:t,ownerState:n}=e;var r;const o=null==(r=(t.vars||t).palette)?void 0:r[n.color];return(0,a.A)({},"inherit"===n.color&&{color:"inherit"},"inherit"!==n.color&&"default"!==n.color&&(0,a.A)({color:null==o?void 0:o.main},!n.disableRipple&&{"&:hover":(0,a.A)({},o&&{backgroundColor:t.vars?`rgba(${o.mainChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,H.X4)(o.main,t.palette.action.hoverOpacity)},{"@media (hover: none)":{backgroundColor:"transparent"}})}),"small"===n.size&&{padding:5,fontSize:t.typography.pxToRem(18)},"large"===n.size&&{padding:12,fontSize:t.typography.pxToRem(28)},{[`&.${rn.disabled}`]:{backgroundColor:"transparent",color:(t.vars||t).palette.action.disabled}})})),ln=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiIconButton"}),{edge:r=!1,children:i,className:s,color:u="default",disabled:c=!1,disableFocusRipple:d=!1,size:f="medium"}=n,m=(0,o.A)(n,on),h=(0,a.A)({},n,{edge:r,color:u,disabled:c,disableFocusRipple:d,size:f}),v=(e=>{const{classes:t,disabled:n,color:r,edge:o,size:a}=e;return p({root:["root",n&&"disabled","default"!==r&&`color${W(r)}`,o&&`edge${W(o)}`,`size${W(a)}`]},nn,t)})(h);return(0,I.jsx)(an,(0,a.A)({className:l(v.root,s),centerRipple:!0,focusRipple:!d,disabled:c,ref:t},m,{ownerState:h,children:i}))}));function sn(e){return d("MuiSvgIcon",e)}ze("MuiSvgIcon",["root","colorPrimary","colorSecondary","colorAction","colorError","colorDisabled","fontSizeInherit","fontSizeSmall","fontSizeMedium","fontSizeLarge"]);const un=["children","className","color","component","fontSize","htmlColor","inheritViewBox","titleAccess","viewBox"],cn=Ae("svg",{name:"MuiSvgIcon",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,"inherit"!==n.color&&t[`color${W(n.color)}`],t[`fontSize${W(n.fontSize)}`]]}})((e=>{let{theme:t,ownerState:n}=e;var r,o,a,i,l,s,u,c,d,p,f,m,h;return{userSelect:"none",width:"1em",height:"1em",display:"inline-block",fill:n.hasSvgAsChild?void 0:"currentColor",flexShrink:0,transition:null==(r=t.transitions)||null==(o=r.create)?void 0:o.call(r,"fill",{duration:null==(a=t.transitions)||null==(a=a.duration)?void 0:a.shorter}),fontSize:{inherit:"inherit",small:(null==(i=t.typography)||null==(l=i.pxToRem)?void 0:l.call(i,20))||"1.25rem",medium:(null==(s=t.typography)||null==(u=s.pxToRem)?void 0:u.call(s,24))||"1.5rem",large:(null==(c=t.typography)||null==(d=c.pxToRem)?void 0:d.call(c,35))||"2.1875rem"}[n.fontSize],color:null!=(p=null==(f=(t.vars||t).palette)||null==(f=f[n.color])?void 0:f.main)?p:{action:null==(m=(t.vars||t).palette)||null==(m=m.action)?void 0:m.active,disabled:null==(h=(t.vars||t).palette)||null==(h=h.action)?void 0:h.disabled,inherit:void 0}[n.color]}})),dn=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiSvgIcon"}),{children:i,className:s,color:u="inherit",component:c="svg",fontSize:d="medium",htmlColor:f,inheritViewBox:m=!1,titleAccess:h,viewBox:v="0 0 24 24"}=r,g=(0,o.A)(r,un),b=e.isValidElement(i)&&"svg"===i.type,y=(0,a.A)({},r,{color:u,component:c,fontSize:d,instanceFontSize:t.fontSize,inheritViewBox:m,viewBox:v,hasSvgAsChild:b}),x={};m||(x.viewBox=v);const w=(e=>{const{color:t,fontSize:n,classes:r}=e;return p({root:["root","inherit"!==t&&`color${W(t)}`,`fontSize${W(n)}`]},sn,r)})(y);return(0,I.jsxs)(cn,(0,a.A)({as:c,className:l(w.root,s),focusable:"false",color:f,"aria-hidden":!h||void 0,role:h?"img":void 0,ref:n},x,g,b&&i.props,{ownerState:y,children:[b?i.props.children:i,h?(0,I.jsx)("title",{children:h}):null]}))}));dn.muiName="SvgIcon";const pn=dn;function fn(t,n){function r(e,r){return(0,I.jsx)(pn,(0,a.A)({"data-testid":`${n}Icon`,ref:r},e,{children:t}))}return r.muiName=pn.muiName,e.memo(e.forwardRef(r))}const mn=fn((0,I.jsx)("path",{d:"M20,12A8,8 0 0,1 12,20A8,8 0 0,1 4,12A8,8 0 0,1 12,4C12.76,4 13.5,4.11 14.2, 4.31L15.77,2.74C14.61,2.26 13.34,2 12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0, 0 22,12M7.91,10.08L6.5,11.5L11,16L21,6L19.59,4.58L11,13.17L7.91,10.08Z"}),"SuccessOutlined"),hn=fn((0,I.jsx)("path",{d:"M12 5.99L19.53 19H4.47L12 5.99M12 2L1 21h22L12 2zm1 14h-2v2h2v-2zm0-6h-2v4h2v-4z"}),"ReportProblemOutlined"),vn=fn((0,I.jsx)("path",{d:"M11 15h2v2h-2zm0-8h2v6h-2zm.99-5C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2zM12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"}),"ErrorOutline"),gn=fn((0,I.jsx)("path",{d:"M11,9H13V7H11M12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4C16.41,4 20,7.59 20, 12C20,16.41 16.41,20 12,20M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10, 10 0 0,0 12,2M11,17H13V11H11V17Z"}),"InfoOutlined"),bn=fn((0,I.jsx)("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close"),yn=["action","children","className","closeText","color","components","componentsProps","icon","iconMapping","onClose","role","severity","slotProps","slots","variant"],xn=Ae(it,{name:"MuiAlert",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`${n.variant}${W(n.color||n.severity)}`]]}})((e=>{let{theme:t}=e;const n="light"===t.palette.mode?H.e$:H.a,r="light"===t.palette.mode?H.a:H.e$;return(0,a.A)({},t.typography.body2,{backgroundColor:"transparent",display:"flex",padding:"6px 16px",variants:[...Object.entries(t.palette).filter((e=>{let[,t]=e;return t.main&&t.light})).map((e=>{let[o]=e;return{props:{colorSeverity:o,variant:"standard"},style:{color:t.vars?t.vars.palette.Alert[`${o}Color`]:n(t.palette[o].light,.6),backgroundColor:t.vars?t.vars.palette.Alert[`${o}StandardBg`]:r(t.palette[o].light,.9),[`& .${st.icon}`]:t.vars?{color:t.vars.palette.Alert[`${o}IconColor`]}:{color:t.palette[o].main}}}})),...Object.entries(t.palette).filter((e=>{let[,t]=e;return t.main&&t.light})).map((e=>{let[r]=e;return{props:{colorSeverity:r,variant:"outlined"},style:{color:t.vars?t.vars.palette.Alert[`${r}Color`]:n(t.palette[r].light,.6),border:`1px solid ${(t.vars||t).palette[r].light}`,[`& .${st.icon}`]:t.vars?{color:t.vars.palette.Alert[`${r}IconColor`]}:{color:t.palette[r].main}}}})),...Object.entries(t.palette).filter((e=>{let[,t]=e;return t.main&&t.dark})).map((e=>{let[n]=e;return{props:{colorSeverity:n,variant:"filled"},style:(0,a.A)({fontWeight:t.typography.fontWeightMedium},t.vars?{color:t.vars.palette.Alert[`${n}FilledColor`],backgroundColor:t.vars.palette.Alert[`${n}FilledBg`]}:{backgroundColor:"dark"===t.palette.mode?t.palette[n].dark:t.palette[n].main,color:t.palette.getContrastText(t.palette[n].main)})}}))]})})),wn=Ae("div",{name:"MuiAlert",slot:"Icon",overridesResolver:(e,t)=>t.icon})({marginRight:12,padding:"7px 0",display:"flex",fontSize:22,opacity:.9}),Sn=Ae("div",{name:"MuiAlert",slot:"Message",overridesResolver:(e,t)=>t.message})({padding:"8px 0",minWidth:0,overflow:"auto"}),kn=Ae("div",{name:"MuiAlert",slot:"Action",overridesResolver:(e,t)=>t.action})({display:"flex",alignItems:"flex-start",padding:"4px 0 0 16px",marginLeft:"auto",marginRight:-8}),Cn={success:(0,I.jsx)(mn,{fontSize:"inherit"}),warning:(0,I.jsx)(hn,{fontSize:"inherit"}),error:(0,I.jsx)(vn,{fontSize:"inherit"}),info:(0,I.jsx)(gn,{fontSize:"inherit"})},An=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiAlert"}),{action:r,children:i,className:s,closeText:u="Close",color:c,components:d={},componentsProps:f={},icon:m,iconMapping:h=Cn,onClose:v,role:g="alert",severity:b="success",slotProps:y={},slots:x={},variant:w="standard"}=n,S=(0,o.A)(n,yn),k=(0,a.A)({},n,{color:c,severity:b,variant:w,colorSeverity:c||b}),C=(e=>{const{variant:t,color:n,severity:r,classes:o}=e;return p({root:["root",`color${W(n||r)}`,`${t}${W(n||r)}`,`${t}`],icon:["icon"],message:["message"],action:["action"]},lt,o)})(k),A={slots:(0,a.A)({closeButton:d.CloseButton,closeIcon:d.CloseIcon},x),slotProps:(0,a.A)({},f,y)},[E,R]=tt("closeButton",{elementType:ln,externalForwardedProps:A,ownerState:k}),[P,M]=tt("closeIcon",{elementType:bn,externalForwardedProps:A,ownerState:k});return(0,I.jsxs)(xn,(0,a.A)({role:g,elevation:0,ownerState:k,className:l(C.root,s),ref:t},S,{children:[!1!==m?(0,I.jsx)(wn,{ownerState:k,className:C.icon,children:m||h[b]||Cn[b]}):null,(0,I.jsx)(Sn,{ownerState:k,className:C.message,children:i}),null!=r?(0,I.jsx)(kn,{ownerState:k,className:C.action,children:r}):null,null==r&&v?(0,I.jsx)(kn,{ownerState:k,className:C.action,children:(0,I.jsx)(E,(0,a.A)({size:"small","aria-label":u,title:u,color:"inherit",onClick:v},R,{children:(0,I.jsx)(P,(0,a.A)({fontSize:"small"},M))}))}):null]}))}));function En(e){return d("MuiCircularProgress",e)}ze("MuiCircularProgress",["root","determinate","indeterminate","colorPrimary","colorSecondary","svg","circle","circleDeterminate","circleIndeterminate","circleDisableShrink"]);const Rn=["className","color","disableShrink","size","style","thickness","value","variant"];let Pn,Mn,Nn,$n,Tn=e=>e;const zn=44,On=(0,It.i7)(Pn||(Pn=Tn`
-  0% {
-    transform: rotate(0deg);
-  }
-
-  100% {
-    transform: rotate(360deg);
-  }
-`)),In=(0,It.i7)(Mn||(Mn=Tn`
-  0% {
-    stroke-dasharray: 1px, 200px;
-    stroke-dashoffset: 0;
-  }
-
-  50% {
-    stroke-dasharray: 100px, 200px;
-    stroke-dashoffset: -15px;
-  }
-
-  100% {
-    stroke-dasharray: 100px, 200px;
-    stroke-dashoffset: -125px;
-  }
-`)),Ln=Ae("span",{name:"MuiCircularProgress",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`color${W(n.color)}`]]}})((e=>{let{ownerState:t,theme:n}=e;return(0,a.A)({display:"inline-block"},"determinate"===t.variant&&{transition:n.transitions.create("transform")},"inherit"!==t.color&&{color:(n.vars||n).palette[t.color].main})}),(e=>{let{ownerState:t}=e;return"indeterminate"===t.variant&&(0,It.AH)(Nn||(Nn=Tn`
-      animation: ${0} 1.4s linear infinite;
-    `),On)})),_n=Ae("svg",{name:"MuiCircularProgress",slot:"Svg",overridesResolver:(e,t)=>t.svg})({display:"block"}),jn=Ae("circle",{name:"MuiCircularProgress",slot:"Circle",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.circle,t[`circle${W(n.variant)}`],n.disableShrink&&t.circleDisableShrink]}})((e=>{let{ownerState:t,theme:n}=e;return(0,a.A)({stroke:"currentColor"},"determinate"===t.variant&&{transition:n.transitions.create("stroke-dashoffset")},"indeterminate"===t.variant&&{strokeDasharray:"80px, 200px",strokeDashoffset:0})}),(e=>{let{ownerState:t}=e;return"indeterminate"===t.variant&&!t.disableShrink&&(0,It.AH)($n||($n=Tn`
-      animation: ${0} 1.4s ease-in-out infinite;
-    `),In)})),Fn=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiCircularProgress"}),{className:r,color:i="primary",disableShrink:s=!1,size:u=40,style:c,thickness:d=3.6,value:f=0,variant:m="indeterminate"}=n,h=(0,o.A)(n,Rn),v=(0,a.A)({},n,{color:i,disableShrink:s,size:u,thickness:d,value:f,variant:m}),g=(e=>{const{classes:t,variant:n,color:r,disableShrink:o}=e;return p({root:["root",n,`color${W(r)}`],svg:["svg"],circle:["circle",`circle${W(n)}`,o&&"circleDisableShrink"]},En,t)})(v),b={},y={},x={};if("determinate"===m){const e=2*Math.PI*((zn-d)/2);b.strokeDasharray=e.toFixed(3),x["aria-valuenow"]=Math.round(f),b.strokeDashoffset=`${((100-f)/100*e).toFixed(3)}px`,y.transform="rotate(-90deg)"}return(0,I.jsx)(Ln,(0,a.A)({className:l(g.root,r),style:(0,a.A)({width:u,height:u},y,c),ownerState:v,ref:t,role:"progressbar"},x,h,{children:(0,I.jsx)(_n,{className:g.svg,ownerState:v,viewBox:"22 22 44 44",children:(0,I.jsx)(jn,{className:g.circle,style:b,ownerState:v,cx:zn,cy:zn,r:(zn-d)/2,fill:"none",strokeWidth:d})})}))})),Wn=Fn;function Dn(e){return d("MuiDivider",e)}ze("MuiDivider",["root","absolute","fullWidth","inset","middle","flexItem","light","vertical","withChildren","withChildrenVertical","textAlignRight","textAlignLeft","wrapper","wrapperVertical"]);const Bn=["absolute","children","className","component","flexItem","light","orientation","role","textAlign","variant"],Vn=Ae("div",{name:"MuiDivider",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.absolute&&t.absolute,t[n.variant],n.light&&t.light,"vertical"===n.orientation&&t.vertical,n.flexItem&&t.flexItem,n.children&&t.withChildren,n.children&&"vertical"===n.orientation&&t.withChildrenVertical,"right"===n.textAlign&&"vertical"!==n.orientation&&t.textAlignRight,"left"===n.textAlign&&"vertical"!==n.orientation&&t.textAlignLeft]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({margin:0,flexShrink:0,borderWidth:0,borderStyle:"solid",borderColor:(t.vars||t).palette.divider,borderBottomWidth:"thin"},n.absolute&&{position:"absolute",bottom:0,left:0,width:"100%"},n.light&&{borderColor:t.vars?`rgba(${t.vars.palette.dividerChannel} / 0.08)`:(0,H.X4)(t.palette.divider,.08)},"inset"===n.variant&&{marginLeft:72},"middle"===n.variant&&"horizontal"===n.orientation&&{marginLeft:t.spacing(2),marginRight:t.spacing(2)},"middle"===n.variant&&"vertical"===n.orientation&&{marginTop:t.spacing(1),marginBottom:t.spacing(1)},"vertical"===n.orientation&&{height:"100%",borderBottomWidth:0,borderRightWidth:"thin"},n.flexItem&&{alignSelf:"stretch",height:"auto"})}),(e=>{let{ownerState:t}=e;return(0,a.A)({},t.children&&{display:"flex",whiteSpace:"nowrap",textAlign:"center",border:0,borderTopStyle:"solid",borderLeftStyle:"solid","&::before, &::after":{content:'""',alignSelf:"center"}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({},n.children&&"vertical"!==n.orientation&&{"&::before, &::after":{width:"100%",borderTop:`thin solid ${(t.vars||t).palette.divider}`,borderTopStyle:"inherit"}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({},n.children&&"vertical"===n.orientation&&{flexDirection:"column","&::before, &::after":{height:"100%",borderLeft:`thin solid ${(t.vars||t).palette.divider}`,borderLeftStyle:"inherit"}})}),(e=>{let{ownerState:t}=e;return(0,a.A)({},"right"===t.textAlign&&"vertical"!==t.orientation&&{"&::before":{width:"90%"},"&::after":{width:"10%"}},"left"===t.textAlign&&"vertical"!==t.orientation&&{"&::before":{width:"10%"},"&::after":{width:"90%"}})})),Un=Ae("span",{name:"MuiDivider",slot:"Wrapper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.wrapper,"vertical"===n.orientation&&t.wrapperVertical]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({display:"inline-block",paddingLeft:`calc(${t.spacing(1)} * 1.2)`,paddingRight:`calc(${t.spacing(1)} * 1.2)`},"vertical"===n.orientation&&{paddingTop:`calc(${t.spacing(1)} * 1.2)`,paddingBottom:`calc(${t.spacing(1)} * 1.2)`})})),Hn=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiDivider"}),{absolute:r=!1,children:i,className:s,component:u=(i?"div":"hr"),flexItem:c=!1,light:d=!1,orientation:f="horizontal",role:m=("hr"!==u?"separator":void 0),textAlign:h="center",variant:v="fullWidth"}=n,g=(0,o.A)(n,Bn),b=(0,a.A)({},n,{absolute:r,component:u,flexItem:c,light:d,orientation:f,role:m,textAlign:h,variant:v}),y=(e=>{const{absolute:t,children:n,classes:r,flexItem:o,light:a,orientation:i,textAlign:l,variant:s}=e;return p({root:["root",t&&"absolute",s,a&&"light","vertical"===i&&"vertical",o&&"flexItem",n&&"withChildren",n&&"vertical"===i&&"withChildrenVertical","right"===l&&"vertical"!==i&&"textAlignRight","left"===l&&"vertical"!==i&&"textAlignLeft"],wrapper:["wrapper","vertical"===i&&"wrapperVertical"]},Dn,r)})(b);return(0,I.jsx)(Vn,(0,a.A)({as:u,className:l(y.root,s),role:m,ref:t,ownerState:b},g,{children:i?(0,I.jsx)(Un,{className:y.wrapper,ownerState:b,children:i}):null}))}));Hn.muiSkipListHighlight=!0;const Kn=Hn,qn=e.createContext();const Xn=()=>{const t=e.useContext(qn);return null!=t&&t};function Gn(e){return d("MuiLinearProgress",e)}ze("MuiLinearProgress",["root","colorPrimary","colorSecondary","determinate","indeterminate","buffer","query","dashed","dashedColorPrimary","dashedColorSecondary","bar","barColorPrimary","barColorSecondary","bar1Indeterminate","bar1Determinate","bar1Buffer","bar2Indeterminate","bar2Buffer"]);const Qn=["className","color","value","valueBuffer","variant"];let Yn,Zn,Jn,er,tr,nr,rr=e=>e;const or=(0,It.i7)(Yn||(Yn=rr`
-  0% {
-    left: -35%;
-    right: 100%;
-  }
-
-  60% {
-    left: 100%;
-    right: -90%;
-  }
-
-  100% {
-    left: 100%;
-    right: -90%;
-  }
-`)),ar=(0,It.i7)(Zn||(Zn=rr`
-  0% {
-    left: -200%;
-    right: 100%;
-  }
-
-  60% {
-    left: 107%;
-    right: -8%;
-  }
-
-  100% {
-    left: 107%;
-    right: -8%;
-  }
-`)),ir=(0,It.i7)(Jn||(Jn=rr`
-  0% {
-    opacity: 1;
-    background-position: 0 -23px;
-  }
-
-  60% {
-    opacity: 0;
-    background-position: 0 -23px;
-  }
-
-  100% {
-    opacity: 1;
-    background-position: -200px -23px;
-  }
-`)),lr=(e,t)=>"inherit"===t?"currentColor":e.vars?e.vars.palette.LinearProgress[`${t}Bg`]:"light"===e.palette.mode?(0,H.a)(e.palette[t].main,.62):(0,H.e$)(e.palette[t].main,.5),sr=Ae("span",{name:"MuiLinearProgress",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[`color${W(n.color)}`],t[n.variant]]}})((e=>{let{ownerState:t,theme:n}=e;return(0,a.A)({position:"relative",overflow:"hidden",display:"block",height:4,zIndex:0,"@media print":{colorAdjust:"exact"},backgroundColor:lr(n,t.color)},"inherit"===t.color&&"buffer"!==t.variant&&{backgroundColor:"none","&::before":{content:'""',position:"absolute",left:0,top:0,right:0,bottom:0,backgroundColor:"currentColor",opacity:.3}},"buffer"===t.variant&&{backgroundColor:"transparent"},"query"===t.variant&&{transform:"rotate(180deg)"})})),ur=Ae("span",{name:"MuiLinearProgress",slot:"Dashed",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.dashed,t[`dashedColor${W(n.color)}`]]}})((e=>{let{ownerState:t,theme:n}=e;const r=lr(n,t.color);return(0,a.A)({position:"absolute",marginTop:0,height:"100%",width:"100%"},"inherit"===t.color&&{opacity:.3},{backgroundImage:`radial-gradient(${r} 0%, ${r} 16%, transparent 42%)`,backgroundSize:"10px 10px",backgroundPosition:"0 -23px"})}),(0,It.AH)(er||(er=rr`
-    animation: ${0} 3s infinite linear;
-  `),ir)),cr=Ae("span",{name:"MuiLinearProgress",slot:"Bar1",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.bar,t[`barColor${W(n.color)}`],("indeterminate"===n.variant||"query"===n.variant)&&t.bar1Indeterminate,"determinate"===n.variant&&t.bar1Determinate,"buffer"===n.variant&&t.bar1Buffer]}})((e=>{let{ownerState:t,theme:n}=e;return(0,a.A)({width:"100%",position:"absolute",left:0,bottom:0,top:0,transition:"transform 0.2s linear",transformOrigin:"left",backgroundColor:"inherit"===t.color?"currentColor":(n.vars||n).palette[t.color].main},"determinate"===t.variant&&{transition:"transform .4s linear"},"buffer"===t.variant&&{zIndex:1,transition:"transform .4s linear"})}),(e=>{let{ownerState:t}=e;return("indeterminate"===t.variant||"query"===t.variant)&&(0,It.AH)(tr||(tr=rr`
-      width: auto;
-      animation: ${0} 2.1s cubic-bezier(0.65, 0.815, 0.735, 0.395) infinite;
-    `),or)})),dr=Ae("span",{name:"MuiLinearProgress",slot:"Bar2",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.bar,t[`barColor${W(n.color)}`],("indeterminate"===n.variant||"query"===n.variant)&&t.bar2Indeterminate,"buffer"===n.variant&&t.bar2Buffer]}})((e=>{let{ownerState:t,theme:n}=e;return(0,a.A)({width:"100%",position:"absolute",left:0,bottom:0,top:0,transition:"transform 0.2s linear",transformOrigin:"left"},"buffer"!==t.variant&&{backgroundColor:"inherit"===t.color?"currentColor":(n.vars||n).palette[t.color].main},"inherit"===t.color&&{opacity:.3},"buffer"===t.variant&&{backgroundColor:lr(n,t.color),transition:"transform .4s linear"})}),(e=>{let{ownerState:t}=e;return("indeterminate"===t.variant||"query"===t.variant)&&(0,It.AH)(nr||(nr=rr`
-      width: auto;
-      animation: ${0} 2.1s cubic-bezier(0.165, 0.84, 0.44, 1) 1.15s infinite;
-    `),ar)})),pr=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiLinearProgress"}),{className:r,color:i="primary",value:s,valueBuffer:u,variant:c="indeterminate"}=n,d=(0,o.A)(n,Qn),f=(0,a.A)({},n,{color:i,variant:c}),m=(e=>{const{classes:t,variant:n,color:r}=e;return p({root:["root",`color${W(r)}`,n],dashed:["dashed",`dashedColor${W(r)}`],bar1:["bar",`barColor${W(r)}`,("indeterminate"===n||"query"===n)&&"bar1Indeterminate","determinate"===n&&"bar1Determinate","buffer"===n&&"bar1Buffer"],bar2:["bar","buffer"!==n&&`barColor${W(r)}`,"buffer"===n&&`color${W(r)}`,("indeterminate"===n||"query"===n)&&"bar2Indeterminate","buffer"===n&&"bar2Buffer"]},Gn,t)})(f),h=Xn(),v={},g={bar1:{},bar2:{}};if("determinate"===c||"buffer"===c)if(void 0!==s){v["aria-valuenow"]=Math.round(s),v["aria-valuemin"]=0,v["aria-valuemax"]=100;let e=s-100;h&&(e=-e),g.bar1.transform=`translateX(${e}%)`}else 0;if("buffer"===c)if(void 0!==u){let e=(u||0)-100;h&&(e=-e),g.bar2.transform=`translateX(${e}%)`}else 0;return(0,I.jsxs)(sr,(0,a.A)({className:l(m.root,r),ownerState:f,role:"progressbar"},v,{ref:t},d,{children:["buffer"===c?(0,I.jsx)(ur,{className:m.dashed,ownerState:f}):null,(0,I.jsx)(cr,{className:m.bar1,ownerState:f,style:g.bar1}),"determinate"===c?null:(0,I.jsx)(dr,{className:m.bar2,ownerState:f,style:g.bar2})]}))}));var fr=n(751);function mr(){const e=y(we);return e[Se]||e}const hr=e.createContext();function vr(e){return d("MuiGrid",e)}const gr=["auto",!0,1,2,3,4,5,6,7,8,9,10,11,12],br=ze("MuiGrid",["root","container","item","zeroMinWidth",...[0,1,2,3,4,5,6,7,8,9,10].map((e=>`spacing-xs-${e}`)),...["column-reverse","column","row-reverse","row"].map((e=>`direction-xs-${e}`)),...["nowrap","wrap-reverse","wrap"].map((e=>`wrap-xs-${e}`)),...gr.map((e=>`grid-xs-${e}`)),...gr.map((e=>`grid-sm-${e}`)),...gr.map((e=>`grid-md-${e}`)),...gr.map((e=>`grid-lg-${e}`)),...gr.map((e=>`grid-xl-${e}`))]),yr=br,xr=["className","columns","columnSpacing","component","container","direction","item","rowSpacing","spacing","wrap","zeroMinWidth"];function wr(e){const t=parseFloat(e);return`${t}${String(e).replace(String(t),"")||"px"}`}function Sr(e){let{breakpoints:t,values:n}=e,r="";Object.keys(n).forEach((e=>{""===r&&0!==n[e]&&(r=e)}));const o=Object.keys(t).sort(((e,n)=>t[e]-t[n]));return o.slice(0,o.indexOf(r))}const kr=Ae("div",{name:"MuiGrid",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e,{container:r,direction:o,item:a,spacing:i,wrap:l,zeroMinWidth:s,breakpoints:u}=n;let c=[];r&&(c=function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};if(!e||e<=0)return[];if("string"===typeof e&&!Number.isNaN(Number(e))||"number"===typeof e)return[n[`spacing-xs-${String(e)}`]];const r=[];return t.forEach((t=>{const o=e[t];Number(o)>0&&r.push(n[`spacing-${t}-${String(o)}`])})),r}(i,u,t));const d=[];return u.forEach((e=>{const r=n[e];r&&d.push(t[`grid-${e}-${String(r)}`])})),[t.root,r&&t.container,a&&t.item,s&&t.zeroMinWidth,...c,"row"!==o&&t[`direction-xs-${String(o)}`],"wrap"!==l&&t[`wrap-xs-${String(l)}`],...d]}})((e=>{let{ownerState:t}=e;return(0,a.A)({boxSizing:"border-box"},t.container&&{display:"flex",flexWrap:"wrap",width:"100%"},t.item&&{margin:0},t.zeroMinWidth&&{minWidth:0},"wrap"!==t.wrap&&{flexWrap:t.wrap})}),(function(e){let{theme:t,ownerState:n}=e;const r=(0,fr.kW)({values:n.direction,breakpoints:t.breakpoints.values});return(0,fr.NI)({theme:t},r,(e=>{const t={flexDirection:e};return 0===e.indexOf("column")&&(t[`& > .${yr.item}`]={maxWidth:"none"}),t}))}),(function(e){let{theme:t,ownerState:n}=e;const{container:r,rowSpacing:o}=n;let a={};if(r&&0!==o){const e=(0,fr.kW)({values:o,breakpoints:t.breakpoints.values});let n;"object"===typeof e&&(n=Sr({breakpoints:t.breakpoints.values,values:e})),a=(0,fr.NI)({theme:t},e,((e,r)=>{var o;const a=t.spacing(e);return"0px"!==a?{marginTop:`-${wr(a)}`,[`& > .${yr.item}`]:{paddingTop:wr(a)}}:null!=(o=n)&&o.includes(r)?{}:{marginTop:0,[`& > .${yr.item}`]:{paddingTop:0}}}))}return a}),(function(e){let{theme:t,ownerState:n}=e;const{container:r,columnSpacing:o}=n;let a={};if(r&&0!==o){const e=(0,fr.kW)({values:o,breakpoints:t.breakpoints.values});let n;"object"===typeof e&&(n=Sr({breakpoints:t.breakpoints.values,values:e})),a=(0,fr.NI)({theme:t},e,((e,r)=>{var o;const a=t.spacing(e);return"0px"!==a?{width:`calc(100% + ${wr(a)})`,marginLeft:`-${wr(a)}`,[`& > .${yr.item}`]:{paddingLeft:wr(a)}}:null!=(o=n)&&o.includes(r)?{}:{width:"100%",marginLeft:0,[`& > .${yr.item}`]:{paddingLeft:0}}}))}return a}),(function(e){let t,{theme:n,ownerState:r}=e;return n.breakpoints.keys.reduce(((e,o)=>{let i={};if(r[o]&&(t=r[o]),!t)return e;if(!0===t)i={flexBasis:0,flexGrow:1,maxWidth:"100%"};else if("auto"===t)i={flexBasis:"auto",flexGrow:0,flexShrink:0,maxWidth:"none",width:"auto"};else{const l=(0,fr.kW)({values:r.columns,breakpoints:n.breakpoints.values}),s="object"===typeof l?l[o]:l;if(void 0===s||null===s)return e;const u=Math.round(t/s*1e8)/1e6+"%";let c={};if(r.container&&r.item&&0!==r.columnSpacing){const e=n.spacing(r.columnSpacing);if("0px"!==e){const t=`calc(${u} + ${wr(e)})`;c={flexBasis:t,maxWidth:t}}}i=(0,a.A)({flexBasis:u,flexGrow:0,maxWidth:u},c)}return 0===n.breakpoints.values[o]?Object.assign(e,i):e[n.breakpoints.up(o)]=i,e}),{})}));const Cr=e=>{const{classes:t,container:n,direction:r,item:o,spacing:a,wrap:i,zeroMinWidth:l,breakpoints:s}=e;let u=[];n&&(u=function(e,t){if(!e||e<=0)return[];if("string"===typeof e&&!Number.isNaN(Number(e))||"number"===typeof e)return[`spacing-xs-${String(e)}`];const n=[];return t.forEach((t=>{const r=e[t];if(Number(r)>0){const e=`spacing-${t}-${String(r)}`;n.push(e)}})),n}(a,s));const c=[];s.forEach((t=>{const n=e[t];n&&c.push(`grid-${t}-${String(n)}`)}));return p({root:["root",n&&"container",o&&"item",l&&"zeroMinWidth",...u,"row"!==r&&`direction-xs-${String(r)}`,"wrap"!==i&&`wrap-xs-${String(i)}`,...c]},vr,t)},Ar=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiGrid"}),{breakpoints:i}=mr(),s=(0,$e.A)(r),{className:u,columns:c,columnSpacing:d,component:p="div",container:f=!1,direction:m="row",item:h=!1,rowSpacing:v,spacing:g=0,wrap:b="wrap",zeroMinWidth:y=!1}=s,x=(0,o.A)(s,xr),w=v||g,S=d||g,k=e.useContext(hr),C=f?c||12:k,A={},E=(0,a.A)({},x);i.keys.forEach((e=>{null!=x[e]&&(A[e]=x[e],delete E[e])}));const R=(0,a.A)({},s,{columns:C,container:f,direction:m,item:h,rowSpacing:w,columnSpacing:S,wrap:b,zeroMinWidth:y,spacing:g},A,{breakpoints:i.keys}),P=Cr(R);return(0,I.jsx)(hr.Provider,{value:C,children:(0,I.jsx)(kr,(0,a.A)({ownerState:R,className:l(P.root,u),as:p,ref:n},E))})}));const Er=Ar;function Rr(e){return d("MuiButton",e)}const Pr=ze("MuiButton",["root","text","textInherit","textPrimary","textSecondary","textSuccess","textError","textInfo","textWarning","outlined","outlinedInherit","outlinedPrimary","outlinedSecondary","outlinedSuccess","outlinedError","outlinedInfo","outlinedWarning","contained","containedInherit","containedPrimary","containedSecondary","containedSuccess","containedError","containedInfo","containedWarning","disableElevation","focusVisible","disabled","colorInherit","colorPrimary","colorSecondary","colorSuccess","colorError","colorInfo","colorWarning","textSizeSmall","textSizeMedium","textSizeLarge","outlinedSizeSmall","outlinedSizeMedium","outlinedSizeLarge","containedSizeSmall","containedSizeMedium","containedSizeLarge","sizeMedium","sizeSmall","sizeLarge","fullWidth","startIcon","endIcon","icon","iconSizeSmall","iconSizeMedium","iconSizeLarge"]);const Mr=e.createContext({});const Nr=e.createContext(void 0),$r=["children","color","component","className","disabled","disableElevation","disableFocusRipple","endIcon","focusVisibleClassName","fullWidth","size","startIcon","type","variant"],Tr=e=>(0,a.A)({},"small"===e.size&&{"& > *:nth-of-type(1)":{fontSize:18}},"medium"===e.size&&{"& > *:nth-of-type(1)":{fontSize:20}},"large"===e.size&&{"& > *:nth-of-type(1)":{fontSize:22}}),zr=Ae(tn,{shouldForwardProp:e=>Ce(e)||"classes"===e,name:"MuiButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,t[n.variant],t[`${n.variant}${W(n.color)}`],t[`size${W(n.size)}`],t[`${n.variant}Size${W(n.size)}`],"inherit"===n.color&&t.colorInherit,n.disableElevation&&t.disableElevation,n.fullWidth&&t.fullWidth]}})((e=>{let{theme:t,ownerState:n}=e;var r,o;const i="light"===t.palette.mode?t.palette.grey[300]:t.palette.grey[800],l="light"===t.palette.mode?t.palette.grey.A100:t.palette.grey[700];return(0,a.A)({},t.typography.button,{minWidth:64,padding:"6px 16px",borderRadius:(t.vars||t).shape.borderRadius,transition:t.transitions.create(["background-color","box-shadow","border-color","color"],{duration:t.transitions.duration.short}),"&:hover":(0,a.A)({textDecoration:"none",backgroundColor:t.vars?`rgba(${t.vars.palette.text.primaryChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,H.X4)(t.palette.text.primary,t.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},"text"===n.variant&&"inherit"!==n.color&&{backgroundColor:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,H.X4)(t.palette[n.color].main,t.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},"outlined"===n.variant&&"inherit"!==n.color&&{border:`1px solid ${(t.vars||t).palette[n.color].main}`,backgroundColor:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,H.X4)(t.palette[n.color].main,t.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},"contained"===n.variant&&{backgroundColor:t.vars?t.vars.palette.Button.inheritContainedHoverBg:l,boxShadow:(t.vars||t).shadows[4],"@media (hover: none)":{boxShadow:(t.vars||t).shadows[2],backgroundColor:(t.vars||t).palette.grey[300]}},"contained"===n.variant&&"inherit"!==n.color&&{backgroundColor:(t.vars||t).palette[n.color].dark,"@media (hover: none)":{backgroundColor:(t.vars||t).palette[n.color].main}}),"&:active":(0,a.A)({},"contained"===n.variant&&{boxShadow:(t.vars||t).shadows[8]}),[`&.${Pr.focusVisible}`]:(0,a.A)({},"contained"===n.variant&&{boxShadow:(t.vars||t).shadows[6]}),[`&.${Pr.disabled}`]:(0,a.A)({color:(t.vars||t).palette.action.disabled},"outlined"===n.variant&&{border:`1px solid ${(t.vars||t).palette.action.disabledBackground}`},"contained"===n.variant&&{color:(t.vars||t).palette.action.disabled,boxShadow:(t.vars||t).shadows[0],backgroundColor:(t.vars||t).palette.action.disabledBackground})},"text"===n.variant&&{padding:"6px 8px"},"text"===n.variant&&"inherit"!==n.color&&{color:(t.vars||t).palette[n.color].main},"outlined"===n.variant&&{padding:"5px 15px",border:"1px solid currentColor"},"outlined"===n.variant&&"inherit"!==n.color&&{color:(t.vars||t).palette[n.color].main,border:t.vars?`1px solid rgba(${t.vars.palette[n.color].mainChannel} / 0.5)`:`1px solid ${(0,H.X4)(t.palette[n.color].main,.5)}`},"contained"===n.variant&&{color:t.vars?t.vars.palette.text.primary:null==(r=(o=t.palette).getContrastText)?void 0:r.call(o,t.palette.grey[300]),backgroundColor:t.vars?t.vars.palette.Button.inheritContainedBg:i,boxShadow:(t.vars||t).shadows[2]},"contained"===n.variant&&"inherit"!==n.color&&{color:(t.vars||t).palette[n.color].contrastText,backgroundColor:(t.vars||t).palette[n.color].main},"inherit"===n.color&&{color:"inherit",borderColor:"currentColor"},"small"===n.size&&"text"===n.variant&&{padding:"4px 5px",fontSize:t.typography.pxToRem(13)},"large"===n.size&&"text"===n.variant&&{padding:"8px 11px",fontSize:t.typography.pxToRem(15)},"small"===n.size&&"outlined"===n.variant&&{padding:"3px 9px",fontSize:t.typography.pxToRem(13)},"large"===n.size&&"outlined"===n.variant&&{padding:"7px 21px",fontSize:t.typography.pxToRem(15)},"small"===n.size&&"contained"===n.variant&&{padding:"4px 10px",fontSize:t.typography.pxToRem(13)},"large"===n.size&&"contained"===n.variant&&{padding:"8px 22px",fontSize:t.typography.pxToRem(15)},n.fullWidth&&{width:"100%"})}),(e=>{let{ownerState:t}=e;return t.disableElevation&&{boxShadow:"none","&:hover":{boxShadow:"none"},[`&.${Pr.focusVisible}`]:{boxShadow:"none"},"&:active":{boxShadow:"none"},[`&.${Pr.disabled}`]:{boxShadow:"none"}}})),Or=Ae("span",{name:"MuiButton",slot:"StartIcon",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.startIcon,t[`iconSize${W(n.size)}`]]}})((e=>{let{ownerState:t}=e;return(0,a.A)({display:"inherit",marginRight:8,marginLeft:-4},"small"===t.size&&{marginLeft:-2},Tr(t))})),Ir=Ae("span",{name:"MuiButton",slot:"EndIcon",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.endIcon,t[`iconSize${W(n.size)}`]]}})((e=>{let{ownerState:t}=e;return(0,a.A)({display:"inherit",marginRight:-4,marginLeft:8},"small"===t.size&&{marginRight:-2},Tr(t))})),Lr=e.forwardRef((function(t,n){const r=e.useContext(Mr),i=e.useContext(Nr),s=Pe({props:m(r,t),name:"MuiButton"}),{children:u,color:c="primary",component:d="button",className:f,disabled:h=!1,disableElevation:v=!1,disableFocusRipple:g=!1,endIcon:b,focusVisibleClassName:y,fullWidth:x=!1,size:w="medium",startIcon:S,type:k,variant:C="text"}=s,A=(0,o.A)(s,$r),E=(0,a.A)({},s,{color:c,component:d,disabled:h,disableElevation:v,disableFocusRipple:g,fullWidth:x,size:w,type:k,variant:C}),R=(e=>{const{color:t,disableElevation:n,fullWidth:r,size:o,variant:i,classes:l}=e,s=p({root:["root",i,`${i}${W(t)}`,`size${W(o)}`,`${i}Size${W(o)}`,`color${W(t)}`,n&&"disableElevation",r&&"fullWidth"],label:["label"],startIcon:["icon","startIcon",`iconSize${W(o)}`],endIcon:["icon","endIcon",`iconSize${W(o)}`]},Rr,l);return(0,a.A)({},l,s)})(E),P=S&&(0,I.jsx)(Or,{className:R.startIcon,ownerState:E,children:S}),M=b&&(0,I.jsx)(Ir,{className:R.endIcon,ownerState:E,children:b}),N=i||"";return(0,I.jsxs)(zr,(0,a.A)({ownerState:E,className:l(r.className,R.root,f,N),component:d,disabled:h,focusRipple:!g,focusVisibleClassName:l(R.focusVisible,y),ref:n,type:k},A,{classes:R,children:[P,u,M]}))})),_r=fn((0,I.jsx)("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2m-2 15-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8z"}),"CheckCircle"),jr=fn((0,I.jsx)("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2m5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12z"}),"Cancel"),Fr=fn((0,I.jsx)("path",{d:"M15 12c2.21 0 4-1.79 4-4s-1.79-4-4-4-4 1.79-4 4 1.79 4 4 4m-9-2V7H4v3H1v2h3v3h2v-3h3v-2zm9 4c-2.67 0-8 1.34-8 4v2h16v-2c0-2.66-5.33-4-8-4"}),"PersonAdd");const Wr=function(e){let{event:t,onAddPerson:n}=e;const{data:r}=t;return r.recognized?(0,I.jsxs)(_e,{children:[(0,I.jsxs)(_e,{sx:{display:"flex",alignItems:"center",mb:2},children:[(0,I.jsx)(_r,{color:"success",sx:{fontSize:40,mr:2}}),(0,I.jsx)(Ve,{variant:"h5",children:"Access Granted"})]}),(0,I.jsxs)(Ve,{variant:"h6",gutterBottom:!0,children:["Welcome, ",r.person_name,"!"]}),(0,I.jsxs)(_e,{sx:{mt:2},children:[(0,I.jsx)(Ve,{variant:"body2",color:"text.secondary",gutterBottom:!0,children:"Confidence Score"}),(0,I.jsx)(pr,{variant:"determinate",value:100*r.confidence,sx:{height:10,borderRadius:5}}),(0,I.jsxs)(Ve,{variant:"body2",color:"text.secondary",sx:{mt:1},children:[(100*r.confidence).toFixed(1),"%"]})]})]}):(0,I.jsxs)(_e,{children:[(0,I.jsxs)(_e,{sx:{display:"flex",alignItems:"center",mb:2},children:[(0,I.jsx)(jr,{color:"error",sx:{fontSize:40,mr:2}}),(0,I.jsx)(Ve,{variant:"h5",children:"Unknown Face Detected"})]}),r.preview_image&&(0,I.jsx)(it,{sx:{p:1,mb:2,maxWidth:300,mx:"auto"},children:(0,I.jsx)("img",{src:`data:image/jpeg;base64,${r.preview_image}`,alt:"Detected face",style:{width:"100%",height:"auto"}})}),(0,I.jsxs)(Er,{container:!0,spacing:2,justifyContent:"center",children:[(0,I.jsx)(Er,{item:!0,children:(0,I.jsx)(Lr,{variant:"contained",color:"primary",startIcon:(0,I.jsx)(Fr,{}),onClick:n,children:"Add Person"})}),(0,I.jsx)(Er,{item:!0,children:(0,I.jsx)(Lr,{variant:"outlined",color:"error",startIcon:(0,I.jsx)(jr,{}),children:"Ignore"})})]})]})};let Dr=0;const Br=t["useId".toString()];function Vr(t){if(void 0!==Br){const e=Br();return null!=t?t:e}return function(t){const[n,r]=e.useState(t),o=t||n;return e.useEffect((()=>{null==n&&(Dr+=1,r(`mui-${Dr}`))}),[n]),o}(t)}const Ur=["elementType","externalSlotProps","ownerState","skipResolvingSlotProps"];const Hr=function(e){var t;const{elementType:n,externalSlotProps:r,ownerState:i,skipResolvingSlotProps:l=!1}=e,s=(0,o.A)(e,Ur),u=l?{}:Xe(r,i),{props:c,internalRef:d}=Ye((0,a.A)({},s,{externalSlotProps:u})),p=He(d,null==u?void 0:u.ref,null==(t=e.additionalProps)?void 0:t.ref);return qe(n,(0,a.A)({},c,{ref:p}),i)};function Kr(t){var n;return parseInt(e.version,10)>=19?(null==t||null==(n=t.props)?void 0:n.ref)||null:(null==t?void 0:t.ref)||null}function qr(e){return e&&e.ownerDocument||document}const Xr=["input","select","textarea","a[href]","button","[tabindex]","audio[controls]","video[controls]",'[contenteditable]:not([contenteditable="false"])'].join(",");function Gr(e){const t=[],n=[];return Array.from(e.querySelectorAll(Xr)).forEach(((e,r)=>{const o=function(e){const t=parseInt(e.getAttribute("tabindex")||"",10);return Number.isNaN(t)?"true"===e.contentEditable||("AUDIO"===e.nodeName||"VIDEO"===e.nodeName||"DETAILS"===e.nodeName)&&null===e.getAttribute("tabindex")?0:e.tabIndex:t}(e);-1!==o&&function(e){return!(e.disabled||"INPUT"===e.tagName&&"hidden"===e.type||function(e){if("INPUT"!==e.tagName||"radio"!==e.type)return!1;if(!e.name)return!1;const t=t=>e.ownerDocument.querySelector(`input[type="radio"]${t}`);let n=t(`[name="${e.name}"]:checked`);return n||(n=t(`[name="${e.name}"]`)),n!==e}(e))}(e)&&(0===o?t.push(e):n.push({documentOrder:r,tabIndex:o,node:e}))})),n.sort(((e,t)=>e.tabIndex===t.tabIndex?e.documentOrder-t.documentOrder:e.tabIndex-t.tabIndex)).map((e=>e.node)).concat(t)}function Qr(){return!0}const Yr=function(t){const{children:n,disableAutoFocus:r=!1,disableEnforceFocus:o=!1,disableRestoreFocus:a=!1,getTabbable:i=Gr,isEnabled:l=Qr,open:s}=t,u=e.useRef(!1),c=e.useRef(null),d=e.useRef(null),p=e.useRef(null),f=e.useRef(null),m=e.useRef(!1),h=e.useRef(null),v=He(Kr(n),h),g=e.useRef(null);e.useEffect((()=>{s&&h.current&&(m.current=!r)}),[r,s]),e.useEffect((()=>{if(!s||!h.current)return;const e=qr(h.current);return h.current.contains(e.activeElement)||(h.current.hasAttribute("tabIndex")||h.current.setAttribute("tabIndex","-1"),m.current&&h.current.focus()),()=>{a||(p.current&&p.current.focus&&(u.current=!0,p.current.focus()),p.current=null)}}),[s]),e.useEffect((()=>{if(!s||!h.current)return;const e=qr(h.current),t=t=>{g.current=t,!o&&l()&&"Tab"===t.key&&e.activeElement===h.current&&t.shiftKey&&(u.current=!0,d.current&&d.current.focus())},n=()=>{const t=h.current;if(null===t)return;if(!e.hasFocus()||!l()||u.current)return void(u.current=!1);if(t.contains(e.activeElement))return;if(o&&e.activeElement!==c.current&&e.activeElement!==d.current)return;if(e.activeElement!==f.current)f.current=null;else if(null!==f.current)return;if(!m.current)return;let n=[];if(e.activeElement!==c.current&&e.activeElement!==d.current||(n=i(h.current)),n.length>0){var r,a;const e=Boolean((null==(r=g.current)?void 0:r.shiftKey)&&"Tab"===(null==(a=g.current)?void 0:a.key)),t=n[0],o=n[n.length-1];"string"!==typeof t&&"string"!==typeof o&&(e?o.focus():t.focus())}else t.focus()};e.addEventListener("focusin",n),e.addEventListener("keydown",t,!0);const r=setInterval((()=>{e.activeElement&&"BODY"===e.activeElement.tagName&&n()}),50);return()=>{clearInterval(r),e.removeEventListener("focusin",n),e.removeEventListener("keydown",t,!0)}}),[r,o,a,l,s,i]);const b=e=>{null===p.current&&(p.current=e.relatedTarget),m.current=!0};return(0,I.jsxs)(e.Fragment,{children:[(0,I.jsx)("div",{tabIndex:s?0:-1,onFocus:b,ref:c,"data-testid":"sentinelStart"}),e.cloneElement(n,{ref:v,onFocus:e=>{null===p.current&&(p.current=e.relatedTarget),m.current=!0,f.current=e.target;const t=n.props.onFocus;t&&t(e)}}),(0,I.jsx)("div",{tabIndex:s?0:-1,onFocus:b,ref:d,"data-testid":"sentinelEnd"})]})};var Zr=n(950);const Jr=e.forwardRef((function(t,n){const{children:r,container:o,disablePortal:a=!1}=t,[i,l]=e.useState(null),s=He(e.isValidElement(r)?Kr(r):null,n);if(ct((()=>{a||l(function(e){return"function"===typeof e?e():e}(o)||document.body)}),[o,a]),ct((()=>{if(i&&!a)return Ue(n,i),()=>{Ue(n,null)}}),[n,i,a]),a){if(e.isValidElement(r)){const t={ref:s};return e.cloneElement(r,t)}return(0,I.jsx)(e.Fragment,{children:r})}return(0,I.jsx)(e.Fragment,{children:i?Zr.createPortal(r,i):i})})),eo=!1;var to="unmounted",no="exited",ro="entering",oo="entered",ao="exiting",io=function(t){function n(e,n){var r;r=t.call(this,e,n)||this;var o,a=n&&!n.isMounting?e.enter:e.appear;return r.appearStatus=null,e.in?a?(o=no,r.appearStatus=ro):o=oo:o=e.unmountOnExit||e.mountOnEnter?to:no,r.state={status:o},r.nextCallback=null,r}Rt(n,t),n.getDerivedStateFromProps=function(e,t){return e.in&&t.status===to?{status:no}:null};var r=n.prototype;return r.componentDidMount=function(){this.updateStatus(!0,this.appearStatus)},r.componentDidUpdate=function(e){var t=null;if(e!==this.props){var n=this.state.status;this.props.in?n!==ro&&n!==oo&&(t=ro):n!==ro&&n!==oo||(t=ao)}this.updateStatus(!1,t)},r.componentWillUnmount=function(){this.cancelNextCallback()},r.getTimeouts=function(){var e,t,n,r=this.props.timeout;return e=t=n=r,null!=r&&"number"!==typeof r&&(e=r.exit,t=r.enter,n=void 0!==r.appear?r.appear:t),{exit:e,enter:t,appear:n}},r.updateStatus=function(e,t){if(void 0===e&&(e=!1),null!==t)if(this.cancelNextCallback(),t===ro){if(this.props.unmountOnExit||this.props.mountOnEnter){var n=this.props.nodeRef?this.props.nodeRef.current:Zr.findDOMNode(this);n&&function(e){e.scrollTop}(n)}this.performEnter(e)}else this.performExit();else this.props.unmountOnExit&&this.state.status===no&&this.setState({status:to})},r.performEnter=function(e){var t=this,n=this.props.enter,r=this.context?this.context.isMounting:e,o=this.props.nodeRef?[r]:[Zr.findDOMNode(this),r],a=o[0],i=o[1],l=this.getTimeouts(),s=r?l.appear:l.enter;!e&&!n||eo?this.safeSetState({status:oo},(function(){t.props.onEntered(a)})):(this.props.onEnter(a,i),this.safeSetState({status:ro},(function(){t.props.onEntering(a,i),t.onTransitionEnd(s,(function(){t.safeSetState({status:oo},(function(){t.props.onEntered(a,i)}))}))})))},r.performExit=function(){var e=this,t=this.props.exit,n=this.getTimeouts(),r=this.props.nodeRef?void 0:Zr.findDOMNode(this);t&&!eo?(this.props.onExit(r),this.safeSetState({status:ao},(function(){e.props.onExiting(r),e.onTransitionEnd(n.exit,(function(){e.safeSetState({status:no},(function(){e.props.onExited(r)}))}))}))):this.safeSetState({status:no},(function(){e.props.onExited(r)}))},r.cancelNextCallback=function(){null!==this.nextCallback&&(this.nextCallback.cancel(),this.nextCallback=null)},r.safeSetState=function(e,t){t=this.setNextCallback(t),this.setState(e,t)},r.setNextCallback=function(e){var t=this,n=!0;return this.nextCallback=function(r){n&&(n=!1,t.nextCallback=null,e(r))},this.nextCallback.cancel=function(){n=!1},this.nextCallback},r.onTransitionEnd=function(e,t){this.setNextCallback(t);var n=this.props.nodeRef?this.props.nodeRef.current:Zr.findDOMNode(this),r=null==e&&!this.props.addEndListener;if(n&&!r){if(this.props.addEndListener){var o=this.props.nodeRef?[this.nextCallback]:[n,this.nextCallback],a=o[0],i=o[1];this.props.addEndListener(a,i)}null!=e&&setTimeout(this.nextCallback,e)}else setTimeout(this.nextCallback,0)},r.render=function(){var t=this.state.status;if(t===to)return null;var n=this.props,r=n.children,a=(n.in,n.mountOnEnter,n.unmountOnExit,n.appear,n.enter,n.exit,n.timeout,n.addEndListener,n.onEnter,n.onEntering,n.onEntered,n.onExit,n.onExiting,n.onExited,n.nodeRef,(0,o.A)(n,["children","in","mountOnEnter","unmountOnExit","appear","enter","exit","timeout","addEndListener","onEnter","onEntering","onEntered","onExit","onExiting","onExited","nodeRef"]));return e.createElement(Pt.Provider,{value:null},"function"===typeof r?r(t,a):e.cloneElement(e.Children.only(r),a))},n}(e.Component);function lo(){}io.contextType=Pt,io.propTypes={},io.defaultProps={in:!1,mountOnEnter:!1,unmountOnExit:!1,appear:!1,enter:!0,exit:!0,onEnter:lo,onEntering:lo,onEntered:lo,onExit:lo,onExiting:lo,onExited:lo},io.UNMOUNTED=to,io.EXITED=no,io.ENTERING=ro,io.ENTERED=oo,io.EXITING=ao;const so=io,uo=e=>e.scrollTop;function co(e,t){var n,r;const{timeout:o,easing:a,style:i={}}=e;return{duration:null!=(n=i.transitionDuration)?n:"number"===typeof o?o:o[t.mode]||0,easing:null!=(r=i.transitionTimingFunction)?r:"object"===typeof a?a[t.mode]:a,delay:i.transitionDelay}}const po=["addEndListener","appear","children","easing","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","timeout","TransitionComponent"],fo={entering:{opacity:1},entered:{opacity:1}},mo=e.forwardRef((function(t,n){const r=mr(),i={enter:r.transitions.duration.enteringScreen,exit:r.transitions.duration.leavingScreen},{addEndListener:l,appear:s=!0,children:u,easing:c,in:d,onEnter:p,onEntered:f,onEntering:m,onExit:h,onExited:v,onExiting:g,style:b,timeout:y=i,TransitionComponent:x=so}=t,w=(0,o.A)(t,po),S=e.useRef(null),k=ut(S,Kr(u),n),C=e=>t=>{if(e){const n=S.current;void 0===t?e(n):e(n,t)}},A=C(m),E=C(((e,t)=>{uo(e);const n=co({style:b,timeout:y,easing:c},{mode:"enter"});e.style.webkitTransition=r.transitions.create("opacity",n),e.style.transition=r.transitions.create("opacity",n),p&&p(e,t)})),R=C(f),P=C(g),M=C((e=>{const t=co({style:b,timeout:y,easing:c},{mode:"exit"});e.style.webkitTransition=r.transitions.create("opacity",t),e.style.transition=r.transitions.create("opacity",t),h&&h(e)})),N=C(v);return(0,I.jsx)(x,(0,a.A)({appear:s,in:d,nodeRef:S,onEnter:E,onEntered:R,onEntering:A,onExit:M,onExited:N,onExiting:P,addEndListener:e=>{l&&l(S.current,e)},timeout:y},w,{children:(t,n)=>e.cloneElement(u,(0,a.A)({style:(0,a.A)({opacity:0,visibility:"exited"!==t||d?void 0:"hidden"},fo[t],b,u.props.style),ref:k},n))}))})),ho=mo;function vo(e){return d("MuiBackdrop",e)}ze("MuiBackdrop",["root","invisible"]);const go=["children","className","component","components","componentsProps","invisible","open","slotProps","slots","TransitionComponent","transitionDuration"],bo=Ae("div",{name:"MuiBackdrop",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.invisible&&t.invisible]}})((e=>{let{ownerState:t}=e;return(0,a.A)({position:"fixed",display:"flex",alignItems:"center",justifyContent:"center",right:0,bottom:0,top:0,left:0,backgroundColor:"rgba(0, 0, 0, 0.5)",WebkitTapHighlightColor:"transparent"},t.invisible&&{backgroundColor:"transparent"})})),yo=e.forwardRef((function(e,t){var n,r,i;const s=Pe({props:e,name:"MuiBackdrop"}),{children:u,className:c,component:d="div",components:f={},componentsProps:m={},invisible:h=!1,open:v,slotProps:g={},slots:b={},TransitionComponent:y=ho,transitionDuration:x}=s,w=(0,o.A)(s,go),S=(0,a.A)({},s,{component:d,invisible:h}),k=(e=>{const{classes:t,invisible:n}=e;return p({root:["root",n&&"invisible"]},vo,t)})(S),C=null!=(n=g.root)?n:m.root;return(0,I.jsx)(y,(0,a.A)({in:v,timeout:x},w,{children:(0,I.jsx)(bo,(0,a.A)({"aria-hidden":!0},C,{as:null!=(r=null!=(i=b.root)?i:f.Root)?r:d,className:l(k.root,c,null==C?void 0:C.className),ownerState:(0,a.A)({},S,null==C?void 0:C.ownerState),classes:k,ref:t,children:u}))}))}));function xo(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.reduce(((e,t)=>null==t?e:function(){for(var n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];e.apply(this,r),t.apply(this,r)}),(()=>{}))}function wo(e){return qr(e).defaultView||window}function So(e){const t=e.documentElement.clientWidth;return Math.abs(window.innerWidth-t)}function ko(e,t){t?e.setAttribute("aria-hidden","true"):e.removeAttribute("aria-hidden")}function Co(e){return parseInt(wo(e).getComputedStyle(e).paddingRight,10)||0}function Ao(e,t,n,r,o){const a=[t,n,...r];[].forEach.call(e.children,(e=>{const t=-1===a.indexOf(e),n=!function(e){const t=-1!==["TEMPLATE","SCRIPT","STYLE","LINK","MAP","META","NOSCRIPT","PICTURE","COL","COLGROUP","PARAM","SLOT","SOURCE","TRACK"].indexOf(e.tagName),n="INPUT"===e.tagName&&"hidden"===e.getAttribute("type");return t||n}(e);t&&n&&ko(e,o)}))}function Eo(e,t){let n=-1;return e.some(((e,r)=>!!t(e)&&(n=r,!0))),n}function Ro(e,t){const n=[],r=e.container;if(!t.disableScrollLock){if(function(e){const t=qr(e);return t.body===e?wo(e).innerWidth>t.documentElement.clientWidth:e.scrollHeight>e.clientHeight}(r)){const e=So(qr(r));n.push({value:r.style.paddingRight,property:"padding-right",el:r}),r.style.paddingRight=`${Co(r)+e}px`;const t=qr(r).querySelectorAll(".mui-fixed");[].forEach.call(t,(t=>{n.push({value:t.style.paddingRight,property:"padding-right",el:t}),t.style.paddingRight=`${Co(t)+e}px`}))}let e;if(r.parentNode instanceof DocumentFragment)e=qr(r).body;else{const t=r.parentElement,n=wo(r);e="HTML"===(null==t?void 0:t.nodeName)&&"scroll"===n.getComputedStyle(t).overflowY?t:r}n.push({value:e.style.overflow,property:"overflow",el:e},{value:e.style.overflowX,property:"overflow-x",el:e},{value:e.style.overflowY,property:"overflow-y",el:e}),e.style.overflow="hidden"}return()=>{n.forEach((e=>{let{value:t,el:n,property:r}=e;t?n.style.setProperty(r,t):n.style.removeProperty(r)}))}}const Po=new class{constructor(){this.containers=void 0,this.modals=void 0,this.modals=[],this.containers=[]}add(e,t){let n=this.modals.indexOf(e);if(-1!==n)return n;n=this.modals.length,this.modals.push(e),e.modalRef&&ko(e.modalRef,!1);const r=function(e){const t=[];return[].forEach.call(e.children,(e=>{"true"===e.getAttribute("aria-hidden")&&t.push(e)})),t}(t);Ao(t,e.mount,e.modalRef,r,!0);const o=Eo(this.containers,(e=>e.container===t));return-1!==o?(this.containers[o].modals.push(e),n):(this.containers.push({modals:[e],container:t,restore:null,hiddenSiblings:r}),n)}mount(e,t){const n=Eo(this.containers,(t=>-1!==t.modals.indexOf(e))),r=this.containers[n];r.restore||(r.restore=Ro(r,t))}remove(e){let t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];const n=this.modals.indexOf(e);if(-1===n)return n;const r=Eo(this.containers,(t=>-1!==t.modals.indexOf(e))),o=this.containers[r];if(o.modals.splice(o.modals.indexOf(e),1),this.modals.splice(n,1),0===o.modals.length)o.restore&&o.restore(),e.modalRef&&ko(e.modalRef,t),Ao(o.container,e.mount,e.modalRef,o.hiddenSiblings,!1),this.containers.splice(r,1);else{const e=o.modals[o.modals.length-1];e.modalRef&&ko(e.modalRef,!1)}return n}isTopModal(e){return this.modals.length>0&&this.modals[this.modals.length-1]===e}};const Mo=function(t){const{container:n,disableEscapeKeyDown:r=!1,disableScrollLock:o=!1,manager:i=Po,closeAfterTransition:l=!1,onTransitionEnter:s,onTransitionExited:u,children:c,onClose:d,open:p,rootRef:f}=t,m=e.useRef({}),h=e.useRef(null),v=e.useRef(null),g=He(v,f),[b,y]=e.useState(!p),x=function(e){return!!e&&e.props.hasOwnProperty("in")}(c);let w=!0;"false"!==t["aria-hidden"]&&!1!==t["aria-hidden"]||(w=!1);const S=()=>(m.current.modalRef=v.current,m.current.mount=h.current,m.current),k=()=>{i.mount(S(),{disableScrollLock:o}),v.current&&(v.current.scrollTop=0)},C=dt((()=>{const e=function(e){return"function"===typeof e?e():e}(n)||qr(h.current).body;i.add(S(),e),v.current&&k()})),A=e.useCallback((()=>i.isTopModal(S())),[i]),E=dt((e=>{h.current=e,e&&(p&&A()?k():v.current&&ko(v.current,w))})),R=e.useCallback((()=>{i.remove(S(),w)}),[w,i]);e.useEffect((()=>()=>{R()}),[R]),e.useEffect((()=>{p?C():x&&l||R()}),[p,R,x,l,C]);const P=e=>t=>{var n;null==(n=e.onKeyDown)||n.call(e,t),"Escape"===t.key&&229!==t.which&&A()&&(r||(t.stopPropagation(),d&&d(t,"escapeKeyDown")))},M=e=>t=>{var n;null==(n=e.onClick)||n.call(e,t),t.target===t.currentTarget&&d&&d(t,"backdropClick")};return{getRootProps:function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const n=Ge(t);delete n.onTransitionEnter,delete n.onTransitionExited;const r=(0,a.A)({},n,e);return(0,a.A)({role:"presentation"},r,{onKeyDown:P(r),ref:g})},getBackdropProps:function(){const e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return(0,a.A)({"aria-hidden":!0},e,{onClick:M(e),open:p})},getTransitionProps:()=>({onEnter:xo((()=>{y(!1),s&&s()}),null==c?void 0:c.props.onEnter),onExited:xo((()=>{y(!0),u&&u(),l&&R()}),null==c?void 0:c.props.onExited)}),rootRef:g,portalRef:E,isTopModal:A,exited:b,hasTransition:x}};function No(e){return d("MuiModal",e)}ze("MuiModal",["root","hidden","backdrop"]);const $o=["BackdropComponent","BackdropProps","classes","className","closeAfterTransition","children","container","component","components","componentsProps","disableAutoFocus","disableEnforceFocus","disableEscapeKeyDown","disablePortal","disableRestoreFocus","disableScrollLock","hideBackdrop","keepMounted","onBackdropClick","onClose","onTransitionEnter","onTransitionExited","open","slotProps","slots","theme"],To=Ae("div",{name:"MuiModal",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,!n.open&&n.exited&&t.hidden]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({position:"fixed",zIndex:(t.vars||t).zIndex.modal,right:0,bottom:0,top:0,left:0},!n.open&&n.exited&&{visibility:"hidden"})})),zo=Ae(yo,{name:"MuiModal",slot:"Backdrop",overridesResolver:(e,t)=>t.backdrop})({zIndex:-1}),Oo=e.forwardRef((function(t,n){var r,i,s,u,c,d;const f=Pe({name:"MuiModal",props:t}),{BackdropComponent:m=zo,BackdropProps:h,className:v,closeAfterTransition:g=!1,children:b,container:y,component:x,components:w={},componentsProps:S={},disableAutoFocus:k=!1,disableEnforceFocus:C=!1,disableEscapeKeyDown:A=!1,disablePortal:E=!1,disableRestoreFocus:R=!1,disableScrollLock:P=!1,hideBackdrop:M=!1,keepMounted:N=!1,onBackdropClick:$,open:T,slotProps:z,slots:O}=f,L=(0,o.A)(f,$o),_=(0,a.A)({},f,{closeAfterTransition:g,disableAutoFocus:k,disableEnforceFocus:C,disableEscapeKeyDown:A,disablePortal:E,disableRestoreFocus:R,disableScrollLock:P,hideBackdrop:M,keepMounted:N}),{getRootProps:j,getBackdropProps:F,getTransitionProps:W,portalRef:D,isTopModal:B,exited:V,hasTransition:U}=Mo((0,a.A)({},_,{rootRef:n})),H=(0,a.A)({},_,{exited:V}),K=(e=>{const{open:t,exited:n,classes:r}=e;return p({root:["root",!t&&n&&"hidden"],backdrop:["backdrop"]},No,r)})(H),q={};if(void 0===b.props.tabIndex&&(q.tabIndex="-1"),U){const{onEnter:e,onExited:t}=W();q.onEnter=e,q.onExited=t}const X=null!=(r=null!=(i=null==O?void 0:O.root)?i:w.Root)?r:To,G=null!=(s=null!=(u=null==O?void 0:O.backdrop)?u:w.Backdrop)?s:m,Q=null!=(c=null==z?void 0:z.root)?c:S.root,Y=null!=(d=null==z?void 0:z.backdrop)?d:S.backdrop,Z=Hr({elementType:X,externalSlotProps:Q,externalForwardedProps:L,getSlotProps:j,additionalProps:{ref:n,as:x},ownerState:H,className:l(v,null==Q?void 0:Q.className,null==K?void 0:K.root,!H.open&&H.exited&&(null==K?void 0:K.hidden))}),J=Hr({elementType:G,externalSlotProps:Y,additionalProps:h,getSlotProps:e=>F((0,a.A)({},e,{onClick:t=>{$&&$(t),null!=e&&e.onClick&&e.onClick(t)}})),className:l(null==Y?void 0:Y.className,null==h?void 0:h.className,null==K?void 0:K.backdrop),ownerState:H});return N||T||U&&!V?(0,I.jsx)(Jr,{ref:D,container:y,disablePortal:E,children:(0,I.jsxs)(X,(0,a.A)({},Z,{children:[!M&&m?(0,I.jsx)(G,(0,a.A)({},J)):null,(0,I.jsx)(Yr,{disableEnforceFocus:C,disableAutoFocus:k,disableRestoreFocus:R,isEnabled:B,open:T,children:e.cloneElement(b,q)})]}))}):null})),Io=Oo;function Lo(e){return d("MuiDialog",e)}const _o=ze("MuiDialog",["root","scrollPaper","scrollBody","container","paper","paperScrollPaper","paperScrollBody","paperWidthFalse","paperWidthXs","paperWidthSm","paperWidthMd","paperWidthLg","paperWidthXl","paperFullWidth","paperFullScreen"]);const jo=e.createContext({}),Fo=["aria-describedby","aria-labelledby","BackdropComponent","BackdropProps","children","className","disableEscapeKeyDown","fullScreen","fullWidth","maxWidth","onBackdropClick","onClick","onClose","open","PaperComponent","PaperProps","scroll","TransitionComponent","transitionDuration","TransitionProps"],Wo=Ae(yo,{name:"MuiDialog",slot:"Backdrop",overrides:(e,t)=>t.backdrop})({zIndex:-1}),Do=Ae(Io,{name:"MuiDialog",slot:"Root",overridesResolver:(e,t)=>t.root})({"@media print":{position:"absolute !important"}}),Bo=Ae("div",{name:"MuiDialog",slot:"Container",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.container,t[`scroll${W(n.scroll)}`]]}})((e=>{let{ownerState:t}=e;return(0,a.A)({height:"100%","@media print":{height:"auto"},outline:0},"paper"===t.scroll&&{display:"flex",justifyContent:"center",alignItems:"center"},"body"===t.scroll&&{overflowY:"auto",overflowX:"hidden",textAlign:"center","&::after":{content:'""',display:"inline-block",verticalAlign:"middle",height:"100%",width:"0"}})})),Vo=Ae(it,{name:"MuiDialog",slot:"Paper",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.paper,t[`scrollPaper${W(n.scroll)}`],t[`paperWidth${W(String(n.maxWidth))}`],n.fullWidth&&t.paperFullWidth,n.fullScreen&&t.paperFullScreen]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({margin:32,position:"relative",overflowY:"auto","@media print":{overflowY:"visible",boxShadow:"none"}},"paper"===n.scroll&&{display:"flex",flexDirection:"column",maxHeight:"calc(100% - 64px)"},"body"===n.scroll&&{display:"inline-block",verticalAlign:"middle",textAlign:"left"},!n.maxWidth&&{maxWidth:"calc(100% - 64px)"},"xs"===n.maxWidth&&{maxWidth:"px"===t.breakpoints.unit?Math.max(t.breakpoints.values.xs,444):`max(${t.breakpoints.values.xs}${t.breakpoints.unit}, 444px)`,[`&.${_o.paperScrollBody}`]:{[t.breakpoints.down(Math.max(t.breakpoints.values.xs,444)+64)]:{maxWidth:"calc(100% - 64px)"}}},n.maxWidth&&"xs"!==n.maxWidth&&{maxWidth:`${t.breakpoints.values[n.maxWidth]}${t.breakpoints.unit}`,[`&.${_o.paperScrollBody}`]:{[t.breakpoints.down(t.breakpoints.values[n.maxWidth]+64)]:{maxWidth:"calc(100% - 64px)"}}},n.fullWidth&&{width:"calc(100% - 64px)"},n.fullScreen&&{margin:0,width:"100%",maxWidth:"100%",height:"100%",maxHeight:"none",borderRadius:0,[`&.${_o.paperScrollBody}`]:{margin:0,maxWidth:"100%"}})})),Uo=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiDialog"}),i=mr(),s={enter:i.transitions.duration.enteringScreen,exit:i.transitions.duration.leavingScreen},{"aria-describedby":u,"aria-labelledby":c,BackdropComponent:d,BackdropProps:f,children:m,className:h,disableEscapeKeyDown:v=!1,fullScreen:g=!1,fullWidth:b=!1,maxWidth:y="sm",onBackdropClick:x,onClick:w,onClose:S,open:k,PaperComponent:C=it,PaperProps:A={},scroll:E="paper",TransitionComponent:R=ho,transitionDuration:P=s,TransitionProps:M}=r,N=(0,o.A)(r,Fo),$=(0,a.A)({},r,{disableEscapeKeyDown:v,fullScreen:g,fullWidth:b,maxWidth:y,scroll:E}),T=(e=>{const{classes:t,scroll:n,maxWidth:r,fullWidth:o,fullScreen:a}=e;return p({root:["root"],container:["container",`scroll${W(n)}`],paper:["paper",`paperScroll${W(n)}`,`paperWidth${W(String(r))}`,o&&"paperFullWidth",a&&"paperFullScreen"]},Lo,t)})($),z=e.useRef(),O=Vr(c),L=e.useMemo((()=>({titleId:O})),[O]);return(0,I.jsx)(Do,(0,a.A)({className:l(T.root,h),closeAfterTransition:!0,components:{Backdrop:Wo},componentsProps:{backdrop:(0,a.A)({transitionDuration:P,as:d},f)},disableEscapeKeyDown:v,onClose:S,open:k,ref:n,onClick:e=>{w&&w(e),z.current&&(z.current=null,x&&x(e),S&&S(e,"backdropClick"))},ownerState:$},N,{children:(0,I.jsx)(R,(0,a.A)({appear:!0,in:k,timeout:P,role:"presentation"},M,{children:(0,I.jsx)(Bo,{className:l(T.container),onMouseDown:e=>{z.current=e.target===e.currentTarget},ownerState:$,children:(0,I.jsx)(Vo,(0,a.A)({as:C,elevation:24,role:"dialog","aria-describedby":u,"aria-labelledby":O},A,{className:l(T.paper,A.className),ownerState:$,children:(0,I.jsx)(jo.Provider,{value:L,children:m})}))})}))}))}));function Ho(e){return d("MuiDialogTitle",e)}const Ko=ze("MuiDialogTitle",["root"]),qo=["className","id"],Xo=Ae(Ve,{name:"MuiDialogTitle",slot:"Root",overridesResolver:(e,t)=>t.root})({padding:"16px 24px",flex:"0 0 auto"}),Go=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiDialogTitle"}),{className:i,id:s}=r,u=(0,o.A)(r,qo),c=r,d=(e=>{const{classes:t}=e;return p({root:["root"]},Ho,t)})(c),{titleId:f=s}=e.useContext(jo);return(0,I.jsx)(Xo,(0,a.A)({component:"h2",className:l(d.root,i),ownerState:c,ref:n,variant:"h6",id:null!=s?s:f},u))}));function Qo(e){return d("MuiDialogContent",e)}ze("MuiDialogContent",["root","dividers"]);const Yo=["className","dividers"],Zo=Ae("div",{name:"MuiDialogContent",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.dividers&&t.dividers]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({flex:"1 1 auto",WebkitOverflowScrolling:"touch",overflowY:"auto",padding:"20px 24px"},n.dividers?{padding:"16px 24px",borderTop:`1px solid ${(t.vars||t).palette.divider}`,borderBottom:`1px solid ${(t.vars||t).palette.divider}`}:{[`.${Ko.root} + &`]:{paddingTop:0}})})),Jo=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiDialogContent"}),{className:r,dividers:i=!1}=n,s=(0,o.A)(n,Yo),u=(0,a.A)({},n,{dividers:i}),c=(e=>{const{classes:t,dividers:n}=e;return p({root:["root",n&&"dividers"]},Qo,t)})(u);return(0,I.jsx)(Zo,(0,a.A)({className:l(c.root,r),ownerState:u,ref:t},s))}));function ea(e){let t,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:166;function r(){for(var r=arguments.length,o=new Array(r),a=0;a<r;a++)o[a]=arguments[a];clearTimeout(t),t=setTimeout((()=>{e.apply(this,o)}),n)}return r.clear=()=>{clearTimeout(t)},r}const ta=["onChange","maxRows","minRows","style","value"];function na(e){return parseInt(e,10)||0}const ra={visibility:"hidden",position:"absolute",overflow:"hidden",height:0,top:0,left:0,transform:"translateZ(0)"};function oa(e){return function(e){for(const t in e)return!1;return!0}(e)||0===e.outerHeightStyle&&!e.overflowing}const aa=e.forwardRef((function(t,n){const{onChange:r,maxRows:i,minRows:l=1,style:s,value:u}=t,c=(0,o.A)(t,ta),{current:d}=e.useRef(null!=u),p=e.useRef(null),f=He(n,p),m=e.useRef(null),h=e.useRef(null),v=e.useCallback((()=>{const e=p.current,n=h.current;if(!e||!n)return;const r=wo(e).getComputedStyle(e);if("0px"===r.width)return{outerHeightStyle:0,overflowing:!1};n.style.width=r.width,n.value=e.value||t.placeholder||"x","\n"===n.value.slice(-1)&&(n.value+=" ");const o=r.boxSizing,a=na(r.paddingBottom)+na(r.paddingTop),s=na(r.borderBottomWidth)+na(r.borderTopWidth),u=n.scrollHeight;n.value="x";const c=n.scrollHeight;let d=u;l&&(d=Math.max(Number(l)*c,d)),i&&(d=Math.min(Number(i)*c,d)),d=Math.max(d,c);return{outerHeightStyle:d+("border-box"===o?a+s:0),overflowing:Math.abs(d-u)<=1}}),[i,l,t.placeholder]),g=dt((()=>{const e=p.current,t=v();if(!e||!t||oa(t))return!1;const n=t.outerHeightStyle;return null!=m.current&&m.current!==n})),b=e.useCallback((()=>{const e=p.current,t=v();if(!e||!t||oa(t))return;const n=t.outerHeightStyle;m.current!==n&&(m.current=n,e.style.height=`${n}px`),e.style.overflow=t.overflowing?"hidden":""}),[v]),y=e.useRef(-1);ct((()=>{const e=ea(b),t=null==p?void 0:p.current;if(!t)return;const n=wo(t);let r;return n.addEventListener("resize",e),"undefined"!==typeof ResizeObserver&&(r=new ResizeObserver((()=>{g()&&(r.unobserve(t),cancelAnimationFrame(y.current),b(),y.current=requestAnimationFrame((()=>{r.observe(t)})))})),r.observe(t)),()=>{e.clear(),cancelAnimationFrame(y.current),n.removeEventListener("resize",e),r&&r.disconnect()}}),[v,b,g]),ct((()=>{b()}));return(0,I.jsxs)(e.Fragment,{children:[(0,I.jsx)("textarea",(0,a.A)({value:u,onChange:e=>{d||b(),r&&r(e)},ref:f,rows:l,style:s},c)),(0,I.jsx)("textarea",{"aria-hidden":!0,className:t.className,readOnly:!0,ref:h,tabIndex:-1,style:(0,a.A)({},ra,s,{paddingTop:0,paddingBottom:0})})]})})),ia=aa;function la(e){let{props:t,states:n,muiFormControl:r}=e;return n.reduce(((e,n)=>(e[n]=t[n],r&&"undefined"===typeof t[n]&&(e[n]=r[n]),e)),{})}const sa=e.createContext(void 0);function ua(){return e.useContext(sa)}const ca=ct;var da=n(869);const pa=function(e){let{styles:t,themeId:n,defaultTheme:r={}}=e;const o=y(r),a="function"===typeof t?t(n&&o[n]||o):t;return(0,I.jsx)(da.A,{styles:a})};const fa=function(e){return(0,I.jsx)(pa,(0,a.A)({},e,{defaultTheme:we,themeId:Se}))};function ma(e){return null!=e&&!(Array.isArray(e)&&0===e.length)}function ha(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];return e&&(ma(e.value)&&""!==e.value||t&&ma(e.defaultValue)&&""!==e.defaultValue)}function va(e){return d("MuiInputBase",e)}const ga=ze("MuiInputBase",["root","formControl","focused","disabled","adornedStart","adornedEnd","error","sizeSmall","multiline","colorSecondary","fullWidth","hiddenLabel","readOnly","input","inputSizeSmall","inputMultiline","inputTypeSearch","inputAdornedStart","inputAdornedEnd","inputHiddenLabel"]),ba=["aria-describedby","autoComplete","autoFocus","className","color","components","componentsProps","defaultValue","disabled","disableInjectingGlobalStyles","endAdornment","error","fullWidth","id","inputComponent","inputProps","inputRef","margin","maxRows","minRows","multiline","name","onBlur","onChange","onClick","onFocus","onKeyDown","onKeyUp","placeholder","readOnly","renderSuffix","rows","size","slotProps","slots","startAdornment","type","value"],ya=(e,t)=>{const{ownerState:n}=e;return[t.root,n.formControl&&t.formControl,n.startAdornment&&t.adornedStart,n.endAdornment&&t.adornedEnd,n.error&&t.error,"small"===n.size&&t.sizeSmall,n.multiline&&t.multiline,n.color&&t[`color${W(n.color)}`],n.fullWidth&&t.fullWidth,n.hiddenLabel&&t.hiddenLabel]},xa=(e,t)=>{const{ownerState:n}=e;return[t.input,"small"===n.size&&t.inputSizeSmall,n.multiline&&t.inputMultiline,"search"===n.type&&t.inputTypeSearch,n.startAdornment&&t.inputAdornedStart,n.endAdornment&&t.inputAdornedEnd,n.hiddenLabel&&t.inputHiddenLabel]},wa=Ae("div",{name:"MuiInputBase",slot:"Root",overridesResolver:ya})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({},t.typography.body1,{color:(t.vars||t).palette.text.primary,lineHeight:"1.4375em",boxSizing:"border-box",position:"relative",cursor:"text",display:"inline-flex",alignItems:"center",[`&.${ga.disabled}`]:{color:(t.vars||t).palette.text.disabled,cursor:"default"}},n.multiline&&(0,a.A)({padding:"4px 0 5px"},"small"===n.size&&{paddingTop:1}),n.fullWidth&&{width:"100%"})})),Sa=Ae("input",{name:"MuiInputBase",slot:"Input",overridesResolver:xa})((e=>{let{theme:t,ownerState:n}=e;const r="light"===t.palette.mode,o=(0,a.A)({color:"currentColor"},t.vars?{opacity:t.vars.opacity.inputPlaceholder}:{opacity:r?.42:.5},{transition:t.transitions.create("opacity",{duration:t.transitions.duration.shorter})}),i={opacity:"0 !important"},l=t.vars?{opacity:t.vars.opacity.inputPlaceholder}:{opacity:r?.42:.5};return(0,a.A)({font:"inherit",letterSpacing:"inherit",color:"currentColor",padding:"4px 0 5px",border:0,boxSizing:"content-box",background:"none",height:"1.4375em",margin:0,WebkitTapHighlightColor:"transparent",display:"block",minWidth:0,width:"100%",animationName:"mui-auto-fill-cancel",animationDuration:"10ms","&::-webkit-input-placeholder":o,"&::-moz-placeholder":o,"&:-ms-input-placeholder":o,"&::-ms-input-placeholder":o,"&:focus":{outline:0},"&:invalid":{boxShadow:"none"},"&::-webkit-search-decoration":{WebkitAppearance:"none"},[`label[data-shrink=false] + .${ga.formControl} &`]:{"&::-webkit-input-placeholder":i,"&::-moz-placeholder":i,"&:-ms-input-placeholder":i,"&::-ms-input-placeholder":i,"&:focus::-webkit-input-placeholder":l,"&:focus::-moz-placeholder":l,"&:focus:-ms-input-placeholder":l,"&:focus::-ms-input-placeholder":l},[`&.${ga.disabled}`]:{opacity:1,WebkitTextFillColor:(t.vars||t).palette.text.disabled},"&:-webkit-autofill":{animationDuration:"5000s",animationName:"mui-auto-fill"}},"small"===n.size&&{paddingTop:1},n.multiline&&{height:"auto",resize:"none",padding:0,paddingTop:0},"search"===n.type&&{MozAppearance:"textfield"})})),ka=(0,I.jsx)(fa,{styles:{"@keyframes mui-auto-fill":{from:{display:"block"}},"@keyframes mui-auto-fill-cancel":{from:{display:"block"}}}}),Ca=e.forwardRef((function(t,n){var r;const i=Pe({props:t,name:"MuiInputBase"}),{"aria-describedby":s,autoComplete:u,autoFocus:c,className:d,components:f={},componentsProps:m={},defaultValue:h,disabled:v,disableInjectingGlobalStyles:g,endAdornment:b,fullWidth:y=!1,id:x,inputComponent:w="input",inputProps:S={},inputRef:k,maxRows:C,minRows:A,multiline:E=!1,name:R,onBlur:P,onChange:M,onClick:N,onFocus:$,onKeyDown:T,onKeyUp:z,placeholder:O,readOnly:L,renderSuffix:_,rows:j,slotProps:F={},slots:D={},startAdornment:V,type:U="text",value:H}=i,K=(0,o.A)(i,ba),q=null!=S.value?S.value:H,{current:X}=e.useRef(null!=q),G=e.useRef(),Q=e.useCallback((e=>{0}),[]),Y=ut(G,k,S.ref,Q),[Z,J]=e.useState(!1),ee=ua();const te=la({props:i,muiFormControl:ee,states:["color","disabled","error","hiddenLabel","size","required","filled"]});te.focused=ee?ee.focused:Z,e.useEffect((()=>{!ee&&v&&Z&&(J(!1),P&&P())}),[ee,v,Z,P]);const ne=ee&&ee.onFilled,re=ee&&ee.onEmpty,oe=e.useCallback((e=>{ha(e)?ne&&ne():re&&re()}),[ne,re]);ca((()=>{X&&oe({value:q})}),[q,oe,X]);e.useEffect((()=>{oe(G.current)}),[]);let ae=w,ie=S;E&&"input"===ae&&(ie=j?(0,a.A)({type:void 0,minRows:j,maxRows:j},ie):(0,a.A)({type:void 0,maxRows:C,minRows:A},ie),ae=ia);e.useEffect((()=>{ee&&ee.setAdornedStart(Boolean(V))}),[ee,V]);const le=(0,a.A)({},i,{color:te.color||"primary",disabled:te.disabled,endAdornment:b,error:te.error,focused:te.focused,formControl:ee,fullWidth:y,hiddenLabel:te.hiddenLabel,multiline:E,size:te.size,startAdornment:V,type:U}),se=(e=>{const{classes:t,color:n,disabled:r,error:o,endAdornment:a,focused:i,formControl:l,fullWidth:s,hiddenLabel:u,multiline:c,readOnly:d,size:f,startAdornment:m,type:h}=e;return p({root:["root",`color${W(n)}`,r&&"disabled",o&&"error",s&&"fullWidth",i&&"focused",l&&"formControl",f&&"medium"!==f&&`size${W(f)}`,c&&"multiline",m&&"adornedStart",a&&"adornedEnd",u&&"hiddenLabel",d&&"readOnly"],input:["input",r&&"disabled","search"===h&&"inputTypeSearch",c&&"inputMultiline","small"===f&&"inputSizeSmall",u&&"inputHiddenLabel",m&&"inputAdornedStart",a&&"inputAdornedEnd",d&&"readOnly"]},va,t)})(le),ue=D.root||f.Root||wa,ce=F.root||m.root||{},de=D.input||f.Input||Sa;return ie=(0,a.A)({},ie,null!=(r=F.input)?r:m.input),(0,I.jsxs)(e.Fragment,{children:[!g&&ka,(0,I.jsxs)(ue,(0,a.A)({},ce,!Ke(ue)&&{ownerState:(0,a.A)({},le,ce.ownerState)},{ref:n,onClick:e=>{G.current&&e.currentTarget===e.target&&G.current.focus(),N&&N(e)}},K,{className:l(se.root,ce.className,d,L&&"MuiInputBase-readOnly"),children:[V,(0,I.jsx)(sa.Provider,{value:null,children:(0,I.jsx)(de,(0,a.A)({ownerState:le,"aria-invalid":te.error,"aria-describedby":s,autoComplete:u,autoFocus:c,defaultValue:h,disabled:te.disabled,id:x,onAnimationStart:e=>{oe("mui-auto-fill-cancel"===e.animationName?G.current:{value:"x"})},name:R,placeholder:O,readOnly:L,required:te.required,rows:j,value:q,onKeyDown:T,onKeyUp:z,type:U},ie,!Ke(de)&&{as:ae,ownerState:(0,a.A)({},le,ie.ownerState)},{ref:Y,className:l(se.input,ie.className,L&&"MuiInputBase-readOnly"),onBlur:e=>{P&&P(e),S.onBlur&&S.onBlur(e),ee&&ee.onBlur?ee.onBlur(e):J(!1)},onChange:function(e){if(!X){const t=e.target||G.current;if(null==t)throw new Error((0,B.A)(1));oe({value:t.value})}for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];S.onChange&&S.onChange(e,...n),M&&M(e,...n)},onFocus:e=>{te.disabled?e.stopPropagation():($&&$(e),S.onFocus&&S.onFocus(e),ee&&ee.onFocus?ee.onFocus(e):J(!0))}}))}),b,_?_((0,a.A)({},te,{startAdornment:V})):null]}))]})})),Aa=Ca;function Ea(e){return d("MuiInput",e)}const Ra=(0,a.A)({},ga,ze("MuiInput",["root","underline","input"])),Pa=["disableUnderline","components","componentsProps","fullWidth","inputComponent","multiline","slotProps","slots","type"],Ma=Ae(wa,{shouldForwardProp:e=>Ce(e)||"classes"===e,name:"MuiInput",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[...ya(e,t),!n.disableUnderline&&t.underline]}})((e=>{let{theme:t,ownerState:n}=e;let r="light"===t.palette.mode?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)";return t.vars&&(r=`rgba(${t.vars.palette.common.onBackgroundChannel} / ${t.vars.opacity.inputUnderline})`),(0,a.A)({position:"relative"},n.formControl&&{"label + &":{marginTop:16}},!n.disableUnderline&&{"&::after":{borderBottom:`2px solid ${(t.vars||t).palette[n.color].main}`,left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:t.transitions.create("transform",{duration:t.transitions.duration.shorter,easing:t.transitions.easing.easeOut}),pointerEvents:"none"},[`&.${Ra.focused}:after`]:{transform:"scaleX(1) translateX(0)"},[`&.${Ra.error}`]:{"&::before, &::after":{borderBottomColor:(t.vars||t).palette.error.main}},"&::before":{borderBottom:`1px solid ${r}`,left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:t.transitions.create("border-bottom-color",{duration:t.transitions.duration.shorter}),pointerEvents:"none"},[`&:hover:not(.${Ra.disabled}, .${Ra.error}):before`]:{borderBottom:`2px solid ${(t.vars||t).palette.text.primary}`,"@media (hover: none)":{borderBottom:`1px solid ${r}`}},[`&.${Ra.disabled}:before`]:{borderBottomStyle:"dotted"}})})),Na=Ae(Sa,{name:"MuiInput",slot:"Input",overridesResolver:xa})({}),$a=e.forwardRef((function(e,t){var n,r,i,l;const s=Pe({props:e,name:"MuiInput"}),{disableUnderline:u,components:c={},componentsProps:d,fullWidth:f=!1,inputComponent:m="input",multiline:h=!1,slotProps:v,slots:g={},type:b="text"}=s,y=(0,o.A)(s,Pa),x=(e=>{const{classes:t,disableUnderline:n}=e,r=p({root:["root",!n&&"underline"],input:["input"]},Ea,t);return(0,a.A)({},t,r)})(s),w={root:{ownerState:{disableUnderline:u}}},k=(null!=v?v:d)?(0,S.A)(null!=v?v:d,w):w,C=null!=(n=null!=(r=g.root)?r:c.Root)?n:Ma,A=null!=(i=null!=(l=g.input)?l:c.Input)?i:Na;return(0,I.jsx)(Aa,(0,a.A)({slots:{root:C,input:A},slotProps:k,fullWidth:f,inputComponent:m,multiline:h,ref:t,type:b},y,{classes:x}))}));$a.muiName="Input";const Ta=$a;function za(e){return d("MuiFilledInput",e)}const Oa=(0,a.A)({},ga,ze("MuiFilledInput",["root","underline","input"])),Ia=["disableUnderline","components","componentsProps","fullWidth","hiddenLabel","inputComponent","multiline","slotProps","slots","type"],La=Ae(wa,{shouldForwardProp:e=>Ce(e)||"classes"===e,name:"MuiFilledInput",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[...ya(e,t),!n.disableUnderline&&t.underline]}})((e=>{let{theme:t,ownerState:n}=e;var r;const o="light"===t.palette.mode,i=o?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)",l=o?"rgba(0, 0, 0, 0.06)":"rgba(255, 255, 255, 0.09)",s=o?"rgba(0, 0, 0, 0.09)":"rgba(255, 255, 255, 0.13)",u=o?"rgba(0, 0, 0, 0.12)":"rgba(255, 255, 255, 0.12)";return(0,a.A)({position:"relative",backgroundColor:t.vars?t.vars.palette.FilledInput.bg:l,borderTopLeftRadius:(t.vars||t).shape.borderRadius,borderTopRightRadius:(t.vars||t).shape.borderRadius,transition:t.transitions.create("background-color",{duration:t.transitions.duration.shorter,easing:t.transitions.easing.easeOut}),"&:hover":{backgroundColor:t.vars?t.vars.palette.FilledInput.hoverBg:s,"@media (hover: none)":{backgroundColor:t.vars?t.vars.palette.FilledInput.bg:l}},[`&.${Oa.focused}`]:{backgroundColor:t.vars?t.vars.palette.FilledInput.bg:l},[`&.${Oa.disabled}`]:{backgroundColor:t.vars?t.vars.palette.FilledInput.disabledBg:u}},!n.disableUnderline&&{"&::after":{borderBottom:`2px solid ${null==(r=(t.vars||t).palette[n.color||"primary"])?void 0:r.main}`,left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:t.transitions.create("transform",{duration:t.transitions.duration.shorter,easing:t.transitions.easing.easeOut}),pointerEvents:"none"},[`&.${Oa.focused}:after`]:{transform:"scaleX(1) translateX(0)"},[`&.${Oa.error}`]:{"&::before, &::after":{borderBottomColor:(t.vars||t).palette.error.main}},"&::before":{borderBottom:`1px solid ${t.vars?`rgba(${t.vars.palette.common.onBackgroundChannel} / ${t.vars.opacity.inputUnderline})`:i}`,left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:t.transitions.create("border-bottom-color",{duration:t.transitions.duration.shorter}),pointerEvents:"none"},[`&:hover:not(.${Oa.disabled}, .${Oa.error}):before`]:{borderBottom:`1px solid ${(t.vars||t).palette.text.primary}`},[`&.${Oa.disabled}:before`]:{borderBottomStyle:"dotted"}},n.startAdornment&&{paddingLeft:12},n.endAdornment&&{paddingRight:12},n.multiline&&(0,a.A)({padding:"25px 12px 8px"},"small"===n.size&&{paddingTop:21,paddingBottom:4},n.hiddenLabel&&{paddingTop:16,paddingBottom:17},n.hiddenLabel&&"small"===n.size&&{paddingTop:8,paddingBottom:9}))})),_a=Ae(Sa,{name:"MuiFilledInput",slot:"Input",overridesResolver:xa})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({paddingTop:25,paddingRight:12,paddingBottom:8,paddingLeft:12},!t.vars&&{"&:-webkit-autofill":{WebkitBoxShadow:"light"===t.palette.mode?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:"light"===t.palette.mode?null:"#fff",caretColor:"light"===t.palette.mode?null:"#fff",borderTopLeftRadius:"inherit",borderTopRightRadius:"inherit"}},t.vars&&{"&:-webkit-autofill":{borderTopLeftRadius:"inherit",borderTopRightRadius:"inherit"},[t.getColorSchemeSelector("dark")]:{"&:-webkit-autofill":{WebkitBoxShadow:"0 0 0 100px #266798 inset",WebkitTextFillColor:"#fff",caretColor:"#fff"}}},"small"===n.size&&{paddingTop:21,paddingBottom:4},n.hiddenLabel&&{paddingTop:16,paddingBottom:17},n.startAdornment&&{paddingLeft:0},n.endAdornment&&{paddingRight:0},n.hiddenLabel&&"small"===n.size&&{paddingTop:8,paddingBottom:9},n.multiline&&{paddingTop:0,paddingBottom:0,paddingLeft:0,paddingRight:0})})),ja=e.forwardRef((function(e,t){var n,r,i,l;const s=Pe({props:e,name:"MuiFilledInput"}),{components:u={},componentsProps:c,fullWidth:d=!1,inputComponent:f="input",multiline:m=!1,slotProps:h,slots:v={},type:g="text"}=s,b=(0,o.A)(s,Ia),y=(0,a.A)({},s,{fullWidth:d,inputComponent:f,multiline:m,type:g}),x=(e=>{const{classes:t,disableUnderline:n}=e,r=p({root:["root",!n&&"underline"],input:["input"]},za,t);return(0,a.A)({},t,r)})(s),w={root:{ownerState:y},input:{ownerState:y}},k=(null!=h?h:c)?(0,S.A)(w,null!=h?h:c):w,C=null!=(n=null!=(r=v.root)?r:u.Root)?n:La,A=null!=(i=null!=(l=v.input)?l:u.Input)?i:_a;return(0,I.jsx)(Aa,(0,a.A)({slots:{root:C,input:A},componentsProps:k,fullWidth:d,inputComponent:f,multiline:m,ref:t,type:g},b,{classes:x}))}));ja.muiName="Input";const Fa=ja;var Wa;const Da=["children","classes","className","label","notched"],Ba=Ae("fieldset",{shouldForwardProp:Ce})({textAlign:"left",position:"absolute",bottom:0,right:0,top:-5,left:0,margin:0,padding:"0 8px",pointerEvents:"none",borderRadius:"inherit",borderStyle:"solid",borderWidth:1,overflow:"hidden",minWidth:"0%"}),Va=Ae("legend",{shouldForwardProp:Ce})((e=>{let{ownerState:t,theme:n}=e;return(0,a.A)({float:"unset",width:"auto",overflow:"hidden"},!t.withLabel&&{padding:0,lineHeight:"11px",transition:n.transitions.create("width",{duration:150,easing:n.transitions.easing.easeOut})},t.withLabel&&(0,a.A)({display:"block",padding:0,height:11,fontSize:"0.75em",visibility:"hidden",maxWidth:.01,transition:n.transitions.create("max-width",{duration:50,easing:n.transitions.easing.easeOut}),whiteSpace:"nowrap","& > span":{paddingLeft:5,paddingRight:5,display:"inline-block",opacity:0,visibility:"visible"}},t.notched&&{maxWidth:"100%",transition:n.transitions.create("max-width",{duration:100,easing:n.transitions.easing.easeOut,delay:50})}))}));function Ua(e){return d("MuiOutlinedInput",e)}const Ha=(0,a.A)({},ga,ze("MuiOutlinedInput",["root","notchedOutline","input"])),Ka=["components","fullWidth","inputComponent","label","multiline","notched","slots","type"],qa=Ae(wa,{shouldForwardProp:e=>Ce(e)||"classes"===e,name:"MuiOutlinedInput",slot:"Root",overridesResolver:ya})((e=>{let{theme:t,ownerState:n}=e;const r="light"===t.palette.mode?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return(0,a.A)({position:"relative",borderRadius:(t.vars||t).shape.borderRadius,[`&:hover .${Ha.notchedOutline}`]:{borderColor:(t.vars||t).palette.text.primary},"@media (hover: none)":{[`&:hover .${Ha.notchedOutline}`]:{borderColor:t.vars?`rgba(${t.vars.palette.common.onBackgroundChannel} / 0.23)`:r}},[`&.${Ha.focused} .${Ha.notchedOutline}`]:{borderColor:(t.vars||t).palette[n.color].main,borderWidth:2},[`&.${Ha.error} .${Ha.notchedOutline}`]:{borderColor:(t.vars||t).palette.error.main},[`&.${Ha.disabled} .${Ha.notchedOutline}`]:{borderColor:(t.vars||t).palette.action.disabled}},n.startAdornment&&{paddingLeft:14},n.endAdornment&&{paddingRight:14},n.multiline&&(0,a.A)({padding:"16.5px 14px"},"small"===n.size&&{padding:"8.5px 14px"}))})),Xa=Ae((function(e){const{className:t,label:n,notched:r}=e,i=(0,o.A)(e,Da),l=null!=n&&""!==n,s=(0,a.A)({},e,{notched:r,withLabel:l});return(0,I.jsx)(Ba,(0,a.A)({"aria-hidden":!0,className:t,ownerState:s},i,{children:(0,I.jsx)(Va,{ownerState:s,children:l?(0,I.jsx)("span",{children:n}):Wa||(Wa=(0,I.jsx)("span",{className:"notranslate",children:"\u200b"}))})}))}),{name:"MuiOutlinedInput",slot:"NotchedOutline",overridesResolver:(e,t)=>t.notchedOutline})((e=>{let{theme:t}=e;const n="light"===t.palette.mode?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return{borderColor:t.vars?`rgba(${t.vars.palette.common.onBackgroundChannel} / 0.23)`:n}})),Ga=Ae(Sa,{name:"MuiOutlinedInput",slot:"Input",overridesResolver:xa})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({padding:"16.5px 14px"},!t.vars&&{"&:-webkit-autofill":{WebkitBoxShadow:"light"===t.palette.mode?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:"light"===t.palette.mode?null:"#fff",caretColor:"light"===t.palette.mode?null:"#fff",borderRadius:"inherit"}},t.vars&&{"&:-webkit-autofill":{borderRadius:"inherit"},[t.getColorSchemeSelector("dark")]:{"&:-webkit-autofill":{WebkitBoxShadow:"0 0 0 100px #266798 inset",WebkitTextFillColor:"#fff",caretColor:"#fff"}}},"small"===n.size&&{padding:"8.5px 14px"},n.multiline&&{padding:0},n.startAdornment&&{paddingLeft:0},n.endAdornment&&{paddingRight:0})})),Qa=e.forwardRef((function(t,n){var r,i,l,s,u;const c=Pe({props:t,name:"MuiOutlinedInput"}),{components:d={},fullWidth:f=!1,inputComponent:m="input",label:h,multiline:v=!1,notched:g,slots:b={},type:y="text"}=c,x=(0,o.A)(c,Ka),w=(e=>{const{classes:t}=e,n=p({root:["root"],notchedOutline:["notchedOutline"],input:["input"]},Ua,t);return(0,a.A)({},t,n)})(c),S=ua(),k=la({props:c,muiFormControl:S,states:["color","disabled","error","focused","hiddenLabel","size","required"]}),C=(0,a.A)({},c,{color:k.color||"primary",disabled:k.disabled,error:k.error,focused:k.focused,formControl:S,fullWidth:f,hiddenLabel:k.hiddenLabel,multiline:v,size:k.size,type:y}),A=null!=(r=null!=(i=b.root)?i:d.Root)?r:qa,E=null!=(l=null!=(s=b.input)?s:d.Input)?l:Ga;return(0,I.jsx)(Aa,(0,a.A)({slots:{root:A,input:E},renderSuffix:t=>(0,I.jsx)(Xa,{ownerState:C,className:w.notchedOutline,label:null!=h&&""!==h&&k.required?u||(u=(0,I.jsxs)(e.Fragment,{children:[h,"\u2009","*"]})):h,notched:"undefined"!==typeof g?g:Boolean(t.startAdornment||t.filled||t.focused)}),fullWidth:f,inputComponent:m,multiline:v,ref:n,type:y},x,{classes:(0,a.A)({},w,{notchedOutline:null})}))}));Qa.muiName="Input";const Ya=Qa;function Za(e){return d("MuiFormLabel",e)}const Ja=ze("MuiFormLabel",["root","colorSecondary","focused","disabled","error","filled","required","asterisk"]),ei=["children","className","color","component","disabled","error","filled","focused","required"],ti=Ae("label",{name:"MuiFormLabel",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:n}=e;return(0,a.A)({},t.root,"secondary"===n.color&&t.colorSecondary,n.filled&&t.filled)}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({color:(t.vars||t).palette.text.secondary},t.typography.body1,{lineHeight:"1.4375em",padding:0,position:"relative",[`&.${Ja.focused}`]:{color:(t.vars||t).palette[n.color].main},[`&.${Ja.disabled}`]:{color:(t.vars||t).palette.text.disabled},[`&.${Ja.error}`]:{color:(t.vars||t).palette.error.main}})})),ni=Ae("span",{name:"MuiFormLabel",slot:"Asterisk",overridesResolver:(e,t)=>t.asterisk})((e=>{let{theme:t}=e;return{[`&.${Ja.error}`]:{color:(t.vars||t).palette.error.main}}})),ri=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiFormLabel"}),{children:r,className:i,component:s="label"}=n,u=(0,o.A)(n,ei),c=la({props:n,muiFormControl:ua(),states:["color","required","focused","disabled","error","filled"]}),d=(0,a.A)({},n,{color:c.color||"primary",component:s,disabled:c.disabled,error:c.error,filled:c.filled,focused:c.focused,required:c.required}),f=(e=>{const{classes:t,color:n,focused:r,disabled:o,error:a,filled:i,required:l}=e;return p({root:["root",`color${W(n)}`,o&&"disabled",a&&"error",i&&"filled",r&&"focused",l&&"required"],asterisk:["asterisk",a&&"error"]},Za,t)})(d);return(0,I.jsxs)(ti,(0,a.A)({as:s,ownerState:d,className:l(f.root,i),ref:t},u,{children:[r,c.required&&(0,I.jsxs)(ni,{ownerState:d,"aria-hidden":!0,className:f.asterisk,children:["\u2009","*"]})]}))}));function oi(e){return d("MuiInputLabel",e)}ze("MuiInputLabel",["root","focused","disabled","error","required","asterisk","formControl","sizeSmall","shrink","animated","standard","filled","outlined"]);const ai=["disableAnimation","margin","shrink","variant","className"],ii=Ae(ri,{shouldForwardProp:e=>Ce(e)||"classes"===e,name:"MuiInputLabel",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`& .${Ja.asterisk}`]:t.asterisk},t.root,n.formControl&&t.formControl,"small"===n.size&&t.sizeSmall,n.shrink&&t.shrink,!n.disableAnimation&&t.animated,n.focused&&t.focused,t[n.variant]]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({display:"block",transformOrigin:"top left",whiteSpace:"nowrap",overflow:"hidden",textOverflow:"ellipsis",maxWidth:"100%"},n.formControl&&{position:"absolute",left:0,top:0,transform:"translate(0, 20px) scale(1)"},"small"===n.size&&{transform:"translate(0, 17px) scale(1)"},n.shrink&&{transform:"translate(0, -1.5px) scale(0.75)",transformOrigin:"top left",maxWidth:"133%"},!n.disableAnimation&&{transition:t.transitions.create(["color","transform","max-width"],{duration:t.transitions.duration.shorter,easing:t.transitions.easing.easeOut})},"filled"===n.variant&&(0,a.A)({zIndex:1,pointerEvents:"none",transform:"translate(12px, 16px) scale(1)",maxWidth:"calc(100% - 24px)"},"small"===n.size&&{transform:"translate(12px, 13px) scale(1)"},n.shrink&&(0,a.A)({userSelect:"none",pointerEvents:"auto",transform:"translate(12px, 7px) scale(0.75)",maxWidth:"calc(133% - 24px)"},"small"===n.size&&{transform:"translate(12px, 4px) scale(0.75)"})),"outlined"===n.variant&&(0,a.A)({zIndex:1,pointerEvents:"none",transform:"translate(14px, 16px) scale(1)",maxWidth:"calc(100% - 24px)"},"small"===n.size&&{transform:"translate(14px, 9px) scale(1)"},n.shrink&&{userSelect:"none",pointerEvents:"auto",maxWidth:"calc(133% - 32px)",transform:"translate(14px, -9px) scale(0.75)"}))})),li=e.forwardRef((function(e,t){const n=Pe({name:"MuiInputLabel",props:e}),{disableAnimation:r=!1,shrink:i,className:s}=n,u=(0,o.A)(n,ai),c=ua();let d=i;"undefined"===typeof d&&c&&(d=c.filled||c.focused||c.adornedStart);const f=la({props:n,muiFormControl:c,states:["size","variant","required","focused"]}),m=(0,a.A)({},n,{disableAnimation:r,formControl:c,shrink:d,size:f.size,variant:f.variant,required:f.required,focused:f.focused}),h=(e=>{const{classes:t,formControl:n,size:r,shrink:o,disableAnimation:i,variant:l,required:s}=e,u=p({root:["root",n&&"formControl",!i&&"animated",o&&"shrink",r&&"normal"!==r&&`size${W(r)}`,l],asterisk:[s&&"asterisk"]},oi,t);return(0,a.A)({},t,u)})(m);return(0,I.jsx)(ii,(0,a.A)({"data-shrink":d,ownerState:m,ref:t,className:l(h.root,s)},u,{classes:h}))}));const si=function(t,n){var r,o;return e.isValidElement(t)&&-1!==n.indexOf(null!=(r=t.type.muiName)?r:null==(o=t.type)||null==(o=o._payload)||null==(o=o.value)?void 0:o.muiName)};function ui(e){return d("MuiFormControl",e)}ze("MuiFormControl",["root","marginNone","marginNormal","marginDense","fullWidth","disabled"]);const ci=["children","className","color","component","disabled","error","focused","fullWidth","hiddenLabel","margin","required","size","variant"],di=Ae("div",{name:"MuiFormControl",slot:"Root",overridesResolver:(e,t)=>{let{ownerState:n}=e;return(0,a.A)({},t.root,t[`margin${W(n.margin)}`],n.fullWidth&&t.fullWidth)}})((e=>{let{ownerState:t}=e;return(0,a.A)({display:"inline-flex",flexDirection:"column",position:"relative",minWidth:0,padding:0,margin:0,border:0,verticalAlign:"top"},"normal"===t.margin&&{marginTop:16,marginBottom:8},"dense"===t.margin&&{marginTop:8,marginBottom:4},t.fullWidth&&{width:"100%"})})),pi=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiFormControl"}),{children:i,className:s,color:u="primary",component:c="div",disabled:d=!1,error:f=!1,focused:m,fullWidth:h=!1,hiddenLabel:v=!1,margin:g="none",required:b=!1,size:y="medium",variant:x="outlined"}=r,w=(0,o.A)(r,ci),S=(0,a.A)({},r,{color:u,component:c,disabled:d,error:f,fullWidth:h,hiddenLabel:v,margin:g,required:b,size:y,variant:x}),k=(e=>{const{classes:t,margin:n,fullWidth:r}=e;return p({root:["root","none"!==n&&`margin${W(n)}`,r&&"fullWidth"]},ui,t)})(S),[C,A]=e.useState((()=>{let t=!1;return i&&e.Children.forEach(i,(e=>{if(!si(e,["Input","Select"]))return;const n=si(e,["Select"])?e.props.input:e;n&&n.props.startAdornment&&(t=!0)})),t})),[E,R]=e.useState((()=>{let t=!1;return i&&e.Children.forEach(i,(e=>{si(e,["Input","Select"])&&(ha(e.props,!0)||ha(e.props.inputProps,!0))&&(t=!0)})),t})),[P,M]=e.useState(!1);d&&P&&M(!1);const N=void 0===m||d?P:m;let $;const T=e.useMemo((()=>({adornedStart:C,setAdornedStart:A,color:u,disabled:d,error:f,filled:E,focused:N,fullWidth:h,hiddenLabel:v,size:y,onBlur:()=>{M(!1)},onEmpty:()=>{R(!1)},onFilled:()=>{R(!0)},onFocus:()=>{M(!0)},registerEffect:$,required:b,variant:x})),[C,u,d,f,E,N,h,v,$,b,y,x]);return(0,I.jsx)(sa.Provider,{value:T,children:(0,I.jsx)(di,(0,a.A)({as:c,ownerState:S,className:l(k.root,s),ref:n},w,{children:i}))})}));function fi(e){return d("MuiFormHelperText",e)}const mi=ze("MuiFormHelperText",["root","error","disabled","sizeSmall","sizeMedium","contained","focused","filled","required"]);var hi;const vi=["children","className","component","disabled","error","filled","focused","margin","required","variant"],gi=Ae("p",{name:"MuiFormHelperText",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.size&&t[`size${W(n.size)}`],n.contained&&t.contained,n.filled&&t.filled]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({color:(t.vars||t).palette.text.secondary},t.typography.caption,{textAlign:"left",marginTop:3,marginRight:0,marginBottom:0,marginLeft:0,[`&.${mi.disabled}`]:{color:(t.vars||t).palette.text.disabled},[`&.${mi.error}`]:{color:(t.vars||t).palette.error.main}},"small"===n.size&&{marginTop:4},n.contained&&{marginLeft:14,marginRight:14})})),bi=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiFormHelperText"}),{children:r,className:i,component:s="p"}=n,u=(0,o.A)(n,vi),c=la({props:n,muiFormControl:ua(),states:["variant","size","disabled","error","filled","focused","required"]}),d=(0,a.A)({},n,{component:s,contained:"filled"===c.variant||"outlined"===c.variant,variant:c.variant,size:c.size,disabled:c.disabled,error:c.error,filled:c.filled,focused:c.focused,required:c.required}),f=(e=>{const{classes:t,contained:n,size:r,disabled:o,error:a,filled:i,focused:l,required:s}=e;return p({root:["root",o&&"disabled",a&&"error",r&&`size${W(r)}`,n&&"contained",l&&"focused",i&&"filled",s&&"required"]},fi,t)})(d);return(0,I.jsx)(gi,(0,a.A)({as:s,ownerState:d,className:l(f.root,i),ref:t},u,{children:" "===r?hi||(hi=(0,I.jsx)("span",{className:"notranslate",children:"\u200b"})):r}))})),yi=qr;const xi=e.createContext({});function wi(e){return d("MuiList",e)}ze("MuiList",["root","padding","dense","subheader"]);const Si=["children","className","component","dense","disablePadding","subheader"],ki=Ae("ul",{name:"MuiList",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,!n.disablePadding&&t.padding,n.dense&&t.dense,n.subheader&&t.subheader]}})((e=>{let{ownerState:t}=e;return(0,a.A)({listStyle:"none",margin:0,padding:0,position:"relative"},!t.disablePadding&&{paddingTop:8,paddingBottom:8},t.subheader&&{paddingTop:0})})),Ci=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiList"}),{children:i,className:s,component:u="ul",dense:c=!1,disablePadding:d=!1,subheader:f}=r,m=(0,o.A)(r,Si),h=e.useMemo((()=>({dense:c})),[c]),v=(0,a.A)({},r,{component:u,dense:c,disablePadding:d}),g=(e=>{const{classes:t,disablePadding:n,dense:r,subheader:o}=e;return p({root:["root",!n&&"padding",r&&"dense",o&&"subheader"]},wi,t)})(v);return(0,I.jsx)(xi.Provider,{value:h,children:(0,I.jsxs)(ki,(0,a.A)({as:u,className:l(g.root,s),ref:n,ownerState:v},m,{children:[f,i]}))})})),Ai=So,Ei=["actions","autoFocus","autoFocusItem","children","className","disabledItemsFocusable","disableListWrap","onKeyDown","variant"];function Ri(e,t,n){return e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:n?null:e.firstChild}function Pi(e,t,n){return e===t?n?e.firstChild:e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:n?null:e.lastChild}function Mi(e,t){if(void 0===t)return!0;let n=e.innerText;return void 0===n&&(n=e.textContent),n=n.trim().toLowerCase(),0!==n.length&&(t.repeating?n[0]===t.keys[0]:0===n.indexOf(t.keys.join("")))}function Ni(e,t,n,r,o,a){let i=!1,l=o(e,t,!!t&&n);for(;l;){if(l===e.firstChild){if(i)return!1;i=!0}const t=!r&&(l.disabled||"true"===l.getAttribute("aria-disabled"));if(l.hasAttribute("tabindex")&&Mi(l,a)&&!t)return l.focus(),!0;l=o(e,l,n)}return!1}const $i=e.forwardRef((function(t,n){const{actions:r,autoFocus:i=!1,autoFocusItem:l=!1,children:s,className:u,disabledItemsFocusable:c=!1,disableListWrap:d=!1,onKeyDown:p,variant:f="selectedMenu"}=t,m=(0,o.A)(t,Ei),h=e.useRef(null),v=e.useRef({keys:[],repeating:!0,previousKeyMatched:!0,lastTime:null});ca((()=>{i&&h.current.focus()}),[i]),e.useImperativeHandle(r,(()=>({adjustStyleForScrollbar:(e,t)=>{let{direction:n}=t;const r=!h.current.style.width;if(e.clientHeight<h.current.clientHeight&&r){const t=`${Ai(yi(e))}px`;h.current.style["rtl"===n?"paddingLeft":"paddingRight"]=t,h.current.style.width=`calc(100% + ${t})`}return h.current}})),[]);const g=ut(h,n);let b=-1;e.Children.forEach(s,((t,n)=>{e.isValidElement(t)?(t.props.disabled||("selectedMenu"===f&&t.props.selected||-1===b)&&(b=n),b===n&&(t.props.disabled||t.props.muiSkipListHighlight||t.type.muiSkipListHighlight)&&(b+=1,b>=s.length&&(b=-1))):b===n&&(b+=1,b>=s.length&&(b=-1))}));const y=e.Children.map(s,((t,n)=>{if(n===b){const n={};return l&&(n.autoFocus=!0),void 0===t.props.tabIndex&&"selectedMenu"===f&&(n.tabIndex=0),e.cloneElement(t,n)}return t}));return(0,I.jsx)(Ci,(0,a.A)({role:"menu",ref:g,className:u,onKeyDown:e=>{const t=h.current,n=e.key,r=yi(t).activeElement;if("ArrowDown"===n)e.preventDefault(),Ni(t,r,d,c,Ri);else if("ArrowUp"===n)e.preventDefault(),Ni(t,r,d,c,Pi);else if("Home"===n)e.preventDefault(),Ni(t,null,d,c,Ri);else if("End"===n)e.preventDefault(),Ni(t,null,d,c,Pi);else if(1===n.length){const o=v.current,a=n.toLowerCase(),i=performance.now();o.keys.length>0&&(i-o.lastTime>500?(o.keys=[],o.repeating=!0,o.previousKeyMatched=!0):o.repeating&&a!==o.keys[0]&&(o.repeating=!1)),o.lastTime=i,o.keys.push(a);const l=r&&!o.repeating&&Mi(r,o);o.previousKeyMatched&&(l||Ni(t,r,!1,c,Ri,o))?e.preventDefault():o.previousKeyMatched=!1}p&&p(e)},tabIndex:i?0:-1},m,{children:y}))})),Ti=ea,zi=wo,Oi=["addEndListener","appear","children","easing","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","timeout","TransitionComponent"];function Ii(e){return`scale(${e}, ${e**2})`}const Li={entering:{opacity:1,transform:Ii(1)},entered:{opacity:1,transform:"none"}},_i="undefined"!==typeof navigator&&/^((?!chrome|android).)*(safari|mobile)/i.test(navigator.userAgent)&&/(os |version\/)15(.|_)4/i.test(navigator.userAgent),ji=e.forwardRef((function(t,n){const{addEndListener:r,appear:i=!0,children:l,easing:s,in:u,onEnter:c,onEntered:d,onEntering:p,onExit:f,onExited:m,onExiting:h,style:v,timeout:g="auto",TransitionComponent:b=so}=t,y=(0,o.A)(t,Oi),x=vt(),w=e.useRef(),S=mr(),k=e.useRef(null),C=ut(k,Kr(l),n),A=e=>t=>{if(e){const n=k.current;void 0===t?e(n):e(n,t)}},E=A(p),R=A(((e,t)=>{uo(e);const{duration:n,delay:r,easing:o}=co({style:v,timeout:g,easing:s},{mode:"enter"});let a;"auto"===g?(a=S.transitions.getAutoHeightDuration(e.clientHeight),w.current=a):a=n,e.style.transition=[S.transitions.create("opacity",{duration:a,delay:r}),S.transitions.create("transform",{duration:_i?a:.666*a,delay:r,easing:o})].join(","),c&&c(e,t)})),P=A(d),M=A(h),N=A((e=>{const{duration:t,delay:n,easing:r}=co({style:v,timeout:g,easing:s},{mode:"exit"});let o;"auto"===g?(o=S.transitions.getAutoHeightDuration(e.clientHeight),w.current=o):o=t,e.style.transition=[S.transitions.create("opacity",{duration:o,delay:n}),S.transitions.create("transform",{duration:_i?o:.666*o,delay:_i?n:n||.333*o,easing:r})].join(","),e.style.opacity=0,e.style.transform=Ii(.75),f&&f(e)})),$=A(m);return(0,I.jsx)(b,(0,a.A)({appear:i,in:u,nodeRef:k,onEnter:R,onEntered:P,onEntering:E,onExit:N,onExited:$,onExiting:M,addEndListener:e=>{"auto"===g&&x.start(w.current||0,e),r&&r(k.current,e)},timeout:"auto"===g?null:g},y,{children:(t,n)=>e.cloneElement(l,(0,a.A)({style:(0,a.A)({opacity:0,transform:Ii(.75),visibility:"exited"!==t||u?void 0:"hidden"},Li[t],v,l.props.style),ref:C},n))}))}));ji.muiSupportAuto=!0;const Fi=ji;function Wi(e){return d("MuiPopover",e)}ze("MuiPopover",["root","paper"]);const Di=["onEntering"],Bi=["action","anchorEl","anchorOrigin","anchorPosition","anchorReference","children","className","container","elevation","marginThreshold","open","PaperProps","slots","slotProps","transformOrigin","TransitionComponent","transitionDuration","TransitionProps","disableScrollLock"],Vi=["slotProps"];function Ui(e,t){let n=0;return"number"===typeof t?n=t:"center"===t?n=e.height/2:"bottom"===t&&(n=e.height),n}function Hi(e,t){let n=0;return"number"===typeof t?n=t:"center"===t?n=e.width/2:"right"===t&&(n=e.width),n}function Ki(e){return[e.horizontal,e.vertical].map((e=>"number"===typeof e?`${e}px`:e)).join(" ")}function qi(e){return"function"===typeof e?e():e}const Xi=Ae(Io,{name:"MuiPopover",slot:"Root",overridesResolver:(e,t)=>t.root})({}),Gi=Ae(it,{name:"MuiPopover",slot:"Paper",overridesResolver:(e,t)=>t.paper})({position:"absolute",overflowY:"auto",overflowX:"hidden",minWidth:16,minHeight:16,maxWidth:"calc(100% - 32px)",maxHeight:"calc(100% - 32px)",outline:0}),Qi=e.forwardRef((function(t,n){var r,i,s;const u=Pe({props:t,name:"MuiPopover"}),{action:c,anchorEl:d,anchorOrigin:f={vertical:"top",horizontal:"left"},anchorPosition:m,anchorReference:h="anchorEl",children:v,className:g,container:b,elevation:y=8,marginThreshold:x=16,open:w,PaperProps:S={},slots:k,slotProps:C,transformOrigin:A={vertical:"top",horizontal:"left"},TransitionComponent:E=Fi,transitionDuration:R="auto",TransitionProps:{onEntering:P}={},disableScrollLock:M=!1}=u,N=(0,o.A)(u.TransitionProps,Di),$=(0,o.A)(u,Bi),T=null!=(r=null==C?void 0:C.paper)?r:S,z=e.useRef(),O=ut(z,T.ref),L=(0,a.A)({},u,{anchorOrigin:f,anchorReference:h,elevation:y,marginThreshold:x,externalPaperSlotProps:T,transformOrigin:A,TransitionComponent:E,transitionDuration:R,TransitionProps:N}),_=(e=>{const{classes:t}=e;return p({root:["root"],paper:["paper"]},Wi,t)})(L),j=e.useCallback((()=>{if("anchorPosition"===h)return m;const e=qi(d),t=(e&&1===e.nodeType?e:yi(z.current).body).getBoundingClientRect();return{top:t.top+Ui(t,f.vertical),left:t.left+Hi(t,f.horizontal)}}),[d,f.horizontal,f.vertical,m,h]),F=e.useCallback((e=>({vertical:Ui(e,A.vertical),horizontal:Hi(e,A.horizontal)})),[A.horizontal,A.vertical]),W=e.useCallback((e=>{const t={width:e.offsetWidth,height:e.offsetHeight},n=F(t);if("none"===h)return{top:null,left:null,transformOrigin:Ki(n)};const r=j();let o=r.top-n.vertical,a=r.left-n.horizontal;const i=o+t.height,l=a+t.width,s=zi(qi(d)),u=s.innerHeight-x,c=s.innerWidth-x;if(null!==x&&o<x){const e=o-x;o-=e,n.vertical+=e}else if(null!==x&&i>u){const e=i-u;o-=e,n.vertical+=e}if(null!==x&&a<x){const e=a-x;a-=e,n.horizontal+=e}else if(l>c){const e=l-c;a-=e,n.horizontal+=e}return{top:`${Math.round(o)}px`,left:`${Math.round(a)}px`,transformOrigin:Ki(n)}}),[d,h,j,F,x]),[D,B]=e.useState(w),V=e.useCallback((()=>{const e=z.current;if(!e)return;const t=W(e);null!==t.top&&(e.style.top=t.top),null!==t.left&&(e.style.left=t.left),e.style.transformOrigin=t.transformOrigin,B(!0)}),[W]);e.useEffect((()=>(M&&window.addEventListener("scroll",V),()=>window.removeEventListener("scroll",V))),[d,M,V]);e.useEffect((()=>{w&&V()})),e.useImperativeHandle(c,(()=>w?{updatePosition:()=>{V()}}:null),[w,V]),e.useEffect((()=>{if(!w)return;const e=Ti((()=>{V()})),t=zi(d);return t.addEventListener("resize",e),()=>{e.clear(),t.removeEventListener("resize",e)}}),[d,w,V]);let U=R;"auto"!==R||E.muiSupportAuto||(U=void 0);const H=b||(d?yi(qi(d)).body:void 0),K=null!=(i=null==k?void 0:k.root)?i:Xi,q=null!=(s=null==k?void 0:k.paper)?s:Gi,X=Hr({elementType:q,externalSlotProps:(0,a.A)({},T,{style:D?T.style:(0,a.A)({},T.style,{opacity:0})}),additionalProps:{elevation:y,ref:O},ownerState:L,className:l(_.paper,null==T?void 0:T.className)}),G=Hr({elementType:K,externalSlotProps:(null==C?void 0:C.root)||{},externalForwardedProps:$,additionalProps:{ref:n,slotProps:{backdrop:{invisible:!0}},container:H,open:w},ownerState:L,className:l(_.root,g)}),{slotProps:Q}=G,Y=(0,o.A)(G,Vi);return(0,I.jsx)(K,(0,a.A)({},Y,!Ke(K)&&{slotProps:Q,disableScrollLock:M},{children:(0,I.jsx)(E,(0,a.A)({appear:!0,in:w,onEntering:(e,t)=>{P&&P(e,t),V()},onExited:()=>{B(!1)},timeout:U},N,{children:(0,I.jsx)(q,(0,a.A)({},X,{children:v}))}))}))}));function Yi(e){return d("MuiMenu",e)}ze("MuiMenu",["root","paper","list"]);const Zi=["onEntering"],Ji=["autoFocus","children","className","disableAutoFocusItem","MenuListProps","onClose","open","PaperProps","PopoverClasses","transitionDuration","TransitionProps","variant","slots","slotProps"],el={vertical:"top",horizontal:"right"},tl={vertical:"top",horizontal:"left"},nl=Ae(Qi,{shouldForwardProp:e=>Ce(e)||"classes"===e,name:"MuiMenu",slot:"Root",overridesResolver:(e,t)=>t.root})({}),rl=Ae(Gi,{name:"MuiMenu",slot:"Paper",overridesResolver:(e,t)=>t.paper})({maxHeight:"calc(100% - 96px)",WebkitOverflowScrolling:"touch"}),ol=Ae($i,{name:"MuiMenu",slot:"List",overridesResolver:(e,t)=>t.list})({outline:0}),al=e.forwardRef((function(t,n){var r,i;const s=Pe({props:t,name:"MuiMenu"}),{autoFocus:u=!0,children:c,className:d,disableAutoFocusItem:f=!1,MenuListProps:m={},onClose:h,open:v,PaperProps:g={},PopoverClasses:b,transitionDuration:y="auto",TransitionProps:{onEntering:x}={},variant:w="selectedMenu",slots:S={},slotProps:k={}}=s,C=(0,o.A)(s.TransitionProps,Zi),A=(0,o.A)(s,Ji),E=Xn(),R=(0,a.A)({},s,{autoFocus:u,disableAutoFocusItem:f,MenuListProps:m,onEntering:x,PaperProps:g,transitionDuration:y,TransitionProps:C,variant:w}),P=(e=>{const{classes:t}=e;return p({root:["root"],paper:["paper"],list:["list"]},Yi,t)})(R),M=u&&!f&&v,N=e.useRef(null);let $=-1;e.Children.map(c,((t,n)=>{e.isValidElement(t)&&(t.props.disabled||("selectedMenu"===w&&t.props.selected||-1===$)&&($=n))}));const T=null!=(r=S.paper)?r:rl,z=null!=(i=k.paper)?i:g,O=Hr({elementType:S.root,externalSlotProps:k.root,ownerState:R,className:[P.root,d]}),L=Hr({elementType:T,externalSlotProps:z,ownerState:R,className:P.paper});return(0,I.jsx)(nl,(0,a.A)({onClose:h,anchorOrigin:{vertical:"bottom",horizontal:E?"right":"left"},transformOrigin:E?el:tl,slots:{paper:T,root:S.root},slotProps:{root:O,paper:L},open:v,ref:n,transitionDuration:y,TransitionProps:(0,a.A)({onEntering:(e,t)=>{N.current&&N.current.adjustStyleForScrollbar(e,{direction:E?"rtl":"ltr"}),x&&x(e,t)}},C),ownerState:R},A,{classes:b,children:(0,I.jsx)(ol,(0,a.A)({onKeyDown:e=>{"Tab"===e.key&&(e.preventDefault(),h&&h(e,"tabKeyDown"))},actions:N,autoFocus:u&&(-1===$||f),autoFocusItem:M,variant:w},m,{className:l(P.list,m.className),children:c}))}))}));function il(e){return d("MuiNativeSelect",e)}const ll=ze("MuiNativeSelect",["root","select","multiple","filled","outlined","standard","disabled","icon","iconOpen","iconFilled","iconOutlined","iconStandard","nativeInput","error"]),sl=["className","disabled","error","IconComponent","inputRef","variant"],ul=e=>{let{ownerState:t,theme:n}=e;return(0,a.A)({MozAppearance:"none",WebkitAppearance:"none",userSelect:"none",borderRadius:0,cursor:"pointer","&:focus":(0,a.A)({},n.vars?{backgroundColor:`rgba(${n.vars.palette.common.onBackgroundChannel} / 0.05)`}:{backgroundColor:"light"===n.palette.mode?"rgba(0, 0, 0, 0.05)":"rgba(255, 255, 255, 0.05)"},{borderRadius:0}),"&::-ms-expand":{display:"none"},[`&.${ll.disabled}`]:{cursor:"default"},"&[multiple]":{height:"auto"},"&:not([multiple]) option, &:not([multiple]) optgroup":{backgroundColor:(n.vars||n).palette.background.paper},"&&&":{paddingRight:24,minWidth:16}},"filled"===t.variant&&{"&&&":{paddingRight:32}},"outlined"===t.variant&&{borderRadius:(n.vars||n).shape.borderRadius,"&:focus":{borderRadius:(n.vars||n).shape.borderRadius},"&&&":{paddingRight:32}})},cl=Ae("select",{name:"MuiNativeSelect",slot:"Select",shouldForwardProp:Ce,overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.select,t[n.variant],n.error&&t.error,{[`&.${ll.multiple}`]:t.multiple}]}})(ul),dl=e=>{let{ownerState:t,theme:n}=e;return(0,a.A)({position:"absolute",right:0,top:"calc(50% - .5em)",pointerEvents:"none",color:(n.vars||n).palette.action.active,[`&.${ll.disabled}`]:{color:(n.vars||n).palette.action.disabled}},t.open&&{transform:"rotate(180deg)"},"filled"===t.variant&&{right:7},"outlined"===t.variant&&{right:7})},pl=Ae("svg",{name:"MuiNativeSelect",slot:"Icon",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.icon,n.variant&&t[`icon${W(n.variant)}`],n.open&&t.iconOpen]}})(dl),fl=e.forwardRef((function(t,n){const{className:r,disabled:i,error:s,IconComponent:u,inputRef:c,variant:d="standard"}=t,f=(0,o.A)(t,sl),m=(0,a.A)({},t,{disabled:i,variant:d,error:s}),h=(e=>{const{classes:t,variant:n,disabled:r,multiple:o,open:a,error:i}=e;return p({select:["select",n,r&&"disabled",o&&"multiple",i&&"error"],icon:["icon",`icon${W(n)}`,a&&"iconOpen",r&&"disabled"]},il,t)})(m);return(0,I.jsxs)(e.Fragment,{children:[(0,I.jsx)(cl,(0,a.A)({ownerState:m,className:l(h.select,r),disabled:i,ref:c||n},f)),t.multiple?null:(0,I.jsx)(pl,{as:u,ownerState:m,className:h.icon})]})}));const ml=function(t){let{controlled:n,default:r,name:o,state:a="value"}=t;const{current:i}=e.useRef(void 0!==n),[l,s]=e.useState(r);return[i?n:l,e.useCallback((e=>{i||s(e)}),[])]};function hl(e){return d("MuiSelect",e)}const vl=ze("MuiSelect",["root","select","multiple","filled","outlined","standard","disabled","focused","icon","iconOpen","iconFilled","iconOutlined","iconStandard","nativeInput","error"]);var gl;const bl=["aria-describedby","aria-label","autoFocus","autoWidth","children","className","defaultOpen","defaultValue","disabled","displayEmpty","error","IconComponent","inputRef","labelId","MenuProps","multiple","name","onBlur","onChange","onClose","onFocus","onOpen","open","readOnly","renderValue","SelectDisplayProps","tabIndex","type","value","variant"],yl=Ae("div",{name:"MuiSelect",slot:"Select",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[{[`&.${vl.select}`]:t.select},{[`&.${vl.select}`]:t[n.variant]},{[`&.${vl.error}`]:t.error},{[`&.${vl.multiple}`]:t.multiple}]}})(ul,{[`&.${vl.select}`]:{height:"auto",minHeight:"1.4375em",textOverflow:"ellipsis",whiteSpace:"nowrap",overflow:"hidden"}}),xl=Ae("svg",{name:"MuiSelect",slot:"Icon",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.icon,n.variant&&t[`icon${W(n.variant)}`],n.open&&t.iconOpen]}})(dl),wl=Ae("input",{shouldForwardProp:e=>ke(e)&&"classes"!==e,name:"MuiSelect",slot:"NativeInput",overridesResolver:(e,t)=>t.nativeInput})({bottom:0,left:0,position:"absolute",opacity:0,pointerEvents:"none",width:"100%",boxSizing:"border-box"});function Sl(e,t){return"object"===typeof t&&null!==t?e===t:String(e)===String(t)}function kl(e){return null==e||"string"===typeof e&&!e.trim()}const Cl=e.forwardRef((function(t,n){var r;const{"aria-describedby":i,"aria-label":s,autoFocus:u,autoWidth:c,children:d,className:f,defaultOpen:m,defaultValue:h,disabled:v,displayEmpty:g,error:b=!1,IconComponent:y,inputRef:x,labelId:w,MenuProps:S={},multiple:k,name:C,onBlur:A,onChange:E,onClose:R,onFocus:P,onOpen:M,open:N,readOnly:$,renderValue:T,SelectDisplayProps:z={},tabIndex:O,value:L,variant:_="standard"}=t,j=(0,o.A)(t,bl),[F,D]=ml({controlled:L,default:h,name:"Select"}),[V,U]=ml({controlled:N,default:m,name:"Select"}),H=e.useRef(null),K=e.useRef(null),[q,X]=e.useState(null),{current:G}=e.useRef(null!=N),[Q,Y]=e.useState(),Z=ut(n,x),J=e.useCallback((e=>{K.current=e,e&&X(e)}),[]),ee=null==q?void 0:q.parentNode;e.useImperativeHandle(Z,(()=>({focus:()=>{K.current.focus()},node:H.current,value:F})),[F]),e.useEffect((()=>{m&&V&&q&&!G&&(Y(c?null:ee.clientWidth),K.current.focus())}),[q,c]),e.useEffect((()=>{u&&K.current.focus()}),[u]),e.useEffect((()=>{if(!w)return;const e=yi(K.current).getElementById(w);if(e){const t=()=>{getSelection().isCollapsed&&K.current.focus()};return e.addEventListener("click",t),()=>{e.removeEventListener("click",t)}}}),[w]);const te=(e,t)=>{e?M&&M(t):R&&R(t),G||(Y(c?null:ee.clientWidth),U(e))},ne=e.Children.toArray(d),re=e=>t=>{let n;if(t.currentTarget.hasAttribute("tabindex")){if(k){n=Array.isArray(F)?F.slice():[];const t=F.indexOf(e.props.value);-1===t?n.push(e.props.value):n.splice(t,1)}else n=e.props.value;if(e.props.onClick&&e.props.onClick(t),F!==n&&(D(n),E)){const r=t.nativeEvent||t,o=new r.constructor(r.type,r);Object.defineProperty(o,"target",{writable:!0,value:{value:n,name:C}}),E(o,e)}k||te(!1,t)}},oe=null!==q&&V;let ae,ie;delete j["aria-invalid"];const le=[];let se=!1,ue=!1;(ha({value:F})||g)&&(T?ae=T(F):se=!0);const ce=ne.map((t=>{if(!e.isValidElement(t))return null;let n;if(k){if(!Array.isArray(F))throw new Error((0,B.A)(2));n=F.some((e=>Sl(e,t.props.value))),n&&se&&le.push(t.props.children)}else n=Sl(F,t.props.value),n&&se&&(ie=t.props.children);return n&&(ue=!0),e.cloneElement(t,{"aria-selected":n?"true":"false",onClick:re(t),onKeyUp:e=>{" "===e.key&&e.preventDefault(),t.props.onKeyUp&&t.props.onKeyUp(e)},role:"option",selected:n,value:void 0,"data-value":t.props.value})}));se&&(ae=k?0===le.length?null:le.reduce(((e,t,n)=>(e.push(t),n<le.length-1&&e.push(", "),e)),[]):ie);let de,pe=Q;!c&&G&&q&&(pe=ee.clientWidth),de="undefined"!==typeof O?O:v?null:0;const fe=z.id||(C?`mui-component-select-${C}`:void 0),me=(0,a.A)({},t,{variant:_,value:F,open:oe,error:b}),he=(e=>{const{classes:t,variant:n,disabled:r,multiple:o,open:a,error:i}=e;return p({select:["select",n,r&&"disabled",o&&"multiple",i&&"error"],icon:["icon",`icon${W(n)}`,a&&"iconOpen",r&&"disabled"],nativeInput:["nativeInput"]},hl,t)})(me),ve=(0,a.A)({},S.PaperProps,null==(r=S.slotProps)?void 0:r.paper),ge=Vr();return(0,I.jsxs)(e.Fragment,{children:[(0,I.jsx)(yl,(0,a.A)({ref:J,tabIndex:de,role:"combobox","aria-controls":ge,"aria-disabled":v?"true":void 0,"aria-expanded":oe?"true":"false","aria-haspopup":"listbox","aria-label":s,"aria-labelledby":[w,fe].filter(Boolean).join(" ")||void 0,"aria-describedby":i,onKeyDown:e=>{if(!$){-1!==[" ","ArrowUp","ArrowDown","Enter"].indexOf(e.key)&&(e.preventDefault(),te(!0,e))}},onMouseDown:v||$?null:e=>{0===e.button&&(e.preventDefault(),K.current.focus(),te(!0,e))},onBlur:e=>{!oe&&A&&(Object.defineProperty(e,"target",{writable:!0,value:{value:F,name:C}}),A(e))},onFocus:P},z,{ownerState:me,className:l(z.className,he.select,f),id:fe,children:kl(ae)?gl||(gl=(0,I.jsx)("span",{className:"notranslate",children:"\u200b"})):ae})),(0,I.jsx)(wl,(0,a.A)({"aria-invalid":b,value:Array.isArray(F)?F.join(","):F,name:C,ref:H,"aria-hidden":!0,onChange:e=>{const t=ne.find((t=>t.props.value===e.target.value));void 0!==t&&(D(t.props.value),E&&E(e,t))},tabIndex:-1,disabled:v,className:he.nativeInput,autoFocus:u,ownerState:me},j)),(0,I.jsx)(xl,{as:y,className:he.icon,ownerState:me}),(0,I.jsx)(al,(0,a.A)({id:`menu-${C||""}`,anchorEl:ee,open:oe,onClose:e=>{te(!1,e)},anchorOrigin:{vertical:"bottom",horizontal:"center"},transformOrigin:{vertical:"top",horizontal:"center"}},S,{MenuListProps:(0,a.A)({"aria-labelledby":w,role:"listbox","aria-multiselectable":k?"true":void 0,disableListWrap:!0,id:ge},S.MenuListProps),slotProps:(0,a.A)({},S.slotProps,{paper:(0,a.A)({},ve,{style:(0,a.A)({minWidth:pe},null!=ve?ve.style:null)})}),children:ce}))]})})),Al=fn((0,I.jsx)("path",{d:"M7 10l5 5 5-5z"}),"ArrowDropDown"),El=["autoWidth","children","classes","className","defaultOpen","displayEmpty","IconComponent","id","input","inputProps","label","labelId","MenuProps","multiple","native","onClose","onOpen","open","renderValue","SelectDisplayProps","variant"],Rl=["root"],Pl={name:"MuiSelect",overridesResolver:(e,t)=>t.root,shouldForwardProp:e=>Ce(e)&&"variant"!==e,slot:"Root"},Ml=Ae(Ta,Pl)(""),Nl=Ae(Ya,Pl)(""),$l=Ae(Fa,Pl)(""),Tl=e.forwardRef((function(t,n){const r=Pe({name:"MuiSelect",props:t}),{autoWidth:i=!1,children:s,classes:u={},className:c,defaultOpen:d=!1,displayEmpty:p=!1,IconComponent:f=Al,id:m,input:h,inputProps:v,label:g,labelId:b,MenuProps:y,multiple:x=!1,native:w=!1,onClose:k,onOpen:C,open:A,renderValue:E,SelectDisplayProps:R,variant:P="outlined"}=r,M=(0,o.A)(r,El),N=w?fl:Cl,$=la({props:r,muiFormControl:ua(),states:["variant","error"]}),T=$.variant||P,z=(0,a.A)({},r,{variant:T,classes:u}),O=(e=>{const{classes:t}=e;return t})(z),L=(0,o.A)(O,Rl),_=h||{standard:(0,I.jsx)(Ml,{ownerState:z}),outlined:(0,I.jsx)(Nl,{label:g,ownerState:z}),filled:(0,I.jsx)($l,{ownerState:z})}[T],j=ut(n,Kr(_));return(0,I.jsx)(e.Fragment,{children:e.cloneElement(_,(0,a.A)({inputComponent:N,inputProps:(0,a.A)({children:s,error:$.error,IconComponent:f,variant:T,type:void 0,multiple:x},w?{id:m}:{autoWidth:i,defaultOpen:d,displayEmpty:p,labelId:b,MenuProps:y,onClose:k,onOpen:C,open:A,renderValue:E,SelectDisplayProps:(0,a.A)({id:m},R)},v,{classes:v?(0,S.A)(L,v.classes):L},h?h.props.inputProps:{})},(x&&w||p)&&"outlined"===T?{notched:!0}:{},{ref:j,className:l(_.props.className,c,O.root)},!h&&{variant:T},M))})}));Tl.muiName="Select";const zl=Tl;function Ol(e){return d("MuiTextField",e)}ze("MuiTextField",["root"]);const Il=["autoComplete","autoFocus","children","className","color","defaultValue","disabled","error","FormHelperTextProps","fullWidth","helperText","id","InputLabelProps","inputProps","InputProps","inputRef","label","maxRows","minRows","multiline","name","onBlur","onChange","onFocus","placeholder","required","rows","select","SelectProps","type","value","variant"],Ll={standard:Ta,filled:Fa,outlined:Ya},_l=Ae(pi,{name:"MuiTextField",slot:"Root",overridesResolver:(e,t)=>t.root})({}),jl=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiTextField"}),{autoComplete:r,autoFocus:i=!1,children:s,className:u,color:c="primary",defaultValue:d,disabled:f=!1,error:m=!1,FormHelperTextProps:h,fullWidth:v=!1,helperText:g,id:b,InputLabelProps:y,inputProps:x,InputProps:w,inputRef:S,label:k,maxRows:C,minRows:A,multiline:E=!1,name:R,onBlur:P,onChange:M,onFocus:N,placeholder:$,required:T=!1,rows:z,select:O=!1,SelectProps:L,type:_,value:j,variant:F="outlined"}=n,W=(0,o.A)(n,Il),D=(0,a.A)({},n,{autoFocus:i,color:c,disabled:f,error:m,fullWidth:v,multiline:E,required:T,select:O,variant:F}),B=(e=>{const{classes:t}=e;return p({root:["root"]},Ol,t)})(D);const V={};"outlined"===F&&(y&&"undefined"!==typeof y.shrink&&(V.notched=y.shrink),V.label=k),O&&(L&&L.native||(V.id=void 0),V["aria-describedby"]=void 0);const U=Vr(b),H=g&&U?`${U}-helper-text`:void 0,K=k&&U?`${U}-label`:void 0,q=Ll[F],X=(0,I.jsx)(q,(0,a.A)({"aria-describedby":H,autoComplete:r,autoFocus:i,defaultValue:d,fullWidth:v,multiline:E,name:R,rows:z,maxRows:C,minRows:A,type:_,value:j,id:U,inputRef:S,onBlur:P,onChange:M,onFocus:N,placeholder:$,inputProps:x},V,w));return(0,I.jsxs)(_l,(0,a.A)({className:l(B.root,u),disabled:f,error:m,fullWidth:v,ref:t,required:T,color:c,variant:F,ownerState:D},W,{children:[null!=k&&""!==k&&(0,I.jsx)(li,(0,a.A)({htmlFor:U,id:K},y,{children:k})),O?(0,I.jsx)(zl,(0,a.A)({"aria-describedby":H,id:U,labelId:K,value:j,input:X},L,{children:s})):X,g&&(0,I.jsx)(bi,(0,a.A)({id:H},h,{children:g}))]}))}));function Fl(e){return d("MuiDialogActions",e)}ze("MuiDialogActions",["root","spacing"]);const Wl=["className","disableSpacing"],Dl=Ae("div",{name:"MuiDialogActions",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,!n.disableSpacing&&t.spacing]}})((e=>{let{ownerState:t}=e;return(0,a.A)({display:"flex",alignItems:"center",padding:8,justifyContent:"flex-end",flex:"0 0 auto"},!t.disableSpacing&&{"& > :not(style) ~ :not(style)":{marginLeft:8}})})),Bl=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiDialogActions"}),{className:r,disableSpacing:i=!1}=n,s=(0,o.A)(n,Wl),u=(0,a.A)({},n,{disableSpacing:i}),c=(e=>{const{classes:t,disableSpacing:n}=e;return p({root:["root",!n&&"spacing"]},Fl,t)})(u);return(0,I.jsx)(Dl,(0,a.A)({className:l(c.root,r),ownerState:u,ref:t},s))}));const Vl=function(t){let{open:n,onClose:r,onSubmit:o}=t;const[a,i]=(0,e.useState)(""),[l,s]=(0,e.useState)(null),[u,c]=(0,e.useState)(null),[d,p]=(0,e.useState)(""),f=()=>{i(""),s(null),c(null),p(""),r()};return(0,I.jsxs)(Uo,{open:n,onClose:f,maxWidth:"sm",fullWidth:!0,children:[(0,I.jsx)(Go,{children:"Add New Person"}),(0,I.jsx)(Jo,{children:(0,I.jsxs)(_e,{sx:{mt:2},children:[(0,I.jsx)(jl,{fullWidth:!0,label:"Full Name",value:a,onChange:e=>i(e.target.value),error:!!d&&!a.trim(),helperText:!a.trim()&&d?d:"",sx:{mb:2}}),(0,I.jsxs)(_e,{sx:{mb:2},children:[(0,I.jsx)("input",{accept:"image/*",style:{display:"none"},id:"face-image",type:"file",onChange:e=>{const t=e.target.files[0];if(t)if(t.type.startsWith("image/")){s(t),p("");const e=new FileReader;e.onloadend=()=>{c(e.result)},e.readAsDataURL(t)}else p("Please select an image file"),s(null),c(null)}}),(0,I.jsx)("label",{htmlFor:"face-image",children:(0,I.jsx)(Lr,{variant:"outlined",component:"span",fullWidth:!0,children:"Select Face Image"})})]}),u&&(0,I.jsxs)(_e,{sx:{mt:2,textAlign:"center"},children:[(0,I.jsx)(Ve,{variant:"body2",color:"text.secondary",gutterBottom:!0,children:"Preview:"}),(0,I.jsx)("img",{src:u,alt:"Preview",style:{maxWidth:"100%",maxHeight:200,objectFit:"contain"}})]}),d&&(0,I.jsx)(Ve,{color:"error",variant:"body2",sx:{mt:1},children:d})]})}),(0,I.jsxs)(Bl,{children:[(0,I.jsx)(Lr,{onClick:f,children:"Cancel"}),(0,I.jsx)(Lr,{onClick:()=>{a.trim()?l?(o(a,l),f()):p("Please select an image"):p("Please enter a name")},variant:"contained",disabled:!a.trim()||!l,children:"Add Person"})]})]})};function Ul(e){return d("MuiListItem",e)}const Hl=ze("MuiListItem",["root","container","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","padding","button","secondaryAction","selected"]);const Kl=ze("MuiListItemButton",["root","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","selected"]);function ql(e){return d("MuiListItemSecondaryAction",e)}ze("MuiListItemSecondaryAction",["root","disableGutters"]);const Xl=["className"],Gl=Ae("div",{name:"MuiListItemSecondaryAction",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.disableGutters&&t.disableGutters]}})((e=>{let{ownerState:t}=e;return(0,a.A)({position:"absolute",right:16,top:"50%",transform:"translateY(-50%)"},t.disableGutters&&{right:0})})),Ql=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiListItemSecondaryAction"}),{className:i}=r,s=(0,o.A)(r,Xl),u=e.useContext(xi),c=(0,a.A)({},r,{disableGutters:u.disableGutters}),d=(e=>{const{disableGutters:t,classes:n}=e;return p({root:["root",t&&"disableGutters"]},ql,n)})(c);return(0,I.jsx)(Gl,(0,a.A)({className:l(d.root,i),ownerState:c,ref:n},s))}));Ql.muiName="ListItemSecondaryAction";const Yl=Ql,Zl=["className"],Jl=["alignItems","autoFocus","button","children","className","component","components","componentsProps","ContainerComponent","ContainerProps","dense","disabled","disableGutters","disablePadding","divider","focusVisibleClassName","secondaryAction","selected","slotProps","slots"],es=Ae("div",{name:"MuiListItem",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e;return[t.root,n.dense&&t.dense,"flex-start"===n.alignItems&&t.alignItemsFlexStart,n.divider&&t.divider,!n.disableGutters&&t.gutters,!n.disablePadding&&t.padding,n.button&&t.button,n.hasSecondaryAction&&t.secondaryAction]}})((e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",width:"100%",boxSizing:"border-box",textAlign:"left"},!n.disablePadding&&(0,a.A)({paddingTop:8,paddingBottom:8},n.dense&&{paddingTop:4,paddingBottom:4},!n.disableGutters&&{paddingLeft:16,paddingRight:16},!!n.secondaryAction&&{paddingRight:48}),!!n.secondaryAction&&{[`& > .${Kl.root}`]:{paddingRight:48}},{[`&.${Hl.focusVisible}`]:{backgroundColor:(t.vars||t).palette.action.focus},[`&.${Hl.selected}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / ${t.vars.palette.action.selectedOpacity})`:(0,H.X4)(t.palette.primary.main,t.palette.action.selectedOpacity),[`&.${Hl.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.focusOpacity}))`:(0,H.X4)(t.palette.primary.main,t.palette.action.selectedOpacity+t.palette.action.focusOpacity)}},[`&.${Hl.disabled}`]:{opacity:(t.vars||t).palette.action.disabledOpacity}},"flex-start"===n.alignItems&&{alignItems:"flex-start"},n.divider&&{borderBottom:`1px solid ${(t.vars||t).palette.divider}`,backgroundClip:"padding-box"},n.button&&{transition:t.transitions.create("background-color",{duration:t.transitions.duration.shortest}),"&:hover":{textDecoration:"none",backgroundColor:(t.vars||t).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},[`&.${Hl.selected}:hover`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.hoverOpacity}))`:(0,H.X4)(t.palette.primary.main,t.palette.action.selectedOpacity+t.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:t.vars?`rgba(${t.vars.palette.primary.mainChannel} / ${t.vars.palette.action.selectedOpacity})`:(0,H.X4)(t.palette.primary.main,t.palette.action.selectedOpacity)}}},n.hasSecondaryAction&&{paddingRight:48})})),ts=Ae("li",{name:"MuiListItem",slot:"Container",overridesResolver:(e,t)=>t.container})({position:"relative"}),ns=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiListItem"}),{alignItems:i="center",autoFocus:s=!1,button:u=!1,children:c,className:d,component:f,components:m={},componentsProps:h={},ContainerComponent:v="li",ContainerProps:{className:g}={},dense:b=!1,disabled:y=!1,disableGutters:x=!1,disablePadding:w=!1,divider:S=!1,focusVisibleClassName:k,secondaryAction:C,selected:A=!1,slotProps:E={},slots:R={}}=r,P=(0,o.A)(r.ContainerProps,Zl),M=(0,o.A)(r,Jl),N=e.useContext(xi),$=e.useMemo((()=>({dense:b||N.dense||!1,alignItems:i,disableGutters:x})),[i,N.dense,b,x]),T=e.useRef(null);ca((()=>{s&&T.current&&T.current.focus()}),[s]);const z=e.Children.toArray(c),O=z.length&&si(z[z.length-1],["ListItemSecondaryAction"]),L=(0,a.A)({},r,{alignItems:i,autoFocus:s,button:u,dense:$.dense,disabled:y,disableGutters:x,disablePadding:w,divider:S,hasSecondaryAction:O,selected:A}),_=(e=>{const{alignItems:t,button:n,classes:r,dense:o,disabled:a,disableGutters:i,disablePadding:l,divider:s,hasSecondaryAction:u,selected:c}=e;return p({root:["root",o&&"dense",!i&&"gutters",!l&&"padding",s&&"divider",a&&"disabled",n&&"button","flex-start"===t&&"alignItemsFlexStart",u&&"secondaryAction",c&&"selected"],container:["container"]},Ul,r)})(L),j=ut(T,n),F=R.root||m.Root||es,W=E.root||h.root||{},D=(0,a.A)({className:l(_.root,W.className,d),disabled:y},M);let B=f||"li";return u&&(D.component=f||"div",D.focusVisibleClassName=l(Hl.focusVisible,k),B=tn),O?(B=D.component||f?B:"div","li"===v&&("li"===B?B="div":"li"===D.component&&(D.component="div")),(0,I.jsx)(xi.Provider,{value:$,children:(0,I.jsxs)(ts,(0,a.A)({as:v,className:l(_.container,g),ref:j,ownerState:L},P,{children:[(0,I.jsx)(F,(0,a.A)({},W,!Ke(F)&&{as:B,ownerState:(0,a.A)({},L,W.ownerState)},D,{children:z})),z.pop()]}))})):(0,I.jsx)(xi.Provider,{value:$,children:(0,I.jsxs)(F,(0,a.A)({},W,{as:B,ref:j},!Ke(F)&&{ownerState:(0,a.A)({},L,W.ownerState)},D,{children:[z,C&&(0,I.jsx)(Yl,{children:C})]}))})}));function rs(e){return d("MuiCard",e)}ze("MuiCard",["root"]);const os=["className","raised"],as=Ae(it,{name:"MuiCard",slot:"Root",overridesResolver:(e,t)=>t.root})((()=>({overflow:"hidden"}))),is=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiCard"}),{className:r,raised:i=!1}=n,s=(0,o.A)(n,os),u=(0,a.A)({},n,{raised:i}),c=(e=>{const{classes:t}=e;return p({root:["root"]},rs,t)})(u);return(0,I.jsx)(as,(0,a.A)({className:l(c.root,r),elevation:i?8:void 0,ref:t,ownerState:u},s))}));function ls(e){return d("MuiCardContent",e)}ze("MuiCardContent",["root"]);const ss=["className","component"],us=Ae("div",{name:"MuiCardContent",slot:"Root",overridesResolver:(e,t)=>t.root})((()=>({padding:16,"&:last-child":{paddingBottom:24}}))),cs=e.forwardRef((function(e,t){const n=Pe({props:e,name:"MuiCardContent"}),{className:r,component:i="div"}=n,s=(0,o.A)(n,ss),u=(0,a.A)({},n,{component:i}),c=(e=>{const{classes:t}=e;return p({root:["root"]},ls,t)})(u);return(0,I.jsx)(us,(0,a.A)({as:i,className:l(c.root,r),ownerState:u,ref:t},s))}));var ds=n(604);const ps=["component","direction","spacing","divider","children","className","useFlexGap"],fs=(0,h.A)(),ms=O("div",{name:"MuiStack",slot:"Root",overridesResolver:(e,t)=>t.root});function hs(e){return x({props:e,name:"MuiStack",defaultTheme:fs})}function vs(t,n){const r=e.Children.toArray(t).filter(Boolean);return r.reduce(((t,o,a)=>(t.push(o),a<r.length-1&&t.push(e.cloneElement(n,{key:`separator-${a}`})),t)),[])}const gs=e=>{let{ownerState:t,theme:n}=e,r=(0,a.A)({display:"flex",flexDirection:"column"},(0,fr.NI)({theme:n},(0,fr.kW)({values:t.direction,breakpoints:n.breakpoints.values}),(e=>({flexDirection:e}))));if(t.spacing){const e=(0,ds.LX)(n),o=Object.keys(n.breakpoints.values).reduce(((e,n)=>(("object"===typeof t.spacing&&null!=t.spacing[n]||"object"===typeof t.direction&&null!=t.direction[n])&&(e[n]=!0),e)),{}),a=(0,fr.kW)({values:t.direction,base:o}),i=(0,fr.kW)({values:t.spacing,base:o});"object"===typeof a&&Object.keys(a).forEach(((e,t,n)=>{if(!a[e]){const r=t>0?a[n[t-1]]:"column";a[e]=r}}));const l=(n,r)=>{return t.useFlexGap?{gap:(0,ds._W)(e,n)}:{"& > :not(style):not(style)":{margin:0},"& > :not(style) ~ :not(style)":{[`margin${o=r?a[r]:t.direction,{row:"Left","row-reverse":"Right",column:"Top","column-reverse":"Bottom"}[o]}`]:(0,ds._W)(e,n)}};var o};r=(0,S.A)(r,(0,fr.NI)({theme:n},i,l))}return r=(0,fr.iZ)(n.breakpoints,r),r};const bs=function(){let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{createStyledComponent:n=ms,useThemeProps:r=hs,componentName:i="MuiStack"}=t,s=n(gs),u=e.forwardRef((function(e,t){const n=r(e),u=(0,$e.A)(n),{component:c="div",direction:f="column",spacing:m=0,divider:h,children:v,className:g,useFlexGap:b=!1}=u,y=(0,o.A)(u,ps),x={direction:f,spacing:m,useFlexGap:b},w=p({root:["root"]},(e=>d(i,e)),{});return(0,I.jsx)(s,(0,a.A)({as:c,ownerState:x,ref:t,className:l(w.root,g)},y,{children:h?vs(v,h):v}))}));return u}({createStyledComponent:Ae("div",{name:"MuiStack",slot:"Root",overridesResolver:(e,t)=>t.root}),useThemeProps:e=>Pe({props:e,name:"MuiStack"})}),ys=bs,xs=fn((0,I.jsx)("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"}),"Cancel");function ws(e){return d("MuiChip",e)}const Ss=ze("MuiChip",["root","sizeSmall","sizeMedium","colorError","colorInfo","colorPrimary","colorSecondary","colorSuccess","colorWarning","disabled","clickable","clickableColorPrimary","clickableColorSecondary","deletable","deletableColorPrimary","deletableColorSecondary","outlined","filled","outlinedPrimary","outlinedSecondary","filledPrimary","filledSecondary","avatar","avatarSmall","avatarMedium","avatarColorPrimary","avatarColorSecondary","icon","iconSmall","iconMedium","iconColorPrimary","iconColorSecondary","label","labelSmall","labelMedium","deleteIcon","deleteIconSmall","deleteIconMedium","deleteIconColorPrimary","deleteIconColorSecondary","deleteIconOutlinedColorPrimary","deleteIconOutlinedColorSecondary","deleteIconFilledColorPrimary","deleteIconFilledColorSecondary","focusVisible"]),ks=["avatar","className","clickable","color","component","deleteIcon","disabled","icon","label","onClick","onDelete","onKeyDown","onKeyUp","size","variant","tabIndex","skipFocusWhenDisabled"],Cs=Ae("div",{name:"MuiChip",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:n}=e,{color:r,iconColor:o,clickable:a,onDelete:i,size:l,variant:s}=n;return[{[`& .${Ss.avatar}`]:t.avatar},{[`& .${Ss.avatar}`]:t[`avatar${W(l)}`]},{[`& .${Ss.avatar}`]:t[`avatarColor${W(r)}`]},{[`& .${Ss.icon}`]:t.icon},{[`& .${Ss.icon}`]:t[`icon${W(l)}`]},{[`& .${Ss.icon}`]:t[`iconColor${W(o)}`]},{[`& .${Ss.deleteIcon}`]:t.deleteIcon},{[`& .${Ss.deleteIcon}`]:t[`deleteIcon${W(l)}`]},{[`& .${Ss.deleteIcon}`]:t[`deleteIconColor${W(r)}`]},{[`& .${Ss.deleteIcon}`]:t[`deleteIcon${W(s)}Color${W(r)}`]},t.root,t[`size${W(l)}`],t[`color${W(r)}`],a&&t.clickable,a&&"default"!==r&&t[`clickableColor${W(r)})`],i&&t.deletable,i&&"default"!==r&&t[`deletableColor${W(r)}`],t[s],t[`${s}${W(r)}`]]}})((e=>{let{theme:t,ownerState:n}=e;const r="light"===t.palette.mode?t.palette.grey[700]:t.palette.grey[300];return(0,a.A)({maxWidth:"100%",fontFamily:t.typography.fontFamily,fontSize:t.typography.pxToRem(13),display:"inline-flex",alignItems:"center",justifyContent:"center",height:32,color:(t.vars||t).palette.text.primary,backgroundColor:(t.vars||t).palette.action.selected,borderRadius:16,whiteSpace:"nowrap",transition:t.transitions.create(["background-color","box-shadow"]),cursor:"unset",outline:0,textDecoration:"none",border:0,padding:0,verticalAlign:"middle",boxSizing:"border-box",[`&.${Ss.disabled}`]:{opacity:(t.vars||t).palette.action.disabledOpacity,pointerEvents:"none"},[`& .${Ss.avatar}`]:{marginLeft:5,marginRight:-6,width:24,height:24,color:t.vars?t.vars.palette.Chip.defaultAvatarColor:r,fontSize:t.typography.pxToRem(12)},[`& .${Ss.avatarColorPrimary}`]:{color:(t.vars||t).palette.primary.contrastText,backgroundColor:(t.vars||t).palette.primary.dark},[`& .${Ss.avatarColorSecondary}`]:{color:(t.vars||t).palette.secondary.contrastText,backgroundColor:(t.vars||t).palette.secondary.dark},[`& .${Ss.avatarSmall}`]:{marginLeft:4,marginRight:-4,width:18,height:18,fontSize:t.typography.pxToRem(10)},[`& .${Ss.icon}`]:(0,a.A)({marginLeft:5,marginRight:-6},"small"===n.size&&{fontSize:18,marginLeft:4,marginRight:-4},n.iconColor===n.color&&(0,a.A)({color:t.vars?t.vars.palette.Chip.defaultIconColor:r},"default"!==n.color&&{color:"inherit"})),[`& .${Ss.deleteIcon}`]:(0,a.A)({WebkitTapHighlightColor:"transparent",color:t.vars?`rgba(${t.vars.palette.text.primaryChannel} / 0.26)`:(0,H.X4)(t.palette.text.primary,.26),fontSize:22,cursor:"pointer",margin:"0 5px 0 -6px","&:hover":{color:t.vars?`rgba(${t.vars.palette.text.primaryChannel} / 0.4)`:(0,H.X4)(t.palette.text.primary,.4)}},"small"===n.size&&{fontSize:16,marginRight:4,marginLeft:-4},"default"!==n.color&&{color:t.vars?`rgba(${t.vars.palette[n.color].contrastTextChannel} / 0.7)`:(0,H.X4)(t.palette[n.color].contrastText,.7),"&:hover, &:active":{color:(t.vars||t).palette[n.color].contrastText}})},"small"===n.size&&{height:24},"default"!==n.color&&{backgroundColor:(t.vars||t).palette[n.color].main,color:(t.vars||t).palette[n.color].contrastText},n.onDelete&&{[`&.${Ss.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.action.selectedChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.focusOpacity}))`:(0,H.X4)(t.palette.action.selected,t.palette.action.selectedOpacity+t.palette.action.focusOpacity)}},n.onDelete&&"default"!==n.color&&{[`&.${Ss.focusVisible}`]:{backgroundColor:(t.vars||t).palette[n.color].dark}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({},n.clickable&&{userSelect:"none",WebkitTapHighlightColor:"transparent",cursor:"pointer","&:hover":{backgroundColor:t.vars?`rgba(${t.vars.palette.action.selectedChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.hoverOpacity}))`:(0,H.X4)(t.palette.action.selected,t.palette.action.selectedOpacity+t.palette.action.hoverOpacity)},[`&.${Ss.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette.action.selectedChannel} / calc(${t.vars.palette.action.selectedOpacity} + ${t.vars.palette.action.focusOpacity}))`:(0,H.X4)(t.palette.action.selected,t.palette.action.selectedOpacity+t.palette.action.focusOpacity)},"&:active":{boxShadow:(t.vars||t).shadows[1]}},n.clickable&&"default"!==n.color&&{[`&:hover, &.${Ss.focusVisible}`]:{backgroundColor:(t.vars||t).palette[n.color].dark}})}),(e=>{let{theme:t,ownerState:n}=e;return(0,a.A)({},"outlined"===n.variant&&{backgroundColor:"transparent",border:t.vars?`1px solid ${t.vars.palette.Chip.defaultBorder}`:`1px solid ${"light"===t.palette.mode?t.palette.grey[400]:t.palette.grey[700]}`,[`&.${Ss.clickable}:hover`]:{backgroundColor:(t.vars||t).palette.action.hover},[`&.${Ss.focusVisible}`]:{backgroundColor:(t.vars||t).palette.action.focus},[`& .${Ss.avatar}`]:{marginLeft:4},[`& .${Ss.avatarSmall}`]:{marginLeft:2},[`& .${Ss.icon}`]:{marginLeft:4},[`& .${Ss.iconSmall}`]:{marginLeft:2},[`& .${Ss.deleteIcon}`]:{marginRight:5},[`& .${Ss.deleteIconSmall}`]:{marginRight:3}},"outlined"===n.variant&&"default"!==n.color&&{color:(t.vars||t).palette[n.color].main,border:`1px solid ${t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / 0.7)`:(0,H.X4)(t.palette[n.color].main,.7)}`,[`&.${Ss.clickable}:hover`]:{backgroundColor:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / ${t.vars.palette.action.hoverOpacity})`:(0,H.X4)(t.palette[n.color].main,t.palette.action.hoverOpacity)},[`&.${Ss.focusVisible}`]:{backgroundColor:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / ${t.vars.palette.action.focusOpacity})`:(0,H.X4)(t.palette[n.color].main,t.palette.action.focusOpacity)},[`& .${Ss.deleteIcon}`]:{color:t.vars?`rgba(${t.vars.palette[n.color].mainChannel} / 0.7)`:(0,H.X4)(t.palette[n.color].main,.7),"&:hover, &:active":{color:(t.vars||t).palette[n.color].main}}})})),As=Ae("span",{name:"MuiChip",slot:"Label",overridesResolver:(e,t)=>{const{ownerState:n}=e,{size:r}=n;return[t.label,t[`label${W(r)}`]]}})((e=>{let{ownerState:t}=e;return(0,a.A)({overflow:"hidden",textOverflow:"ellipsis",paddingLeft:12,paddingRight:12,whiteSpace:"nowrap"},"outlined"===t.variant&&{paddingLeft:11,paddingRight:11},"small"===t.size&&{paddingLeft:8,paddingRight:8},"small"===t.size&&"outlined"===t.variant&&{paddingLeft:7,paddingRight:7})}));function Es(e){return"Backspace"===e.key||"Delete"===e.key}const Rs=e.forwardRef((function(t,n){const r=Pe({props:t,name:"MuiChip"}),{avatar:i,className:s,clickable:u,color:c="default",component:d,deleteIcon:f,disabled:m=!1,icon:h,label:v,onClick:g,onDelete:b,onKeyDown:y,onKeyUp:x,size:w="medium",variant:S="filled",tabIndex:k,skipFocusWhenDisabled:C=!1}=r,A=(0,o.A)(r,ks),E=e.useRef(null),R=ut(E,n),P=e=>{e.stopPropagation(),b&&b(e)},M=!(!1===u||!g)||u,N=M||b?tn:d||"div",$=(0,a.A)({},r,{component:N,disabled:m,size:w,color:c,iconColor:e.isValidElement(h)&&h.props.color||c,onDelete:!!b,clickable:M,variant:S}),T=(e=>{const{classes:t,disabled:n,size:r,color:o,iconColor:a,onDelete:i,clickable:l,variant:s}=e;return p({root:["root",s,n&&"disabled",`size${W(r)}`,`color${W(o)}`,l&&"clickable",l&&`clickableColor${W(o)}`,i&&"deletable",i&&`deletableColor${W(o)}`,`${s}${W(o)}`],label:["label",`label${W(r)}`],avatar:["avatar",`avatar${W(r)}`,`avatarColor${W(o)}`],icon:["icon",`icon${W(r)}`,`iconColor${W(a)}`],deleteIcon:["deleteIcon",`deleteIcon${W(r)}`,`deleteIconColor${W(o)}`,`deleteIcon${W(s)}Color${W(o)}`]},ws,t)})($),z=N===tn?(0,a.A)({component:d||"div",focusVisibleClassName:T.focusVisible},b&&{disableRipple:!0}):{};let O=null;b&&(O=f&&e.isValidElement(f)?e.cloneElement(f,{className:l(f.props.className,T.deleteIcon),onClick:P}):(0,I.jsx)(xs,{className:l(T.deleteIcon),onClick:P}));let L=null;i&&e.isValidElement(i)&&(L=e.cloneElement(i,{className:l(T.avatar,i.props.className)}));let _=null;return h&&e.isValidElement(h)&&(_=e.cloneElement(h,{className:l(T.icon,h.props.className)})),(0,I.jsxs)(Cs,(0,a.A)({as:N,className:l(T.root,s),disabled:!(!M||!m)||void 0,onClick:g,onKeyDown:e=>{e.currentTarget===e.target&&Es(e)&&e.preventDefault(),y&&y(e)},onKeyUp:e=>{e.currentTarget===e.target&&(b&&Es(e)?b(e):"Escape"===e.key&&E.current&&E.current.blur()),x&&x(e)},ref:R,tabIndex:C&&m?-1:k,ownerState:$},z,A,{children:[L||_,(0,I.jsx)(As,{className:l(T.label),ownerState:$,children:v}),O]}))})),Ps=fn((0,I.jsx)("path",{d:"M19 6.41 17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");const Ms=function(e){let{notifications:t=[],onAddPerson:n,onDismiss:r}=e;return t.length?(0,I.jsx)(Ci,{sx:{width:"100%",bgcolor:"background.paper"},children:t.map(((e,t)=>{var o;if(!e||!e.data)return null;const{event_type:a,timestamp:i,data:l}=e,s=null!==(o=null===l||void 0===l?void 0:l.recognized)&&void 0!==o&&o,u=i?new Date(i):new Date;return(0,I.jsx)(ns,{sx:{px:0,"&:not(:last-child)":{mb:2}},children:(0,I.jsx)(is,{sx:{width:"100%",borderLeft:6,borderColor:s?"success.main":"error.main"},children:(0,I.jsxs)(cs,{children:[(0,I.jsxs)(_e,{sx:{display:"flex",justifyContent:"space-between",alignItems:"flex-start"},children:[(0,I.jsxs)(_e,{children:[(0,I.jsxs)(ys,{direction:"row",spacing:1,alignItems:"center",children:[s?(0,I.jsx)(_r,{color:"success"}):(0,I.jsx)(jr,{color:"error"}),(0,I.jsx)(Ve,{variant:"h6",children:s?"Access Granted":"Unknown Face Detected"})]}),s&&(null===l||void 0===l?void 0:l.person_name)&&(0,I.jsxs)(Ve,{variant:"body1",sx:{mt:1},children:["Welcome, ",l.person_name,"!"]}),(0,I.jsx)(Ve,{variant:"caption",color:"text.secondary",sx:{mt:1,display:"block"},children:u.toLocaleString()})]}),(0,I.jsx)(ln,{size:"small",onClick:()=>r(t),sx:{ml:1},children:(0,I.jsx)(Ps,{})})]}),!s&&(0,I.jsxs)(ys,{direction:"row",spacing:2,sx:{mt:2},children:[(0,I.jsx)(Lr,{variant:"contained",color:"primary",size:"small",startIcon:(0,I.jsx)(Fr,{}),onClick:()=>n(l),children:"Add Person"}),(0,I.jsx)(Lr,{variant:"outlined",color:"error",size:"small",startIcon:(0,I.jsx)(jr,{}),children:"Ignore"})]}),s&&(null===l||void 0===l?void 0:l.confidence)&&(0,I.jsx)(Rs,{label:`Confidence: ${(100*l.confidence).toFixed(1)}%`,color:"success",size:"small",sx:{mt:2}})]})})},`${i||t}-${t}`)}))}):(0,I.jsx)(Ve,{variant:"body2",color:"text.secondary",align:"center",sx:{py:2},children:"No recognition events yet"})};const Ns=function(){const[t,n]=(0,e.useState)(null),[r,o]=(0,e.useState)(null),[a,i]=(0,e.useState)([]),[l,s]=(0,e.useState)(!1),[u,c]=(0,e.useState)(!1),[d,p]=(0,e.useState)(null);return(0,e.useEffect)((()=>{const e=new WebSocket("ws://localhost:3000/ws");return e.onopen=()=>{s(!0),p(null)},e.onclose=()=>{s(!1),p("WebSocket connection lost. Reconnecting...")},e.onerror=e=>{p("WebSocket error: "+e.message)},e.onmessage=e=>{const t=JSON.parse(e.data);o(t),i((e=>[t,...e].slice(0,10)))},n(e),()=>{e.close()}}),[]),(0,I.jsxs)(Ne,{maxWidth:"md",children:[(0,I.jsxs)(_e,{sx:{my:4},children:[(0,I.jsx)(Ve,{variant:"h4",component:"h1",gutterBottom:!0,align:"center",children:"Face Recognition Dashboard"}),d&&(0,I.jsx)(An,{severity:"error",sx:{mb:2},children:d}),!l&&(0,I.jsx)(An,{severity:"warning",sx:{mb:2},children:"Connecting to server..."}),(0,I.jsx)(it,{sx:{p:3,mb:3},children:r?(0,I.jsx)(Wr,{event:r,onAddPerson:()=>c(!0)}):(0,I.jsxs)(_e,{sx:{textAlign:"center",py:4},children:[(0,I.jsx)(Wn,{}),(0,I.jsx)(Ve,{variant:"body1",sx:{mt:2},children:"Waiting for face recognition events..."})]})}),(0,I.jsxs)(it,{sx:{p:3},children:[(0,I.jsx)(Ve,{variant:"h6",gutterBottom:!0,children:"Recent Recognition Events"}),(0,I.jsx)(Kn,{sx:{mb:2}}),(0,I.jsx)(Ms,{notifications:a,onAddPerson:()=>c(!0),onDismiss:e=>{i((t=>t.filter(((t,n)=>n!==e))))}})]})]}),(0,I.jsx)(Vl,{open:u,onClose:()=>c(!1),onSubmit:async(e,t)=>{try{const n=new FormData;n.append("name",e),n.append("file",t);if(!(await fetch("/add-person",{method:"POST",body:n})).ok)throw new Error("Failed to add person");c(!1)}catch(d){p("Failed to add person: "+d.message)}}})]})};r.createRoot(document.getElementById("root")).render((0,I.jsx)(e.StrictMode,{children:(0,I.jsx)(Ns,{})}))})()})();
-//# sourceMappingURL=main.c5968f34.js.map
\ No newline at end of file
@@ -152,18 +152,17 @@ function App() {
       console.log("=== Add Person Request ===");
       console.log("Last event:", lastEvent);
       
-      if (!lastEvent?.data?.vector) {
-        console.error("No vector in lastEvent:", lastEvent);
-        throw new Error("No face vector available to add.");
+      if (!lastEvent?.data?.event_id) {
+        console.error("No event_id in lastEvent:", lastEvent);
+        throw new Error("No face available to add.");
       }
   
+      // The server looks the face vector up by event_id
       const requestData = {
-        vector: lastEvent.data.vector,
+        event_id: lastEvent.data.event_id,
       };
       
       console.log("Request data:", requestData);
-      console.log("Vector type:", typeof lastEvent.data.vector);
-      console.log("Vector length:", lastEvent.data.vector.length);
   
       const response = await fetch('/add-person', {
         method: 'POST',
@@ -203,7 +203,7 @@ function RecognitionResult({ event, onAddPerson, onDismiss }) {
           </Box>
         </Slide>
         
-        {data.preview_image && (
+        {data.preview_url && (
           <Slide direction="up" in timeout={800}>
             <Paper 
               sx={{ 
@@ -242,7 +242,7 @@ function RecognitionResult({ event, onAddPerson, onDismiss }) {
                 </Typography>
               </Box>
               <img 
-                src={`data:image/jpeg;base64,${data.preview_image}`}
+                src={data.preview_url}
                 alt="Detected face"
                 style={{ 
                   width: '100%', 
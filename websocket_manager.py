@@ -1,27 +1,107 @@
-from fastapi import WebSocket, WebSocketDisconnect
-from typing import Set, Optional
+import asyncio
+import json
+from fastapi import WebSocket
+from typing import Dict, Optional
 from datetime import datetime
+from event_bus import bus
+
+
+class _Client:
+    """A connected viewer with its own bounded outbound queue and sender task."""
+
+    def __init__(self, ws: WebSocket, queue_size: int):
+        self.ws = ws
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflows = 0  # consecutive broadcasts that found the queue full
+        self.task: Optional[asyncio.Task] = None
+
 
 class WebSocketManager:
-    def __init__(self):
-        self.connections: Set[WebSocket] = set()
+    """
+    Broadcasts are enqueue-only: each message is serialized once and pushed
+    onto every client's queue, and a per-client task does the actual sends.
+    A full queue drops its oldest message; a client that stays full for
+    max_overflows broadcasts in a row (or whose send times out) is evicted.
+
+    The broadcast_* helpers publish on the event bus; every worker's manager
+    subscribes to those events (see subscribe()), so dashboards connected to
+    any worker receive them.
+    """
+
+    def __init__(self, queue_size: int = 32, max_overflows: int = 64, send_timeout: float = 5.0):
+        self.queue_size = queue_size
+        self.max_overflows = max_overflows
+        self.send_timeout = send_timeout
+        self.connections: Dict[WebSocket, _Client] = {}
+        self._closing = set()  # close tasks for evicted clients, kept alive until they finish
+        self.dropped = 0
+        self.evicted = 0
 
     async def connect(self, ws: WebSocket):
         await ws.accept()
-        self.connections.add(ws)
+        client = _Client(ws, self.queue_size)
+        client.task = asyncio.create_task(self._sender(client))
+        self.connections[ws] = client
 
     def disconnect(self, ws: WebSocket):
-        self.connections.discard(ws)
+        client = self.connections.pop(ws, None)
+        if client is not None and client.task is not asyncio.current_task():
+            client.task.cancel()
+
+    async def _sender(self, client: _Client):
+        try:
+            while True:
+                text = await client.queue.get()
+                await asyncio.wait_for(client.ws.send_text(text), self.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Disconnected, closed or too slow: stop sending to this client
+            self.disconnect(client.ws)
+
+    def _evict(self, client: _Client):
+        self.evicted += 1
+        self.disconnect(client.ws)
+        task = asyncio.create_task(self._close(client.ws))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(ws: WebSocket):
+        try:
+            await ws.close(code=1013)  # try again later
+        except Exception:
+            pass
 
     async def broadcast(self, message: dict):
-        for ws in list(self.connections):
+        text = json.dumps(message, separators=(",", ":"))
+        for client in list(self.connections.values()):
             try:
-                await ws.send_json(message)
-            except WebSocketDisconnect:
-                self.disconnect(ws)
+                client.queue.put_nowait(text)
+                client.overflows = 0
+            except asyncio.QueueFull:
+                # Keep the newest state: drop the oldest pending message
+                client.queue.get_nowait()
+                client.queue.put_nowait(text)
+                self.dropped += 1
+                client.overflows += 1
+                if client.overflows >= self.max_overflows:
+                    self._evict(client)
+
+    def subscribe(self):
+        for event_type in ("recognition", "person_added", "visit_updated"):
+            bus.subscribe(event_type, self.broadcast)
+
+    def stats(self) -> dict:
+        return {
+            "connections": len(self.connections),
+            "queued": sum(c.queue.qsize() for c in self.connections.values()),
+            "dropped": self.dropped,
+            "evicted": self.evicted,
+        }
 
-    async def broadcast_recognition(self, status: str, person_id: Optional[int], device_id: Optional[str], preview_image: str, vector: Optional[list[float]]):
-        """Broadcast a recognition event to all connected clients."""
+    async def broadcast_recognition(self, status: str, person_id: Optional[int], device_id: Optional[str], event_id: str):
+        """Broadcast a recognition event to all connected clients (preview/vector are fetched by event_id)."""
         message = {
             "event_type": "recognition",
             "timestamp": datetime.now().isoformat(),
@@ -29,25 +109,31 @@ class WebSocketManager:
                 "status": status,
                 "person_id": person_id,
                 "device_id": device_id,
-                "preview_image": preview_image,
-                "vector": vector,
+                "event_id": event_id,
+                "preview_url": f"/preview/{event_id}",
                 "recognized": status in ["green", "yellow"]
             }
         }
-        await self.broadcast(message)
+        bus.publish("recognition", message)
 
-    async def broadcast_person_added(self):
-        await self.broadcast({
+    async def broadcast_person_added(self, count: int = 1):
+        data = {"status": "success"}
+        if count != 1:
+            data["count"] = count  # bulk enrollment: one event for the whole batch
+        bus.publish("person_added", {
             "event_type": "person_added",
             "timestamp": datetime.utcnow().isoformat() + "Z",
-            "data": {"status": "success"}
+            "data": data
         })
 
-    async def broadcast_visit_updated(self, person_id: str):
-        await self.broadcast({
+    async def broadcast_visit_updated(self, person_id: Optional[str], count: int = 1):
+        data = {"status": "success", "person_id": person_id}
+        if count != 1:
+            data["count"] = count  # bulk update: one event for the whole batch
+        bus.publish("visit_updated", {
             "event_type": "visit_updated",
             "timestamp": datetime.utcnow().isoformat() + "Z",
-            "data": {"status": "success", "person_id": person_id}
+            "data": data
         })
 
 # Create a single instance to be used across the application